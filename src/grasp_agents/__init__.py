@@ -14,56 +14,131 @@ their own subpackages and are imported from there, e.g.::
     from grasp_agents.types.events import TurnStartEvent
     from grasp_agents.memory import scan_memdir
     from grasp_agents.skills import parse_slash_command
+
+The names below are resolved lazily, on first access.
 """
 
-# --- Agents / processors / workflows ---
-from .agent import LLMAgent
-
-# --- Sessions / durability / memory / skills ---
-from .durability import AgentCheckpoint, CheckpointStore, InMemoryCheckpointStore
-
-# --- Logging ---
-from .grasp_logging import enable_verbose_stdout_logging, setup_logging
-from .llm import LLM, FallbackLLM, LLMSettings, RetryPolicy
-from .memory import MemoryEntry, MemoryProvider
-from .printer import Printer, print_events
-from .processors import ParallelProcessor, Processor
-from .runner import Runner
-from .session_context import RunContext, SessionContext
-from .skills import SkillRegistry
-
-# --- Tools ---
-from .tools.agent_tool import AgentTool
-from .tools.base import BaseTool
-from .tools.function_tool import FunctionTool, function_tool
-from .tools.processor_tool import ProcessorTool
-
-# --- Messages / content / responses ---
-from .types.content import (
-    CacheControl,
-    Content,
-    InputImage,
-    InputRenderable,
-    InputRenderableModel,
-)
-from .types.events import Event, ProcPacketOutEvent, RunPacketOutEvent, StopReason
-from .types.items import (
-    AssistantMessage,
-    DeveloperMessage,
-    SystemMessage,
-    UserMessage,
-)
-from .types.packet import Packet
-from .types.response import Response
-
-# --- UI ---
-from .ui.console import EventConsole, render_events
-from .workflow import LoopedWorkflow, SequentialWorkflow, WorkflowProcessor
-
-try:
-    from .mcp import MCPClient, MCPServerSSE, MCPServerStdio
-except ImportError:
-    pass
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # --- Agents / processors / workflows ---
+    from .agent import LLMAgent
+
+    # --- Sessions / durability / memory / skills ---
+    from .durability import AgentCheckpoint, CheckpointStore, InMemoryCheckpointStore
+
+    # --- Logging ---
+    from .grasp_logging import enable_verbose_stdout_logging, setup_logging
+    from .llm import LLM, FallbackLLM, LLMSettings, RetryPolicy
+    from .mcp import MCPClient, MCPClientPool, MCPServerSSE, MCPServerStdio
+    from .memory import MemoryEntry, MemoryProvider
+    from .printer import Printer, print_events
+    from .processors import ParallelProcessor, Processor
+    from .runner import Runner
+    from .session_context import RunContext, SessionContext
+    from .skills import SkillRegistry
+
+    # --- Tools ---
+    from .tools.agent_tool import AgentTool
+    from .tools.base import BaseTool
+    from .tools.function_tool import FunctionTool, function_tool
+    from .tools.processor_tool import ProcessorTool
+
+    # --- Messages / content / responses ---
+    from .types.content import (
+        CacheControl,
+        Content,
+        InputImage,
+        InputRenderable,
+        InputRenderableModel,
+    )
+    from .types.events import Event, ProcPacketOutEvent, RunPacketOutEvent, StopReason
+    from .types.items import (
+        AssistantMessage,
+        DeveloperMessage,
+        SystemMessage,
+        UserMessage,
+    )
+    from .types.packet import Packet
+    from .types.response import Response
+
+    # --- UI ---
+    from .ui.console import EventConsole, render_events
+    from .workflow import LoopedWorkflow, SequentialWorkflow, WorkflowProcessor
+
+# Name → submodule it lives in. Resolved on first access (PEP 562), so
+# ``import grasp_agents`` costs nothing until a name is used, and using one
+# (say ``LLMAgent``) loads only its own import graph — not ``rich``'s console,
+# the MCP SDK or the UI.
+_LAZY: dict[str, str] = {
+    "LLMAgent": "agent",
+    "AgentCheckpoint": "durability",
+    "CheckpointStore": "durability",
+    "InMemoryCheckpointStore": "durability",
+    "enable_verbose_stdout_logging": "grasp_logging",
+    "setup_logging": "grasp_logging",
+    "LLM": "llm",
+    "FallbackLLM": "llm",
+    "LLMSettings": "llm",
+    "RetryPolicy": "llm",
+    "MCPClient": "mcp",
+    "MCPClientPool": "mcp",
+    "MCPServerSSE": "mcp",
+    "MCPServerStdio": "mcp",
+    "MemoryEntry": "memory",
+    "MemoryProvider": "memory",
+    "Printer": "printer",
+    "print_events": "printer",
+    "ParallelProcessor": "processors",
+    "Processor": "processors",
+    "Runner": "runner",
+    "RunContext": "session_context",
+    "SessionContext": "session_context",
+    "SkillRegistry": "skills",
+    "AgentTool": "tools.agent_tool",
+    "BaseTool": "tools.base",
+    "FunctionTool": "tools.function_tool",
+    "function_tool": "tools.function_tool",
+    "ProcessorTool": "tools.processor_tool",
+    "CacheControl": "types.content",
+    "Content": "types.content",
+    "InputImage": "types.content",
+    "InputRenderable": "types.content",
+    "InputRenderableModel": "types.content",
+    "Event": "types.events",
+    "ProcPacketOutEvent": "types.events",
+    "RunPacketOutEvent": "types.events",
+    "StopReason": "types.events",
+    "AssistantMessage": "types.items",
+    "DeveloperMessage": "types.items",
+    "SystemMessage": "types.items",
+    "UserMessage": "types.items",
+    "Packet": "types.packet",
+    "Response": "types.response",
+    "EventConsole": "ui.console",
+    "render_events": "ui.console",
+    "LoopedWorkflow": "workflow",
+    "SequentialWorkflow": "workflow",
+    "WorkflowProcessor": "workflow",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # The MCP names need the ``mcp`` extra; without it they raise ImportError.
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "LLM",
@@ -87,6 +162,7 @@ __all__ = [
     "LLMSettings",
     "LoopedWorkflow",
     "MCPClient",
+    "MCPClientPool",
     "MCPServerSSE",
     "MCPServerStdio",
     "MemoryEntry",
@@ -1,37 +1,86 @@
-from .agent_context import AgentContext
-from .agent_loop import AgentLoop
-from .approval_callback import (
-    DEFAULT_DENY_MESSAGE,
-    ApprovalCallback,
-    build_callback_approval,
-)
-from .approval_store import (
-    ApprovalAllow,
-    ApprovalDecision,
-    ApprovalDeny,
-    ApprovalScope,
-    ApprovalStore,
-    InMemoryApprovalStore,
-    LocalApprovalStore,
-    PendingApproval,
-    build_store_approval,
-)
-from .llm_agent import LLMAgent
-from .llm_agent_transcript import LLMAgentTranscript
-from .loop_state import (
-    NextStep,
-    NextStepContinue,
-    NextStepForceFinalAnswer,
-    NextStepRunTools,
-    NextStepStop,
-    decide_next_step,
-)
-from .tool_decision import (
-    AllowTool,
-    RaiseToolException,
-    RejectToolContent,
-    ToolCallDecision,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_context import AgentContext
+    from .agent_loop import AgentLoop
+    from .approval_callback import (
+        DEFAULT_DENY_MESSAGE,
+        ApprovalCallback,
+        build_callback_approval,
+    )
+    from .approval_store import (
+        ApprovalAllow,
+        ApprovalDecision,
+        ApprovalDeny,
+        ApprovalScope,
+        ApprovalStore,
+        InMemoryApprovalStore,
+        LocalApprovalStore,
+        PendingApproval,
+        build_store_approval,
+    )
+    from .llm_agent import LLMAgent
+    from .llm_agent_transcript import LLMAgentTranscript
+    from .loop_state import (
+        NextStep,
+        NextStepContinue,
+        NextStepForceFinalAnswer,
+        NextStepRunTools,
+        NextStepStop,
+        decide_next_step,
+    )
+    from .sqlite_approval_store import SqliteApprovalStore
+    from .tool_decision import (
+        AllowTool,
+        RaiseToolException,
+        RejectToolContent,
+        ToolCallDecision,
+    )
+
+# Resolved on first access, so importing one agent submodule (say the approval
+# store, from the session context) doesn't load the whole agent stack.
+_LAZY: dict[str, str] = {
+    "AgentContext": "agent_context",
+    "AgentLoop": "agent_loop",
+    "DEFAULT_DENY_MESSAGE": "approval_callback",
+    "ApprovalCallback": "approval_callback",
+    "build_callback_approval": "approval_callback",
+    "ApprovalAllow": "approval_store",
+    "ApprovalDecision": "approval_store",
+    "ApprovalDeny": "approval_store",
+    "ApprovalScope": "approval_store",
+    "ApprovalStore": "approval_store",
+    "InMemoryApprovalStore": "approval_store",
+    "LocalApprovalStore": "approval_store",
+    "PendingApproval": "approval_store",
+    "build_store_approval": "approval_store",
+    "LLMAgent": "llm_agent",
+    "LLMAgentTranscript": "llm_agent_transcript",
+    "NextStep": "loop_state",
+    "NextStepContinue": "loop_state",
+    "NextStepForceFinalAnswer": "loop_state",
+    "NextStepRunTools": "loop_state",
+    "NextStepStop": "loop_state",
+    "decide_next_step": "loop_state",
+    "SqliteApprovalStore": "sqlite_approval_store",
+    "AllowTool": "tool_decision",
+    "RaiseToolException": "tool_decision",
+    "RejectToolContent": "tool_decision",
+    "ToolCallDecision": "tool_decision",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "DEFAULT_DENY_MESSAGE",
@@ -56,6 +105,7 @@ __all__ = [
     "PendingApproval",
     "RaiseToolException",
     "RejectToolContent",
+    "SqliteApprovalStore",
     "ToolCallDecision",
     "build_callback_approval",
     "build_store_approval",
@@ -26,7 +26,7 @@ notified, never re-delivered).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
 
@@ -97,6 +97,12 @@ class AgentContext:
     # backgrounded / bubbled) output to the right agent's pane.
     agent_name: str = ""
 
+    # The last :meth:`snapshot`, returned again while nothing changed — so a
+    # checkpoint re-serializes this state only when it is dirty.
+    _last_snapshot: AgentContextState | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def create(
         cls,
@@ -165,9 +171,12 @@ class AgentContext:
         )
 
     def snapshot(self) -> AgentContextState:
-        """Capture the transcript-paired agent-context state."""
+        """
+        Capture the transcript-paired agent-context state. Returns the previous
+        snapshot object itself when the state has not changed since.
+        """
         read_file_state, dotfile_overrides = self.file_edit_state.export_state()
-        return AgentContextState(
+        state = AgentContextState(
             read_file_state=read_file_state,
             dotfile_overrides=dotfile_overrides,
             shell_cwd=self.shell_state.cwd,
@@ -182,6 +191,11 @@ class AgentContext:
             ),
             nb_exec_context_id=self.nb_kernel_holder.context_id,
         )
+        last = self._last_snapshot
+        if last is not None and last == state:
+            return last
+        self._last_snapshot = state
+        return state
 
     def restore(
         self,
@@ -276,7 +290,7 @@ class AgentContext:
         Runs only at quiescence (no live run); the persisted-head / filesystem
         crash protocol around it is the caller's.
         """
-        self.transcript.messages = self.transcript.messages[:message_count]
+        self.transcript.truncate(message_count)
 
         # Exported before the restore replaces it: a drained-but-unflushed
         # note's deferred flip is the only trace that the note (now truncated)
@@ -17,7 +17,8 @@ from grasp_agents.tools.base import (
     BaseTool,
     NamedToolChoice,
     ToolChoice,
-    batch_has_concurrency_conflict,
+    key_root,
+    tool_call_dependencies,
 )
 from grasp_agents.types.errors import AgentFinalAnswerError, LLMToolCallValidationError
 from grasp_agents.types.events import (
@@ -56,7 +57,7 @@ from grasp_agents.types.llm_events import (
     ResponseRetrying,
 )
 from grasp_agents.utils.errors import format_error_chain
-from grasp_agents.utils.streaming import stream_concurrent
+from grasp_agents.utils.streaming import DEFAULT_MAX_BUFFERED, stream_concurrent
 from grasp_agents.utils.validation import validate_obj_from_json_or_py_string
 
 from .loop_state import (
@@ -159,6 +160,7 @@ class AgentLoop[CtxT]:
     final_answer_as_tool_call: Final[bool]
     max_turns: Final[int]
     run_timeout: Final[float | None]
+    max_tool_concurrency: Final[int | None]
     force_react_mode: Final[bool]
     tracing_exclude_input_fields: Final[set[str] | None]
 
@@ -210,6 +212,7 @@ class AgentLoop[CtxT]:
         stream_llm: bool = True,
         max_turns: int,
         run_timeout: float | None = None,
+        max_tool_concurrency: int | None = None,
         tracing_exclude_input_fields: set[str] | None = None,
         force_react_mode: bool = False,
     ) -> None:
@@ -228,6 +231,7 @@ class AgentLoop[CtxT]:
         self.stream_llm = stream_llm
         self.max_turns = max_turns
         self.run_timeout = run_timeout
+        self.max_tool_concurrency = max_tool_concurrency
         self.force_react_mode = force_react_mode
         self.final_answer_type = final_answer_type
         self.final_answer_as_tool_call = final_answer_as_tool_call
@@ -385,6 +389,10 @@ class AgentLoop[CtxT]:
         # (paired with the ``untrusted_content`` system-prompt section).
         if untrusted:
             parts = wrap_untrusted(parts, source=call.name)
+        # Large image / file parts enter the transcript by reference.
+        blob_store = self.ctx.blob_store
+        if blob_store is not None and not isinstance(parts, str):
+            parts = await blob_store.offload_parts(parts)
 
         return FunctionToolOutputItem(
             call_id=call.call_id, output=parts, is_error=is_error
@@ -757,16 +765,26 @@ class AgentLoop[CtxT]:
                     )
                     for _, call, tool, inp in immediate
                 ]
-                # Serialize the batch (each stream drained fully before the
-                # next) when two calls need exclusive access to overlapping keys
-                # so their writes can't interleave; otherwise run concurrently.
-                # Per-stream failure isolation comes from ``merged.errors`` in
-                # both modes.
-                conflict = batch_has_concurrency_conflict(
-                    [(tool, inp) for _, _, tool, inp in immediate]
-                )
+                # A call starts only after the earlier calls whose keys it
+                # conflicts with (overlapping writes, or a write and a read)
+                # have finished, so those run in the model's order; everything
+                # else runs concurrently, within the agent-wide and per-tool
+                # budgets. Per-stream failure isolation comes from
+                # ``merged.errors`` either way.
                 merged = stream_concurrent(
-                    streams, max_concurrency=1 if conflict else None
+                    streams,
+                    max_concurrency=self.max_tool_concurrency,
+                    max_buffered=DEFAULT_MAX_BUFFERED,
+                    after=tool_call_dependencies(
+                        [(tool, inp) for _, _, tool, inp in immediate],
+                        root=key_root(self.ctx),
+                    ),
+                    groups=[tool.name for _, _, tool, _ in immediate],
+                    group_limits={
+                        tool.name: tool.max_concurrency
+                        for _, _, tool, _ in immediate
+                        if tool.max_concurrency is not None
+                    },
                 )
                 async for stream_idx, event in merged:
                     # Capture the tool's terminal event — its result
@@ -915,14 +933,10 @@ class AgentLoop[CtxT]:
         tool_calls = response.tool_call_items
         if not tool_calls:
             return []
-        answered = {
-            m.call_id
-            for m in self._agent_ctx.transcript.messages
-            if isinstance(m, FunctionToolOutputItem)
-        }
+        transcript = self._agent_ctx.transcript
         for tc in tool_calls:
             self._skip_call_ids.discard(tc.call_id)
-        return [tc for tc in tool_calls if tc.call_id not in answered]
+        return [tc for tc in tool_calls if not transcript.has_tool_result(tc.call_id)]
 
     def _close_dangling_tool_calls(
         self, response: Response
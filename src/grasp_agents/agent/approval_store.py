@@ -14,7 +14,9 @@ Use this when approvals need to:
 The agent task awaits an :class:`asyncio.Future`; external code
 completes it by calling :meth:`ApprovalStore.resolve`. The requesting
 task must stay alive between submit and resolve — if the process
-dies, pending approvals are lost.
+dies, pending approvals are lost. To share pending requests and
+allowlists between processes, use
+:class:`~grasp_agents.agent.sqlite_approval_store.SqliteApprovalStore`.
 
 Usage::
 
@@ -42,6 +44,8 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from grasp_agents.file_backend.atomic_write import atomic_write_text
+
 from .tool_decision import RejectToolContent, ToolCallDecision
 
 if TYPE_CHECKING:
@@ -228,22 +232,20 @@ class LocalApprovalStore:
                 if isinstance(vals, list)
             }
 
-    def _save_persistent(self) -> None:
+    async def _save_persistent(self) -> None:
+        """
+        Atomically rewrite ``persist_path`` from the current allowlists.
+
+        The snapshot is taken on the event loop (under ``_lock``); encoding and
+        the write run on a worker thread.
+        """
         if self._persist_path is None:
             return
-        self._persist_path.parent.mkdir(parents=True, exist_ok=True)
-        self._persist_path.write_text(
-            json.dumps(
-                {
-                    "always_approved": sorted(self._persistent_allowlist),
-                    "sessions": {
-                        key: sorted(keys)
-                        for key, keys in sorted(self._session_allowlist.items())
-                    },
-                },
-                indent=2,
-            )
+        snapshot = (
+            set(self._persistent_allowlist),
+            {key: set(keys) for key, keys in self._session_allowlist.items()},
         )
+        await asyncio.to_thread(_write_allowlists, self._persist_path, *snapshot)
 
     # --- ApprovalStore methods ---
 
@@ -273,10 +275,10 @@ class LocalApprovalStore:
                     self._session_allowlist.setdefault(session_key, set()).add(
                         pending.approval_key
                     )
-                    self._save_persistent()
+                    await self._save_persistent()
                 elif decision.scope is ApprovalScope.ALWAYS:
                     self._persistent_allowlist.add(pending.approval_key)
-                    self._save_persistent()
+                    await self._save_persistent()
         if fut is None:
             return False
         if not fut.done():
@@ -296,12 +298,12 @@ class LocalApprovalStore:
     async def add_persistent(self, approval_key: str) -> None:
         async with self._lock:
             self._persistent_allowlist.add(approval_key)
-            self._save_persistent()
+            await self._save_persistent()
 
     async def add_session(self, session_key: str, approval_key: str) -> None:
         async with self._lock:
             self._session_allowlist.setdefault(session_key, set()).add(approval_key)
-            self._save_persistent()
+            await self._save_persistent()
 
     async def clear_session(self, session_key: str) -> None:
         async with self._lock:
@@ -311,7 +313,18 @@ class LocalApprovalStore:
                 fut = self._futures.pop((session_key, call_id), None)
                 if fut is not None and not fut.done():
                     fut.cancel()
-            self._save_persistent()
+            await self._save_persistent()
+
+
+def _write_allowlists(
+    path: Path, persistent: set[str], sessions: dict[str, set[str]]
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "always_approved": sorted(persistent),
+        "sessions": {key: sorted(keys) for key, keys in sorted(sessions.items())},
+    }
+    atomic_write_text(path, json.dumps(payload, indent=2))
 
 
 # Deprecated alias: the store persists its allowlists to a local file, so the
@@ -1,9 +1,10 @@
+from __future__ import annotations
+
 import asyncio
 import contextlib
 import json
 import operator
 import time
-from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from logging import getLogger
@@ -17,7 +18,6 @@ from grasp_agents.context.system_reminder import (
     SESSION_RESUMED_SUBJECT,
     wrap_in_system_reminder,
 )
-from grasp_agents.durability.checkpoint_store import CheckpointStore
 from grasp_agents.durability.checkpoints import CheckpointKind
 from grasp_agents.durability.store_keys import (
     is_direct_child,
@@ -31,8 +31,6 @@ from grasp_agents.durability.task_record import (
     TaskRecord,
     TaskStatus,
 )
-from grasp_agents.session_context import SessionContext
-from grasp_agents.tools.base import BaseTool
 from grasp_agents.types.events import (
     BackgroundTaskCompletedEvent,
     BackgroundTaskInfo,
@@ -47,7 +45,6 @@ from grasp_agents.types.events import (
 from grasp_agents.types.items import FunctionToolCallItem, InputMessageItem
 from grasp_agents.utils.errors import format_error_chain
 
-from .llm_agent_transcript import LLMAgentTranscript
 from .task_progress import (
     append_task_log,
     excerpt_for_inline,
@@ -57,9 +54,15 @@ from .task_progress import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+    from grasp_agents.durability.checkpoint_store import CheckpointStore
     from grasp_agents.file_backend.base import FileBackend
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.tools.base import BaseTool
 
     from .agent_context import AgentContext
+    from .llm_agent_transcript import LLMAgentTranscript
 
 logger = getLogger(__name__)
 
@@ -98,14 +101,15 @@ def make_background_tasks_section(
     (``auto_background_at`` set). The tools are read live off the call's
     ``agent_ctx`` at prompt-build time, so tools wired after construction
     (e.g. by a team onto its residents) are picked up at the next run entry.
-    The KillTask line renders only when that tool is attached.
+    The KillTask line renders only when that tool is attached. The render is
+    memoized on the backgroundable tool names plus KillTask's presence.
     """
 
     def compute(
         *,
         ctx: SessionContext[Any] | None = None,
         exec_id: str | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
         **_: Any,
     ) -> str | None:
         del ctx, exec_id
@@ -155,7 +159,18 @@ def make_background_tasks_section(
 
         return "\n".join(lines)
 
-    return SystemPromptSection(name=section_name, compute=compute)
+    def cache_key(
+        *, agent_ctx: AgentContext | None = None, **_: Any
+    ) -> tuple[tuple[str, ...], bool] | None:
+        if agent_ctx is None:
+            return None
+        tools = agent_ctx.tools
+        backgroundable = tuple(
+            name for name, t in tools.items() if t.auto_background_at is not None
+        )
+        return backgroundable, "KillTask" in tools
+
+    return SystemPromptSection(name=section_name, compute=compute, cache_key=cache_key)
 
 
 def _make_launch_note(
@@ -770,7 +785,7 @@ class BackgroundTaskManager[CtxT]:
         *,
         ctx: SessionContext[CtxT],
         exec_id: str,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> tuple[Any, BackgroundTaskLaunchedEvent | None]:
         """
         Run a tool call, backgrounding it per ``tool.auto_background_at`` (assumed
@@ -990,7 +1005,7 @@ class BackgroundTaskManager[CtxT]:
     # --- Turn-boundary drain ---
 
     async def _append_log(
-        self, bt: BackgroundTask, text: str, backend: "FileBackend"
+        self, bt: BackgroundTask, text: str, backend: FileBackend
     ) -> None:
         """
         Mirror new stream ``text`` to the task's ``.grasp/tasks/<call_id>.log``
@@ -1245,7 +1260,7 @@ class BackgroundTaskManager[CtxT]:
         task_key: str,
         ctx: SessionContext[CtxT] | None,
         exec_id: str | None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> bool:
         """Re-spawn a child task from its session checkpoint."""
         if not ctx or not exec_id or not ctx.checkpoint_store:
@@ -1294,7 +1309,7 @@ class BackgroundTaskManager[CtxT]:
         *,
         ctx: SessionContext[CtxT] | None = None,
         exec_id: str | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
         task_launch_seq: int | None = None,
     ) -> list[InputMessageItem]:
         """
@@ -11,10 +11,20 @@ project or compact. This keeps the loop focused on the generate → tools cycle
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from typing import TYPE_CHECKING
 
-from grasp_agents.context.compaction import Budgeted, ContextBudget, count_turns
-from grasp_agents.context.projection import apply_folds, repair_tool_call_pairing
+from grasp_agents.context.compaction import (
+    Budgeted,
+    ContextBudget,
+    Speculative,
+)
+from grasp_agents.context.projection import (
+    apply_folds,
+    apply_view_edits,
+    repair_tool_call_pairing,
+)
+from grasp_agents.hooks import ViewEditor
 from grasp_agents.llm.token_counting import count_input_tokens
 from grasp_agents.types.events import CompactionEvent, CompactionInfo
 
@@ -63,6 +73,16 @@ class ContextWindowManager:
         # dropped past a rollback rewind.
         self.folds: list[FoldSpec] = []
 
+        # Folded-body cache: ``apply_folds`` over the first ``_folded_len`` log
+        # messages under ``_folded_folds``. The log is append + suffix-truncate
+        # only, so while the folds are unchanged and the item at
+        # ``_folded_len - 1`` is still ``_folded_tail``, new messages are appended
+        # to it instead of re-folding the whole log.
+        self._folded: list[InputItem] = []
+        self._folded_len = 0
+        self._folded_folds: list[FoldSpec] = []
+        self._folded_tail: InputItem | None = None
+
         # Budget anchor: the last response's exact reported input_tokens over the
         # first ``_last_counted_len`` log messages; the turn's new messages are
         # counted on top via litellm. ``_pending_view_count`` is the basis of the
@@ -100,6 +120,8 @@ class ContextWindowManager:
     def set_compactor(self, compactor: Compactor) -> None:
         if isinstance(compactor, Budgeted) and compactor.budget is None:
             compactor.budget = self.default_budget()
+        if compactor is not self.compactor:
+            self.cancel_speculation()
         self.compactor = compactor
 
     # --- view derivation ---
@@ -115,16 +137,47 @@ class ContextWindowManager:
         so step rollback stays valid across compaction. They run as a pipeline in
         registration order; with none registered the conversation passes through
         unchanged. A projection can orphan a ``tool_call`` / ``tool_result`` pair,
-        so the final view is repaired once before the call. The view is never
-        written back to the transcript.
+        so the final view is repaired once before the call (skipped when only
+        folds on the transcript's indexed turn boundaries shape it). The view is
+        never written back to the transcript.
         """
         self._pending_view_count = len(self._transcript.messages)
         if not self.folds and not self.view_projectors:
             # No compaction: the log is pairing-valid and the header adds no tool
             # calls, so the prepended view needs no repair.
             return [*self.initial_context, *self._transcript.messages]
+        if not self.view_projectors and all(
+            self._transcript.is_turn_boundary(fold.start)
+            and self._transcript.is_turn_boundary(fold.end)
+            for fold in self.folds
+        ):
+            # Folds cut on turn boundaries orphan no pair: no repair needed either.
+            return [*self.initial_context, *self._folded_body()]
         body = await self._build_view_body(exec_id=exec_id)
-        return repair_tool_call_pairing([*self.initial_context, *body])
+        return repair_tool_call_pairing(chain(self.initial_context, body))
+
+    def _folded_body(self) -> list[InputItem]:
+        """
+        The log with folds applied, patched incrementally as the log grows. The
+        returned list is the cache itself — callers must not mutate it.
+        """
+        messages = self._transcript.messages
+        n = self._folded_len
+        if (
+            n > len(messages)
+            or (n > 0 and messages[n - 1] is not self._folded_tail)
+            or self._folded_folds != self.folds
+            # A fold past the cached end was skipped as out of bounds; re-fold
+            # so it applies once the log covers it.
+            or any(f.end > n for f in self.folds)
+        ):
+            self._folded = apply_folds(messages, self.folds)
+            self._folded_folds = list(self.folds)
+        else:
+            self._folded.extend(messages[n:])
+        self._folded_len = len(messages)
+        self._folded_tail = messages[-1] if messages else None
+        return self._folded
 
     async def _build_view_body(self, *, exec_id: str) -> Sequence[InputItem]:
         """
@@ -132,16 +185,33 @@ class ContextWindowManager:
         without the header or pairing repair. Folds (summarized spans) apply
         first; projectors then trim what remains. Both shape the view, never the
         log.
+
+        The folded body is cached across turns and copied at most once: a
+        :class:`~grasp_agents.hooks.ViewEditor` contributes sparse edits applied
+        in place, and a plain projector receives the working list directly.
         """
-        body: Sequence[InputItem] = self._transcript.messages
-        if self.folds:
-            body = apply_folds(body, self.folds)
-        if self.view_projectors:
-            input_tokens = self.effective_input_tokens()
-            for project in self.view_projectors:
-                body = await project(
-                    list(body), exec_id=exec_id, input_tokens=input_tokens
+        body = self._folded_body() if self.folds else self._transcript.messages
+        if not self.view_projectors:
+            return body
+
+        input_tokens = self.effective_input_tokens()
+        owned = False  # ``body`` is a private copy, safe to edit in place
+        for project in self.view_projectors:
+            if isinstance(project, ViewEditor):
+                edits = await project.edits(
+                    body, exec_id=exec_id, input_tokens=input_tokens
                 )
+                if edits:
+                    if not owned:
+                        body, owned = list(body), True
+                    apply_view_edits(body, edits)
+                continue
+            if not owned:
+                body, owned = list(body), True
+            projected = await project(body, exec_id=exec_id, input_tokens=input_tokens)
+            # A projector may return a list it keeps; only our own copy is editable.
+            owned = projected is body
+            body = projected if isinstance(projected, list) else list(projected)
         return body
 
     # --- token accounting ---
@@ -163,7 +233,7 @@ class ContextWindowManager:
             if not delta:
                 return self._last_input_tokens
             return self._last_input_tokens + count_input_tokens(model, delta)
-        view = [*self.initial_context, *apply_folds(messages, self.folds)]
+        view = [*self.initial_context, *self._folded_body()]
         return count_input_tokens(model, view)
 
     def _anchor_valid(self) -> bool:
@@ -240,14 +310,13 @@ class ContextWindowManager:
 
     def compaction_event(self, fold: FoldSpec, *, exec_id: str) -> CompactionEvent:
         """The event announcing a recorded fold (the reduced view size + summary)."""
-        messages = self._transcript.messages
         budget = getattr(self.compactor, "budget", None)
         return CompactionEvent(
             source=self._source,
             exec_id=exec_id,
             data=CompactionInfo(
-                folded_turns=count_turns(messages[fold.start : fold.end]),
-                preserved_turns=count_turns(messages[fold.end :]),
+                folded_turns=self._transcript.count_turns(fold.start, fold.end),
+                preserved_turns=self._transcript.count_turns(fold.end),
                 context_tokens=self.effective_input_tokens(),
                 context_window=getattr(budget, "max_input_tokens", None),
                 summary=fold.summary,
@@ -256,12 +325,23 @@ class ContextWindowManager:
 
     def load_folds(self, folds: Sequence[FoldSpec]) -> None:
         """Replace folds from a restored checkpoint."""
+        self.cancel_speculation()
         self.folds = list(folds)
 
     def drop_folds_after(self, message_count: int) -> None:
         """Drop folds whose span extends past a rollback rewind point."""
+        self.cancel_speculation()
         self.folds = [f for f in self.folds if f.end <= message_count]
 
+    def cancel_speculation(self) -> None:
+        """
+        Cancel the compactor's background summary, if it keeps one. Speculation
+        is never persisted, so this only discards work that a fold would have
+        reused.
+        """
+        if isinstance(self.compactor, Speculative):
+            self.compactor.cancel_speculation()
+
     @property
     def context_window(self) -> int | None:
         """The input-token window compaction targets — from a registered budget."""
@@ -1,9 +1,9 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 import time
-from collections.abc import AsyncIterator, Mapping, Sequence
 from copy import deepcopy
-from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,10 +14,36 @@ from typing import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping, Sequence
+    from pathlib import Path
+
     from grasp_agents.context.prompt_builder import (
         InputAttachment,
+        SectionStats,
         SystemPromptSection,
     )
+    from grasp_agents.hooks import (
+        AfterLlmHook,
+        AfterToolHook,
+        BeforeLlmHook,
+        BeforeToolHook,
+        Compactor,
+        FinalAnswerExtractor,
+        InitialContextBuilder,
+        InputContentBuilder,
+        OutputParser,
+        ToolInputConverter,
+        ToolOutputConverter,
+        ViewProjector,
+    )
+    from grasp_agents.llm.llm import LLM
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.tools.base import BaseTool
+    from grasp_agents.types.content import Content, InputImage
+    from grasp_agents.types.io import LLMPrompt, ProcName
+    from grasp_agents.types.response import Response
+
+    from .tool_decision import ToolCallDecision
 
 from pydantic import BaseModel
 
@@ -36,33 +62,15 @@ from grasp_agents.durability.checkpoints import (
     StepWatermark,
 )
 from grasp_agents.durability.resume import prepare_messages_for_resume
-from grasp_agents.hooks import (
-    AfterLlmHook,
-    AfterToolHook,
-    BeforeLlmHook,
-    BeforeToolHook,
-    Compactor,
-    FinalAnswerExtractor,
-    InitialContextBuilder,
-    InputContentBuilder,
-    OutputParser,
-    ToolInputConverter,
-    ToolOutputConverter,
-    ViewProjector,
-)
-from grasp_agents.llm.llm import LLM
 from grasp_agents.memory.injection import (
     make_memory_section,
     relevant_memories_attachment,
 )
 from grasp_agents.processors.processor import Processor
 from grasp_agents.sandbox.environment import SnapshotCapable
-from grasp_agents.session_context import SessionContext
 from grasp_agents.skills.injection import make_skills_section
 from grasp_agents.skills.types import SkillFilter
 from grasp_agents.telemetry import SpanKind
-from grasp_agents.tools.base import BaseTool
-from grasp_agents.types.content import Content, InputImage
 from grasp_agents.types.errors import ProcInputValidationError
 from grasp_agents.types.events import (
     Event,
@@ -71,10 +79,8 @@ from grasp_agents.types.events import (
     SystemMessageEvent,
     UserMessageEvent,
 )
-from grasp_agents.types.io import LLMPrompt, ProcName
 from grasp_agents.types.items import FunctionToolCallItem, InputItem, InputMessageItem
 from grasp_agents.types.message import USER_SENDER
-from grasp_agents.types.response import Response
 from grasp_agents.utils.callbacks import is_method_overridden
 from grasp_agents.utils.io import get_prompt
 from grasp_agents.utils.validation import validate_obj_from_json_or_py_string
@@ -84,7 +90,6 @@ from .agent_loop import AgentLoop
 from .background_tasks import make_background_tasks_section
 from .context_window import ContextWindowManager
 from .llm_agent_transcript import LLMAgentTranscript
-from .tool_decision import ToolCallDecision
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -154,6 +159,10 @@ class LLMAgent[InT, OutT, CtxT](
         # Max concurrently-running background tasks (auto-backgrounded tool calls
         # / sub-agents). Hitting the cap errors until some finish.
         max_background: int = 16,
+        # Max foreground tool calls of one turn running at once (``None``:
+        # uncapped). Conflicting calls are ordered regardless; per-tool caps
+        # come from ``BaseTool.max_concurrency``.
+        max_tool_concurrency: int | None = None,
         # Force the agent to produce a separate message without tool calls
         # prior to calling tools [For non-reasoning LLMs only]
         force_react_mode: bool = False,
@@ -162,13 +171,13 @@ class LLMAgent[InT, OutT, CtxT](
         final_answer_as_tool_call: bool = False,
         # MCP integration (clients must be ``connect()``-ed before the
         # agent is constructed; pass a ``MCPClientSpec`` to filter tools)
-        mcp_clients: "Sequence[MCPClient | MCPClientSpec] | None" = None,
+        mcp_clients: Sequence[MCPClient | MCPClientSpec] | None = None,
         # Auto-attached environment-info section. ``True`` attaches the
         # default block (date / platform / os / cwd / model); ``False``
         # attaches nothing. Pass a ``SystemPromptSection`` built with
         # ``make_env_info_section(include=..., extra_fields=..., ...)`` to
         # control exactly which facts appear.
-        env_info: "bool | SystemPromptSection" = False,
+        env_info: bool | SystemPromptSection = False,
         # Memory feature toggle (opt-in). When True, the agent gets:
         # - the ``memory`` system-prompt section (taxonomy + index)
         # - the ``relevant_memories_attachment`` (per-turn surfacing)
@@ -189,14 +198,14 @@ class LLMAgent[InT, OutT, CtxT](
         # allowlist of skill names, ``skill_exclude`` a blocklist; both set
         # applies the intersection; both default ``None`` (the full
         # ``ctx.skills`` catalog). Mirrors ``MCPClientSpec(include=, exclude=)``.
-        skill_include: "Iterable[str] | None" = None,
-        skill_exclude: "Iterable[str] | None" = None,
+        skill_include: Iterable[str] | None = None,
+        skill_exclude: Iterable[str] | None = None,
         # Time-awareness toggle (opt-in). When True, each input message gets a
         # ``current_time`` ``InputAttachment`` — a live wall-clock stamp on the
         # *input* (not the cached system prompt, so no per-turn cache churn),
         # giving the agent a clock for deadlines / staleness / "now". Pass an
         # ``InputAttachment`` to customize. Default False.
-        time_aware: "bool | InputAttachment" = False,
+        time_aware: bool | InputAttachment = False,
         # Tracing on/off
         tracing_enabled: bool = True,
         # Fields to exclude from tracing input events
@@ -457,6 +466,7 @@ class LLMAgent[InT, OutT, CtxT](
             llm_output_schema=llm_output_schema,
             max_turns=max_turns,
             run_timeout=run_timeout,
+            max_tool_concurrency=max_tool_concurrency,
             force_react_mode=force_react_mode,
             final_answer_type=final_answer_type,
             final_answer_as_tool_call=final_answer_as_tool_call,
@@ -506,9 +516,9 @@ class LLMAgent[InT, OutT, CtxT](
 
     def _filter_mcp_tools(
         self,
-        client: "MCPClient",
-        include: "Iterable[str] | None",
-        exclude: "Iterable[str] | None",
+        client: MCPClient,
+        include: Iterable[str] | None,
+        exclude: Iterable[str] | None,
     ) -> list[BaseTool[BaseModel, Any, CtxT]]:
         """A connected client's tools, filtered by ``include`` ∧ not ``exclude``."""
         include_set = set(include) if include is not None else None
@@ -547,10 +557,15 @@ class LLMAgent[InT, OutT, CtxT](
         return self._prompt_builder.sys_prompt
 
     @property
-    def system_prompt_sections(self) -> tuple["SystemPromptSection", ...]:
+    def system_prompt_sections(self) -> tuple[SystemPromptSection, ...]:
         """Read-only view of registered system-prompt sections, in order."""
         return tuple(self._prompt_builder.system_prompt_sections)
 
+    @property
+    def system_prompt_section_stats(self) -> Mapping[str, SectionStats]:
+        """Per-section render counters (computes, cache hits, timings)."""
+        return self._prompt_builder.section_stats
+
     @property
     def in_prompt(self) -> LLMPrompt | None:
         return self._prompt_builder.in_prompt
@@ -622,6 +637,7 @@ class LLMAgent[InT, OutT, CtxT](
         or through the owning workflow/runner's ``aclose``). ``ctx`` is passed
         so ``cancel_all`` can persist CANCELLED task records.
         """
+        self._cw.cancel_speculation()
         await self._agent_ctx.close(ctx=self._ctx)
 
     @property
@@ -915,8 +931,13 @@ class LLMAgent[InT, OutT, CtxT](
                 # session persistence is silently inert — say so, once.
                 self._ctx.warn_unowned_session_record()
 
+        # Unchanged since the last save -> the same object, whose serialized
+        # form the head reuses (see ``_head_json``).
         agent_ctx_state = self._agent_ctx.snapshot()
-        if fs_snapshot_ref is None:
+        if fs_snapshot_ref is None and (
+            agent_ctx_state.ipy_exec_context_id is not None
+            or agent_ctx_state.nb_exec_context_id is not None
+        ):
             agent_ctx_state = agent_ctx_state.model_copy(
                 update={"ipy_exec_context_id": None, "nb_exec_context_id": None}
             )
@@ -930,10 +951,11 @@ class LLMAgent[InT, OutT, CtxT](
             fs_snapshot_ref=fs_snapshot_ref,
             agent_ctx_state=agent_ctx_state,
         )
+        # The head carries metadata and watermarks only; the log delta is
+        # taken from the live transcript past the persisted cursor.
         checkpoint = AgentCheckpoint(
             processor_name=self.name,
             session_key=self._ctx.session_key,
-            messages=list(self.transcript.messages),
             current=current,
             step_watermarks=list(self._step_watermarks),
             folds=list(self._cw.folds),
@@ -941,7 +963,9 @@ class LLMAgent[InT, OutT, CtxT](
             location=location,
             stop_reason=stop_reason,
         )
-        await self._serialize_agent_checkpoint(self._ctx, checkpoint)
+        await self._serialize_agent_checkpoint(
+            self._ctx, checkpoint, self.transcript.messages
+        )
 
         # Cache this head as the rewind point a *future* step will be cut from.
         self._committed = current
@@ -1115,13 +1139,14 @@ class LLMAgent[InT, OutT, CtxT](
             marker = AgentCheckpoint(
                 session_key=self._ctx.session_key,
                 processor_name=self.name,
-                messages=list(self.transcript.messages),
                 current=self._committed.model_copy(update={"step": step}),
                 step_watermarks=list(self._step_watermarks),
                 folds=list(self._cw.folds),
                 location=AgentCheckpointLocation.ROLLING_BACK,
             )
-            await self._serialize_rollback_checkpoint(self._ctx, marker)
+            await self._serialize_rollback_checkpoint(
+                self._ctx, marker, self.transcript.messages
+            )
 
         # Rewind the filesystem before cutting this agent's head: the head
         # still carries this boundary until ``_persist_rollback``, so a crash
@@ -1226,13 +1251,14 @@ class LLMAgent[InT, OutT, CtxT](
         checkpoint = AgentCheckpoint(
             session_key=self._ctx.session_key,
             processor_name=self.name,
-            messages=list(self.transcript.messages),
             current=current,
             step_watermarks=list(self._step_watermarks),
             folds=list(self._cw.folds),
             location=AgentCheckpointLocation.ROLLED_BACK,
         )
-        await self._serialize_rollback_checkpoint(self._ctx, checkpoint)
+        await self._serialize_rollback_checkpoint(
+            self._ctx, checkpoint, self.transcript.messages
+        )
 
     def parse_output_default(self, final_answer: str) -> OutT:
         return validate_obj_from_json_or_py_string(
@@ -1320,7 +1346,7 @@ class LLMAgent[InT, OutT, CtxT](
             return self._step
         return max(recorded, default=0) + 1
 
-    def _anchor_human_turn(self, message: "TeamMessage") -> None:
+    def _anchor_human_turn(self, message: TeamMessage) -> None:
         """
         A resident's rollback anchor: a human message about to be taken from
         the inbox starts a new step. Runs before the message's consumption seq
@@ -1392,6 +1418,9 @@ class LLMAgent[InT, OutT, CtxT](
                 ),
             )
 
+        if self._ctx.blob_store is not None:
+            (input_message,) = await self._ctx.blob_store.offload([input_message])
+
         # No mutations above this line.
         if self.reset_transcript_on_run:
             # A reset run starts a new conversation: drop the log (the system
@@ -1426,6 +1455,8 @@ class LLMAgent[InT, OutT, CtxT](
                 yield event
         finally:
             self._run_active = False
+            # A background summary must not outlive the run that started it.
+            self._cw.cancel_speculation()
 
     async def _process_stream_body(
         self,
@@ -1677,7 +1708,7 @@ class LLMAgent[InT, OutT, CtxT](
             ctx=self._ctx, exec_id=exec_id, agent_ctx=self._agent_ctx
         )
 
-    def add_system_prompt_section(self, section: "SystemPromptSection") -> None:
+    def add_system_prompt_section(self, section: SystemPromptSection) -> None:
         """
         Append a :class:`SystemPromptSection` to the agent's prompt builder.
 
@@ -1689,7 +1720,7 @@ class LLMAgent[InT, OutT, CtxT](
         """
         self._prompt_builder.add_system_prompt_section(section)
 
-    def add_input_attachment(self, attachment: "InputAttachment") -> None:
+    def add_input_attachment(self, attachment: InputAttachment) -> None:
         """
         Append an :class:`InputAttachment` to the agent's prompt builder.
 
@@ -1881,7 +1912,7 @@ class LLMAgent[InT, OutT, CtxT](
         if is_method_overridden("on_after_tool_impl", self, base_cls):
             self._loop.after_tool_hooks.append(self.on_after_tool_impl)
 
-    def copy(self) -> "LLMAgent[InT, OutT, CtxT]":
+    def copy(self) -> LLMAgent[InT, OutT, CtxT]:
         # LLM sharing: handled by LLM.__deepcopy__ (returns self)
         # Tool sharing: handled by BaseTool.__deepcopy__ (_copy_shared_attrs)
         return deepcopy(self)
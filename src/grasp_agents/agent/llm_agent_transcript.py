@@ -1,6 +1,7 @@
+from bisect import bisect_left, bisect_right
 from collections.abc import Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from grasp_agents.types.errors import TranscriptInvariantError
 from grasp_agents.types.items import (
@@ -8,9 +9,130 @@ from grasp_agents.types.items import (
     FunctionToolOutputItem,
     InputItem,
     InputMessageItem,
+    ReasoningItem,
 )
 
 
+class _TranscriptIndex:
+    """
+    Invariant state over the first ``length`` items of a message list, kept
+    current one appended item at a time.
+
+    Tracks the open tool calls (a multiset, as the pairing invariant counts
+    them), the turn boundaries (cuts that orphan no call and separate no
+    reasoning item from its calls — see ``context.compaction``), the positions
+    of each item kind, and the first input message wedged between a call and
+    its result. A *checkpoint* is a boundary where no call is open: all running
+    state is empty there, so a truncation rewinds to the latest checkpoint at
+    or before the cut and replays the few items of the turn it lands in.
+    """
+
+    def __init__(self) -> None:
+        self.source: list[InputItem] | None = None
+        self.length = 0
+        self.tail: InputItem | None = None
+
+        # Running state (empty at every checkpoint).
+        self.open_calls: dict[str, int] = {}
+        self.turn_open: set[str] = set()
+        self.reasoning_open = False
+
+        # Positional state (sorted; trimmed on rewind).
+        self.calls: list[int] = []
+        self.outputs: list[int] = []
+        self.inputs: list[int] = []
+        self.boundaries: list[int] = []
+        self.checkpoints: list[int] = []
+        self.answered: dict[str, int] = {}
+        # (position, role, call ids open there) of the first wedged input.
+        self.violation: tuple[int, str, list[str]] | None = None
+
+    def __eq__(self, other: object) -> bool:
+        # Derived state: never part of the owning transcript's equality.
+        return isinstance(other, _TranscriptIndex)
+
+    def in_sync(self, messages: list[InputItem]) -> bool:
+        """Whether ``messages`` extends (or equals) what the index covers."""
+        n = self.length
+        return (
+            messages is self.source
+            and n <= len(messages)
+            and (n == 0 or messages[n - 1] is self.tail)
+        )
+
+    def extend(self, messages: list[InputItem]) -> None:
+        for i in range(self.length, len(messages)):
+            self._push(i, messages[i])
+        self.source = messages
+        self.length = len(messages)
+        self.tail = messages[-1] if messages else None
+
+    def rewind(self, messages: list[InputItem], message_count: int) -> None:
+        """Cover only ``messages[:message_count]`` (called before the cut)."""
+        k = bisect_right(self.checkpoints, message_count)
+        checkpoint = self.checkpoints[k - 1] if k else 0
+
+        for item in messages[checkpoint : self.length]:
+            if isinstance(item, FunctionToolOutputItem):
+                left = self.answered[item.call_id] - 1
+                if left:
+                    self.answered[item.call_id] = left
+                else:
+                    del self.answered[item.call_id]
+
+        for positions in (self.calls, self.outputs, self.inputs):
+            del positions[bisect_left(positions, checkpoint) :]
+        del self.boundaries[bisect_right(self.boundaries, checkpoint) :]
+        del self.checkpoints[bisect_right(self.checkpoints, checkpoint) :]
+        if self.violation is not None and self.violation[0] >= checkpoint:
+            self.violation = None
+        self.open_calls.clear()
+        self.turn_open.clear()
+        self.reasoning_open = False
+
+        for i in range(checkpoint, message_count):
+            self._push(i, messages[i])
+        self.length = message_count
+        self.tail = messages[message_count - 1] if message_count else None
+
+    def open_call_ids(self) -> list[str]:
+        return [
+            call_id for call_id, count in self.open_calls.items() for _ in range(count)
+        ]
+
+    def _push(self, i: int, item: InputItem) -> None:
+        if isinstance(item, ReasoningItem):
+            self.reasoning_open = True
+
+        elif isinstance(item, FunctionToolCallItem):
+            self.calls.append(i)
+            self.open_calls[item.call_id] = self.open_calls.get(item.call_id, 0) + 1
+            self.turn_open.add(item.call_id)
+
+        elif isinstance(item, FunctionToolOutputItem):
+            self.outputs.append(i)
+            self.answered[item.call_id] = self.answered.get(item.call_id, 0) + 1
+            count = self.open_calls.get(item.call_id)
+            if count == 1:
+                del self.open_calls[item.call_id]
+            elif count is not None:
+                self.open_calls[item.call_id] = count - 1
+            self.turn_open.discard(item.call_id)
+            if not self.turn_open:
+                self.reasoning_open = False
+
+        elif isinstance(item, InputMessageItem):
+            self.inputs.append(i)
+            if self.open_calls and self.violation is None:
+                self.violation = (i, item.role, self.open_call_ids())
+            self.reasoning_open = False
+
+        if not self.turn_open and not self.reasoning_open:
+            self.boundaries.append(i + 1)
+            if not self.open_calls:
+                self.checkpoints.append(i + 1)
+
+
 class LLMAgentTranscript(BaseModel):
     """
     Per-run message history for :class:`LLMAgent` — the pure conversation log.
@@ -20,20 +142,38 @@ class LLMAgentTranscript(BaseModel):
     :class:`SessionContext.memory` (the memdir-backed knowledge store). The system
     prompt is not stored here — it lives in the ephemeral header
     (``initial_context``) the agent prepends to the model-facing view each turn.
+
+    The log's invariants (open tool calls, turn boundaries, per-kind positions)
+    are indexed incrementally: queries cost O(items appended since the last
+    one), and :meth:`truncate` rewinds the index rather than rebuilding it.
+    Assigning ``messages`` directly is allowed; the index notices and rebuilds
+    once on the next query.
     """
 
     messages: list[InputItem] = Field(default_factory=list[InputItem])
 
+    _index: _TranscriptIndex = PrivateAttr(default_factory=_TranscriptIndex)
+
     def clear(self) -> None:
         self.messages = []
 
     def truncate(self, message_count: int) -> None:
         if 0 <= message_count < len(self.messages):
+            index = self._index
+            if index.in_sync(self.messages) and message_count <= index.length:
+                index.rewind(self.messages, message_count)
             del self.messages[message_count:]
 
     def update(self, new_messages: Sequence[InputItem]) -> None:
         self.messages.extend(new_messages)
 
+    def _synced(self) -> _TranscriptIndex:
+        index = self._index
+        if not index.in_sync(self.messages):
+            index = self._index = _TranscriptIndex()
+        index.extend(self.messages)
+        return index
+
     def validate_tool_call_pairing(self) -> None:
         """
         Raise if a tool call isn't immediately resolved by its result.
@@ -43,31 +183,64 @@ class LLMAgentTranscript(BaseModel):
         (user / system / developer) message, and that none dangle
         unresolved at the end. Same-turn assistant items (reasoning, output
         text) between a call and its result are allowed — they're part of
-        the same assistant message. Called before each LLM generation.
+        the same assistant message. Called before each LLM generation; checks
+        only the items appended since the previous call.
 
         Raises:
             TranscriptInvariantError: On a wedged input message or a
                 dangling tool call.
 
         """
-        open_calls: list[str] = []
-        for item in self.messages:
-            if isinstance(item, FunctionToolCallItem):
-                open_calls.append(item.call_id)
-            elif isinstance(item, FunctionToolOutputItem):
-                if item.call_id in open_calls:
-                    open_calls.remove(item.call_id)
-            elif isinstance(item, InputMessageItem) and open_calls:
-                raise TranscriptInvariantError(
-                    f"Tool call(s) {open_calls} not resolved before a "
-                    f"{item.role!r} message: tool calls must be immediately "
-                    "followed by their tool results."
-                )
-        if open_calls:
+        index = self._synced()
+        if index.violation is not None:
+            _, role, open_calls = index.violation
+            raise TranscriptInvariantError(
+                f"Tool call(s) {open_calls} not resolved before a "
+                f"{role!r} message: tool calls must be immediately "
+                "followed by their tool results."
+            )
+        if index.open_calls:
             raise TranscriptInvariantError(
-                f"Transcript has unresolved tool call(s) with no result: {open_calls}."
+                "Transcript has unresolved tool call(s) with no result: "
+                f"{index.open_call_ids()}."
             )
 
+    def has_tool_result(self, call_id: str) -> bool:
+        """Whether the log holds a ``FunctionToolOutputItem`` for ``call_id``."""
+        return call_id in self._synced().answered
+
+    @property
+    def turn_boundaries(self) -> Sequence[int]:
+        """
+        Cut points of the whole log that keep every turn whole — the same as
+        ``context.compaction._turn_boundaries(messages)``, without the scan.
+        Read-only: the sequence is the index's own.
+        """
+        return self._synced().boundaries
+
+    def is_turn_boundary(self, position: int) -> bool:
+        """Whether cutting the log before ``messages[position]`` keeps turns whole."""
+        if position == 0:
+            return True
+        boundaries = self._synced().boundaries
+        i = bisect_left(boundaries, position)
+        return i < len(boundaries) and boundaries[i] == position
+
+    def count_turns(self, start: int = 0, end: int | None = None) -> int:
+        """
+        Number of whole turns in ``messages[start:end]`` — what
+        :func:`~grasp_agents.context.compaction.count_turns` returns for that
+        slice. Served from the index when ``start`` is a turn boundary (folds
+        always start on one); any other span is scanned.
+        """
+        end = len(self.messages) if end is None else min(end, len(self.messages))
+        if self.is_turn_boundary(start):
+            boundaries = self._synced().boundaries
+            return bisect_right(boundaries, end) - bisect_right(boundaries, start)
+        span = _TranscriptIndex()
+        span.extend(self.messages[start:end])
+        return len(span.boundaries)
+
     @property
     def is_empty(self) -> bool:
         return len(self.messages) == 0
@@ -84,10 +257,8 @@ class LLMAgentTranscript(BaseModel):
         not — so a message absorbed into a checkpointed log is always answered,
         even across a crash and resume, with nothing tracked outside the log.
         """
-        if not self.messages:
-            return False
         return isinstance(
-            self.messages[-1],
+            self._synced().tail,
             (InputMessageItem, FunctionToolOutputItem, FunctionToolCallItem),
         )
 
@@ -0,0 +1,464 @@
+"""
+SQLite-backed :class:`~grasp_agents.agent.approval_store.ApprovalStore`.
+
+:class:`LocalApprovalStore` keeps pending requests in process memory and
+rewrites one JSON file per decision. :class:`SqliteApprovalStore` keeps both in
+a single SQLite database instead, so several processes (API workers, a TUI and
+a worker pool, ...) can share one approval state:
+
+* **Indexed.** Allowlists are primary-keyed tables — ``is_pre_approved`` is
+  one index lookup however many sessions the store holds.
+* **Incremental and atomic.** Each decision is one row insert / update in its
+  own transaction (WAL journal), never a rewrite of the whole state.
+* **Cross-process.** A pending request is a row. Any process may list and
+  resolve it; the process that submitted it (and awaits its future) notices
+  the decision on its next poll. Polls check ``PRAGMA data_version`` first and
+  only query when another connection has committed since.
+* **Expiring.** ``session_ttl`` expires session-scoped approvals that many
+  seconds after they were (last) granted; ``pending_ttl`` drops pending rows
+  whose submitter vanished without resolving them. Expired rows stop matching
+  immediately and are deleted by :meth:`SqliteApprovalStore.purge_expired`,
+  which also runs periodically on writes.
+
+All database work runs on worker threads (``asyncio.to_thread``) over one
+connection, serialized by a lock.
+
+Usage::
+
+    store = SqliteApprovalStore(Path(".grasp/approvals.db"), session_ttl=86400)
+    ctx = SessionContext(approval_store=store, session_key="user-42")
+    ...
+    await store.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .approval_store import (
+    ApprovalAllow,
+    ApprovalDecision,
+    ApprovalDeny,
+    ApprovalScope,
+    PendingApproval,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from os import PathLike
+
+logger = getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS always_approved (
+    approval_key TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS session_approved (
+    session_key TEXT NOT NULL,
+    approval_key TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (session_key, approval_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pending (
+    session_key TEXT NOT NULL,
+    call_id TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    approval_key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    decision TEXT,
+    PRIMARY KEY (session_key, call_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS pending_by_owner ON pending (owner);
+CREATE INDEX IF NOT EXISTS session_approved_by_expiry
+    ON session_approved (expires_at) WHERE expires_at IS NOT NULL;
+"""
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Generator[None]:
+    """An immediate (write-locking) transaction, rolled back on error."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _encode_decision(decision: ApprovalDecision) -> str:
+    if isinstance(decision, ApprovalAllow):
+        return json.dumps({"allow": decision.scope.value})
+    return json.dumps({"deny": decision.reason})
+
+
+def _decode_decision(raw: str) -> ApprovalDecision:
+    data: dict[str, str] = json.loads(raw)
+    if "allow" in data:
+        return ApprovalAllow(scope=ApprovalScope(data["allow"]))
+    return ApprovalDeny(reason=data["deny"])
+
+
+class SqliteApprovalStore:
+    """
+    Durable, multi-process :class:`ApprovalStore` in a SQLite database.
+
+    ``path`` is created (with its parent directory) on first use.
+    ``session_ttl`` / ``pending_ttl`` are in seconds; ``None`` (the default)
+    keeps rows until cleared; set ``pending_ttl`` well above any approval
+    ``timeout`` the gate uses, since it also drops rows whose submitter is
+    still waiting. ``poll_interval`` is how often the submitting
+    process checks for decisions made by other processes while it has
+    requests outstanding.
+
+    Futures returned by :meth:`submit_pending` belong to the submitting store
+    instance: a request resolved elsewhere completes the future on the next
+    poll; one cleared elsewhere (``clear_session``, ``pending_ttl``) or
+    dropped by this instance's own ``pending_ttl`` purge cancels it, exactly
+    as a local ``clear_session`` does.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        *,
+        session_ttl: float | None = None,
+        pending_ttl: float | None = None,
+        poll_interval: float = 0.2,
+        purge_interval: float = 60.0,
+    ) -> None:
+        self._path = Path(path)
+        self._session_ttl = session_ttl
+        self._pending_ttl = pending_ttl
+        self._poll_interval = poll_interval
+        self._purge_interval = purge_interval
+        # Identifies this instance's rows in ``pending.owner``.
+        self._owner = uuid.uuid4().hex
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.Lock()
+        self._data_version = -1
+        self._last_purge = 0.0
+        self._futures: dict[tuple[str, str], asyncio.Future[ApprovalDecision]] = {}
+        self._watcher: asyncio.Task[None] | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    # --- ApprovalStore methods ---
+
+    async def submit_pending(
+        self, pending: PendingApproval
+    ) -> asyncio.Future[ApprovalDecision]:
+        await self._run(self._insert_pending, pending, time.time())
+        fut: asyncio.Future[ApprovalDecision] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._futures[pending.session_key, pending.call_id] = fut
+        self._ensure_watcher()
+        return fut
+
+    async def resolve(
+        self,
+        session_key: str,
+        call_id: str,
+        decision: ApprovalDecision,
+    ) -> bool:
+        found = await self._run(
+            self._resolve_row, session_key, call_id, decision, time.time()
+        )
+        fut = self._futures.pop((session_key, call_id), None)
+        if fut is None:
+            return found
+        if not fut.done():
+            fut.set_result(decision)
+        return True
+
+    async def list_pending(self, session_key: str) -> list[PendingApproval]:
+        return await self._run(self._select_pending, session_key, time.time())
+
+    async def is_pre_approved(self, approval_key: str, *, session_key: str) -> bool:
+        return await self._run(
+            self._select_approved, approval_key, session_key, time.time()
+        )
+
+    async def add_persistent(self, approval_key: str) -> None:
+        await self._run(self._insert_persistent, approval_key)
+
+    async def add_session(self, session_key: str, approval_key: str) -> None:
+        await self._run(self._insert_session, session_key, approval_key, time.time())
+
+    async def clear_session(self, session_key: str) -> None:
+        await self._run(self._delete_session, session_key)
+        for key in [k for k in self._futures if k[0] == session_key]:
+            fut = self._futures.pop(key)
+            if not fut.done():
+                fut.cancel()
+
+    # --- Maintenance ---
+
+    async def purge_expired(self) -> int:
+        """Delete expired session approvals and stale pending rows; return count."""
+        return await self._run(self._purge, time.time())
+
+    async def close(self) -> None:
+        """Stop polling and close the connection. Outstanding futures stay open."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+        await asyncio.to_thread(self._close)
+
+    # --- Cross-process delivery ---
+
+    def _ensure_watcher(self) -> None:
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        while self._futures:
+            await asyncio.sleep(self._poll_interval)
+            if not self._futures:
+                break
+            try:
+                rows = await self._run(self._select_owned)
+            except sqlite3.Error:
+                logger.warning("Approval poll of %s failed", self._path, exc_info=True)
+                continue
+            if rows is None:
+                continue
+            for key in list(self._futures):
+                if key in rows and rows[key] is None:
+                    continue
+                fut = self._futures.pop(key)
+                if fut.done():
+                    continue
+                raw = rows.get(key)
+                if raw is None:
+                    fut.cancel()
+                else:
+                    fut.set_result(_decode_decision(raw))
+
+    # --- Database (worker thread) ---
+
+    async def _run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.to_thread(self._locked, fn, *args)
+
+    def _locked[T](self, fn: Callable[..., T], *args: Any) -> T:
+        with self._conn_lock:
+            return fn(self._connect(), *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _close(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _maybe_purge(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._last_purge >= self._purge_interval:
+            self._purge_rows(conn, now)
+
+    def _purge(self, conn: sqlite3.Connection, now: float) -> int:
+        with _transaction(conn):
+            return self._purge_rows(conn, now)
+
+    def _purge_rows(self, conn: sqlite3.Connection, now: float) -> int:
+        self._last_purge = now
+        removed = conn.execute(
+            "DELETE FROM session_approved WHERE expires_at <= ?", (now,)
+        ).rowcount
+        if self._pending_ttl is not None:
+            dropped = conn.execute(
+                "DELETE FROM pending WHERE created_at <= ?",
+                (now - self._pending_ttl,),
+            ).rowcount
+            if dropped:
+                # ``data_version`` ignores this connection's own commits, so
+                # force the next poll to re-read owned rows and cancel the
+                # futures of any this purge dropped.
+                self._data_version = -1
+            removed += dropped
+        return removed
+
+    def _insert_pending(
+        self, conn: sqlite3.Connection, pending: PendingApproval, now: float
+    ) -> None:
+        with _transaction(conn):
+            self._maybe_purge(conn, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO pending VALUES (?, ?, ?, ?, ?, ?, ?, NULL)",
+                (
+                    pending.session_key,
+                    pending.call_id,
+                    pending.tool_name,
+                    pending.arguments,
+                    pending.approval_key,
+                    self._owner,
+                    now,
+                ),
+            )
+
+    def _resolve_row(
+        self,
+        conn: sqlite3.Connection,
+        session_key: str,
+        call_id: str,
+        decision: ApprovalDecision,
+        now: float,
+    ) -> bool:
+        with _transaction(conn):
+            self._maybe_purge(conn, now)
+            row = conn.execute(
+                "SELECT approval_key, owner FROM pending "
+                "WHERE session_key = ? AND call_id = ? AND decision IS NULL",
+                (session_key, call_id),
+            ).fetchone()
+            if row is None:
+                return False
+            approval_key, owner = row
+            if owner == self._owner:
+                conn.execute(
+                    "DELETE FROM pending WHERE session_key = ? AND call_id = ?",
+                    (session_key, call_id),
+                )
+            else:
+                # The submitting process picks the decision up and deletes it.
+                conn.execute(
+                    "UPDATE pending SET decision = ? "
+                    "WHERE session_key = ? AND call_id = ?",
+                    (_encode_decision(decision), session_key, call_id),
+                )
+            if isinstance(decision, ApprovalAllow):
+                if decision.scope is ApprovalScope.SESSION:
+                    self._upsert_session(conn, session_key, approval_key, now)
+                elif decision.scope is ApprovalScope.ALWAYS:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO always_approved VALUES (?)",
+                        (approval_key,),
+                    )
+            return True
+
+    def _select_pending(
+        self, conn: sqlite3.Connection, session_key: str, now: float
+    ) -> list[PendingApproval]:
+        cutoff = now - self._pending_ttl if self._pending_ttl is not None else None
+        rows = conn.execute(
+            "SELECT call_id, tool_name, arguments, approval_key FROM pending "
+            "WHERE session_key = ? AND decision IS NULL "
+            "AND (? IS NULL OR created_at > ?) ORDER BY created_at",
+            (session_key, cutoff, cutoff),
+        ).fetchall()
+        return [
+            PendingApproval(
+                session_key=session_key,
+                call_id=call_id,
+                tool_name=tool_name,
+                arguments=arguments,
+                approval_key=approval_key,
+            )
+            for call_id, tool_name, arguments, approval_key in rows
+        ]
+
+    def _select_approved(
+        self,
+        conn: sqlite3.Connection,
+        approval_key: str,
+        session_key: str,
+        now: float,
+    ) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM always_approved WHERE approval_key = ? "
+            "UNION ALL SELECT 1 FROM session_approved "
+            "WHERE session_key = ? AND approval_key = ? "
+            "AND (expires_at IS NULL OR expires_at > ?) LIMIT 1",
+            (approval_key, session_key, approval_key, now),
+        ).fetchone()
+        return row is not None
+
+    def _select_owned(
+        self, conn: sqlite3.Connection
+    ) -> dict[tuple[str, str], str | None] | None:
+        """
+        This instance's pending rows and their decisions.
+
+        ``None`` when no other connection has committed since the last call
+        (nothing can have changed).
+        """
+        (version,) = conn.execute("PRAGMA data_version").fetchone()
+        if version == self._data_version:
+            return None
+        self._data_version = version
+        rows = conn.execute(
+            "SELECT session_key, call_id, decision FROM pending WHERE owner = ?",
+            (self._owner,),
+        ).fetchall()
+        owned: dict[tuple[str, str], str | None] = {}
+        for session_key, call_id, decision in rows:
+            owned[session_key, call_id] = decision
+        if any(decision is not None for decision in owned.values()):
+            with _transaction(conn):
+                conn.execute(
+                    "DELETE FROM pending WHERE owner = ? AND decision IS NOT NULL",
+                    (self._owner,),
+                )
+        return owned
+
+    def _insert_persistent(self, conn: sqlite3.Connection, approval_key: str) -> None:
+        conn.execute(
+            "INSERT OR IGNORE INTO always_approved VALUES (?)", (approval_key,)
+        )
+
+    def _insert_session(
+        self,
+        conn: sqlite3.Connection,
+        session_key: str,
+        approval_key: str,
+        now: float,
+    ) -> None:
+        with _transaction(conn):
+            self._maybe_purge(conn, now)
+            self._upsert_session(conn, session_key, approval_key, now)
+
+    def _upsert_session(
+        self,
+        conn: sqlite3.Connection,
+        session_key: str,
+        approval_key: str,
+        now: float,
+    ) -> None:
+        expires_at = now + self._session_ttl if self._session_ttl is not None else None
+        conn.execute(
+            "INSERT INTO session_approved VALUES (?, ?, ?) "
+            "ON CONFLICT (session_key, approval_key) "
+            "DO UPDATE SET expires_at = excluded.expires_at",
+            (session_key, approval_key, expires_at),
+        )
+
+    def _delete_session(self, conn: sqlite3.Connection, session_key: str) -> None:
+        with _transaction(conn):
+            conn.execute(
+                "DELETE FROM session_approved WHERE session_key = ?", (session_key,)
+            )
+            conn.execute("DELETE FROM pending WHERE session_key = ?", (session_key,))
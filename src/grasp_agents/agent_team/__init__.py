@@ -7,7 +7,9 @@ messages to each other over a shared mailbox
 :class:`~grasp_agents.runtime.Transport`
 (:class:`~grasp_agents.mailbox.InMemoryMailboxTransport` for a single process, or
 :class:`~grasp_agents.mailbox.CheckpointMailboxTransport` for durable delivery over
-the session checkpoint store). See ``docs/experimental/agent-team``.
+the session checkpoint store, optionally push-notified across processes by a
+:class:`~grasp_agents.mailbox_broker.MailboxBroker`). See
+``docs/experimental/agent-team``.
 """
 
 from __future__ import annotations
@@ -16,6 +18,7 @@ from grasp_agents.mailbox import (
     CheckpointMailboxTransport,
     InMemoryMailboxTransport,
 )
+from grasp_agents.mailbox_broker import MailboxBroker, MailboxNotifier
 
 from .agent_card import MemberCard
 from .agent_team import AgentTeam, TeamRunResult
@@ -39,6 +42,8 @@ __all__ = [
     "AgentTeam",
     "CheckpointMailboxTransport",
     "InMemoryMailboxTransport",
+    "MailboxBroker",
+    "MailboxNotifier",
     "MemberCard",
     "MemberHost",
     "MessageDeliveredEvent",
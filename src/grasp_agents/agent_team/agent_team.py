@@ -62,6 +62,7 @@ if TYPE_CHECKING:
     from grasp_agents.runtime import Transport
     from grasp_agents.tools.base import BaseTool
     from grasp_agents.types.events import Event
+    from grasp_agents.usage_tracker import UsageBudget
 
 logger = logging.getLogger(__name__)
 
@@ -212,6 +213,12 @@ class AgentTeam[CtxT](CheckpointPersistMixin):
             ctx if ctx is not None else current_session_context()  # type: ignore[assignment]
         )
 
+        # Roll member usage up into a team scope on the session ledger
+        # (``usage_tracker.usage_for(team_name)``).
+        for member_name in self._members_by_name:
+            if member_name != self._name:
+                self._ctx.usage_tracker.set_parent(member_name, self._name)
+
         # The lead holds the session's environment-rewind right; claiming here
         # makes a conflict (e.g. a ctx that already declares a different
         # rewinder) a construction error, not a mid-run one.
@@ -289,7 +296,7 @@ class AgentTeam[CtxT](CheckpointPersistMixin):
 
         self._hop_exhausted = False
         self._token_exhausted = False
-        self._tokens_at_start = 0
+        self._token_budget: UsageBudget | None = None
         self._hops_at_start = 0
         # Posts mid-flight between the budget count (saved first, conservative)
         # and the transport deposit; quiescence holds while any are in flight.
@@ -480,6 +487,10 @@ class AgentTeam[CtxT](CheckpointPersistMixin):
         # would otherwise stack a stale callback per build, and one rewind
         # would post duplicate notices.
         self._ctx.remove_environment_restored_callback(self._notify_environment_rewind)
+        # Likewise detach the members' usage rollup into this team's scope.
+        for member_name in self._members_by_name:
+            if member_name != self._name:
+                self._ctx.usage_tracker.remove_parent(member_name, self._name)
         for member in self._members:
             try:
                 await member.aclose()
@@ -549,7 +560,16 @@ class AgentTeam[CtxT](CheckpointPersistMixin):
 
         # Baseline the per-run token budget here; on resume this rebases (the budget
         # bounds this run's own spend, generous across restarts — like max_hops).
-        self._tokens_at_start = self._ctx.usage_tracker.total_usage.total_tokens
+        # The ledger flags the budget as usage is recorded, so the per-post check
+        # is O(1) rather than a re-sum of the session's usage.
+        tracker = self._ctx.usage_tracker
+        if self._token_budget is not None:
+            tracker.remove_budget(self._token_budget)
+        self._token_budget = (
+            tracker.add_budget(max_tokens=self._max_tokens)
+            if self._max_tokens is not None
+            else None
+        )
         self._token_exhausted = False
         self._hop_exhausted = False
 
@@ -612,6 +632,8 @@ class AgentTeam[CtxT](CheckpointPersistMixin):
             # let a later wakeup/source ``post`` count hops and deposit mail
             # against a run that no longer exists.
             self._driver = None
+            if self._token_budget is not None:
+                self._ctx.usage_tracker.remove_budget(self._token_budget)
 
         yield TeamEndedEvent(
             source=self._name,
@@ -842,10 +864,7 @@ class AgentTeam[CtxT](CheckpointPersistMixin):
         Whether this run's token spend (delta from its start baseline) has
         reached ``max_tokens``. Always ``False`` when no budget is set.
         """
-        if self._max_tokens is None:
-            return False
-        spent = self._ctx.usage_tracker.total_usage.total_tokens - self._tokens_at_start
-        return spent >= self._max_tokens
+        return self._token_budget is not None and self._token_budget.exceeded
 
     def _final_stop_reason(self) -> TeamStopReason:
         if self._failed:
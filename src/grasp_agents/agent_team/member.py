@@ -58,6 +58,13 @@ class MemberHost:
     name. Human input is posted to the same mailbox as control-plane mail (it drains
     ahead of peer messages). For a single-process team, use
     :class:`~.agent_team.AgentTeam` instead.
+
+    The shared mailbox is polled by default. For immediate cross-process
+    hand-offs, build each process's session with a notifying transport —
+    ``transport=CheckpointMailboxTransport(store, session_key=...,
+    notifier=MailboxNotifier(sock_path, start_broker=True))`` — so every post
+    wakes the recipient's process through a
+    :class:`~grasp_agents.mailbox_broker.MailboxBroker`.
     """
 
     def __init__(
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from grasp_agents.context.prompt_builder import InputAttachment, SystemPromptSection
+from grasp_agents.context.prompt_builder import (
+    InputAttachment,
+    SystemPromptSection,
+    static_cache_key,
+)
 
 from .message import USER_SENDER
 
@@ -81,7 +85,9 @@ def make_team_section(
     def compute(**_: Any) -> str:
         return text
 
-    return SystemPromptSection(name=section_name, compute=compute)
+    return SystemPromptSection(
+        name=section_name, compute=compute, cache_key=static_cache_key
+    )
 
 
 def make_rewind_notice(rewinder: str) -> str:
@@ -8,37 +8,88 @@ section/attachment vocabulary (:class:`SystemPromptSection`,
 Future context-window management (compaction) lands here too.
 """
 
-from .compaction import (
-    CollapseToolOutputsProjector,
-    Compaction,
-    ContextBudget,
-    LLMSummarizer,
-    Summarizer,
-    SummarizingCompactor,
-    collapse_tool_outputs,
-)
-from .env_section import (
-    CURRENT_TIME_ATTACHMENT_NAME,
-    ENV_INFO_SECTION_NAME,
-    make_current_time_attachment,
-    make_env_info_section,
-)
-from .prompt_builder import (
-    InputAttachment,
-    InputAttachmentCompute,
-    PromptBuilder,
-    SectionCompute,
-    SystemPromptSection,
-)
-from .system_reminder import SYSTEM_REMINDER_TAG, wrap_in_system_reminder
-from .untrusted_content import (
-    UNTRUSTED_CONTENT_INSTRUCTION,
-    UNTRUSTED_CONTENT_SECTION_NAME,
-    UNTRUSTED_CONTENT_TAG,
-    make_untrusted_content_section,
-    unwrap_untrusted,
-    wrap_untrusted,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .compaction import (
+        CollapseToolOutputsProjector,
+        Compaction,
+        ContextBudget,
+        LLMSummarizer,
+        Summarizer,
+        SummarizingCompactor,
+        collapse_tool_output_edits,
+        collapse_tool_outputs,
+    )
+    from .env_section import (
+        CURRENT_TIME_ATTACHMENT_NAME,
+        ENV_INFO_SECTION_NAME,
+        make_current_time_attachment,
+        make_env_info_section,
+    )
+    from .prompt_builder import (
+        InputAttachment,
+        InputAttachmentCompute,
+        PromptBuilder,
+        SectionCacheKey,
+        SectionCompute,
+        SectionStats,
+        SystemPromptSection,
+        static_cache_key,
+    )
+    from .system_reminder import SYSTEM_REMINDER_TAG, wrap_in_system_reminder
+    from .untrusted_content import (
+        UNTRUSTED_CONTENT_INSTRUCTION,
+        UNTRUSTED_CONTENT_SECTION_NAME,
+        UNTRUSTED_CONTENT_TAG,
+        make_untrusted_content_section,
+        unwrap_untrusted,
+        wrap_untrusted,
+    )
+
+_LAZY: dict[str, str] = {
+    "CollapseToolOutputsProjector": "compaction",
+    "Compaction": "compaction",
+    "ContextBudget": "compaction",
+    "LLMSummarizer": "compaction",
+    "Summarizer": "compaction",
+    "SummarizingCompactor": "compaction",
+    "collapse_tool_output_edits": "compaction",
+    "collapse_tool_outputs": "compaction",
+    "CURRENT_TIME_ATTACHMENT_NAME": "env_section",
+    "ENV_INFO_SECTION_NAME": "env_section",
+    "make_current_time_attachment": "env_section",
+    "make_env_info_section": "env_section",
+    "InputAttachment": "prompt_builder",
+    "InputAttachmentCompute": "prompt_builder",
+    "PromptBuilder": "prompt_builder",
+    "SectionCacheKey": "prompt_builder",
+    "SectionCompute": "prompt_builder",
+    "SectionStats": "prompt_builder",
+    "SystemPromptSection": "prompt_builder",
+    "static_cache_key": "prompt_builder",
+    "SYSTEM_REMINDER_TAG": "system_reminder",
+    "wrap_in_system_reminder": "system_reminder",
+    "UNTRUSTED_CONTENT_INSTRUCTION": "untrusted_content",
+    "UNTRUSTED_CONTENT_SECTION_NAME": "untrusted_content",
+    "UNTRUSTED_CONTENT_TAG": "untrusted_content",
+    "make_untrusted_content_section": "untrusted_content",
+    "unwrap_untrusted": "untrusted_content",
+    "wrap_untrusted": "untrusted_content",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "CURRENT_TIME_ATTACHMENT_NAME",
@@ -54,14 +105,18 @@ __all__ = [
     "InputAttachmentCompute",
     "LLMSummarizer",
     "PromptBuilder",
+    "SectionCacheKey",
     "SectionCompute",
+    "SectionStats",
     "Summarizer",
     "SummarizingCompactor",
     "SystemPromptSection",
+    "collapse_tool_output_edits",
     "collapse_tool_outputs",
     "make_current_time_attachment",
     "make_env_info_section",
     "make_untrusted_content_section",
+    "static_cache_key",
     "unwrap_untrusted",
     "wrap_in_system_reminder",
     "wrap_untrusted",
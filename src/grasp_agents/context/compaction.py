@@ -15,12 +15,15 @@ recent turns' tool outputs verbatim and snippets older ones — budget-gated or
 proactive; :class:`SummarizingCompactor` folds older turns into a summary produced
 by a :class:`Summarizer` (an LLM call by default, or any processor / workflow). The
 cheap projector tier is measured before the summary fold fires, so folding only
-escalates when collapse alone can't free enough.
+escalates when collapse alone can't free enough. With ``speculate_at`` set, the
+summary is precomputed in the background once the view nears the budget, so the
+fold point rarely waits on the summarizer.
 """
 
+import asyncio
 import logging
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Protocol, Self, runtime_checkable
 
 from grasp_agents.llm.llm import LLM
@@ -36,6 +39,8 @@ from grasp_agents.types.items import (
     ReasoningItem,
 )
 
+from .projection import apply_view_edits
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_BUFFER_TOKENS = 8192
@@ -159,6 +164,20 @@ class Budgeted(Protocol):
     budget: ContextBudget | None
 
 
+@runtime_checkable
+class Speculative(Protocol):
+    """
+    A compactor that may hold background work between turns.
+
+    Implemented by :class:`SummarizingCompactor` (``speculate_at``). The
+    ``ContextWindowManager`` cancels it whenever the log or the fold set is
+    replaced underneath it (resume, rollback, compactor swap), and the agent
+    cancels it when a run ends or the agent is closed.
+    """
+
+    def cancel_speculation(self) -> None: ...
+
+
 def _turn_boundaries(messages: Sequence[InputItem]) -> list[int]:
     """
     Cut points (indices into ``messages``) that keep every turn whole.
@@ -197,7 +216,12 @@ def _turn_boundaries(messages: Sequence[InputItem]) -> list[int]:
 
 
 def count_turns(messages: Sequence[InputItem]) -> int:
-    """Number of whole turns in a span (see :func:`_turn_boundaries`)."""
+    """
+    Number of whole turns in a span (see :func:`_turn_boundaries`).
+
+    For spans of an agent's log, :meth:`LLMAgentTranscript.count_turns` answers
+    from the transcript's incremental index instead of rescanning.
+    """
     return len(_turn_boundaries(messages))
 
 
@@ -253,7 +277,7 @@ def _collapsed_text(text: str, *, head_chars: int, tail_chars: int) -> str:
     return f"{head}{notice}{tail}"
 
 
-def collapse_tool_outputs(
+def collapse_tool_output_edits(
     messages: Sequence[InputItem],
     *,
     keep_recent_turns: int = DEFAULT_KEEP_RECENT_TURNS,
@@ -261,31 +285,22 @@ def collapse_tool_outputs(
     head_chars: int = DEFAULT_HEAD_CHARS,
     tail_chars: int = DEFAULT_TAIL_CHARS,
     model: str = "",
-) -> list[InputItem]:
+) -> dict[int, InputItem]:
     """
-    Collapse tool outputs older than the recent window; keep recent ones verbatim.
-
-    Recency, not size, decides what is hidden: the most recent ``keep_recent_turns``
-    turns' outputs are left intact (the working set the model is most likely still
-    acting on, which it could not recover if collapsed), and every *older*
-    ``FunctionToolOutputItem`` is collapsed to its first ``head_chars`` + a notice +
-    last ``tail_chars`` chars. The kept window is shrunk toward a one-turn floor when
-    it would exceed ``keep_recent_tokens``. Outputs carrying images or files, and
-    those too short to gain, are left intact; structure and tool-call pairing are
-    preserved. The log is never mutated — only this derived view — so a collapsed
-    output is recoverable on rollback / resume and re-expands if the projector is
-    removed.
+    The substitutions :func:`collapse_tool_outputs` makes, as sparse
+    :data:`~grasp_agents.context.projection.ViewEdits` (position -> collapsed
+    output) rather than a copy of the whole view.
     """
     keep_from = _keep_recent_start(
         messages, keep_recent_turns, keep_recent_tokens, model
     )
+    edits: dict[int, InputItem] = {}
     if keep_from <= 0:
-        return list(messages)
+        return edits
 
     shed = 0
-    result = list(messages)
     for i in range(keep_from):
-        item = result[i]
+        item = messages[i]
         if (
             isinstance(item, FunctionToolOutputItem)
             and not item.images
@@ -297,7 +312,7 @@ def collapse_tool_outputs(
             )
             if len(collapsed) < len(text):
                 shed += len(text) - len(collapsed)
-                result[i] = item.model_copy(update={"output": collapsed})
+                edits[i] = item.model_copy(update={"output": collapsed})
     if shed:
         logger.debug(
             "collapse: kept last %d turn(s) verbatim; shed ~%d chars of older "
@@ -305,6 +320,44 @@ def collapse_tool_outputs(
             keep_recent_turns,
             shed,
         )
+    return edits
+
+
+def collapse_tool_outputs(
+    messages: Sequence[InputItem],
+    *,
+    keep_recent_turns: int = DEFAULT_KEEP_RECENT_TURNS,
+    keep_recent_tokens: int | None = None,
+    head_chars: int = DEFAULT_HEAD_CHARS,
+    tail_chars: int = DEFAULT_TAIL_CHARS,
+    model: str = "",
+) -> list[InputItem]:
+    """
+    Collapse tool outputs older than the recent window; keep recent ones verbatim.
+
+    Recency, not size, decides what is hidden: the most recent ``keep_recent_turns``
+    turns' outputs are left intact (the working set the model is most likely still
+    acting on, which it could not recover if collapsed), and every *older*
+    ``FunctionToolOutputItem`` is collapsed to its first ``head_chars`` + a notice +
+    last ``tail_chars`` chars. The kept window is shrunk toward a one-turn floor when
+    it would exceed ``keep_recent_tokens``. Outputs carrying images or files, and
+    those too short to gain, are left intact; structure and tool-call pairing are
+    preserved. The log is never mutated — only this derived view — so a collapsed
+    output is recoverable on rollback / resume and re-expands if the projector is
+    removed.
+    """
+    result = list(messages)
+    apply_view_edits(
+        result,
+        collapse_tool_output_edits(
+            messages,
+            keep_recent_turns=keep_recent_turns,
+            keep_recent_tokens=keep_recent_tokens,
+            head_chars=head_chars,
+            tail_chars=tail_chars,
+            model=model,
+        ),
+    )
     return result
 
 
@@ -335,6 +388,9 @@ class CollapseToolOutputsProjector(Budgeted):
     reclaim pressure from recent turns, reasoning, or long replies::
 
         agent.add_view_projector(CollapseToolOutputsProjector())
+
+    It is also a :class:`~grasp_agents.hooks.ViewEditor`: the agent applies its
+    collapse as sparse :meth:`edits` rather than copying the view.
     """
 
     def __init__(
@@ -357,19 +413,20 @@ class CollapseToolOutputsProjector(Budgeted):
         self.head_chars = head_chars
         self.tail_chars = tail_chars
 
-    async def __call__(
+    async def edits(
         self,
-        messages: list[InputItem],
+        messages: Sequence[InputItem],
         *,
         exec_id: str,  # noqa: ARG002
         input_tokens: int,
-    ) -> Sequence[InputItem]:
+    ) -> dict[int, InputItem]:
+        """The collapse as sparse view edits (empty while under budget)."""
         if not self.proactive and (
             self.budget is None or not self.budget.is_exceeded(input_tokens)
         ):
-            return messages
+            return {}
 
-        return collapse_tool_outputs(
+        return collapse_tool_output_edits(
             messages,
             keep_recent_turns=self.keep_recent_turns,
             keep_recent_tokens=self.keep_recent_tokens,
@@ -378,6 +435,21 @@ class CollapseToolOutputsProjector(Budgeted):
             model=self.budget.model if self.budget else "",
         )
 
+    async def __call__(
+        self,
+        messages: list[InputItem],
+        *,
+        exec_id: str,
+        input_tokens: int,
+    ) -> Sequence[InputItem]:
+        edits = await self.edits(messages, exec_id=exec_id, input_tokens=input_tokens)
+        if not edits:
+            return messages
+
+        result = list(messages)
+        apply_view_edits(result, edits)
+        return result
+
 
 def _first_turn_end(messages: Sequence[InputItem], start: int, limit: int) -> int:
     """First turn boundary in ``(start, limit]`` — one whole turn from ``start``."""
@@ -490,7 +562,37 @@ class LLMSummarizer:
         return response.output_text.strip()
 
 
-class SummarizingCompactor(Budgeted):
+@dataclass
+class _Speculation:
+    """A background summary of ``messages[start:end]``, keyed by its log range."""
+
+    start: int
+    end: int
+    # The span's last item, held by identity: a rollback or transcript reset that
+    # rewrites the range replaces it, which invalidates the speculation in O(1).
+    last_item: InputItem
+    task: asyncio.Task[str] = field(repr=False)
+
+    def covers(self, messages: Sequence[InputItem], folded_end: int) -> bool:
+        return (
+            self.start == folded_end
+            and self.end <= len(messages)
+            and messages[self.end - 1] is self.last_item
+        )
+
+
+def _failed(task: asyncio.Task[str]) -> bool:
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+
+def _consume_exception(task: asyncio.Task[str]) -> None:
+    # A discarded speculation may fail or be cancelled without ever being awaited;
+    # retrieve its exception so asyncio doesn't log it as never retrieved.
+    if not task.cancelled():
+        task.exception()
+
+
+class SummarizingCompactor(Budgeted, Speculative):
     """
     A :class:`~grasp_agents.hooks.Compactor` that folds old turns into a summary
     under context-window pressure.
@@ -519,9 +621,15 @@ class SummarizingCompactor(Budgeted):
         keep_recent_turns: int = DEFAULT_KEEP_RECENT_TURNS,
         keep_recent_tokens: int | None = None,
         max_summary_input_tokens: int | None = None,
+        speculate_at: float | None = None,
     ) -> None:
+        if speculate_at is not None and not 0 < speculate_at <= 1:
+            raise ValueError(f"speculate_at must be in (0, 1], got {speculate_at}")
+
         self.summarizer = summarizer
         self.budget = budget
+        self.speculate_at = speculate_at
+        self._speculation: _Speculation | None = None
 
         self.keep_recent_turns = keep_recent_turns
         self.keep_recent_tokens = keep_recent_tokens
@@ -604,6 +712,89 @@ class SummarizingCompactor(Budgeted):
 
         return (folded_end, end)
 
+    def _maybe_speculate(
+        self,
+        messages: Sequence[InputItem],
+        *,
+        input_tokens: int,
+        folds: Sequence[FoldSpec],
+    ) -> None:
+        limit = self.budget.soft_limit if self.budget is not None else None
+        if (
+            self.speculate_at is None
+            or limit is None
+            or input_tokens < self.speculate_at * limit
+        ):
+            return
+
+        folded_end = max((f.end for f in folds), default=0)
+        spec = self._speculation
+        if spec is not None:
+            if spec.covers(messages, folded_end) and not _failed(spec.task):
+                return
+            self.cancel_speculation()
+
+        span = self._select_span(messages, folds)
+        if span is None:
+            return
+
+        start, end = span
+        task = asyncio.create_task(self.summarizer(messages[start:end]))
+        task.add_done_callback(_consume_exception)
+        self._speculation = _Speculation(
+            start=start, end=end, last_item=messages[end - 1], task=task
+        )
+        logger.debug(
+            "speculating summary of messages [%d, %d): view ~%d tok of soft_limit %d",
+            start,
+            end,
+            input_tokens,
+            limit,
+        )
+
+    async def _take_speculation(
+        self, messages: Sequence[InputItem], folds: Sequence[FoldSpec]
+    ) -> FoldSpec | None:
+        """Claim the pending speculation as a fold if it is still valid."""
+        spec, self._speculation = self._speculation, None
+        if spec is None:
+            return None
+
+        folded_end = max((f.end for f in folds), default=0)
+        if not spec.covers(messages, folded_end):
+            spec.task.cancel()
+            logger.debug(
+                "discarding stale speculative summary of [%d, %d)", spec.start, spec.end
+            )
+            return None
+
+        try:
+            await asyncio.wait([spec.task])
+        except asyncio.CancelledError:
+            spec.task.cancel()
+            raise
+
+        if _failed(spec.task):
+            logger.warning(
+                "speculative summary of [%d, %d) failed; summarizing synchronously",
+                spec.start,
+                spec.end,
+                exc_info=None if spec.task.cancelled() else spec.task.exception(),
+            )
+            return None
+
+        summary = spec.task.result().strip()
+        if not summary:
+            return None
+
+        return FoldSpec(start=spec.start, end=spec.end, summary=summary)
+
+    def cancel_speculation(self) -> None:
+        """Cancel and drop any background summary in flight."""
+        if self._speculation is not None:
+            self._speculation.task.cancel()
+            self._speculation = None
+
     async def __call__(
         self,
         messages: Sequence[InputItem],
@@ -616,8 +807,22 @@ class SummarizingCompactor(Budgeted):
         if not force and (
             self.budget is None or not self.budget.is_exceeded(input_tokens)
         ):
+            self._maybe_speculate(messages, input_tokens=input_tokens, folds=folds)
             return None
 
+        fold = await self._take_speculation(messages, folds)
+        if fold is not None:
+            logger.info(
+                "summarizing context: view ~%d tok over soft_limit %s (window %s); "
+                "folding messages [%d, %d) from speculative summary",
+                input_tokens,
+                self.budget.soft_limit if self.budget is not None else None,
+                self.budget.max_input_tokens if self.budget is not None else None,
+                fold.start,
+                fold.end,
+            )
+            return fold
+
         span = self._select_span(messages, folds)
         if span is None:
             return None
@@ -648,9 +853,10 @@ class Compaction:
 
     Always builds the budget-gated, recency-gated tool-output :attr:`collapse`
     projector; adds the reactive :attr:`summarize` compactor when a ``summarizer``
-    (or an ``llm`` to wrap in :class:`LLMSummarizer`) is given. ``budget`` is
-    optional — the agent injects its model-derived budget on registration, so the
-    common path needs no budget at all::
+    (or an ``llm`` to wrap in :class:`LLMSummarizer`) is given; ``speculate_at``
+    lets it precompute summaries in the background. ``budget`` is optional — the
+    agent injects its model-derived budget on registration, so the common path
+    needs no budget at all::
 
         agent.add_compaction()  # auto-configured from the agent's model + llm
     """
@@ -667,6 +873,7 @@ class Compaction:
         keep_recent_tokens: int | None = None,
         collapse_proactive: bool = False,
         max_summary_input_tokens: int | None = None,
+        speculate_at: float | None = None,
     ) -> None:
         self.budget = budget
 
@@ -689,6 +896,7 @@ class Compaction:
                 keep_recent_turns=keep_recent_turns,
                 keep_recent_tokens=keep_recent_tokens,
                 max_summary_input_tokens=max_summary_input_tokens,
+                speculate_at=speculate_at,
             )
             if summarizer is not None
             else None
@@ -91,7 +91,9 @@ def make_env_info_section(
     ``{"Project": "grasp-agents"}``).
 
     The compute is sync; the date is recomputed each turn but the rest is
-    process-level constant. ``cache_control`` marks a prompt-cache
+    process-level constant, so the render is keyed on the date and the
+    effective cwd and only redone when one of them moves (a ``"datetime"``
+    field disables the memoization). ``cache_control`` marks a prompt-cache
     checkpoint on this block — leave it ``None`` unless the section sits at
     a stable prefix boundary you want cached (a per-turn ``datetime`` field
     would only fragment the cache, so don't pair the two).
@@ -124,10 +126,20 @@ def make_env_info_section(
             return None
         return "<environment>\n" + "\n".join(rows) + "\n</environment>"
 
+    def cache_key(
+        *, ctx: SessionContext[Any] | None = None, **_: Any
+    ) -> tuple[str | None, str | None] | None:
+        if "datetime" in selected:
+            return None
+        date = datetime.now(tz=UTC).date().isoformat() if "date" in selected else None
+        cwd = _effective_cwd(ctx) if "cwd" in selected else None
+        return date, cwd
+
     return SystemPromptSection(
         name=section_name,
         compute=compute,
         cache_control=cache_control,
+        cache_key=cache_key,
     )
 
 
@@ -10,10 +10,15 @@ built-ins live here:
 * :func:`repair_tool_call_pairing` fixes a ``tool_call`` / ``tool_result`` pair a
   projection may have orphaned — the view-time companion to
   :meth:`LLMAgentTranscript.validate_tool_call_pairing`, which validates the log.
+
+Both are single passes over the view. Projectors that only substitute items
+(e.g. tool-output collapse) can emit :data:`ViewEdits` — a sparse
+``index -> replacement`` map applied in place with :func:`apply_view_edits` —
+instead of returning a full copy of the view.
 """
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 
 from grasp_agents.types.folds import FoldSpec
 from grasp_agents.types.items import (
@@ -31,8 +36,17 @@ logger = logging.getLogger(__name__)
 # not an error, so the model treats the turn as resolved rather than retrying.
 _ELIDED_RESULT = "[Tool result omitted from this view by context management.]"
 
+# Sparse substitutions into a view: position -> replacement item.
+ViewEdits = Mapping[int, InputItem]
+
+
+def apply_view_edits(view: list[InputItem], edits: ViewEdits) -> None:
+    """Apply ``edits`` to ``view`` in place (positions index ``view``)."""
+    for i, item in edits.items():
+        view[i] = item
+
 
-def repair_tool_call_pairing(messages: Sequence[InputItem]) -> list[InputItem]:
+def repair_tool_call_pairing(messages: Iterable[InputItem]) -> list[InputItem]:
     """
     Return a copy of ``messages`` in which every tool call is resolved.
 
@@ -50,26 +64,32 @@ def repair_tool_call_pairing(messages: Sequence[InputItem]) -> list[InputItem]:
     that cuts on turn boundaries leaves no orphans, so this is a no-op there.
     """
     repaired: list[InputItem] = []
-    open_calls: list[str] = []
+    # Open call_id -> number of unresolved calls with it, in first-open order.
+    open_calls: dict[str, int] = {}
 
     def _resolve_open() -> None:
-        for call_id in open_calls:
-            repaired.append(
+        for call_id, count in open_calls.items():
+            repaired.extend(
                 FunctionToolOutputItem.from_tool_result(
                     call_id=call_id, output=_ELIDED_RESULT
                 )
+                for _ in range(count)
             )
         open_calls.clear()
 
     for item in messages:
         if isinstance(item, FunctionToolCallItem):
-            open_calls.append(item.call_id)
+            open_calls[item.call_id] = open_calls.get(item.call_id, 0) + 1
             repaired.append(item)
         elif isinstance(item, FunctionToolOutputItem):
             # Pair it with an open call; otherwise it is free-floating
             # (no call in this view) or a duplicate — drop it.
-            if item.call_id in open_calls:
-                open_calls.remove(item.call_id)
+            count = open_calls.get(item.call_id)
+            if count is not None:
+                if count == 1:
+                    del open_calls[item.call_id]
+                else:
+                    open_calls[item.call_id] = count - 1
                 repaired.append(item)
         elif isinstance(item, InputMessageItem):
             # A tool call must be resolved before any input message.
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import json
+import time
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -30,7 +31,7 @@ from grasp_agents.utils.generics import AutoInstanceAttributesMixin
 from .system_reminder import wrap_in_system_reminder
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Sequence
+    from collections.abc import Awaitable, Hashable, Mapping, Sequence
 
     from grasp_agents.agent.agent_context import AgentContext
     from grasp_agents.hooks import InitialContextBuilder, InputContentBuilder
@@ -68,6 +69,35 @@ class SectionCompute(Protocol):
     ) -> str | Awaitable[str | None] | None: ...
 
 
+@runtime_checkable
+class SectionCacheKey(Protocol):
+    """
+    Invalidation key for a :class:`SystemPromptSection`.
+
+    Receives the same kwargs as :class:`SectionCompute` and returns a hashable
+    fingerprint of everything the section's text depends on — an mtime, a
+    version counter, a store watermark, the identity of the object it reads.
+    While the key compares equal to the previous one, :class:`PromptBuilder`
+    reuses the cached render instead of calling ``compute``. ``None`` means
+    "not cacheable right now" and forces a recompute.
+
+    The key runs on every build, so it must be much cheaper than ``compute``.
+    """
+
+    def __call__(
+        self,
+        *,
+        ctx: SessionContext[Any] | None = None,
+        exec_id: str | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> Hashable | None: ...
+
+
+def static_cache_key(**_: Any) -> tuple[()]:
+    """:class:`SectionCacheKey` for a section whose text never changes."""
+    return ()
+
+
 @dataclass(frozen=True)
 class SystemPromptSection:
     """
@@ -78,11 +108,45 @@ class SystemPromptSection:
     ``cache_control``, when set, marks a prompt-cache checkpoint on this
     section's block — providers with prompt caching (e.g. Anthropic) cache
     the prefix up to and including it; the rest ignore it.
+
+    ``cache_key``, when set, declares what the section depends on (see
+    :class:`SectionCacheKey`): the builder memoizes the render and only
+    calls ``compute`` again once the key changes. Without it the section is
+    recomputed on every build.
     """
 
     name: str
     compute: SectionCompute
     cache_control: CacheControl | None = None
+    cache_key: SectionCacheKey | None = None
+
+
+@dataclass
+class SectionStats:
+    """
+    Per-section render counters kept by :class:`PromptBuilder`.
+
+    ``computes`` counts ``compute`` invocations, ``hits`` counts builds
+    served from the memoized render. Timings are wall-clock seconds spent
+    in ``compute`` (including awaiting it).
+    """
+
+    computes: int = 0
+    hits: int = 0
+    compute_seconds: float = 0.0
+    last_compute_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.computes + self.hits
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class _RenderedSection:
+    section: SystemPromptSection
+    key: Hashable | None
+    part: InputText | None
 
 
 @runtime_checkable
@@ -157,6 +221,10 @@ class PromptBuilder[InT, CtxT](AutoInstanceAttributesMixin):
         # preserved; ``None`` outputs are dropped. Skills (and later memory)
         # plug in here.
         self.system_prompt_sections: list[SystemPromptSection] = []
+        # Last render per section name (memoized when the section declares a
+        # ``cache_key``) and the matching hit/compute counters.
+        self._rendered_sections: dict[str, _RenderedSection] = {}
+        self._section_stats: dict[str, SectionStats] = {}
 
         # Attachments appended to the user message at run time. Each
         # attachment's compute receives the just-built input_message plus
@@ -190,6 +258,22 @@ class PromptBuilder[InT, CtxT](AutoInstanceAttributesMixin):
                 return
         self.system_prompt_sections.append(section)
 
+    @property
+    def section_stats(self) -> Mapping[str, SectionStats]:
+        """Render counters and timings per system-prompt section name."""
+        return dict(self._section_stats)
+
+    def invalidate_section_cache(self, name: str | None = None) -> None:
+        """
+        Drop the memoized render of section ``name`` (every section when
+        ``None``), forcing a recompute on the next build regardless of its
+        ``cache_key``.
+        """
+        if name is None:
+            self._rendered_sections.clear()
+        else:
+            self._rendered_sections.pop(name, None)
+
     def add_input_attachment(self, attachment: InputAttachment) -> None:
         """
         Register ``attachment`` for the user message. If an attachment with
@@ -242,6 +326,11 @@ class PromptBuilder[InT, CtxT](AutoInstanceAttributesMixin):
         ignore it. For a dynamic prompt use a section (dynamic ``compute``) or an
         :class:`InitialContextBuilder` returning a system message.
 
+        Sections declaring a ``cache_key`` are served from the previous
+        render while the key is unchanged. A recomputed section whose text
+        did not change reuses its previous part too, so an unchanged prompt
+        is emitted byte-for-byte identical and provider prompt caches hold.
+
         Returns ``None`` when there's no base prompt and every section
         renders empty.
         """
@@ -252,17 +341,63 @@ class PromptBuilder[InT, CtxT](AutoInstanceAttributesMixin):
             parts.append(InputText(text=base))
 
         for section in self.system_prompt_sections:
-            result = section.compute(ctx=ctx, exec_id=exec_id, agent_ctx=agent_ctx)
-            if inspect.isawaitable(result):
-                result = await result
-            if not result:
-                continue
-            parts.append(InputText(text=result, cache_control=section.cache_control))
+            part = await self._render_section(
+                section, ctx=ctx, exec_id=exec_id, agent_ctx=agent_ctx
+            )
+            if part is not None:
+                parts.append(part)
 
         if not parts:
             return None
         return parts
 
+    async def _render_section(
+        self,
+        section: SystemPromptSection,
+        *,
+        ctx: SessionContext[CtxT],
+        exec_id: str,
+        agent_ctx: AgentContext | None,
+    ) -> InputText | None:
+        stats = self._section_stats.setdefault(section.name, SectionStats())
+        previous = self._rendered_sections.get(section.name)
+        if previous is not None and previous.section is not section:
+            # Replaced via ``add_system_prompt_section``: the old render is
+            # not this section's output.
+            previous = None
+
+        key: Hashable | None = None
+        if section.cache_key is not None:
+            key = section.cache_key(ctx=ctx, exec_id=exec_id, agent_ctx=agent_ctx)
+            if key is not None and previous is not None and previous.key == key:
+                stats.hits += 1
+                return previous.part
+
+        start = time.perf_counter()
+        result = section.compute(ctx=ctx, exec_id=exec_id, agent_ctx=agent_ctx)
+        if inspect.isawaitable(result):
+            result = await result
+        elapsed = time.perf_counter() - start
+        stats.computes += 1
+        stats.compute_seconds += elapsed
+        stats.last_compute_seconds = elapsed
+
+        part: InputText | None = None
+        if result:
+            if (
+                previous is not None
+                and previous.part is not None
+                and (previous.part.text == result)
+            ):
+                part = previous.part
+            else:
+                part = InputText(text=result, cache_control=section.cache_control)
+
+        self._rendered_sections[section.name] = _RenderedSection(
+            section=section, key=key, part=part
+        )
+        return part
+
     @final
     async def build_initial_context(
         self,
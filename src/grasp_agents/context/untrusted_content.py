@@ -137,11 +137,17 @@ def make_untrusted_content_section(
     cache-stable; leave ``cache_control`` None so it stays inside the single
     system-prompt cache span rather than fragmenting it.
     """
-    from .prompt_builder import SystemPromptSection  # noqa: PLC0415
+    from .prompt_builder import (  # noqa: PLC0415
+        SystemPromptSection,
+        static_cache_key,
+    )
 
     def compute(**_: Any) -> str:
         return instruction
 
     return SystemPromptSection(
-        name=section_name, compute=compute, cache_control=cache_control
+        name=section_name,
+        compute=compute,
+        cache_control=cache_control,
+        cache_key=static_cache_key,
     )
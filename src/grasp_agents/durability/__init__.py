@@ -1,38 +1,96 @@
-# pyright: reportUnusedImport=false
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .checkpoint_mixin import AgentCheckpointPersistMixin, CheckpointPersistMixin
+    from .checkpoint_store import CheckpointStore, InMemoryCheckpointStore
+    from .checkpoints import (
+        CURRENT_SCHEMA_VERSION,
+        SCHEMA_VERSION_SUMMARIES,
+        AgentCheckpoint,
+        AgentContextState,
+        CheckpointKind,
+        CheckpointSchemaError,
+        PersistedRecord,
+        ProcessorCheckpoint,
+        RunnerCheckpoint,
+        SessionCheckpoint,
+        StepWatermark,
+    )
+    from .codec import BinaryCodec, JsonlCodec, MessageCodec
+    from .context_serialization import ContextKind, rehydrate_context, serialize_context
+    from .file_checkpoint_store import FileCheckpointStore
+    from .message_record import MessageRecord, MessageStatus
+    from .resume import InterruptionType, ResumeState, prepare_messages_for_resume
+    from .session_history import (
+        AgentHistory,
+        read_agent_histories,
+        read_fs_snapshot_refs,
+        read_pending_messages,
+        read_task_records,
+    )
+    from .store_keys import (
+        TOOL_CALL_PREFIX,
+        make_store_key,
+        make_tool_call_path,
+        session_prefix,
+        task_prefix,
+    )
+    from .task_record import TaskRecord, TaskStatus
+
+_LAZY: dict[str, str] = {
+    "AgentCheckpointPersistMixin": "checkpoint_mixin",
+    "CheckpointPersistMixin": "checkpoint_mixin",
+    "CheckpointStore": "checkpoint_store",
+    "InMemoryCheckpointStore": "checkpoint_store",
+    "CURRENT_SCHEMA_VERSION": "checkpoints",
+    "SCHEMA_VERSION_SUMMARIES": "checkpoints",
+    "AgentCheckpoint": "checkpoints",
+    "AgentContextState": "checkpoints",
+    "CheckpointKind": "checkpoints",
+    "CheckpointSchemaError": "checkpoints",
+    "PersistedRecord": "checkpoints",
+    "ProcessorCheckpoint": "checkpoints",
+    "RunnerCheckpoint": "checkpoints",
+    "SessionCheckpoint": "checkpoints",
+    "StepWatermark": "checkpoints",
+    "BinaryCodec": "codec",
+    "JsonlCodec": "codec",
+    "MessageCodec": "codec",
+    "ContextKind": "context_serialization",
+    "rehydrate_context": "context_serialization",
+    "serialize_context": "context_serialization",
+    "FileCheckpointStore": "file_checkpoint_store",
+    "MessageRecord": "message_record",
+    "MessageStatus": "message_record",
+    "InterruptionType": "resume",
+    "ResumeState": "resume",
+    "prepare_messages_for_resume": "resume",
+    "AgentHistory": "session_history",
+    "read_agent_histories": "session_history",
+    "read_fs_snapshot_refs": "session_history",
+    "read_pending_messages": "session_history",
+    "read_task_records": "session_history",
+    "TOOL_CALL_PREFIX": "store_keys",
+    "make_store_key": "store_keys",
+    "make_tool_call_path": "store_keys",
+    "session_prefix": "store_keys",
+    "task_prefix": "store_keys",
+    "TaskRecord": "task_record",
+    "TaskStatus": "task_record",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
 
-from .checkpoint_mixin import AgentCheckpointPersistMixin, CheckpointPersistMixin
-from .checkpoint_store import CheckpointStore, InMemoryCheckpointStore
-from .checkpoints import (
-    CURRENT_SCHEMA_VERSION,
-    SCHEMA_VERSION_SUMMARIES,
-    AgentCheckpoint,
-    AgentContextState,
-    CheckpointKind,
-    CheckpointSchemaError,
-    PersistedRecord,
-    ProcessorCheckpoint,
-    RunnerCheckpoint,
-    SessionCheckpoint,
-    StepWatermark,
-)
-from .context_serialization import ContextKind, rehydrate_context, serialize_context
-from .file_checkpoint_store import FileCheckpointStore
-from .message_record import MessageRecord, MessageStatus
-from .resume import InterruptionType, ResumeState, prepare_messages_for_resume
-from .session_history import (
-    AgentHistory,
-    read_agent_histories,
-    read_pending_messages,
-    read_task_records,
-)
-from .store_keys import (
-    TOOL_CALL_PREFIX,
-    make_store_key,
-    make_tool_call_path,
-    session_prefix,
-    task_prefix,
-)
-from .task_record import TaskRecord, TaskStatus
 
 __all__ = [
     "CURRENT_SCHEMA_VERSION",
@@ -41,6 +99,7 @@ __all__ = [
     "AgentCheckpoint",
     "AgentCheckpointPersistMixin",
     "AgentHistory",
+    "BinaryCodec",
     "CheckpointKind",
     "CheckpointPersistMixin",
     "CheckpointSchemaError",
@@ -49,6 +108,8 @@ __all__ = [
     "FileCheckpointStore",
     "InMemoryCheckpointStore",
     "InterruptionType",
+    "JsonlCodec",
+    "MessageCodec",
     "MessageRecord",
     "MessageStatus",
     "PersistedRecord",
@@ -63,6 +124,7 @@ __all__ = [
     "make_tool_call_path",
     "prepare_messages_for_resume",
     "read_agent_histories",
+    "read_fs_snapshot_refs",
     "read_pending_messages",
     "read_task_records",
     "rehydrate_context",
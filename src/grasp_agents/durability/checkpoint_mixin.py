@@ -10,11 +10,22 @@ from .checkpoints import AgentCheckpoint, CheckpointKind, ProcessorCheckpoint
 from .store_keys import make_store_key
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.items import InputItem
+
+    from .checkpoints import AgentContextState, StepWatermark
 
 logger = logging.getLogger(__name__)
 
 
+def _with_field(obj_json: str, name: str, value_json: str) -> str:
+    """Add ``"name": value_json`` to the serialized JSON object ``obj_json``."""
+    sep = "," if obj_json != "{}" else ""
+    return f'{obj_json[:-1]}{sep}"{name}":{value_json}}}'
+
+
 class CheckpointPersistMixin:
     """
     Adds checkpoint key composition + load/save to a session-scoped object.
@@ -104,26 +115,92 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
     rollback, trim-and-load on resume).
     """
 
-    # ``_persisted_messages`` holds the exact message objects already on the
-    # log (strong refs, so identity comparison stays sound): a save appends the
-    # delta while they remain a leading prefix of the transcript, else rewrites
-    # the whole log. ``_log_version`` is the log file the current head points
-    # at — rewrites bump it (see :meth:`_serialize_agent_checkpoint`).
-    _persisted_messages: tuple[Any, ...] = ()
+    # The persisted-watermark cursor. ``_persisted_messages`` holds the exact
+    # message objects already on the log (strong refs, so identity comparison
+    # stays sound) and ``_persisted_source`` the list they were last taken
+    # from: while that list still ends its persisted prefix with the same
+    # object, a save appends ``messages[len(persisted):]`` without looking at
+    # the prefix. Any other list is compared item by item, and a diverged one
+    # rewrites the whole log. ``_log_version`` is the log file the current head
+    # points at — rewrites bump it (see :meth:`_serialize_agent_checkpoint`).
+    _persisted_messages: Sequence[Any] = ()
+    _persisted_source: Sequence[Any] | None = None
     _log_version: int = 0
 
+    # Serialized ``agent_ctx_state`` per state object the last head carried
+    # (the states are frozen), plus the last ``current`` one: a head re-dumps
+    # only a state that is new and differs from the last current state.
+    _ctx_state_json: dict[int, tuple[AgentContextState, str]] | None = None
+    _current_ctx_state_json: tuple[AgentContextState, str] | None = None
+
+    def _prefix_intact(self, messages: Sequence[Any]) -> bool:
+        persisted = self._persisted_messages
+        n = len(persisted)
+        if len(messages) < n:
+            return False
+        if messages is self._persisted_source:
+            return n == 0 or messages[n - 1] is persisted[-1]
+        return all(m is p for m, p in zip(messages, persisted, strict=False))
+
+    def _advance_cursor(self, messages: Sequence[Any], *, rewrite: bool) -> None:
+        persisted = self._persisted_messages
+        if rewrite or not isinstance(persisted, list):
+            self._persisted_messages = list(messages)
+        else:
+            persisted.extend(messages[len(persisted) :])
+        self._persisted_source = messages
+
+    def _head_json(self, checkpoint: AgentCheckpoint) -> bytes:
+        """
+        The head blob: ``checkpoint`` without ``messages``, with every
+        ``agent_ctx_state`` it carries spliced in from the serialization cache.
+        """
+        cache = self._ctx_state_json or {}
+        last = self._current_ctx_state_json
+        used: dict[int, tuple[AgentContextState, str]] = {}
+
+        def state_json(state: AgentContextState) -> str:
+            hit = used.get(id(state)) or cache.get(id(state))
+            if hit is None or hit[0] is not state:
+                if last is not None and last[0] == state:
+                    hit = (state, last[1])
+                else:
+                    hit = (state, state.model_dump_json())
+            used[id(state)] = hit
+            return hit[1]
+
+        def watermark_json(watermark: StepWatermark) -> str:
+            shell = watermark.model_dump_json(exclude={"agent_ctx_state"})
+            return _with_field(
+                shell, "agent_ctx_state", state_json(watermark.agent_ctx_state)
+            )
+
+        head = checkpoint.model_dump_json(
+            exclude={"messages", "current", "step_watermarks"}
+        )
+        head = _with_field(head, "current", watermark_json(checkpoint.current))
+        watermarks = ",".join(map(watermark_json, checkpoint.step_watermarks))
+        head = _with_field(head, "step_watermarks", f"[{watermarks}]")
+
+        self._ctx_state_json = used
+        self._current_ctx_state_json = used[id(checkpoint.current.agent_ctx_state)]
+        return head.encode("utf-8")
+
     async def _serialize_agent_checkpoint(
         self,
         ctx: SessionContext[Any],
         checkpoint: AgentCheckpoint,
+        messages: Sequence[InputItem] | None = None,
     ) -> None:
         """
         Persist an :class:`AgentCheckpoint` as message-log + head.
 
-        Appends only the messages added since the last checkpoint, then
-        overwrites the small head blob with ``messages`` excluded. Log is
-        written before the head so the head's ``message_count`` only ever
-        undercounts a crash — never points past what is on the log.
+        ``messages`` is the transcript to persist (default
+        ``checkpoint.messages``); an agent passes its live log, so the head is
+        built without copying it. Appends only the messages past the persisted
+        cursor, then overwrites the small head blob (metadata and watermarks
+        only). Log is written before the head so the head's ``message_count``
+        only ever undercounts a crash — never points past what is on the log.
 
         The whole log is rewritten instead when the already-persisted messages
         are no longer a leading prefix of the transcript — a resume tail-strip,
@@ -148,29 +225,26 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
             return
 
         t0 = time.monotonic()
-        messages = checkpoint.messages
-        persisted = self._persisted_messages
-        prefix_intact = len(messages) >= len(persisted) and all(
-            m is p for m, p in zip(messages, persisted, strict=False)
-        )
-        rewrite = not prefix_intact
+        if messages is None:
+            messages = checkpoint.messages
+        persisted_count = len(self._persisted_messages)
+        rewrite = not self._prefix_intact(messages)
         # A new version is only needed when an existing head + log pair
         # would be superseded; the first save of a fresh session rewrites
         # its own (empty) version in place.
-        supersedes = bool(persisted) or self._checkpoint_number > 0
+        supersedes = persisted_count > 0 or self._checkpoint_number > 0
         log_version = self._log_version + (1 if rewrite and supersedes else 0)
         if rewrite:
             await store.rewrite_messages(key, messages, version=log_version)
         else:
-            new_messages = messages[len(persisted) :]
+            new_messages = messages[persisted_count:]
             if new_messages:
                 await store.append_messages(key, new_messages, version=log_version)
 
         checkpoint.checkpoint_number = self._checkpoint_number + 1
         checkpoint.current.message_count = len(messages)
         checkpoint.current.log_version = log_version
-        head_blob = checkpoint.model_dump_json(exclude={"messages"}).encode("utf-8")
-        await store.save(key, head_blob)
+        await store.save(key, self._head_json(checkpoint))
 
         if rewrite and self._log_version != log_version:
             try:
@@ -184,7 +258,7 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
                 )
 
         self._log_version = log_version
-        self._persisted_messages = tuple(messages)
+        self._advance_cursor(messages, rewrite=rewrite)
         self._checkpoint_number += 1
         logger.debug(
             "checkpoint saved (#%d, %d msgs%s) in %.0fms",
@@ -198,6 +272,7 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
         self,
         ctx: SessionContext[Any],
         checkpoint: AgentCheckpoint,
+        messages: Sequence[InputItem] | None = None,
     ) -> None:
         """
         Persist a rewound :class:`AgentCheckpoint`: head-first, then truncate
@@ -208,26 +283,27 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
         re-trims the leftover tail), never past it. The log is truncated in
         place, so the head keeps the live log version (the checkpoint's
         ``current`` may be cut from an older boundary). Without a checkpoint
-        store (live-only rollback) only the append bookkeeping is re-anchored
-        to the truncated transcript.
+        store (live-only rollback) only the append cursor is re-anchored to
+        the truncated transcript. ``messages`` defaults to
+        ``checkpoint.messages``, as in :meth:`_serialize_agent_checkpoint`.
         """
-        messages = checkpoint.messages
+        if messages is None:
+            messages = checkpoint.messages
         checkpoint.current.message_count = len(messages)
         checkpoint.current.log_version = self._log_version
 
         store = ctx.checkpoint_store
         key = self._checkpoint_store_key(ctx)
         if store is None or key is None:
-            self._persisted_messages = tuple(messages)
+            self._advance_cursor(messages, rewrite=True)
             return
 
         checkpoint.checkpoint_number = self._checkpoint_number + 1
-        head_blob = checkpoint.model_dump_json(exclude={"messages"}).encode("utf-8")
-        await store.save(key, head_blob)
+        await store.save(key, self._head_json(checkpoint))
         await store.truncate_messages(
             key, message_count=len(messages), version=self._log_version
         )
-        self._persisted_messages = tuple(messages)
+        self._advance_cursor(messages, rewrite=True)
         self._checkpoint_number += 1
 
     async def _deserialize_agent_checkpoint(
@@ -242,6 +318,11 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
         exists the log is rewritten to the committed prefix so later appends
         extend a clean file — a one-off write at resume, off the per-turn hot
         path; a clean log is left untouched.
+
+        A reload by the instance that wrote the head (e.g. after completing an
+        interrupted rollback, or of an emptied transcript) reuses the records
+        its cursor already holds and decodes only the log's tail past them
+        (:meth:`CheckpointStore.read_message_tail`).
         """
         store = ctx.checkpoint_store
         key = self._checkpoint_store_key(ctx)
@@ -255,7 +336,20 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
         if head is None:
             return None
 
-        raw = await store.read_messages(key, version=head.current.log_version)
+        version = head.current.log_version
+        known = self._persisted_messages
+        if (
+            known
+            and head.checkpoint_number == self._checkpoint_number
+            and version == self._log_version
+            and len(known) <= head.current.message_count
+        ):
+            # No other writer has saved a head since ours: the log still
+            # starts with exactly the records the cursor holds.
+            tail = await store.read_message_tail(key, start=len(known), version=version)
+            raw = [*known, *tail]
+        else:
+            raw = await store.read_messages(key, version=version)
         committed = raw[: head.current.message_count]
         head.messages = committed
         # Drop an uncommitted / torn tail (records past the head's watermark)
@@ -270,7 +364,7 @@ class AgentCheckpointPersistMixin(CheckpointPersistMixin):
 
         self._checkpoint_number = head.checkpoint_number
         self._log_version = head.current.log_version
-        self._persisted_messages = tuple(committed)
+        self._advance_cursor(committed, rewrite=True)
         logger.info(
             "checkpoint resumed (#%d, %d msgs) in %.0fms",
             head.checkpoint_number,
@@ -2,41 +2,19 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 
 from grasp_agents.types.items import InputItem
 
 from .checkpoints import CheckpointSchemaError
+
+# The JSONL framing helpers moved to :mod:`.codec`; re-exported for existing
+# imports from this module.
+from .codec import decode_message_log, encode_messages
 from .store_keys import is_under
 
 logger = logging.getLogger(__name__)
 
-_INPUT_ITEM_ADAPTER: TypeAdapter[InputItem] = TypeAdapter(InputItem)
-
-
-def encode_messages(messages: Sequence[InputItem]) -> bytes:
-    """Frame messages as newline-terminated JSONL (one ``InputItem`` per line)."""
-    return b"".join(m.model_dump_json().encode("utf-8") + b"\n" for m in messages)
-
-
-def decode_message_log(blob: bytes) -> list[InputItem]:
-    """
-    Parse a JSONL message log, tolerating a torn tail.
-
-    Stops at the first line that fails to parse (a partial trailing record
-    from an interrupted append, or any corruption beyond it) and returns the
-    valid prefix — so an interrupted write costs at most the last record.
-    """
-    messages: list[InputItem] = []
-    for line in blob.split(b"\n"):
-        if not line:
-            continue
-        try:
-            messages.append(_INPUT_ITEM_ADAPTER.validate_json(line))
-        except ValueError:
-            break
-    return messages
-
 
 class CheckpointStore(ABC):
     """
@@ -96,9 +74,9 @@ class CheckpointStore(ABC):
     # Keyed to the checkpoint head: ``append_messages`` extends it incrementally,
     # ``read_messages`` returns the whole log, ``rewrite_messages`` replaces it
     # (used on resume to drop an uncommitted / torn tail). ``read_messages`` must
-    # tolerate a torn final record (see :func:`decode_message_log`);
-    # ``encode_messages`` / ``decode_message_log`` give backends a ready JSONL
-    # framing.
+    # tolerate a torn final record (see :func:`.codec.decode_message_log`);
+    # :mod:`.codec` gives backends ready JSONL and binary framings.
+    # ``read_message_tail`` reads only the records past a watermark.
     #
     # ``version`` namespaces independent log files for one key. A
     # full-history rewrite goes to a NEW version while the head still
@@ -120,6 +98,17 @@ class CheckpointStore(ABC):
         self, key: str, messages: Sequence[InputItem], *, version: int = 0
     ) -> None: ...
 
+    async def read_message_tail(
+        self, key: str, *, start: int, version: int = 0
+    ) -> list[InputItem]:
+        """
+        The log's records from index ``start`` on.
+
+        The default reads the whole log and slices it; a backend that can skip
+        records without decoding them should override.
+        """
+        return (await self.read_messages(key, version=version))[start:]
+
     async def truncate_messages(
         self, key: str, *, message_count: int, version: int = 0
     ) -> None:
@@ -173,6 +162,11 @@ class InMemoryCheckpointStore(CheckpointStore):
     async def read_messages(self, key: str, *, version: int = 0) -> list[InputItem]:
         return list(self._logs.get((key, version), []))
 
+    async def read_message_tail(
+        self, key: str, *, start: int, version: int = 0
+    ) -> list[InputItem]:
+        return self._logs.get((key, version), [])[start:]
+
     async def rewrite_messages(
         self, key: str, messages: Sequence[InputItem], *, version: int = 0
     ) -> None:
@@ -180,3 +174,11 @@ class InMemoryCheckpointStore(CheckpointStore):
             self._logs[key, version] = list(messages)
         else:
             self._logs.pop((key, version), None)
+
+
+__all__ = [
+    "CheckpointStore",
+    "InMemoryCheckpointStore",
+    "decode_message_log",
+    "encode_messages",
+]
@@ -384,8 +384,9 @@ class AgentCheckpoint(ProcessorCheckpoint):
     # (one ``InputItem`` per JSONL line), keyed alongside this head blob. It is
     # never written into the head: the head is overwritten every turn, so
     # embedding the growing transcript here would re-serialize it each time.
-    # In memory this carries the full transcript; ``model_dump_json`` for the
-    # head excludes it.
+    # A loaded checkpoint carries the full transcript here; a save leaves it
+    # empty and hands the serializer the live transcript instead, which
+    # appends only the records past its persisted cursor.
     messages: list[InputItem] = Field(default_factory=list[InputItem])
 
     usage: ResponseUsage | None = None
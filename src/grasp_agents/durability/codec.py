@@ -0,0 +1,354 @@
+"""
+Message-log encodings for :class:`~.checkpoint_store.CheckpointStore` backends.
+
+A message log is a sequence of records, one ``InputItem`` each. Two record
+framings exist, and one log may mix them (a store switched to a new codec keeps
+appending to its old logs):
+
+- **JSON line** — ``model_dump_json`` plus a newline (:class:`JsonlCodec`, the
+  default, and the only framing older stores ever wrote).
+- **Binary frame** — a NUL byte, a format version, flags, the payload length and
+  its CRC-32, then the payload (:class:`BinaryCodec`). The payload is the item's
+  JSON-mode dump as msgpack (or compact JSON when msgpack is not installed),
+  optionally zstd-compressed. A JSON line never starts with NUL, so the
+  first byte tells the framings apart.
+
+A binary record may move large string fields (base64 image / file data,
+encrypted reasoning) **out of line**: the field is replaced by a
+``{"$ga_blob": <sha256>}`` reference and its content returned separately, for
+the store to persist content-addressed (so an image repeated across turns or
+sessions is stored once). :func:`decode_message_log` resolves references through
+the store's ``load_blob``.
+
+Decoding is tolerant the same way for both framings: it stops at the first
+record that is torn (short, CRC mismatch, unparsable) or references a blob that
+is not there, and returns the valid prefix. A frame of a *newer* format version
+than this reader knows is not corruption — it raises
+:class:`~.checkpoints.CheckpointSchemaError`. ``start`` skips leading records
+without validating them, so reading the tail past a watermark costs only the
+tail.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+
+from pydantic import TypeAdapter
+
+from grasp_agents.types.items import InputItem
+
+from .checkpoints import CheckpointSchemaError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_INPUT_ITEM_ADAPTER: TypeAdapter[InputItem] = TypeAdapter(InputItem)
+
+# Binary frame: marker, format version, flags, payload length, payload CRC-32.
+_FRAME_MARKER = 0x00
+_FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct(">BBBII")
+
+_FLAG_ZSTD = 0x01
+_FLAG_MSGPACK = 0x02
+_FLAG_BLOBS = 0x04
+
+# The key of an out-of-line reference in a record's body.
+BLOB_REF_KEY = "$ga_blob"
+
+# Stored blob content: a one-byte tag, then the (possibly compressed) bytes.
+_BLOB_RAW = b"R"
+_BLOB_ZSTD = b"Z"
+
+DEFAULT_INLINE_LIMIT = 64 * 1024
+
+
+class EncodedMessages(NamedTuple):
+    """Encoded log records, plus the out-of-line blobs they reference."""
+
+    records: bytes
+    # sha256 hex digest → stored blob bytes (see :func:`decode_blob`).
+    blobs: dict[str, bytes]
+
+
+class MessageCodec(ABC):
+    """
+    Encodes message-log records for a store.
+
+    Only the encoding is per codec: :func:`decode_message_log` reads every
+    framing, so a store's codec can change without migrating its logs.
+    """
+
+    @abstractmethod
+    def encode(self, messages: Sequence[InputItem]) -> EncodedMessages: ...
+
+
+class JsonlCodec(MessageCodec):
+    """Newline-terminated JSON, one ``InputItem`` per line."""
+
+    def encode(self, messages: Sequence[InputItem]) -> EncodedMessages:
+        return EncodedMessages(encode_messages(messages), {})
+
+
+class BinaryCodec(MessageCodec):
+    """
+    Length-prefixed, CRC-checked binary frames.
+
+    Args:
+        body: ``"msgpack"`` (needs ``msgpack``), ``"json"``, or ``"auto"`` —
+            msgpack when installed, else compact JSON.
+        compression: ``"zstd"`` (needs ``zstandard``) to compress each frame's
+            payload and each out-of-line blob, or ``None``.
+        level: The zstd compression level.
+        inline_limit: String fields at least this many characters long are
+            stored out of line; ``None`` keeps everything inline.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        body: Literal["auto", "msgpack", "json"] = "auto",
+        compression: Literal["zstd"] | None = None,
+        level: int = 3,
+        inline_limit: int | None = DEFAULT_INLINE_LIMIT,
+    ) -> None:
+        if inline_limit is not None and inline_limit < 1:
+            raise ValueError(f"inline_limit must be >= 1, got {inline_limit}")
+        if body == "auto":
+            body = "msgpack" if _msgpack_available() else "json"
+        self._packb: Callable[[Any], bytes] | None = None
+        if body == "msgpack":
+            self._packb = _import_msgpack().packb
+        self._compress: Callable[[bytes], bytes] | None = None
+        if compression == "zstd":
+            self._compress = _import_zstd().ZstdCompressor(level=level).compress
+        self._inline_limit = inline_limit
+
+    def encode(self, messages: Sequence[InputItem]) -> EncodedMessages:
+        frames: list[bytes] = []
+        blobs: dict[str, bytes] = {}
+        for message in messages:
+            frames.append(self._encode_one(message, blobs))
+        return EncodedMessages(b"".join(frames), blobs)
+
+    def _encode_one(self, message: InputItem, blobs: dict[str, bytes]) -> bytes:
+        flags = 0
+        limit = self._inline_limit
+        dumped = message.model_dump_json() if self._packb is None else None
+        if dumped is not None and (limit is None or len(dumped) < limit):
+            # Nothing to move out of line (a string field is never longer than
+            # the whole dump): the dump is the payload.
+            payload = dumped.encode("utf-8")
+        else:
+            data: Any = message.model_dump(mode="json")
+            if limit is not None:
+                found: dict[str, bytes] = {}
+                data = _extract_blobs(data, limit, found, self._encode_blob)
+                if found:
+                    flags |= _FLAG_BLOBS
+                    blobs.update(found)
+            if self._packb is not None:
+                flags |= _FLAG_MSGPACK
+                payload = self._packb(data)
+            else:
+                payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if self._compress is not None:
+            flags |= _FLAG_ZSTD
+            payload = self._compress(payload)
+        header = _FRAME_HEADER.pack(
+            _FRAME_MARKER, _FRAME_VERSION, flags, len(payload), zlib.crc32(payload)
+        )
+        return header + payload
+
+    def _encode_blob(self, raw: bytes) -> bytes:
+        if self._compress is None:
+            return _BLOB_RAW + raw
+        return _BLOB_ZSTD + self._compress(raw)
+
+
+def encode_messages(messages: Sequence[InputItem]) -> bytes:
+    """Frame messages as newline-terminated JSONL (one ``InputItem`` per line)."""
+    return b"".join(m.model_dump_json().encode("utf-8") + b"\n" for m in messages)
+
+
+def decode_blob(data: bytes) -> bytes:
+    """The content of a stored out-of-line blob."""
+    tag, body = data[:1], data[1:]
+    if tag == _BLOB_RAW:
+        return body
+    if tag == _BLOB_ZSTD:
+        return _import_zstd().ZstdDecompressor().decompress(body)
+    raise ValueError(f"Unknown blob encoding {tag!r}")
+
+
+def decode_message_log(
+    blob: bytes,
+    *,
+    start: int = 0,
+    load_blob: Callable[[str], bytes | None] | None = None,
+) -> list[InputItem]:
+    """
+    Parse a message log, tolerating a torn tail.
+
+    Reads JSON lines and binary frames alike. Stops at the first record that
+    fails to parse (a partial trailing record from an interrupted append, or
+    any corruption beyond it) and returns the valid prefix — so an interrupted
+    write costs at most the last record. The first ``start`` records are
+    skipped without being validated. ``load_blob`` resolves out-of-line
+    references (stored blob bytes, or ``None`` when missing — which ends the
+    log there, like a torn record). A frame needing ``msgpack`` /
+    ``zstandard`` when it is not installed raises ``ImportError`` rather than
+    truncating the log.
+
+    Raises:
+        CheckpointSchemaError: A binary frame has a newer format version.
+
+    """
+    messages: list[InputItem] = []
+    view = memoryview(blob)
+    pos, end, index = 0, len(blob), 0
+    while pos < end:
+        if blob[pos] == _FRAME_MARKER:
+            if end - pos < _FRAME_HEADER.size:
+                break
+            _, version, flags, length, crc = _FRAME_HEADER.unpack_from(blob, pos)
+            if version > _FRAME_VERSION:
+                raise CheckpointSchemaError(
+                    f"Message-log frame version {version} is newer than the "
+                    f"supported {_FRAME_VERSION}"
+                )
+            body_start = pos + _FRAME_HEADER.size
+            pos = body_start + length
+            if pos > end:
+                break
+            if index >= start:
+                payload = view[body_start:pos]
+                if zlib.crc32(payload) != crc:
+                    break
+                message = _decode_frame(bytes(payload), flags, load_blob)
+                if message is None:
+                    break
+                messages.append(message)
+        else:
+            newline = blob.find(b"\n", pos)
+            line_end = end if newline < 0 else newline
+            line_start, pos = pos, line_end + 1
+            if line_start == line_end:
+                continue
+            if index >= start:
+                message = _validate_json(blob[line_start:line_end])
+                if message is None:
+                    break
+                messages.append(message)
+        index += 1
+    return messages
+
+
+def _decode_frame(
+    payload: bytes,
+    flags: int,
+    load_blob: Callable[[str], bytes | None] | None,
+) -> InputItem | None:
+    if flags & _FLAG_ZSTD:
+        payload = _import_zstd().ZstdDecompressor().decompress(payload)
+    if not flags & (_FLAG_MSGPACK | _FLAG_BLOBS):
+        return _validate_json(payload)
+    unpackb = _import_msgpack().unpackb if flags & _FLAG_MSGPACK else json.loads
+    try:
+        data = unpackb(payload)
+        if flags & _FLAG_BLOBS:
+            data = _resolve_blobs(data, load_blob)
+        return _INPUT_ITEM_ADAPTER.validate_python(data)
+    except ValueError:  # incl. a missing blob
+        return None
+
+
+def _validate_json(data: bytes) -> InputItem | None:
+    try:
+        return _INPUT_ITEM_ADAPTER.validate_json(data)
+    except ValueError:
+        return None
+
+
+class _MissingBlobError(ValueError):
+    pass
+
+
+def _extract_blobs(
+    data: Any,
+    limit: int,
+    found: dict[str, bytes],
+    encode_blob: Callable[[bytes], bytes],
+) -> Any:
+    if isinstance(data, str):
+        if len(data) < limit:
+            return data
+        raw = data.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest not in found:
+            found[digest] = encode_blob(raw)
+        return {BLOB_REF_KEY: digest}
+    if isinstance(data, dict):
+        return {
+            k: _extract_blobs(v, limit, found, encode_blob)
+            for k, v in data.items()  # pyright: ignore[reportUnknownVariableType]
+        }
+    if isinstance(data, list):
+        return [
+            _extract_blobs(v, limit, found, encode_blob)
+            for v in data  # pyright: ignore[reportUnknownVariableType]
+        ]
+    return data
+
+
+def _resolve_blobs(data: Any, load_blob: Callable[[str], bytes | None] | None) -> Any:
+    if isinstance(data, dict):
+        if len(data) == 1 and BLOB_REF_KEY in data:  # pyright: ignore[reportUnknownArgumentType]
+            digest = cast("str", data[BLOB_REF_KEY])
+            stored = load_blob(digest) if load_blob else None
+            if stored is None:
+                raise _MissingBlobError
+            return decode_blob(stored).decode("utf-8")
+        return {
+            k: _resolve_blobs(v, load_blob)
+            for k, v in data.items()  # pyright: ignore[reportUnknownVariableType]
+        }
+    if isinstance(data, list):
+        return [
+            _resolve_blobs(v, load_blob)
+            for v in data  # pyright: ignore[reportUnknownVariableType]
+        ]
+    return data
+
+
+def _msgpack_available() -> bool:
+    return importlib.util.find_spec("msgpack") is not None
+
+
+def _import_msgpack() -> Any:
+    try:
+        import msgpack  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+    except ImportError as exc:
+        raise ImportError(
+            "msgpack-bodied checkpoint logs need msgpack: "
+            "pip install 'grasp_agents[checkpoint-binary]'"
+        ) from exc
+    return msgpack  # pyright: ignore[reportUnknownVariableType]
+
+
+def _import_zstd() -> Any:
+    try:
+        import zstandard  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+    except ImportError as exc:
+        raise ImportError(
+            "zstd-compressed checkpoint logs need zstandard: "
+            "pip install 'grasp_agents[checkpoint-binary]'"
+        ) from exc
+    return zstandard
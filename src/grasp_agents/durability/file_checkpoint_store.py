@@ -7,25 +7,58 @@ components and ``.json`` is appended to the leaf. A checkpoint at
 parent's file (``<x>.json``) and the directory (``<x>/``) carrying its
 children share a name without colliding.
 
-Writes are atomic (``tempfile.mkstemp`` + ``os.replace``). Concurrent
-writes to the same key serialize via a per-key ``asyncio.Lock``. No
-TTL / GC — retention is the caller's concern.
+Writes are atomic (``tempfile.mkstemp`` + ``os.replace``). No TTL / GC —
+retention is the caller's concern.
+
+**Group commit.** Every mutation (head write, log append, log rewrite,
+delete) goes through one FIFO commit queue. A committer drains whatever has
+queued — optionally waiting ``commit_window`` seconds for more — and applies
+the batch in a single worker-thread hop: appends go to persistent file
+handles (an LRU of at most ``max_open_logs``), and each touched log file and
+each directory whose entries changed is ``fsync``-ed **once** per batch, no
+matter how many appends (across how many keys) hit it. A write's awaitable
+resolves only once it is durable, so many agents appending concurrently share
+fsyncs instead of queueing behind each other's.
+
+**Crash consistency.**
+
+- Writes apply in submission order, so concurrent writes to one key are
+  serialized (the last one submitted wins).
+- A write is durable when its awaitable resolves: file contents and, for a
+  newly created file or a rename, the directory entry.
+- A head write (or log rewrite / delete) is a **barrier**: every write
+  submitted before it is made durable before it is applied. So a head saved
+  after a log append can never survive a crash that loses the append — a
+  resumed head never acknowledges a missing log tail.
+- An append lands at the log's end in place (no temp + rename), so a crash
+  mid-append can leave a torn final record; ``decode_message_log`` discards
+  it. Nothing before it is affected.
+
+**Encoding.** Message logs are written by the store's ``codec`` (JSONL by
+default; see :mod:`.codec`) and read back whatever framing each record uses,
+so switching a store to :class:`~.codec.BinaryCodec` keeps its existing logs
+readable. Out-of-line parts land content-addressed under ``<root>/.blobs/``,
+written (and ``fsync``-ed) in the same commit step as the append or rewrite
+that references them, so a durable record never points at a missing blob.
+Blobs are shared across keys and never collected — like the logs, retention
+is the caller's concern. Heads stay JSON: they carry no transcript.
 """
 
 from __future__ import annotations
 
 import asyncio
 import os
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
-from grasp_agents.file_backend.atomic_write import atomic_write_bytes
+from grasp_agents.file_backend.atomic_write import DirSyncBatch, atomic_write_bytes
 
-from .checkpoint_store import (
-    CheckpointStore,
-    decode_message_log,
-    encode_messages,
-)
+from .checkpoint_store import CheckpointStore
+from .codec import JsonlCodec, MessageCodec, decode_message_log
 from .store_keys import is_under
 
 if TYPE_CHECKING:
@@ -37,63 +70,82 @@ if TYPE_CHECKING:
 
 _INVALID_SEGMENTS: frozenset[str] = frozenset({"", ".", ".."})
 
+_BLOB_DIR = ".blobs"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Open log handles kept for appends; the least recently used is closed first.
+DEFAULT_MAX_OPEN_LOGS = 64
+
 
 class FileCheckpointStore(CheckpointStore):
     """
     Filesystem-backed :class:`~.checkpoint_store.CheckpointStore`.
 
-    See module docstring for layout and safety semantics.
+    See module docstring for layout, group commit and crash-consistency
+    semantics. ``commit_window`` (seconds, default ``0``) is how long the
+    committer waits after the first queued write to gather more into the same
+    batch; at ``0`` a batch is whatever queued while the previous one was
+    being committed. ``codec`` encodes message-log records (default
+    :class:`~.codec.JsonlCodec`).
     """
 
-    def __init__(self, root: str | PathLike[str]) -> None:
+    def __init__(
+        self,
+        root: str | PathLike[str],
+        *,
+        codec: MessageCodec | None = None,
+        commit_window: float = 0.0,
+        max_open_logs: int = DEFAULT_MAX_OPEN_LOGS,
+    ) -> None:
+        if commit_window < 0:
+            raise ValueError(f"commit_window must be >= 0, got {commit_window}")
+        if max_open_logs < 1:
+            raise ValueError(f"max_open_logs must be >= 1, got {max_open_logs}")
         # Resolve early so containment checks compare against a stable,
         # canonical path (no symlink surprises at save time).
         self._root = Path(root).resolve()
-        self._locks: dict[str, asyncio.Lock] = {}
-        self._locks_guard = asyncio.Lock()
+        self._codec = codec or JsonlCodec()
+        self._committer = _GroupCommitter(
+            window=commit_window, logs=_OpenLogs(max_open_logs)
+        )
 
     @property
     def root(self) -> Path:
         return self._root
 
+    @property
+    def codec(self) -> MessageCodec:
+        return self._codec
+
     async def save(self, key: str, data: bytes) -> None:
-        path = self._key_to_path(key)
-        lock = await self._get_lock(key)
-        async with lock:
-            await asyncio.to_thread(_atomic_write, path, data)
+        await self._committer.submit(_Write("replace", self._key_to_path(key), data))
 
     async def load(self, key: str) -> bytes | None:
         path = self._key_to_path(key)
         return await asyncio.to_thread(_read_if_exists, path)
 
     async def delete(self, key: str) -> None:
-        lock = await self._get_lock(key)
-        async with lock:
-            await asyncio.to_thread(_unlink_if_exists, self._key_to_path(key))
-            await asyncio.to_thread(
-                _unlink_if_exists, self._key_to_path(key, suffix=".jsonl")
-            )
-            # Version-suffixed message logs (``<leaf>.v<N>.jsonl``).
-            await asyncio.to_thread(
-                _unlink_log_versions, self._key_to_path(key, suffix="")
-            )
-        # Evict the per-key lock so long-lived stores serving many sessions
-        # don't grow it unboundedly. A task racing this delete on the same
-        # key may briefly hold the old lock object — delete-vs-write races
-        # on one key are a caller-level conflict either way.
-        async with self._locks_guard:
-            self._locks.pop(key, None)
+        await self._committer.submit(
+            _Write("delete_key", self._key_to_path(key, suffix=""))
+        )
 
     async def list_keys(self, prefix: str) -> list[str]:
         return await asyncio.to_thread(_list_keys, self._root, prefix)
 
+    async def flush(self) -> None:
+        """Wait until every write submitted so far is durable."""
+        await self._committer.flush()
+
+    async def aclose(self) -> None:
+        """Flush pending writes and close the cached log handles."""
+        await self._committer.flush()
+        await asyncio.to_thread(self._committer.logs.close_all)
+
     # --- Append-only message log ---
     #
     # The transcript lives in a sibling ``.jsonl`` at the head key's path
     # (``.v<N>.jsonl`` for versions > 0 — see the base class on why
-    # rewrites go to a fresh version). Appends go straight to the file's
-    # end (no temp+rename), so a torn final record is possible —
-    # ``decode_message_log`` discards it. ``list_keys`` globs ``*.json``
+    # rewrites go to a fresh version). ``list_keys`` globs ``*.json``
     # only, so logs never surface as checkpoint keys.
 
     def _log_suffix(self, version: int) -> str:
@@ -104,36 +156,58 @@ class FileCheckpointStore(CheckpointStore):
     ) -> None:
         if not messages:
             return
+        await self.submit_messages(key, messages, version=version)
+
+    def submit_messages(
+        self, key: str, messages: Sequence[InputItem], *, version: int = 0
+    ) -> asyncio.Future[None]:
+        """
+        Queue an append and return its durability acknowledgement.
+
+        The append's position in the commit order is fixed on return, so a
+        caller can pipeline — submit the append, then save the head that
+        acknowledges it, and await both — without the head ever becoming
+        durable first (a head write is a barrier). ``append_messages`` is
+        this plus the await.
+        """
         path = self._key_to_path(key, suffix=self._log_suffix(version))
-        blob = encode_messages(messages)
-        lock = await self._get_lock(key)
-        async with lock:
-            await asyncio.to_thread(_append_bytes, path, blob)
+        return self._committer.enqueue(self._log_write("append", path, messages))
 
     async def read_messages(self, key: str, *, version: int = 0) -> list[InputItem]:
         path = self._key_to_path(key, suffix=self._log_suffix(version))
-        return await asyncio.to_thread(_read_message_log, path)
+        return await asyncio.to_thread(_read_message_log, path, self._root, 0)
+
+    async def read_message_tail(
+        self, key: str, *, start: int, version: int = 0
+    ) -> list[InputItem]:
+        # Records before ``start`` are skipped undecoded.
+        path = self._key_to_path(key, suffix=self._log_suffix(version))
+        return await asyncio.to_thread(_read_message_log, path, self._root, start)
 
     async def rewrite_messages(
         self, key: str, messages: Sequence[InputItem], *, version: int = 0
     ) -> None:
         path = self._key_to_path(key, suffix=self._log_suffix(version))
-        lock = await self._get_lock(key)
-        async with lock:
-            if not messages:
-                await asyncio.to_thread(_unlink_if_exists, path)
-            else:
-                await asyncio.to_thread(_atomic_write, path, encode_messages(messages))
+        if not messages:
+            await self._committer.submit(_Write("unlink", path))
+        else:
+            await self._committer.submit(self._log_write("replace", path, messages))
 
     # --- Internals ---
 
-    async def _get_lock(self, key: str) -> asyncio.Lock:
-        async with self._locks_guard:
-            lock = self._locks.get(key)
-            if lock is None:
-                lock = asyncio.Lock()
-                self._locks[key] = lock
-        return lock
+    def _log_write(
+        self,
+        kind: Literal["append", "replace"],
+        path: Path,
+        messages: Sequence[InputItem],
+    ) -> _Write:
+        records, blobs = self._codec.encode(messages)
+        return _Write(
+            kind,
+            path,
+            records,
+            blobs={_blob_path(self._root, d): data for d, data in blobs.items()},
+        )
 
     def _key_to_path(self, key: str, *, suffix: str = ".json") -> Path:
         """
@@ -178,9 +252,278 @@ class FileCheckpointStore(CheckpointStore):
         return target
 
 
-def _atomic_write(path: Path, data: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    atomic_write_bytes(path, data)
+# --- Group commit ---
+
+
+type _WriteKind = Literal["append", "replace", "unlink", "delete_key"]
+
+
+@dataclass(slots=True)
+class _Write:
+    kind: _WriteKind
+    path: Path
+    data: bytes = b""
+    # Out-of-line parts the records reference, written before them.
+    blobs: dict[Path, bytes] = field(default_factory=dict[Path, bytes])
+    # Set by the committer once the write is applied (and, on success, durable).
+    error: BaseException | None = None
+
+
+@dataclass(slots=True)
+class _Pending:
+    write: _Write
+    done: asyncio.Future[None] = field(repr=False)
+
+
+class _OpenLogs:
+    """
+    An LRU of append-mode file descriptors, one per log file.
+
+    Touched only from the committer's worker thread, plus :meth:`close_all`
+    once the committer is idle — the lock just keeps that hand-off safe.
+
+    A cached handle is checked against the path before each reuse: if another
+    store instance or process replaced or removed the log, the handle points at
+    an unlinked inode, so it is dropped and the path reopened instead of
+    appending where nobody will read. Handles still open when the LRU is
+    garbage-collected are closed then, so skipping ``aclose`` does not leak.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._fds: OrderedDict[Path, int] = OrderedDict()
+        self._lock = threading.Lock()
+        weakref.finalize(self, _close_fds, self._fds)
+
+    def __len__(self) -> int:
+        return len(self._fds)
+
+    def get(self, path: Path) -> tuple[int, bool]:
+        """The append fd for ``path`` and whether this call created the file."""
+        with self._lock:
+            fd = self._fds.get(path)
+            if fd is not None:
+                if _same_file(fd, path):
+                    self._fds.move_to_end(path)
+                    return fd, False
+                del self._fds[path]
+                os.close(fd)
+            flags = os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0)
+            try:
+                fd = os.open(path, flags | os.O_CREAT | os.O_EXCL, 0o666)
+                created = True
+            except FileExistsError:
+                fd = os.open(path, flags)
+                created = False
+            self._fds[path] = fd
+            while len(self._fds) > self._capacity:
+                _, old = self._fds.popitem(last=False)
+                os.close(old)
+            return fd, created
+
+    def fd(self, path: Path) -> int | None:
+        return self._fds.get(path)
+
+    def evict(self, path: Path) -> None:
+        """Close ``path``'s handle — the file is about to be replaced or removed."""
+        with self._lock:
+            fd = self._fds.pop(path, None)
+            if fd is not None:
+                os.close(fd)
+
+    def close_all(self) -> None:
+        with self._lock:
+            _close_fds(self._fds)
+
+
+def _close_fds(fds: OrderedDict[Path, int]) -> None:
+    handles = list(fds.values())
+    fds.clear()
+    for fd in handles:
+        os.close(fd)
+
+
+def _same_file(fd: int, path: Path) -> bool:
+    """Whether ``path`` still names the file open at ``fd``."""
+    try:
+        current = path.stat()
+    except FileNotFoundError:
+        return False
+    held = os.fstat(fd)
+    return (held.st_ino, held.st_dev) == (current.st_ino, current.st_dev)
+
+
+class _GroupCommitter:
+    """
+    Applies queued writes in batches, one worker-thread hop per batch.
+
+    The drain task runs only while writes are queued and exits when the queue
+    is empty, so an idle store holds no task (and no event loop).
+    """
+
+    def __init__(self, *, window: float, logs: _OpenLogs) -> None:
+        self.logs = logs
+        self._window = window
+        self._queue: list[_Pending] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def enqueue(self, write: _Write) -> asyncio.Future[None]:
+        done = asyncio.get_running_loop().create_future()
+        self._queue.append(_Pending(write, done))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain(), name="checkpoint-commit")
+        return done
+
+    async def submit(self, write: _Write) -> None:
+        await self.enqueue(write)
+
+    async def flush(self) -> None:
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    async def _drain(self) -> None:
+        while self._queue:
+            if self._window > 0:
+                await asyncio.sleep(self._window)
+            batch, self._queue = self._queue, []
+            try:
+                await asyncio.to_thread(
+                    _commit_batch, [p.write for p in batch], self.logs
+                )
+            except asyncio.CancelledError:
+                for pending in batch + self._queue:
+                    pending.done.cancel()
+                self._queue = []
+                raise
+            except Exception as exc:  # a bug, not an I/O error — fail the batch
+                for pending in batch:
+                    pending.write.error = pending.write.error or exc
+            for pending in batch:
+                if pending.done.done():  # the waiter was cancelled
+                    continue
+                if pending.write.error is not None:
+                    pending.done.set_exception(pending.write.error)
+                else:
+                    pending.done.set_result(None)
+
+
+def _commit_batch(writes: list[_Write], logs: _OpenLogs) -> None:
+    """
+    Apply ``writes`` in order, making each durable before it is reported.
+
+    Appends are written and their files remembered; dirty files and the
+    directories whose entries changed are synced once, at the next barrier
+    (any non-append write) or at the end of the batch. A failed sync fails
+    every write it was covering.
+    """
+    dirs = DirSyncBatch()
+    dirty: dict[Path, list[_Write]] = {}
+    covered: list[_Write] = []
+
+    def barrier() -> None:
+        for path, path_writes in dirty.items():
+            try:
+                _fsync_log(path, logs)
+            except OSError as exc:
+                for write in path_writes:
+                    write.error = write.error or exc
+        dirty.clear()
+        try:
+            dirs.sync()
+        except OSError as exc:
+            for write in covered:
+                write.error = write.error or exc
+        covered.clear()
+
+    for write in writes:
+        if write.kind != "append":
+            barrier()
+        try:
+            _apply_write(write, logs, dirs)
+        except OSError as exc:
+            write.error = exc
+        else:
+            if write.kind == "append":
+                dirty.setdefault(write.path, []).append(write)
+        covered.append(write)
+    barrier()
+
+
+def _apply_write(write: _Write, logs: _OpenLogs, dirs: DirSyncBatch) -> None:
+    for blob_path, data in write.blobs.items():
+        _write_blob(blob_path, data, dirs)
+    if write.kind == "append":
+        _ensure_parent(write.path, dirs)
+        fd, created = logs.get(write.path)
+        _write_all(fd, write.data)
+        if created:
+            dirs.add(write.path.parent)
+    elif write.kind == "replace":
+        logs.evict(write.path)
+        _ensure_parent(write.path, dirs)
+        atomic_write_bytes(write.path, write.data, sync_dir=dirs)
+    elif write.kind == "unlink":
+        logs.evict(write.path)
+        if _unlink_if_exists(write.path):
+            dirs.add(write.path.parent)
+    else:  # "delete_key": the head, its log and every version-suffixed log
+        base = write.path
+        targets = [
+            base.with_name(base.name + ".json"),
+            base.with_name(base.name + ".jsonl"),
+        ]
+        if base.parent.is_dir():
+            targets += base.parent.glob(f"{base.name}.v*.jsonl")
+        for path in targets:
+            logs.evict(path)
+            if _unlink_if_exists(path):
+                dirs.add(path.parent)
+
+
+def _write_blob(path: Path, data: bytes, dirs: DirSyncBatch) -> None:
+    # Content-addressed: an existing blob already holds exactly this content.
+    if path.exists():
+        return
+    _ensure_parent(path, dirs)
+    atomic_write_bytes(path, data, sync_dir=dirs)
+
+
+def _blob_path(root: Path, digest: str) -> Path:
+    return root / _BLOB_DIR / digest[:2] / digest
+
+
+def _fsync_log(path: Path, logs: _OpenLogs) -> None:
+    fd = logs.fd(path)
+    if fd is not None:
+        os.fsync(fd)
+        return
+    # The LRU closed the handle mid-batch; ``fsync`` flushes the file, not
+    # the descriptor, so any fresh one will do.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _ensure_parent(path: Path, dirs: DirSyncBatch) -> None:
+    """Create ``path``'s missing ancestors, queueing each new entry's sync."""
+    parent = path.parent
+    if parent.is_dir():
+        return
+    missing: list[Path] = []
+    while not parent.is_dir():
+        missing.append(parent)
+        parent = parent.parent
+    for directory in reversed(missing):
+        directory.mkdir(exist_ok=True)
+        dirs.add(directory.parent)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
 
 
 def _read_if_exists(path: Path) -> bytes | None:
@@ -190,39 +533,27 @@ def _read_if_exists(path: Path) -> bytes | None:
         return None
 
 
-def _append_bytes(path: Path, blob: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("ab") as f:
-        f.write(blob)
-        # fsync to match the head's durability: the head is saved (fsynced)
-        # right after this append, so a power loss must not be able to keep
-        # the head while losing the log tail it acknowledges.
-        f.flush()
-        os.fsync(f.fileno())
-
-
-def _read_message_log(path: Path) -> list[InputItem]:
+def _read_message_log(path: Path, root: Path, start: int) -> list[InputItem]:
     try:
         blob = path.read_bytes()
     except FileNotFoundError:
         return []
-    return decode_message_log(blob)
 
+    def load_blob(digest: str) -> bytes | None:
+        # The digest comes from the log — never let it name a path of its own.
+        if len(digest) != 64 or not _HEX_DIGITS.issuperset(digest):
+            return None
+        return _read_if_exists(_blob_path(root, digest))
+
+    return decode_message_log(blob, start=start, load_blob=load_blob)
 
-def _unlink_if_exists(path: Path) -> None:
+
+def _unlink_if_exists(path: Path) -> bool:
     try:
         path.unlink()
     except FileNotFoundError:
-        pass
-
-
-def _unlink_log_versions(base_path: Path) -> None:
-    """Remove every version-suffixed log (``<leaf>.v<N>.jsonl``)."""
-    parent = base_path.parent
-    if not parent.is_dir():
-        return
-    for path in parent.glob(f"{base_path.name}.v*.jsonl"):
-        _unlink_if_exists(path)
+        return False
+    return True
 
 
 def _list_keys(root: Path, prefix: str) -> list[str]:
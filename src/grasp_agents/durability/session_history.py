@@ -9,8 +9,9 @@ the store or disturbing a live session sharing it.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .checkpoints import AgentCheckpoint, CheckpointKind
 from .message_record import MessageRecord, MessageStatus
@@ -112,3 +113,34 @@ async def read_pending_messages(
         if record is not None and record.status is MessageStatus.PENDING:
             pending.append(record.message)
     return pending
+
+
+async def read_fs_snapshot_refs(store: CheckpointStore, prefix: str = "") -> set[str]:
+    """
+    Every filesystem snapshot ref recorded under ``prefix`` (default: the
+    whole store) — session records, agent heads and their step watermarks
+    alike. The live set a snapshot store's garbage collection must keep.
+    Unreadable records are skipped.
+    """
+    refs: set[str] = set()
+    for key in await store.list_keys(prefix):
+        data = await store.load(key)
+        if data is None:
+            continue
+        try:
+            _collect_fs_snapshot_refs(json.loads(data), refs)
+        except ValueError:
+            continue
+    return refs
+
+
+def _collect_fs_snapshot_refs(node: Any, refs: set[str]) -> None:
+    if isinstance(node, dict):
+        for field_name, value in node.items():  # pyright: ignore[reportUnknownVariableType]
+            if field_name == "fs_snapshot_ref" and isinstance(value, str):
+                refs.add(value)
+            else:
+                _collect_fs_snapshot_refs(value, refs)
+    elif isinstance(node, list):
+        for value in node:  # pyright: ignore[reportUnknownVariableType]
+            _collect_fs_snapshot_refs(value, refs)
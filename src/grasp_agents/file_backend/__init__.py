@@ -22,7 +22,12 @@ import importlib
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .atomic_write import atomic_write_bytes, atomic_write_text
+    from .atomic_write import (
+        DirSyncBatch,
+        atomic_write_bytes,
+        atomic_write_text,
+        fsync_dir,
+    )
     from .base import FileBackend, FileEntry, FileStat
     from .local import LocalFileBackend
     from .mcp import MCPFileBackend
@@ -40,6 +45,8 @@ if TYPE_CHECKING:
 _LAZY: dict[str, str] = {
     "atomic_write_bytes": "atomic_write",
     "atomic_write_text": "atomic_write",
+    "DirSyncBatch": "atomic_write",
+    "fsync_dir": "atomic_write",
     "FileBackend": "base",
     "FileEntry": "base",
     "FileStat": "base",
@@ -66,6 +73,7 @@ def __getattr__(name: str) -> Any:
 
 
 __all__ = [
+    "DirSyncBatch",
     "FileBackend",
     "FileEntry",
     "FileStat",
@@ -76,6 +84,7 @@ __all__ = [
     "atomic_write_bytes",
     "atomic_write_text",
     "check_sensitive_path",
+    "fsync_dir",
     "has_binary_extension",
     "is_blocked_device",
     "resolve_safe",
@@ -9,6 +9,10 @@ Pattern (standard POSIX "write, rename" dance):
 2. Write the payload to the temp file and ``fsync`` it.
 3. ``os.replace`` the temp file onto the target. Atomic on POSIX and on
    Windows (Python 3.3+).
+4. Optionally (``sync_dir``) ``fsync`` the parent directory, so the rename
+   itself survives a power loss — without it the new name can roll back to
+   the old file. Writers that land many files at once pass a
+   :class:`DirSyncBatch` instead and sync each directory once at the end.
 
 On any failure the temp file is cleaned up so partial / torn files never
 appear at the target location.
@@ -34,6 +38,57 @@ import tempfile
 from pathlib import Path
 
 
+def fsync_dir(path: Path) -> None:
+    """
+    Flush ``path``'s directory entries (creates, renames, unlinks) to disk.
+
+    A no-op on Windows, which cannot open a directory for ``fsync`` (and
+    journals renames itself).
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class DirSyncBatch:
+    """
+    Directories whose entries must be flushed, each synced once.
+
+    Collects the parents of many atomic writes (``sync_dir=batch``) so a
+    writer landing N files in one directory pays one directory ``fsync``
+    instead of N. Nothing is durable until :meth:`sync` returns.
+    """
+
+    def __init__(self) -> None:
+        self._dirs: dict[Path, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._dirs)
+
+    def add(self, path: Path) -> None:
+        self._dirs[path] = None
+
+    def sync(self) -> None:
+        """
+        ``fsync`` every collected directory, then forget them.
+
+        Every directory is attempted; the first failure is re-raised after.
+        """
+        dirs, self._dirs = list(self._dirs), {}
+        error: OSError | None = None
+        for path in dirs:
+            try:
+                fsync_dir(path)
+            except OSError as exc:
+                error = error or exc
+        if error is not None:
+            raise error
+
+
 def atomic_write_bytes(
     path: Path,
     data: bytes,
@@ -41,6 +96,7 @@ def atomic_write_bytes(
     mode: int = 0o600,
     overwrite: bool = True,
     fsync: bool = True,
+    sync_dir: bool | DirSyncBatch = False,
 ) -> None:
     """
     Write ``data`` to ``path`` atomically.
@@ -54,6 +110,10 @@ def atomic_write_bytes(
         fsync: If True (default), ``fsync`` the temp file before rename.
             Set False to skip the durability flush in performance-sensitive
             cases where a crash-window reorder is acceptable.
+        sync_dir: ``True`` to ``fsync`` the parent directory after the
+            rename (the rename is then durable on return); a
+            :class:`DirSyncBatch` to defer that to the batch's ``sync``.
+            Default ``False``: the contents are durable, the rename is not.
 
     Raises:
         FileExistsError: When ``overwrite=False`` and the target exists.
@@ -94,6 +154,10 @@ def atomic_write_bytes(
         except OSError:
             pass
         raise
+    if isinstance(sync_dir, DirSyncBatch):
+        sync_dir.add(parent)
+    elif sync_dir:
+        fsync_dir(parent)
 
 
 def atomic_write_text(
@@ -33,11 +33,15 @@ Time is wall-clock seconds since epoch (float) for parity with
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
+from .paths import PathAccessError
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     from .paths import AccessMode
@@ -60,6 +64,8 @@ class FileEntry:
     path: Path  # absolute path in the backend's address space
     is_dir: bool
     mtime: float = 0.0
+    size: int | None = None  # bytes; ``None`` when the listing doesn't carry it
+    mtime_ns: int | None = None  # exact mtime, when the backend reports it
 
 
 GrepOutputMode = Literal["files_with_matches", "content", "count"]
@@ -109,6 +115,16 @@ class FileBackend(ABC):
     @abstractmethod
     def allowed_roots(self) -> list[Path]: ...
 
+    @property
+    def relative_root(self) -> Path | None:
+        """
+        Directory a relative path resolves against (the first allowed root
+        by default); ``None`` when there is none. Tool concurrency keys are
+        made absolute with it before they are compared.
+        """
+        roots = self.allowed_roots
+        return roots[0] if roots else None
+
     @abstractmethod
     def add_allowed_root(self, root: Path) -> None:
         """
@@ -152,9 +168,63 @@ class FileBackend(ABC):
         """
         ...
 
+    async def validate_many(
+        self,
+        paths: Sequence[Path],
+        *,
+        must_exist: bool,
+        access: AccessMode = "read",
+        dotfile_overrides: set[Path] | None = None,
+    ) -> list[Path | PathAccessError]:
+        """
+        :meth:`validate_path` for each of ``paths``, in order — the resolved
+        Path, or the :class:`PathAccessError` that path raised (one refused
+        path doesn't fail the batch).
+
+        Concrete default — one :meth:`validate_path` call per path. Backends
+        that can check a batch in one pass (e.g. the local filesystem, in one
+        worker-thread hop) override it with the same policy.
+        """
+        out: list[Path | PathAccessError] = []
+        for path in paths:
+            try:
+                out.append(
+                    await self.validate_path(
+                        path,
+                        must_exist=must_exist,
+                        access=access,
+                        dotfile_overrides=dotfile_overrides,
+                    )
+                )
+            except PathAccessError as exc:
+                out.append(exc)
+        return out
+
     @abstractmethod
     async def stat(self, path: Path) -> FileStat: ...
 
+    async def stat_many(
+        self, paths: Sequence[Path], *, max_concurrency: int = 16
+    ) -> list[FileStat | None]:
+        """
+        :meth:`stat` for each of ``paths``, in order; ``None`` where the
+        path can't be stat-ed (missing, vanished, permission).
+
+        Concrete default — concurrent :meth:`stat` calls, at most
+        ``max_concurrency`` in flight. Backends with a cheaper bulk path
+        override it.
+        """
+        limiter = asyncio.Semaphore(max_concurrency)
+
+        async def _stat(path: Path) -> FileStat | None:
+            async with limiter:
+                try:
+                    return await self.stat(path)
+                except OSError:
+                    return None
+
+        return list(await asyncio.gather(*(_stat(p) for p in paths)))
+
     @abstractmethod
     async def exists(self, path: Path) -> bool: ...
 
@@ -177,6 +247,26 @@ class FileBackend(ABC):
         """Return ``(data, mtime)``. Used by :class:`EditTool`."""
         ...
 
+    async def read_many(
+        self, paths: Sequence[Path], *, max_concurrency: int = 16
+    ) -> list[tuple[bytes, float]]:
+        """
+        Return ``(data, mtime)`` for each of ``paths``, in order.
+
+        Concrete default — concurrent :meth:`read_bytes` calls, at most
+        ``max_concurrency`` in flight, so it works on any backend. Backends
+        with a cheaper bulk path (e.g. one archive download from a remote
+        sandbox) override it. Raises like :meth:`read_bytes` if any path is
+        missing.
+        """
+        limiter = asyncio.Semaphore(max_concurrency)
+
+        async def _read(path: Path) -> tuple[bytes, float]:
+            async with limiter:
+                return await self.read_bytes(path)
+
+        return list(await asyncio.gather(*(_read(p) for p in paths)))
+
     @abstractmethod
     async def write_bytes(
         self,
@@ -5,7 +5,13 @@ filesystem.
 Holds the path-safety guards (sandbox roots, sensitive-path deny list,
 device-path block) — the tools call :meth:`validate_path` before any
 I/O. Search delegates to ``rg`` for grep (see :mod:`..file_search.grep`)
-and ``os.walk`` for find_files.
+and an ``os.scandir`` walk for find_files.
+
+The batched calls (:meth:`~LocalFileBackend.validate_many`,
+:meth:`~LocalFileBackend.stat_many`, :meth:`~LocalFileBackend.read_many`)
+make one worker-thread hop per batch rather than one per path, and
+validation resolves each directory's realpath once per batch against
+allowed roots resolved once per backend.
 
 Read-before-write bookkeeping lives on the *agent* (each
 :class:`AgentLoop` owns its own :class:`FileEditSessionState`); the
@@ -17,6 +23,7 @@ from __future__ import annotations
 import asyncio
 import fnmatch
 import os
+import stat as stat_module
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,11 +34,12 @@ from .paths import (
     check_access_path,
     check_sensitive_path,
     is_blocked_device,
+    resolve_roots,
     resolve_safe,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from .paths import AccessMode
 
@@ -122,6 +130,8 @@ class LocalFileBackend(FileBackend):
         self._deny_read = self._resolve_carveouts(deny_read)
         self._allow_read = self._resolve_carveouts(allow_read)
         self._deny_write = self._resolve_carveouts([*(deny_write or []), *ro])
+        # ``_allowed_roots`` resolved, computed on first validation.
+        self._resolved_roots: tuple[Path, ...] | None = None
 
     @staticmethod
     def _resolve_carveouts(paths: list[Path | str] | None) -> tuple[Path, ...]:
@@ -133,11 +143,17 @@ class LocalFileBackend(FileBackend):
     def allowed_roots(self) -> list[Path]:
         return list(self._allowed_roots)
 
+    @property
+    def relative_root(self) -> Path | None:
+        # ``Path.resolve`` joins a relative path onto the process cwd.
+        return Path.cwd()
+
     def add_allowed_root(self, root: Path) -> None:
         resolved = Path(root).expanduser()
         if any(resolved == r or r in resolved.parents for r in self._allowed_roots):
             return
         self._allowed_roots.append(resolved)
+        self._resolved_roots = None
 
     async def validate_path(
         self,
@@ -146,13 +162,66 @@ class LocalFileBackend(FileBackend):
         must_exist: bool,
         access: AccessMode = "read",
         dotfile_overrides: set[Path] | None = None,
+    ) -> Path:
+        return self._validate(
+            path,
+            must_exist=must_exist,
+            access=access,
+            dotfile_overrides=dotfile_overrides,
+            resolver=None,
+        )
+
+    async def validate_many(
+        self,
+        paths: Sequence[Path],
+        *,
+        must_exist: bool,
+        access: AccessMode = "read",
+        dotfile_overrides: set[Path] | None = None,
+    ) -> list[Path | PathAccessError]:
+        def _validate_all() -> list[Path | PathAccessError]:
+            resolver = _DirRealpathCache()
+            out: list[Path | PathAccessError] = []
+            for path in paths:
+                try:
+                    out.append(
+                        self._validate(
+                            path,
+                            must_exist=must_exist,
+                            access=access,
+                            dotfile_overrides=dotfile_overrides,
+                            resolver=resolver,
+                        )
+                    )
+                except PathAccessError as exc:
+                    out.append(exc)
+            return out
+
+        return await asyncio.to_thread(_validate_all)
+
+    def _validate(
+        self,
+        path: Path,
+        *,
+        must_exist: bool,
+        access: AccessMode,
+        dotfile_overrides: set[Path] | None,
+        resolver: _DirRealpathCache | None,
     ) -> Path:
         if is_blocked_device(path):
             raise PathAccessError(
                 f"Cannot access device path {path}: blocks or produces infinite output."
             )
 
-        resolved = resolve_safe(path, self._allowed_roots, must_exist=must_exist)
+        if self._resolved_roots is None and self._allowed_roots:
+            self._resolved_roots = resolve_roots(self._allowed_roots)
+        resolved = resolve_safe(
+            path,
+            self._allowed_roots,
+            must_exist=must_exist,
+            resolved_roots=self._resolved_roots,
+            resolver=resolver.resolve if resolver is not None else None,
+        )
 
         err = check_sensitive_path(
             resolved,
@@ -180,6 +249,27 @@ class LocalFileBackend(FileBackend):
         # only the permission bits can apply 0o7777 themselves.
         return FileStat(mtime=st.st_mtime, mode=st.st_mode, size=st.st_size)
 
+    async def stat_many(
+        self, paths: Sequence[Path], *, max_concurrency: int = 16
+    ) -> list[FileStat | None]:
+        # One worker hop for the whole batch; ``max_concurrency`` is moot.
+        del max_concurrency
+
+        def _stat_all() -> list[FileStat | None]:
+            out: list[FileStat | None] = []
+            for path in paths:
+                try:
+                    st = path.stat()
+                except OSError:
+                    out.append(None)
+                    continue
+                out.append(
+                    FileStat(mtime=st.st_mtime, mode=st.st_mode, size=st.st_size)
+                )
+            return out
+
+        return await asyncio.to_thread(_stat_all)
+
     async def exists(self, path: Path) -> bool:
         return await asyncio.to_thread(path.exists)
 
@@ -203,6 +293,24 @@ class LocalFileBackend(FileBackend):
 
         return await asyncio.to_thread(_read)
 
+    async def read_many(
+        self, paths: Sequence[Path], *, max_concurrency: int = 16
+    ) -> list[tuple[bytes, float]]:
+        # One worker hop for the whole batch; ``max_concurrency`` is moot.
+        # ``open`` follows symlinks like ``read_bytes``' resolve, and the
+        # mtime comes from the open descriptor.
+        del max_concurrency
+
+        def _read_all() -> list[tuple[bytes, float]]:
+            out: list[tuple[bytes, float]] = []
+            for path in paths:
+                with open(path, "rb") as f:  # noqa: PTH123
+                    mtime = os.fstat(f.fileno()).st_mtime
+                    out.append((f.read(), mtime))
+            return out
+
+        return await asyncio.to_thread(_read_all)
+
     async def write_bytes(
         self,
         path: Path,
@@ -248,20 +356,35 @@ class LocalFileBackend(FileBackend):
             if not path.is_dir():
                 return []
             entries: list[FileEntry] = []
-            paths_iter = path.rglob("*") if recursive else path.iterdir()
-            for p in paths_iter:
+            # ``(dir path, its Path)``; like ``rglob``, symlinked directories
+            # are listed but not descended into.
+            pending: list[tuple[str, Path]] = [(str(path), path)]
+            while pending:
+                dir_str, dir_path = pending.pop()
                 try:
-                    st = p.stat()
+                    with os.scandir(dir_str) as it:
+                        dir_entries = list(it)
                 except OSError:
                     continue
-                entries.append(
-                    FileEntry(
-                        name=p.name,
-                        path=p,
-                        is_dir=p.is_dir(),
-                        mtime=st.st_mtime,
+                for entry in dir_entries:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    is_dir = stat_module.S_ISDIR(st.st_mode)
+                    entry_path = dir_path / entry.name
+                    entries.append(
+                        FileEntry(
+                            name=entry.name,
+                            path=entry_path,
+                            is_dir=is_dir,
+                            mtime=st.st_mtime,
+                            size=st.st_size,
+                            mtime_ns=st.st_mtime_ns,
+                        )
                     )
-                )
+                    if recursive and is_dir and not entry.is_symlink():
+                        pending.append((entry.path, entry_path))
             return entries
 
         return await asyncio.to_thread(_walk)
@@ -275,39 +398,57 @@ class LocalFileBackend(FileBackend):
         head_limit: int = 250,
     ) -> tuple[list[FileEntry], bool]:
         def _walk() -> tuple[list[FileEntry], bool]:
+            # Same visit order as a top-down ``os.walk`` (a directory's files,
+            # then each subdirectory in turn; symlinked directories are not
+            # descended), but relative paths are built as strings and each
+            # match is stat-ed once from its ``DirEntry``.
             matched: list[FileEntry] = []
             collect_budget = head_limit + 1
-            truncated = False
-            root_str = str(root)
-            for dirpath, dirnames, filenames in os.walk(root_str):
-                dirnames[:] = [
-                    d
-                    for d in dirnames
-                    if d not in _ALWAYS_SKIP_DIRS
-                    and (include_hidden or not d.startswith("."))
-                ]
-                for fname in filenames:
-                    if not include_hidden and fname.startswith("."):
-                        continue
-                    abs_path = Path(dirpath) / fname
-                    rel_path = str(abs_path.relative_to(root))
-                    if _glob_matches(pattern, rel_path):
-                        try:
-                            mtime = abs_path.stat().st_mtime
-                        except OSError:
-                            continue
-                        matched.append(
-                            FileEntry(
-                                name=fname,
-                                path=abs_path,
-                                is_dir=False,
-                                mtime=mtime,
+            pending: list[tuple[str, Path, str]] = [(str(root), root, "")]
+            while pending:
+                dir_str, dir_path, rel_dir = pending.pop()
+                try:
+                    with os.scandir(dir_str) as it:
+                        dir_entries = list(it)
+                except OSError:
+                    continue
+                subdirs: list[tuple[str, Path, str]] = []
+                for entry in dir_entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if (
+                            name not in _ALWAYS_SKIP_DIRS
+                            and (include_hidden or not name.startswith("."))
+                            and not entry.is_symlink()
+                        ):
+                            subdirs.append(
+                                (entry.path, dir_path / name, f"{rel_dir}{name}/")
                             )
+                        continue
+                    if not include_hidden and name.startswith("."):
+                        continue
+                    if not _glob_matches(pattern, rel_dir + name):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    matched.append(
+                        FileEntry(
+                            name=name,
+                            path=dir_path / name,
+                            is_dir=False,
+                            mtime=mtime,
                         )
-                        if len(matched) >= collect_budget:
-                            truncated = True
-                            return matched, truncated
-            return matched, truncated
+                    )
+                    if len(matched) >= collect_budget:
+                        return matched, True
+                pending.extend(reversed(subdirs))
+            return matched, False
 
         return await asyncio.to_thread(_walk)
 
@@ -347,6 +488,42 @@ class LocalFileBackend(FileBackend):
         )
 
 
+class _DirRealpathCache:
+    """
+    ``Path.resolve`` for a batch of paths, resolving each parent directory
+    once: a path whose leaf is not a symlink resolves to its parent's
+    realpath joined with its name. Paths with ``..`` segments, and symlinked
+    leaves, take the full ``resolve``.
+    """
+
+    def __init__(self) -> None:
+        self._dirs: dict[tuple[str, bool], Path] = {}
+
+    def resolve(self, candidate: Path, strict: bool) -> Path:
+        if ".." in candidate.parts:
+            return candidate.resolve(strict=strict)
+        absolute = candidate if candidate.is_absolute() else Path.cwd() / candidate
+        name = absolute.name
+        if not name:
+            return candidate.resolve(strict=strict)
+        key = (str(absolute.parent), strict)
+        parent = self._dirs.get(key)
+        if parent is None:
+            parent = self._dirs[key] = absolute.parent.resolve(strict=strict)
+        leaf = parent / name
+        try:
+            st = os.lstat(leaf)
+        except FileNotFoundError:
+            if strict:
+                raise
+            return leaf
+        except OSError:
+            return candidate.resolve(strict=strict)
+        if stat_module.S_ISLNK(st.st_mode):
+            return leaf.resolve(strict=strict)
+        return leaf
+
+
 def glob_filter_entries(
     entries: Iterable[FileEntry],
     root: Path,
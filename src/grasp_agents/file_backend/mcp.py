@@ -6,7 +6,8 @@ Built around two MCP surfaces:
 * **resources** — the canonical read-only surface. ``read_text`` calls
   ``resources/read``; ``stat`` / ``exists`` / ``list_dir`` /
   ``find_files`` all query a cached :class:`MCPResourceIndex` populated
-  by a single ``resources/list`` per session.
+  by a single (paginated) ``resources/list`` per session and kept
+  current by the server's ``resources/list_changed`` notifications.
 
 * **tools** — for mutations only. The server SHOULD expose:
 
@@ -57,6 +58,7 @@ if TYPE_CHECKING:
     from mcp.types import ContentBlock
 
     from grasp_agents.mcp.client import MCPClient
+    from grasp_agents.mcp.resource_index import ResourceEntry
 
     from .paths import AccessMode
 
@@ -112,6 +114,7 @@ class MCPFileBackend(FileBackend):
         self._uri_scheme = resource_uri_scheme
         self._write_tool = write_tool_name
         self._delete_tool = delete_tool_name
+        self._owns_index = index is None
         self._index = index or MCPResourceIndex(client, uri_scheme=resource_uri_scheme)
 
     @property
@@ -131,6 +134,11 @@ class MCPFileBackend(FileBackend):
         """Expose the resource index for sharing with other adapters."""
         return self._index
 
+    def close(self) -> None:
+        """Close the resource index if this backend created it."""
+        if self._owns_index:
+            self._index.close()
+
     # ---- Path / URI helpers --------------------------------------------------
 
     def _posix(self, path: Path) -> PurePosixPath:
@@ -213,8 +221,7 @@ class MCPFileBackend(FileBackend):
             return True
         if await self._index.get(self._index.make_uri(parent)) is not None:
             return True
-        children = await self._index.list_under(parent)
-        return len(children) > 0
+        return await self._index.has_entries_under(parent)
 
     async def read_text(self, path: Path) -> tuple[str, float]:
         uri = self._to_uri(path)
@@ -282,15 +289,7 @@ class MCPFileBackend(FileBackend):
 
     async def list_dir(self, path: Path, *, recursive: bool = False) -> list[FileEntry]:
         entries = await self._index.children_of(self._posix(path), recursive=recursive)
-        return [
-            FileEntry(
-                name=e.path.name,
-                path=type(path)(str(e.path)),
-                is_dir=e.is_dir,
-                mtime=e.mtime_seconds,
-            )
-            for e in entries
-        ]
+        return [_file_entry(e, type(path)) for e in entries]
 
     async def find_files(
         self,
@@ -301,13 +300,15 @@ class MCPFileBackend(FileBackend):
         head_limit: int = 250,
     ) -> tuple[list[FileEntry], bool]:
         """
-        Glob over the resource index. MCP has no native glob; we use the
-        cached ``resources/list`` (one round-trip per session) and
-        filter client-side, sorted newest-first.
+        Glob over the resource index. MCP has no native glob; we match
+        against the index's path trie over the cached ``resources/list``
+        (no round-trip unless stale), sorted newest-first.
         """
-        flat_entries = await self.list_dir(root, recursive=True)
+        matched = await self._index.glob(
+            self._posix(root), pattern, include_hidden=include_hidden
+        )
         return glob_filter_entries(
-            flat_entries,
+            [_file_entry(e, type(root)) for e in matched],
             root,
             pattern,
             include_hidden=include_hidden,
@@ -368,6 +369,16 @@ class MCPFileBackend(FileBackend):
         return _parse_json_payload(result.content, tool_name)
 
 
+def _file_entry(entry: ResourceEntry, path_type: type[Path]) -> FileEntry:
+    return FileEntry(
+        name=entry.path.name,
+        path=path_type(str(entry.path)),
+        is_dir=entry.is_dir,
+        mtime=entry.mtime_seconds,
+        size=entry.size if entry.size >= 0 else None,
+    )
+
+
 def _ms_to_seconds(raw: Any) -> float:
     if raw is None:
         return 0.0
@@ -38,7 +38,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 AccessMode = Literal["read", "write"]
 
@@ -200,6 +203,8 @@ def resolve_safe(
     allowed_roots: list[Path],
     *,
     must_exist: bool = False,
+    resolved_roots: Sequence[Path] | None = None,
+    resolver: Callable[[Path, bool], Path] | None = None,
 ) -> Path:
     """
     Resolve ``path`` and confirm it lies under at least one allowed root.
@@ -213,6 +218,12 @@ def resolve_safe(
         must_exist: If True, the path itself must exist (uses
             ``resolve(strict=True)``). Use True for ``Read`` and ``Edit``
             of existing files; False for ``Write`` creating a new file.
+        resolved_roots: ``allowed_roots`` already passed through
+            :func:`resolve_roots`, so a caller validating many paths
+            resolves its roots once instead of on every call.
+        resolver: Stand-in for ``Path.resolve(strict=...)`` taking
+            ``(path, strict)`` — e.g. one caching directory realpaths
+            across a batch. Must raise as ``Path.resolve`` does.
 
     Returns:
         Resolved absolute path.
@@ -227,19 +238,37 @@ def resolve_safe(
 
     candidate = Path(path).expanduser()
     try:
-        resolved = candidate.resolve(strict=must_exist)
+        resolved = (
+            resolver(candidate, must_exist)
+            if resolver is not None
+            else candidate.resolve(strict=must_exist)
+        )
     except FileNotFoundError as exc:
         raise PathAccessError(f"Path does not exist: {path}") from exc
     except OSError as exc:
         raise PathAccessError(f"Cannot resolve path {path!r}: {exc}") from exc
+    return check_contained(resolved, allowed_roots, resolved_roots=resolved_roots)
+
+
+def resolve_roots(allowed_roots: Sequence[Path]) -> tuple[Path, ...]:
+    """``allowed_roots`` expanded and resolved, for :func:`resolve_safe`."""
+    return tuple(root.expanduser().resolve() for root in allowed_roots)
+
 
-    for root in allowed_roots:
-        root_resolved = root.expanduser().resolve()
-        try:
-            resolved.relative_to(root_resolved)
-        except ValueError:
-            continue
-        else:
+def check_contained(
+    resolved: Path,
+    allowed_roots: Sequence[Path],
+    *,
+    resolved_roots: Sequence[Path] | None = None,
+) -> Path:
+    """
+    Return ``resolved`` (an already-resolved path) if it lies under one of
+    ``allowed_roots``; raise :class:`PathAccessError` otherwise.
+    """
+    if resolved_roots is None:
+        resolved_roots = resolve_roots(allowed_roots)
+    for root_resolved in resolved_roots:
+        if resolved == root_resolved or root_resolved in resolved.parents:
             return resolved
 
     root_strs = ", ".join(str(r) for r in allowed_roots)
@@ -11,9 +11,6 @@ from logging import Formatter, Handler, LogRecord
 from pathlib import Path
 from typing import Any
 
-import yaml
-from rich.text import Text
-
 try:
     from opentelemetry import trace as _otel_trace
 except ImportError:  # opentelemetry is an optional dependency
@@ -36,6 +33,9 @@ class ColorFormatter(Formatter):
         message = super().format(record)
         color: str | None = getattr(record, "color", None)
         if color:
+            # Deferred: importing the library shouldn't load ``rich``.
+            from rich.text import Text  # noqa: PLC0415
+
             styled = Text(message, style=color)
             return styled.markup
         return message
@@ -103,31 +103,38 @@ def body_for_log(text: str, *, full: bool) -> str:
 # through a session must not be able to turn redaction off for the rest of it.
 _REDACT_ENABLED: bool = _env_flag("GRASP_LOG_REDACT_SECRETS", default=True)
 
-# Bounded quantifiers throughout (no unbounded backtracking) to stay ReDoS-safe
-# on large log payloads.
-_TOKEN_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(
-        r"-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----",
-        re.DOTALL,
-    ),
-    re.compile(r"eyJ[A-Za-z0-9_-]{6,}\.[A-Za-z0-9_-]{6,}\.[A-Za-z0-9_-]{6,}"),  # JWT
-    re.compile(r"\bsk-ant-[A-Za-z0-9_-]{12,}"),  # Anthropic
-    re.compile(r"\b[sr]k-(?:proj-)?[A-Za-z0-9_-]{16,}"),  # OpenAI
-    re.compile(r"\bAIza[A-Za-z0-9_-]{16,}"),  # Google
-    re.compile(r"\b(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9]{16,}"),  # GitHub
-    re.compile(r"\bxox[baprs]-[A-Za-z0-9-]{10,}"),  # Slack
-    re.compile(r"\bhf_[A-Za-z0-9]{16,}"),  # Hugging Face
-    re.compile(r"\bgsk_[A-Za-z0-9]{16,}"),  # Groq
+# Every secret shape below starts with, or is introduced by, one of these
+# literals. Scanning for them is one cheap pass, and clean text (nearly every
+# log line) stops there without running the full pattern.
+_SECRET_PREFILTER = re.compile(
+    r"-----BEGIN|eyJ|[sr]k-|AIza|gh[pousr]_|xox[baprs]-|hf_|gsk_"
+    r"|(?i:key|token|secret|passw|credential|authorization|bearer)"
 )
 
-# ``NAME=secret`` / ``NAME: secret`` and ``Authorization: Bearer …`` — keep the
-# name, drop the value.
-_ASSIGNMENT_PATTERN = re.compile(
-    r"(?i)\b([A-Za-z0-9_]*(?:KEY|TOKEN|SECRET|PASSWORD|PASSWD|CREDENTIAL)[A-Za-z0-9_]*)"
-    r"(\s*[=:]\s*)([^\s,;'\"]{4,})"
-)
-_AUTH_PATTERN = re.compile(
-    r"(?i)\b(authorization|bearer)(\s*[=:]?\s+)([A-Za-z0-9._~+/-]{8,}=*)"
+# All secret shapes as one alternation, applied in a single ``sub`` pass. Bounded
+# quantifiers throughout (no unbounded backtracking) to stay ReDoS-safe on large
+# log payloads. Provider tokens are masked (head…tail kept for debugging);
+# ``NAME=secret`` / ``NAME: secret`` and ``Authorization: Bearer …`` keep the name
+# and drop the value.
+_SECRET_PATTERN = re.compile(
+    r"(?P<pem>-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----)"
+    r"|(?P<token>"
+    r"eyJ[A-Za-z0-9_-]{6,}\.[A-Za-z0-9_-]{6,}\.[A-Za-z0-9_-]{6,}"  # JWT
+    r"|\bsk-ant-[A-Za-z0-9_-]{12,}"  # Anthropic
+    r"|\b[sr]k-(?:proj-)?[A-Za-z0-9_-]{16,}"  # OpenAI
+    r"|\bAIza[A-Za-z0-9_-]{16,}"  # Google
+    r"|\b(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9]{16,}"  # GitHub
+    r"|\bxox[baprs]-[A-Za-z0-9-]{10,}"  # Slack
+    r"|\bhf_[A-Za-z0-9]{16,}"  # Hugging Face
+    r"|\bgsk_[A-Za-z0-9]{16,}"  # Groq
+    r")"
+    r"|(?P<assign_name>(?i:\b[A-Za-z0-9_]*"
+    r"(?:KEY|TOKEN|SECRET|PASSWORD|PASSWD|CREDENTIAL)[A-Za-z0-9_]*))"
+    # A PEM block is never an assignment value: let the ``pem`` branch take it.
+    r"(?P<assign_sep>\s*[=:]\s*)(?!-----BEGIN)(?P<assign_value>[^\s,;'\"]{4,})"
+    r"|(?i:\b(?P<auth_name>authorization|bearer)(?P<auth_sep>\s*[=:]?\s+)"
+    r"(?P<auth_value>[A-Za-z0-9._~+/-]{8,}=*))",
+    re.DOTALL,
 )
 
 
@@ -137,18 +144,28 @@ def _mask(token: str) -> str:
     return f"{token[:6]}…{token[-4:]}"
 
 
-def _mask_match(match: re.Match[str]) -> str:
+def _redact_match(match: re.Match[str]) -> str:
+    # ``lastgroup`` is the last *closed* named group: the value group for the
+    # two name-keeping shapes, the enclosing group otherwise.
+    kind = match.lastgroup
+    if kind == "assign_value":
+        return f"{match['assign_name']}{match['assign_sep']}<redacted>"
+    if kind == "auth_value":
+        return f"{match['auth_name']}{match['auth_sep']}<redacted>"
     return _mask(match.group(0))
 
 
 def redact_secrets(text: str) -> str:
-    """Mask secret-looking substrings (API keys, tokens, Bearer headers, PEM)."""
-    if not _REDACT_ENABLED or not text:
+    """
+    Mask secret-looking substrings (API keys, tokens, Bearer headers, PEM).
+
+    One literal prefilter pass, then — only if it hits — one pass of the
+    combined pattern. Shared by the log filter and the tracing decorators' span
+    payloads.
+    """
+    if not _REDACT_ENABLED or not text or _SECRET_PREFILTER.search(text) is None:
         return text
-    for pattern in _TOKEN_PATTERNS:
-        text = pattern.sub(_mask_match, text)
-    text = _ASSIGNMENT_PATTERN.sub(r"\1\2<redacted>", text)
-    return _AUTH_PATTERN.sub(r"\1\2<redacted>", text)
+    return _SECRET_PATTERN.sub(_redact_match, text)
 
 
 class SecretRedactingFilter(logging.Filter):
@@ -157,11 +174,15 @@ class SecretRedactingFilter(logging.Filter):
 
     Attach to handlers that emit ``grasp_agents`` records (``setup_logging`` and
     ``enable_verbose_stdout_logging`` do this automatically); embedding hosts can
-    add it to their own handlers in one line.
+    add it to their own handlers in one line. As a handler filter it runs only
+    for records that handler emits (after its level check). The message is
+    scanned once per record, and further handlers skip it. Only a message that
+    actually contained a secret has its ``msg`` / ``args`` replaced by the
+    redacted text; any other record keeps them for downstream formatters.
     """
 
     def filter(self, record: LogRecord) -> bool:
-        if not _REDACT_ENABLED:
+        if not _REDACT_ENABLED or getattr(record, "_grasp_redacted", False):
             return True
         with contextlib.suppress(Exception):
             message = record.getMessage()
@@ -169,6 +190,7 @@ class SecretRedactingFilter(logging.Filter):
             if redacted != message:
                 record.msg = redacted
                 record.args = None
+            record._grasp_redacted = True  # type: ignore[attr-defined]  # noqa: SLF001
         return True
 
 
@@ -268,6 +290,8 @@ def setup_logging(logs_file_path: str | Path, logs_config_path: str | Path) -> N
     """Configure logging from a YAML ``dictConfig`` file (host/app entry point)."""
     logs_file_path = Path(logs_file_path)
     logs_file_path.parent.mkdir(exist_ok=True, parents=True)
+    import yaml  # noqa: PLC0415
+
     with Path(logs_config_path).open() as f:
         config = yaml.safe_load(f)
 
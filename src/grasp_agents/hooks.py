@@ -6,6 +6,7 @@ overrides (*_impl methods). The Protocols here define the callable signatures.
 
 Agent Loop Hooks (registered on AgentLoop via LLMAgent):
     ViewProjector  — derives the per-turn model-facing view from the log
+    ViewEditor     — a ViewProjector that can emit sparse edits instead of a copy
     BeforeLlmHook  — fires before each LLM call
     AfterLlmHook   — fires after each LLM response
     FinalAnswerExtractor  — determines when the agent should stop
@@ -26,26 +27,31 @@ Processor Hooks:
     WorkflowLoopTerminator — determines when a looped workflow exits
 """
 
-from collections.abc import Mapping, Sequence
-from typing import Any, Protocol
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel
 
-from grasp_agents.agent.tool_decision import ToolCallDecision
 from grasp_agents.selector import Selector
-from grasp_agents.session_context import SessionContext
-from grasp_agents.types.content import Content
-from grasp_agents.types.folds import FoldSpec
-from grasp_agents.types.io import ProcName
-from grasp_agents.types.items import (
-    FunctionToolCallItem,
-    FunctionToolOutputItem,
-    InputItem,
-    InputMessageItem,
-    ToolOutputPart,
-)
-from grasp_agents.types.packet import Packet
-from grasp_agents.types.response import Response
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from grasp_agents.agent.tool_decision import ToolCallDecision
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.content import Content
+    from grasp_agents.types.folds import FoldSpec
+    from grasp_agents.types.io import ProcName
+    from grasp_agents.types.items import (
+        FunctionToolCallItem,
+        FunctionToolOutputItem,
+        InputItem,
+        InputMessageItem,
+        ToolOutputPart,
+    )
+    from grasp_agents.types.packet import Packet
+    from grasp_agents.types.response import Response
 
 __all__ = [
     "AfterLlmHook",
@@ -61,6 +67,7 @@ __all__ = [
     "Selector",
     "ToolInputConverter",
     "ToolOutputConverter",
+    "ViewEditor",
     "ViewProjector",
     "WorkflowLoopTerminator",
 ]
@@ -166,6 +173,26 @@ class ViewProjector(Protocol):
     ) -> Sequence[InputItem]: ...
 
 
+@runtime_checkable
+class ViewEditor(ViewProjector, Protocol):
+    """
+    A :class:`ViewProjector` that only substitutes items, exposed as edits.
+
+    ``edits`` returns sparse ``index -> replacement`` substitutions into
+    ``messages`` (``context.projection.ViewEdits``) — empty to leave the view as
+    is — which the agent applies in place instead of calling the projector and
+    copying its result. ``__call__`` must produce the same view.
+    """
+
+    async def edits(
+        self,
+        messages: Sequence[InputItem],
+        *,
+        exec_id: str,
+        input_tokens: int,
+    ) -> Mapping[int, InputItem]: ...
+
+
 class Compactor(Protocol):
     """
     Summarize an old span of the transcript log under context-window pressure.
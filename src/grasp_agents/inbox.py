@@ -20,7 +20,6 @@ runs until its task is cancelled from outside, not until the inbox is closed.
 
 from __future__ import annotations
 
-import asyncio
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
@@ -197,9 +196,10 @@ class AgentInbox:
 
     async def wait(self, timeout: float) -> None:  # noqa: ASYNC109
         """
-        Sleep up to ``timeout`` between mailbox polls (a plain mailbox has no
-        arrival signal). The resident loop re-checks :meth:`has_pending` and its
-        own background-task completions after each wait; it is ended from outside
-        by cancelling the run's task.
+        Sleep up to ``timeout`` between mailbox polls, returning early when the
+        transport signals a post to this recipient
+        (:meth:`Transport.wait_for_arrival`). The resident loop re-checks
+        :meth:`has_pending` and its own background-task completions after each
+        wait; it is ended from outside by cancelling the run's task.
         """
-        await asyncio.sleep(timeout)
+        await self._transport.wait_for_arrival(self._recipient, timeout)
@@ -1,14 +1,43 @@
-from .cloud_llm import CloudLLM
-from .fallback_llm import FallbackLLM
-from .llm import LLM, LLMSettings
-from .model_info import (
-    ModelCapabilities,
-    count_tokens,
-    get_context_window,
-    get_model_capabilities,
-)
-from .resilience import RetryPolicy
-from .token_counting import count_input_tokens
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cloud_llm import CloudLLM
+    from .fallback_llm import FallbackLLM
+    from .llm import LLM, LLMSettings
+    from .model_info import (
+        ModelCapabilities,
+        count_tokens,
+        get_context_window,
+        get_model_capabilities,
+    )
+    from .resilience import RetryPolicy
+    from .token_counting import count_input_tokens
+
+_LAZY: dict[str, str] = {
+    "CloudLLM": "cloud_llm",
+    "FallbackLLM": "fallback_llm",
+    "LLM": "llm",
+    "LLMSettings": "llm",
+    "ModelCapabilities": "model_info",
+    "count_tokens": "model_info",
+    "get_context_window": "model_info",
+    "get_model_capabilities": "model_info",
+    "RetryPolicy": "resilience",
+    "count_input_tokens": "token_counting",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "LLM",
@@ -2,18 +2,15 @@
 Facade over LiteLLM's model metadata database.
 
 Keeps the LiteLLM dependency contained — if LiteLLM changes its internals,
-only this module needs updating.
+only this module needs updating. LiteLLM itself (seconds to import: it loads
+its provider tables and tokenizers) is imported on the first lookup, not
+with this module.
 """
 
 import logging
 from dataclasses import dataclass
 from typing import Any
 
-from litellm import get_model_info as _get_model_info
-from litellm import (
-    token_counter as _token_counter,  # pyright: ignore[reportUnknownVariableType]
-)
-
 logger = logging.getLogger(__name__)
 
 _warned_unresolved: set[tuple[str, str]] = set()
@@ -66,8 +63,10 @@ def get_model_capabilities(
     Returns a frozen dataclass — cheap to cache, easy to test with.
     Falls back to permissive defaults for unknown models (all True, no limits).
     """
+    from litellm import get_model_info  # noqa: PLC0415
+
     try:
-        info = _get_model_info(model, custom_llm_provider=provider)
+        info = get_model_info(model, custom_llm_provider=provider)
     except Exception:
         _warn_unresolved("model capabilities", model)
         return _PERMISSIVE_DEFAULTS
@@ -98,8 +97,12 @@ def count_tokens(
     with a default per-image cost, never fetched. Returns 0 on failure (unknown
     model, missing tokenizer).
     """
+    from litellm import (  # noqa: PLC0415
+        token_counter,  # pyright: ignore[reportUnknownVariableType]
+    )
+
     try:
-        return _token_counter(  # type: ignore[no-any-return]
+        return token_counter(  # type: ignore[no-any-return]
             model=model,
             text=text,
             messages=messages,
@@ -112,8 +115,10 @@ def count_tokens(
 
 def get_context_window(model: str, provider: str | None = None) -> int | None:
     """Return max input tokens for a model, or None if unknown."""
+    from litellm import get_model_info  # noqa: PLC0415
+
     try:
-        info = _get_model_info(model, custom_llm_provider=provider)
+        info = get_model_info(model, custom_llm_provider=provider)
         return info.get("max_input_tokens")  # type: ignore[return-value]
     except Exception:
         _warn_unresolved("the context window", model)
@@ -54,12 +54,13 @@ def _file_tokens(file: InputFile) -> int:
     Estimate a file's token cost. Inlined files carry base64 ``file_data``, so
     size it from the decoded byte length (~chars/token) — a rough, deliberately
     conservative heuristic (the real cost is provider/format-dependent).
+    An out-of-line payload is sized from its ``BlobRef``, without loading it.
     By-reference files (``file_id`` / ``file_url``, no inline data) fall back to
     a flat estimate.
     """
-    data = file.file_data
-    if data is not None and data:
-        return (len(data) * 3 // 4) // _CHARS_PER_TOKEN
+    size = file.blob.size if file.blob is not None else len(file.file_data or "")
+    if size:
+        return (size * 3 // 4) // _CHARS_PER_TOKEN
     return _FALLBACK_TOKENS_PER_FILE
 
 
@@ -95,6 +96,8 @@ def _to_chat_messages(items: Sequence[InputItem]) -> list[dict[str, Any]]:
             content: list[dict[str, Any]] = []
             if text:
                 content.append({"type": "text", "text": text})
+            # Images are counted at a flat per-image cost, never decoded — an
+            # out-of-line one needs no payload.
             content.extend(
                 {"type": "image_url", "image_url": {"url": img.image_url or "data:,"}}
                 for img in images
@@ -41,7 +41,6 @@ from anthropic.types.web_search_tool_request_error_param import (
 
 from grasp_agents.llm_providers._file_helpers import file_part_data
 from grasp_agents.types.content import (
-    BASE64_DATA_PREFIX,
     CacheControl,
     InputFile,
     InputImage,
@@ -194,10 +193,8 @@ def items_to_provider_inputs(
 def _image_to_block(img: InputImage) -> ImageBlockParam:
     cc = _to_cache_control(img.cache_control)
 
-    if img.is_base64 and img.image_url:
-        data = img.image_url.removeprefix(
-            BASE64_DATA_PREFIX.format(mime_type=img.mime_type)
-        )
+    data = img.base64_data
+    if data is not None:
         if img.mime_type not in SUPPORTED_MIME_TYPES:
             raise ValueError(f"Unsupported MIME type for base64 image: {img.mime_type}")
 
@@ -223,8 +220,9 @@ def _image_to_block(img: InputImage) -> ImageBlockParam:
 def _file_to_block(file: InputFile) -> DocumentBlockParam:
     cc = _to_cache_control(file.cache_control)
 
-    if file.file_data:
-        data, media_type = file_part_data(file.file_data, file.filename)
+    file_data = file.inline_data
+    if file_data:
+        data, media_type = file_part_data(file_data, file.filename)
         if media_type == "application/pdf":
             return DocumentBlockParam(
                 type="document",
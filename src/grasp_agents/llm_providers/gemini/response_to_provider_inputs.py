@@ -14,7 +14,6 @@ from typing import TYPE_CHECKING
 
 from grasp_agents.llm_providers._file_helpers import file_part_data
 from grasp_agents.types.content import (
-    BASE64_DATA_PREFIX,
     InputFile,
     InputImage,
     InputText,
@@ -141,12 +140,10 @@ def _image_to_part(img: InputImage) -> GeminiPart:
     level = _DETAIL_TO_MEDIA_RESOLUTION.get(img.detail)
     resolution = GeminiMediaResolution(level=level) if level else None
 
-    if img.is_base64 and img.image_url:
-        raw = img.image_url.removeprefix(
-            BASE64_DATA_PREFIX.format(mime_type=img.mime_type)
-        )
+    raw = img.decoded_bytes()
+    if raw is not None:
         return GeminiPart(
-            inline_data=GeminiBlob(data=base64.b64decode(raw), mime_type=img.mime_type),
+            inline_data=GeminiBlob(data=raw, mime_type=img.mime_type),
             media_resolution=resolution,
         )
 
@@ -166,10 +163,11 @@ def _image_to_part(img: InputImage) -> GeminiPart:
 
 
 def _file_to_part(file: InputFile) -> GeminiPart:
-    if file.file_data:
-        data, mime_type = file_part_data(file.file_data, file.filename)
+    file_data = file.inline_data
+    if file_data:
+        _, mime_type = file_part_data(file_data, file.filename)
         return GeminiPart(
-            inline_data=GeminiBlob(data=base64.b64decode(data), mime_type=mime_type)
+            inline_data=GeminiBlob(data=file.decoded_bytes(), mime_type=mime_type)
         )
     if file.file_url:
         _, mime_type = file_part_data("", file.filename)
@@ -202,8 +202,9 @@ def _input_message_to_message_param(
             content.append(image_param)
         else:  # InputFile — the remaining InputPart member
             file_param: ChatCompletionFileFileParam = {}
-            if part.file_data:
-                file_param["file_data"] = part.file_data
+            file_data = part.inline_data
+            if file_data:
+                file_param["file_data"] = file_data
             if part.file_id:
                 file_param["file_id"] = part.file_id
             if part.filename:
@@ -23,6 +23,7 @@ from openai.types.responses.response_input_item_param import (
     ResponseInputItemParam,
 )
 
+from grasp_agents.types.content import InputFile, InputImage, InputText
 from grasp_agents.types.items import (
     FindInPageAction,
     FunctionToolOutputItem,
@@ -47,6 +48,7 @@ _GRASP_EXTENSION_FIELDS = {
 # unknown parameters (e.g. ``mime_type`` on a base64 image part).
 _GRASP_PART_EXTENSION_FIELDS = {
     "mime_type",
+    "blob",
     "cache_control",
     "provider_specific_fields",
 }
@@ -62,6 +64,19 @@ def _iter_part_dicts(dumped: dict[str, Any]) -> Iterator[dict[str, Any]]:
                 yield cast("dict[str, Any]", part)
 
 
+def _part_params(
+    item: InputItem, dumped: dict[str, Any]
+) -> Iterator[tuple[InputImage | InputText | InputFile, dict[str, Any]]]:
+    """Each input content part of ``item`` with its dumped param."""
+    if isinstance(item, InputMessageItem):
+        parts, part_params = item.content, dumped["content"]
+    elif isinstance(item, FunctionToolOutputItem) and isinstance(item.output, list):
+        parts, part_params = item.output, dumped["output"]
+    else:
+        return
+    yield from zip(parts, part_params, strict=True)
+
+
 def _reapply_part_cache_breakpoints(item: InputItem, dumped: dict[str, Any]) -> None:
     """
     Attach an explicit prompt-cache breakpoint (gpt-5.6+) to each part param
@@ -69,17 +84,20 @@ def _reapply_part_cache_breakpoints(item: InputItem, dumped: dict[str, Any]) ->
     request-level ``prompt_cache_options``, so ``CacheControl.ttl`` is
     ignored here.
     """
-    if isinstance(item, InputMessageItem):
-        parts, part_params = item.content, dumped["content"]
-    elif isinstance(item, FunctionToolOutputItem) and isinstance(item.output, list):
-        parts, part_params = item.output, dumped["output"]
-    else:
-        return
-    for part, part_param in zip(parts, part_params, strict=True):
+    for part, part_param in _part_params(item, dumped):
         if part.cache_control is not None:
             part_param["prompt_cache_breakpoint"] = {"mode": "explicit"}
 
 
+def _inline_blob_parts(item: InputItem, dumped: dict[str, Any]) -> None:
+    """Put each out-of-line payload back where the API expects it."""
+    for part, part_param in _part_params(item, dumped):
+        if isinstance(part, InputImage) and part.blob is not None:
+            part_param["image_url"] = part.to_str()
+        elif isinstance(part, InputFile) and part.blob is not None:
+            part_param["file_data"] = part.inline_data
+
+
 def _scrub_part_fields(dumped: dict[str, Any]) -> None:
     for part in _iter_part_dicts(dumped):
         for key in _GRASP_PART_EXTENSION_FIELDS:
@@ -105,6 +123,7 @@ def items_to_provider_inputs(
         )
         _scrub_part_fields(dumped)
         _reapply_part_cache_breakpoints(item, dumped)
+        _inline_blob_parts(item, dumped)
         # The Responses API reads a client-sent message ``id`` as a reference to a
         # stored item and 404s on it (fatally when the message carries an image);
         # our ``msg_`` ids are internal bookkeeping, so don't echo them back.
@@ -127,8 +146,7 @@ def _web_search_item_to_param(
             api_action["queries"] = action.queries
         if action.sources:
             api_action["sources"] = [
-                ActionSearchSourceParam(type="url", url=s.url)
-                for s in action.sources
+                ActionSearchSourceParam(type="url", url=s.url) for s in action.sources
             ]
 
     elif isinstance(action, FindInPageAction):
@@ -7,10 +7,13 @@ mailbox implementations, beside the in-process :class:`~grasp_agents.runtime.
 InProcessTransport` used for event routing. So a single agent's inbox, a multi-agent
 team's driver, and (in future) a networked backend all sit on the same seam — no
 adapter, no parallel transport type. A mailbox has no native arrival signal, so
-:meth:`consume` blocks by polling :meth:`has_pending` every ``poll_interval``;
-``fetch`` is non-removing and a consumer ``ack``s after a successful activation,
-so delivery is at-least-once. The transport is session-scoped and outlives any
-one run — consumers stop by cancellation, not by closing it.
+:meth:`consume` blocks by polling :meth:`has_pending` every ``poll_interval`` —
+unless a durable mailbox is given a
+:class:`~grasp_agents.mailbox_broker.MailboxNotifier`, which wakes consumers on
+every post (polling remains the fallback). ``fetch`` is non-removing and a
+consumer ``ack``s after a successful activation, so delivery is at-least-once.
+The transport is session-scoped and outlives any one run — consumers stop by
+cancellation, not by closing it.
 
 - :class:`InMemoryMailboxTransport` — ephemeral, process-local; single-process.
 - :class:`CheckpointMailboxTransport` — durable, over the session
@@ -38,6 +41,7 @@ if TYPE_CHECKING:
     from datetime import timedelta
 
     from grasp_agents.durability.checkpoint_store import CheckpointStore
+    from grasp_agents.mailbox_broker import MailboxNotifier
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +93,34 @@ async def void_mail_after(
     await transport.void_processed_after(recipient, seq, on_void=notify)
 
 
+class _Arrivals:
+    """
+    Per-recipient "mail was posted since the consumer last woke" flags.
+
+    A flag is set on every post and cleared by the wait it wakes, so a post
+    landing between a consumer's empty check and its wait still wakes it. A
+    stale flag only costs one spurious re-check.
+    """
+
+    def __init__(self) -> None:
+        self._events: dict[str, asyncio.Event] = {}
+
+    def signal(self, recipient: str) -> None:
+        self._events.setdefault(recipient, asyncio.Event()).set()
+
+    def signal_all(self) -> None:
+        for event in self._events.values():
+            event.set()
+
+    async def wait(self, recipient: str, timeout: float) -> None:  # noqa: ASYNC109
+        event = self._events.setdefault(recipient, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except TimeoutError:
+            pass
+        event.clear()
+
+
 class InMemoryMailboxTransport(Transport[TeamMessage]):
     """
     Process-local mailboxes held in memory — no backend required.
@@ -204,6 +236,14 @@ class CheckpointMailboxTransport(Transport[TeamMessage]):
     actor in-process; a separate-process ``MemberHost`` deployment must give each
     member its own process (its own recipient). An advisory lease would be needed
     only if that constraint is ever relaxed.
+
+    **Wake-ups.** Consumers scan the store every ``poll_interval``. Given a
+    ``notifier``, every post also wakes this instance's parked consumers and is
+    published to a :class:`~grasp_agents.mailbox_broker.MailboxBroker`, which
+    wakes the recipient's consumer in whichever process it runs; while the
+    broker is reachable the scan drops to the notifier's safety-net
+    ``poll_interval``. The store stays the only source of truth: a lost wake
+    delays a message, never loses it.
     """
 
     def __init__(
@@ -212,13 +252,21 @@ class CheckpointMailboxTransport(Transport[TeamMessage]):
         *,
         session_key: str = DEFAULT_SESSION_KEY,
         poll_interval: float = 0.05,
+        notifier: MailboxNotifier | None = None,
     ) -> None:
         super().__init__()
         self._store = store
         self._session_key = session_key
         self._poll_interval = poll_interval
+        self._notifier = notifier
+        self._arrivals = _Arrivals()
+        self._subscribed: set[str] = set()
         self._closed = asyncio.Event()
 
+    @property
+    def notifier(self) -> MailboxNotifier | None:
+        return self._notifier
+
     def register(self, recipient: str) -> None:
         # Mailboxes are keyed in the store; nothing to pre-allocate.
         del recipient
@@ -277,6 +325,10 @@ class CheckpointMailboxTransport(Transport[TeamMessage]):
                 self._inbox_key(single.recipient, single),
                 record.model_dump_json().encode(),
             )
+            # Wake only once the record is durable: a woken consumer must find it.
+            if self._notifier is not None:
+                self._arrivals.signal(single.recipient)
+                await self._notifier.publish(self._inbox_prefix(single.recipient))
 
     async def _fetch_next(self, recipient: str) -> TeamMessage | None:
         keys = sorted(await self._store.list_keys(self._inbox_prefix(recipient)))
@@ -329,12 +381,32 @@ class CheckpointMailboxTransport(Transport[TeamMessage]):
             message = await self._fetch_next(recipient)
             if message is not None:
                 return message
-            try:
-                await asyncio.wait_for(self._closed.wait(), self._poll_interval)
-            except TimeoutError:
-                pass
+            timeout = self._poll_interval
+            notifier = self._notifier
+            if notifier is not None and await self._subscribe(recipient):
+                # Pushed wakes cover other processes' posts; the store scan
+                # is only a safety net for a wake lost in transit.
+                timeout = max(timeout, notifier.poll_interval)
+            await self._arrivals.wait(recipient, timeout)
         return CLOSED
 
+    async def wait_for_arrival(self, recipient: str, timeout: float) -> None:  # noqa: ASYNC109
+        await self._subscribe(recipient)
+        await self._arrivals.wait(recipient, timeout)
+
+    async def _subscribe(self, recipient: str) -> bool:
+        """Subscribe ``recipient`` to pushed wakes; whether they are flowing."""
+        notifier = self._notifier
+        if notifier is None:
+            return False
+        if recipient not in self._subscribed:
+            self._subscribed.add(recipient)
+            await notifier.subscribe(
+                self._inbox_prefix(recipient),
+                lambda: self._arrivals.signal(recipient),
+            )
+        return await notifier.ensure_connected()
+
     async def ack(self, recipient: str, envelope: TeamMessage) -> None:
         inbox_key = self._inbox_key(recipient, envelope)
         data = await self._store.load(inbox_key)
@@ -480,3 +552,4 @@ class CheckpointMailboxTransport(Transport[TeamMessage]):
 
     async def shutdown(self) -> None:
         self._closed.set()
+        self._arrivals.signal_all()
@@ -0,0 +1,341 @@
+"""
+Push notification for cross-process mailboxes.
+
+A :class:`~grasp_agents.mailbox.CheckpointMailboxTransport` over a shared store
+has no native arrival signal: a consumer in another process only notices new
+mail on its next ``list_keys`` poll. This module adds a notification layer
+*beside* the store — the store stays the source of truth, notifications only
+cut the wait:
+
+- :class:`MailboxBroker` — a tiny fan-out server on a Unix socket. Any host
+  may start one (or let a :class:`MailboxNotifier` start it on demand).
+- :class:`MailboxNotifier` — a transport's client. It subscribes to the
+  mailboxes its process consumes, publishes after every ``post``, and calls
+  back when a peer publishes to a subscribed mailbox.
+
+The wire protocol is one ASCII line per frame: ``S <topic>`` subscribes the
+connection, ``P <topic>`` publishes, and the broker forwards a publish to every
+subscriber as ``W <topic>``. A topic is an opaque mailbox name (the transport
+uses the recipient's inbox store prefix).
+
+Everything is best-effort. With no broker reachable (not started, crashed,
+or a platform without Unix sockets) the notifier reports itself disconnected,
+retries at most every ``reconnect_interval`` seconds, and the transport keeps
+polling at its normal interval, so no message is ever lost — only delayed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import socket
+import time
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from os import PathLike
+    from types import TracebackType
+
+logger = getLogger(__name__)
+
+# Wait between safety-net store scans while the notifier is connected.
+DEFAULT_NOTIFIED_POLL_INTERVAL = 2.0
+
+_SUBSCRIBE = b"S"
+_PUBLISH = b"P"
+_WAKE = b"W"
+
+
+def _frame(kind: bytes, topic: str) -> bytes:
+    if "\n" in topic:
+        raise ValueError(f"Mailbox topic must not contain a newline: {topic!r}")
+    return kind + b" " + topic.encode() + b"\n"
+
+
+def _parse(line: bytes) -> tuple[bytes, str] | None:
+    kind, sep, topic = line.rstrip(b"\n").partition(b" ")
+    if not sep or not topic:
+        return None
+    return kind, topic.decode(errors="replace")
+
+
+class MailboxBroker:
+    """
+    Fan-out server relaying mailbox publishes to subscribers over a Unix socket.
+
+    Holds no messages — a subscriber that is not connected at publish time
+    simply misses the wake and finds the mail on its next poll. Start it with
+    ``await broker.start()`` (or ``async with``); :meth:`close` stops serving
+    and removes the socket file.
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self._path = Path(path)
+        self._server: asyncio.Server | None = None
+        self._subscribers: dict[str, set[asyncio.StreamWriter]] = {}
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def is_serving(self) -> bool:
+        return self._server is not None and self._server.is_serving()
+
+    async def start(self) -> None:
+        """
+        Bind the socket and start serving.
+
+        A leftover socket file nobody answers on (a crashed broker) is
+        replaced; a live broker already serving at ``path`` makes this raise
+        :class:`FileExistsError`.
+        """
+        if self._server is not None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._path.exists():
+            if await _is_listening(self._path):
+                raise FileExistsError(f"A mailbox broker already serves {self._path}")
+            self._path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(self._serve, path=self._path)
+
+    async def close(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.close()
+        # ``wait_closed`` waits for every connection; end them all.
+        writers = list(self._connections)
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+        await server.wait_closed()
+        self._path.unlink(missing_ok=True)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        topics: set[str] = set()
+        self._connections.add(writer)
+        try:
+            await self._relay(reader, writer, topics)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for topic in topics:
+                writers = self._subscribers.get(topic)
+                if writers is not None:
+                    writers.discard(writer)
+                    if not writers:
+                        del self._subscribers[topic]
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _relay(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        topics: set[str],
+    ) -> None:
+        while line := await reader.readline():
+            frame = _parse(line)
+            if frame is None:
+                continue
+            kind, topic = frame
+            if kind == _SUBSCRIBE:
+                topics.add(topic)
+                self._subscribers.setdefault(topic, set()).add(writer)
+            elif kind == _PUBLISH:
+                self._fan_out(topic)
+
+    def _fan_out(self, topic: str) -> None:
+        wake = _frame(_WAKE, topic)
+        for writer in list(self._subscribers.get(topic, ())):
+            if writer.is_closing():
+                continue
+            # A wake is a hint; a subscriber too slow to drain its socket
+            # loses wakes, not mail.
+            transport = writer.transport
+            if transport.get_write_buffer_size() < 64 * 1024:
+                writer.write(wake)
+
+
+class MailboxNotifier:
+    """
+    One process's connection to a :class:`MailboxBroker` at ``path``.
+
+    Pass it to ``CheckpointMailboxTransport(notifier=...)``; the transport
+    subscribes the mailboxes it consumes and publishes on every ``post``.
+    With ``start_broker=True`` a notifier that finds no broker starts one in
+    this process (whichever process gets there first serves the others).
+    While connected the transport re-scans the store only every
+    ``poll_interval`` seconds as a safety net; while disconnected it polls at
+    its own interval and reconnection is retried every ``reconnect_interval``.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        *,
+        start_broker: bool = False,
+        poll_interval: float = DEFAULT_NOTIFIED_POLL_INTERVAL,
+        reconnect_interval: float = 1.0,
+    ) -> None:
+        self._path = Path(path)
+        self._start_broker = start_broker
+        self._poll_interval = poll_interval
+        self._reconnect_interval = reconnect_interval
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._broker: MailboxBroker | None = None
+        self._callbacks: dict[str, list[Callable[[], None]]] = {}
+        self._next_attempt = 0.0
+        self._connect_lock: asyncio.Lock | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def subscribe(self, topic: str, on_wake: Callable[[], None]) -> None:
+        """Call ``on_wake`` whenever any process publishes to ``topic``."""
+        self._callbacks.setdefault(topic, []).append(on_wake)
+        if await self.ensure_connected():
+            self._send(_frame(_SUBSCRIBE, topic))
+
+    async def publish(self, topic: str) -> None:
+        """Wake every subscriber of ``topic`` (best-effort)."""
+        if await self.ensure_connected():
+            self._send(_frame(_PUBLISH, topic))
+
+    async def ensure_connected(self) -> bool:
+        """Connect (and re-subscribe) if disconnected and a retry is due."""
+        if self.connected:
+            return True
+        if time.monotonic() < self._next_attempt:
+            return False
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            if not await self._connect():
+                self._next_attempt = time.monotonic() + self._reconnect_interval
+                return False
+        for topic in self._callbacks:
+            self._send(_frame(_SUBSCRIBE, topic))
+        return True
+
+    async def close(self) -> None:
+        """Disconnect, and stop the broker if this notifier started it."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+        self._drop_connection()
+        if self._broker is not None:
+            await self._broker.close()
+            self._broker = None
+
+    # --- Internals ---
+
+    async def _connect(self) -> bool:
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        try:
+            reader, writer = await asyncio.open_unix_connection(self._path)
+        except OSError:
+            if not self._start_broker or not await self._try_start_broker():
+                return False
+            try:
+                reader, writer = await asyncio.open_unix_connection(self._path)
+            except OSError:
+                return False
+        self._writer = writer
+        self._reader_task = asyncio.create_task(
+            self._read(reader), name=f"mailbox-notifier:{self._path.name}"
+        )
+        return True
+
+    async def _try_start_broker(self) -> bool:
+        broker = MailboxBroker(self._path)
+        try:
+            await broker.start()
+        except FileExistsError:
+            # Another process won the race; connect to its broker.
+            return True
+        except OSError:
+            logger.warning(
+                "Could not start a mailbox broker at %s; polling instead",
+                self._path,
+                exc_info=True,
+            )
+            return False
+        self._broker = broker
+        return True
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                frame = _parse(line)
+                if frame is None or frame[0] != _WAKE:
+                    continue
+                for on_wake in self._callbacks.get(frame[1], ()):
+                    on_wake()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            # Broker gone: fall back to polling until a reconnect succeeds.
+            self._drop_connection()
+            self._next_attempt = time.monotonic() + self._reconnect_interval
+
+    def _send(self, data: bytes) -> None:
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            return
+        try:
+            writer.write(data)
+        except (ConnectionError, RuntimeError):
+            self._drop_connection()
+
+    def _drop_connection(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
+
+async def _is_listening(path: Path) -> bool:
+    try:
+        _, writer = await asyncio.open_unix_connection(path)
+    except OSError:
+        return False
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+    return True
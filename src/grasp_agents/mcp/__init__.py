@@ -1,6 +1,17 @@
-# pyright: reportMissingImports=false
-try:
+"""
+MCP client integration. Needs the ``mcp`` extra; the names below resolve
+lazily, so ``import grasp_agents.mcp`` works (and costs nothing) without it,
+and the SDK loads only when one of them is first used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
     from .client import MCPClient, MCPServerConfig, MCPServerSSE, MCPServerStdio
+    from .pool import MCPClientPool
     from .resource import MCPListResourcesTool, MCPReadResourceTool
     from .section import (
         MCP_INSTRUCTIONS_SECTION_NAME,
@@ -8,12 +19,47 @@ try:
     )
     from .spec import MCPClientSpec
     from .tool import MCPTool
-except ImportError:
-    pass
+
+_LAZY: dict[str, str] = {
+    "MCPClient": "client",
+    "MCPServerConfig": "client",
+    "MCPServerSSE": "client",
+    "MCPServerStdio": "client",
+    "MCPClientPool": "pool",
+    "MCPListResourcesTool": "resource",
+    "MCPReadResourceTool": "resource",
+    "MCP_INSTRUCTIONS_SECTION_NAME": "section",
+    "make_mcp_instructions_section": "section",
+    "MCPClientSpec": "spec",
+    "MCPTool": "tool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = import_module(f".{submodule}", __name__)
+    except ModuleNotFoundError as err:
+        if (err.name or "").partition(".")[0] != "mcp":
+            raise
+        raise ImportError(
+            f"{name} requires the 'mcp' extra: pip install \"grasp_agents[mcp]\""
+        ) from err
+    attr = getattr(module, name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "MCP_INSTRUCTIONS_SECTION_NAME",
     "MCPClient",
+    "MCPClientPool",
     "MCPClientSpec",
     "MCPListResourcesTool",
     "MCPReadResourceTool",
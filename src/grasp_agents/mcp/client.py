@@ -4,10 +4,10 @@ import logging
 import time
 from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
-from typing import Self
+from typing import TYPE_CHECKING, Protocol, Self
 
-from .resource import MCPListResourcesTool, MCPReadResourceTool
-from .tool import MCPTool
+from .resource import MCPListResourcesTool, MCPReadResourceTool, MCPResourceSession
+from .tool import MCPTool, MCPToolSession
 
 try:
     from mcp import ClientSession, StdioServerParameters
@@ -15,8 +15,12 @@ try:
     from mcp.types import (
         GetPromptResult,
         ListPromptsResult,
+        ResourceListChangedNotification,
+        ResourceUpdatedNotification,
         ServerCapabilities,
+        ServerNotification,
     )
+    from mcp.types import Tool as McpToolDef
 except ImportError as _err:
     msg = (
         "MCP support requires the 'mcp' package. "
@@ -24,9 +28,19 @@ except ImportError as _err:
     )
     raise ImportError(msg) from _err
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mcp.shared.session import RequestResponder
+    from mcp.types import ClientResult, ServerRequest
+
 _logger = logging.getLogger(__name__)
 
 
+class _ToolSession(MCPToolSession, MCPResourceSession, Protocol):
+    """What discovered tools are bound to: a session, or a pool routing over several."""
+
+
 @dataclass
 class MCPServerStdio:
     """Stdio-based MCP server configuration."""
@@ -78,6 +92,8 @@ class MCPClient:
         ) = None
         self._capabilities: ServerCapabilities | None = None
         self._instructions: str | None = None
+        self._tool_defs: list[McpToolDef] = []
+        self._resource_listeners: list[Callable[[str | None], None]] = []
 
     @property
     def name(self) -> str:
@@ -144,35 +160,14 @@ class MCPClient:
                 )
 
             read, write = transport
-            session = await exit_stack.enter_async_context(ClientSession(read, write))
+            session = await exit_stack.enter_async_context(
+                ClientSession(read, write, message_handler=self._handle_message)
+            )
             init_result = await session.initialize()
             capabilities = init_result.capabilities
 
-            tools: list[MCPTool | MCPListResourcesTool | MCPReadResourceTool] = []
-
-            response = await session.list_tools()
-            for t in response.tools:
-                try:
-                    tools.append(
-                        MCPTool(session=session, tool_def=t, timeout=self._tool_timeout)
-                    )
-                except Exception:
-                    # One tool with a pathological schema must not take down the
-                    # whole server connection — skip it and keep the rest.
-                    _logger.exception(
-                        "Skipping MCP tool %r (server %r): failed to build its "
-                        "input schema",
-                        t.name,
-                        self.name,
-                    )
-
-            if capabilities.resources:
-                tools.extend(
-                    [
-                        MCPListResourcesTool(session=session, server_name=self._name),
-                        MCPReadResourceTool(session=session, server_name=self._name),
-                    ]
-                )
+            tool_defs = (await session.list_tools()).tools
+            tools = self._make_tools(session, tool_defs, capabilities)
         except BaseException:
             await exit_stack.aclose()
             raise
@@ -183,6 +178,7 @@ class MCPClient:
         self._session = session
         self._capabilities = capabilities
         self._instructions = init_result.instructions
+        self._tool_defs = tool_defs
         self._tools = tools
         _logger.info(
             "MCPClient '%s': connected in %.2fs, discovered %d tools (resources: %s)",
@@ -192,6 +188,71 @@ class MCPClient:
             "yes" if capabilities.resources else "no",
         )
 
+    def add_resource_listener(self, listener: Callable[[str | None], None]) -> None:
+        """
+        Call ``listener`` when the server announces a resource change:
+        ``listener(None)`` on ``notifications/resources/list_changed``,
+        ``listener(uri)`` on ``notifications/resources/updated``.
+        """
+        if listener not in self._resource_listeners:
+            self._resource_listeners.append(listener)
+
+    def remove_resource_listener(self, listener: Callable[[str | None], None]) -> None:
+        if listener in self._resource_listeners:
+            self._resource_listeners.remove(listener)
+
+    async def _handle_message(
+        self,
+        message: RequestResponder[ServerRequest, ClientResult]
+        | ServerNotification
+        | Exception,
+    ) -> None:
+        if not isinstance(message, ServerNotification):
+            return
+        notification = message.root
+        if isinstance(notification, ResourceListChangedNotification):
+            uri = None
+        elif isinstance(notification, ResourceUpdatedNotification):
+            uri = str(notification.params.uri)
+        else:
+            return
+        self._notify_resource_listeners(uri)
+
+    def _notify_resource_listeners(self, uri: str | None) -> None:
+        for listener in tuple(self._resource_listeners):
+            listener(uri)
+
+    def _make_tools(
+        self,
+        session: _ToolSession,
+        tool_defs: list[McpToolDef],
+        capabilities: ServerCapabilities,
+    ) -> list[MCPTool | MCPListResourcesTool | MCPReadResourceTool]:
+        tools: list[MCPTool | MCPListResourcesTool | MCPReadResourceTool] = []
+        for t in tool_defs:
+            try:
+                tools.append(
+                    MCPTool(session=session, tool_def=t, timeout=self._tool_timeout)
+                )
+            except Exception:
+                # One tool with a pathological schema must not take down the
+                # whole server connection — skip it and keep the rest.
+                _logger.exception(
+                    "Skipping MCP tool %r (server %r): failed to build its "
+                    "input schema",
+                    t.name,
+                    self.name,
+                )
+
+        if capabilities.resources:
+            tools.extend(
+                [
+                    MCPListResourcesTool(session=session, server_name=self._name),
+                    MCPReadResourceTool(session=session, server_name=self._name),
+                ]
+            )
+        return tools
+
     async def close(self) -> None:
         """Close the connection and terminate the server process."""
         if self._exit_stack is not None:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 import keyword
 import re
 from enum import Enum, IntEnum, StrEnum
+from functools import lru_cache
 from typing import Any, Literal, Union
 
 from pydantic import BaseModel, Field, create_model
@@ -28,6 +30,26 @@ def json_schema_to_pydantic(
     return _schema_to_model(model_name, schema, defs, set(), cache)
 
 
+def cached_json_schema_to_pydantic(
+    schema: dict[str, Any],
+    model_name: str,
+) -> type[BaseModel]:
+    """
+    :func:`json_schema_to_pydantic`, memoized on the schema's canonical JSON and
+    ``model_name``.
+
+    Every client connected to the same server (pool members, reconnects, agent
+    copies) lists identical tool schemas; they share one model class instead of
+    each rebuilding it.
+    """
+    return _cached_model(json.dumps(schema, sort_keys=True), model_name)
+
+
+@lru_cache(maxsize=1024)
+def _cached_model(schema_json: str, model_name: str) -> type[BaseModel]:
+    return json_schema_to_pydantic(json.loads(schema_json), model_name)
+
+
 def _schema_to_model(
     name: str,
     schema: dict[str, Any],
@@ -0,0 +1,374 @@
+"""
+A pool of live sessions to one MCP server.
+
+:class:`MCPClientPool` keeps ``size`` :class:`MCPClient` connections to the same
+server and routes tool calls across them, so parallel branches and agent copies
+neither serialize on one stdio pipe nor each spawn their own server process. It
+is an :class:`MCPClient` itself — pass it wherever a client is accepted
+(``LLMAgent(mcp_clients=[pool])``, :class:`MCPClientSpec`, adapters) — and its
+tool catalog is discovered once and shared by every agent it is attached to.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+import anyio
+
+from .client import MCPClient, MCPServerConfig, MCPServerStdio
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+    from datetime import timedelta
+
+    from pydantic import AnyUrl
+
+try:
+    from mcp import ClientSession
+    from mcp.shared.session import ProgressFnT
+    from mcp.types import (
+        CallToolResult,
+        ListResourcesResult,
+        ListResourceTemplatesResult,
+        PaginatedRequestParams,
+        ReadResourceResult,
+    )
+except ImportError as _err:
+    msg = (
+        "MCP support requires the 'mcp' package. "
+        "Install with: pip install grasp-agents[mcp]"
+    )
+    raise ImportError(msg) from _err
+
+_logger = logging.getLogger(__name__)
+
+# A dead pipe or dropped connection; an MCP-level error reply is not one.
+_TRANSPORT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+def _server_key(server: MCPServerConfig) -> Hashable:
+    if isinstance(server, MCPServerStdio):
+        env = tuple(sorted(server.env.items())) if server.env is not None else None
+        return ("stdio", server.command, tuple(server.args), env)
+    return ("sse", server.url)
+
+
+@dataclass(eq=False)
+class _Member:
+    """One pooled connection, owned by its runner task."""
+
+    index: int
+    client: MCPClient | None = None
+    inflight: int = 0
+    # Set to make the runner drop the connection (failed health check or call,
+    # pool close); the runner reconnects unless the pool is closing.
+    broken: asyncio.Event = field(default_factory=asyncio.Event)
+    # Set once the first connection attempt has finished, either way.
+    attempted: asyncio.Event = field(default_factory=asyncio.Event)
+    error: BaseException | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.client is not None and not self.broken.is_set()
+
+
+class MCPClientPool(MCPClient):
+    """
+    ``size`` live sessions to one MCP server behind a single client.
+
+    Tool calls (and resource / prompt requests) go to the least-loaded healthy
+    session, at most ``max_concurrency`` at a time across the pool. Each session
+    is pinged every ``health_check_interval`` seconds; one that fails a ping or a
+    call at the transport level is dropped and reconnected in the background
+    with exponential backoff (``reconnect_backoff`` doubling up to
+    ``max_reconnect_backoff``) while the others keep serving.
+
+    The tool catalog is listed on connect and shared: :meth:`tools` returns one
+    set of tools routed through the pool, and input models are built once per
+    schema (see :func:`~grasp_agents.mcp.json_schema.cached_json_schema_to_pydantic`).
+    :meth:`shared` returns one pool per server spec for callers that don't pass
+    the pool around themselves::
+
+        pool = MCPClientPool("fs", server=MCPServerStdio(command="mcp-fs"), size=4)
+        async with pool:
+            agent = LLMAgent(..., mcp_clients=[pool])
+
+    Each session is opened and closed by its own runner task, as the MCP
+    transports require. Resource change notifications from any session reach
+    the pool's own listeners (:meth:`add_resource_listener`).
+    """
+
+    _shared: ClassVar[dict[Hashable, MCPClientPool]] = {}
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        server: MCPServerConfig,
+        size: int = 2,
+        max_concurrency: int | None = 8,
+        tool_timeout: float | None = 30.0,
+        health_check_interval: float | None = 30.0,
+        health_check_timeout: float = 5.0,
+        reconnect_backoff: float = 0.5,
+        max_reconnect_backoff: float = 30.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"MCPClientPool size must be >= 1, got {size}")
+        super().__init__(name, server=server, tool_timeout=tool_timeout)
+        self._size = size
+        self._limiter = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._reconnect_backoff = reconnect_backoff
+        self._max_reconnect_backoff = max_reconnect_backoff
+        self._members: list[_Member] = []
+        self._runners: list[asyncio.Task[None]] = []
+        self._closing = False
+
+    @classmethod
+    def shared(cls, name: str, *, server: MCPServerConfig, **kwargs: Any) -> Self:
+        """
+        The pool for ``server``, created on first request. Later calls with an
+        equal server spec return the same pool (``name`` and ``kwargs`` of later
+        calls are ignored); closing it releases the slot.
+        """
+        key = _server_key(server)
+        pool = cls._shared.get(key)
+        if not isinstance(pool, cls):
+            pool = cls(name, server=server, **kwargs)
+            cls._shared[key] = pool
+        return pool
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def healthy_sessions(self) -> int:
+        """Number of sessions currently connected and serving."""
+        return sum(m.healthy for m in self._members)
+
+    # --- lifecycle ---
+
+    async def connect(self) -> None:
+        """
+        Open the pool's sessions and discover tools.
+
+        Waits for every session's first connection attempt; succeeds if at least
+        one connected (the rest keep retrying in the background) and raises the
+        first error otherwise, leaving the pool closed.
+        """
+        if self._tools is not None:
+            return
+
+        self._closing = False
+        self._members = [_Member(index=i) for i in range(self._size)]
+        self._runners = [
+            asyncio.create_task(self._run_member(m), name=f"mcp-pool-{self.name}-{i}")
+            for i, m in enumerate(self._members)
+        ]
+        await asyncio.gather(*(m.attempted.wait() for m in self._members))
+
+        first = next((m.client for m in self._members if m.client is not None), None)
+        if first is None:
+            error = next(m.error for m in self._members if m.error is not None)
+            await self.close()
+            raise error
+
+        capabilities = first.server_capabilities
+        assert capabilities is not None
+        self._capabilities = capabilities
+        self._instructions = first.instructions
+        self._tool_defs = first._tool_defs  # noqa: SLF001
+        self._tools = self._make_tools(self, self._tool_defs, capabilities)
+        _logger.info(
+            "MCPClientPool '%s': %d/%d sessions connected, %d tools",
+            self.name,
+            self.healthy_sessions,
+            self._size,
+            len(self._tools),
+        )
+
+    async def close(self) -> None:
+        """Close every session and terminate the server processes."""
+        self._closing = True
+        for member in self._members:
+            member.broken.set()
+        if self._runners:
+            await asyncio.gather(*self._runners, return_exceptions=True)
+        self._members = []
+        self._runners = []
+        self._tools = None
+        self._capabilities = None
+        if self._shared.get(_server_key(self._server)) is self:
+            del self._shared[_server_key(self._server)]
+
+    async def _run_member(self, member: _Member) -> None:
+        """Connect, serve, health-check and reconnect one session until closing."""
+        failures = 0
+        while not self._closing:
+            client = MCPClient(
+                f"{self.name}[{member.index}]",
+                server=self._server,
+                tool_timeout=self._tool_timeout,
+            )
+            try:
+                await client.connect()
+            except Exception as err:
+                member.error = err
+                member.attempted.set()
+                delay = min(
+                    self._reconnect_backoff * 2**failures, self._max_reconnect_backoff
+                )
+                failures += 1
+                _logger.warning(
+                    "MCPClientPool '%s': session %d failed to connect (%s); "
+                    "retrying in %.1fs",
+                    self.name,
+                    member.index,
+                    err,
+                    delay,
+                )
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(member.broken.wait(), timeout=delay)
+                member.broken.clear()
+                continue
+
+            # A fresh client per connection: relay its resource notifications
+            # to the pool's listeners (an index built over the pool) again.
+            client.add_resource_listener(self._notify_resource_listeners)
+            failures = 0
+            member.error = None
+            member.client = client
+            member.attempted.set()
+            try:
+                await self._serve(member, client)
+            finally:
+                member.client = None
+                await client.close()
+            if not self._closing:
+                member.broken.clear()
+                _logger.info(
+                    "MCPClientPool '%s': reconnecting session %d",
+                    self.name,
+                    member.index,
+                )
+
+    async def _serve(self, member: _Member, client: MCPClient) -> None:
+        """Hold ``client`` open until it is marked broken or fails a ping."""
+        while True:
+            if self._health_check_interval is None:
+                await member.broken.wait()
+                return
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    member.broken.wait(), timeout=self._health_check_interval
+                )
+            if member.broken.is_set():
+                return
+            try:
+                await asyncio.wait_for(
+                    client.session.send_ping(), timeout=self._health_check_timeout
+                )
+            except Exception:
+                _logger.warning(
+                    "MCPClientPool '%s': session %d failed its health check",
+                    self.name,
+                    member.index,
+                    exc_info=True,
+                )
+                member.broken.set()
+                return
+
+    # --- routing ---
+
+    def _pick(self) -> _Member:
+        healthy = [m for m in self._members if m.healthy]
+        if not healthy:
+            msg = (
+                f"MCPClientPool '{self.name}': no healthy session. Call connect() "
+                "or use as async context manager first, or wait for a reconnect."
+            )
+            raise RuntimeError(msg)
+        return min(healthy, key=lambda m: m.inflight)
+
+    def _require_session(self) -> ClientSession:
+        # Prompts and adapters (``session``) go to the least-loaded session; they
+        # bypass the concurrency bound, which governs calls made through the pool.
+        client = self._pick().client
+        assert client is not None
+        return client.session
+
+    async def _dispatch[R](self, request: Callable[[ClientSession], Awaitable[R]]) -> R:
+        if self._limiter is None:
+            return await self._dispatch_unbounded(request)
+        async with self._limiter:
+            return await self._dispatch_unbounded(request)
+
+    async def _dispatch_unbounded[R](
+        self, request: Callable[[ClientSession], Awaitable[R]]
+    ) -> R:
+        member = self._pick()
+        assert member.client is not None
+        member.inflight += 1
+        try:
+            return await request(member.client.session)
+        except _TRANSPORT_ERRORS:
+            _logger.warning(
+                "MCPClientPool '%s': session %d lost its transport; reconnecting",
+                self.name,
+                member.index,
+            )
+            member.broken.set()
+            raise
+        finally:
+            member.inflight -= 1
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        read_timeout_seconds: timedelta | None = None,
+        progress_callback: ProgressFnT | None = None,
+        *,
+        meta: dict[str, Any] | None = None,
+    ) -> CallToolResult:
+        """Call a tool on the least-loaded healthy session."""
+        return await self._dispatch(
+            lambda session: session.call_tool(
+                name,
+                arguments,
+                read_timeout_seconds,
+                progress_callback,
+                meta=meta,
+            )
+        )
+
+    async def list_resources(
+        self, *, params: PaginatedRequestParams | None = None
+    ) -> ListResourcesResult:
+        return await self._dispatch(
+            lambda session: session.list_resources(params=params)
+        )
+
+    async def list_resource_templates(
+        self, *, params: PaginatedRequestParams | None = None
+    ) -> ListResourceTemplatesResult:
+        return await self._dispatch(
+            lambda session: session.list_resource_templates(params=params)
+        )
+
+    async def read_resource(self, uri: AnyUrl) -> ReadResourceResult:
+        return await self._dispatch(lambda session: session.read_resource(uri))
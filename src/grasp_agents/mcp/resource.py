@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 from pydantic import AnyUrl, BaseModel
 
@@ -12,8 +12,13 @@ if TYPE_CHECKING:
     from grasp_agents.session_context import SessionContext
 
 try:
-    from mcp import ClientSession
-    from mcp.types import PaginatedRequestParams, TextResourceContents
+    from mcp.types import (
+        ListResourcesResult,
+        ListResourceTemplatesResult,
+        PaginatedRequestParams,
+        ReadResourceResult,
+        TextResourceContents,
+    )
 except ImportError as _err:
     msg = (
         "MCP support requires the 'mcp' package. "
@@ -24,6 +29,23 @@ except ImportError as _err:
 logger = logging.getLogger(__name__)
 
 
+class MCPResourceSession(Protocol):
+    """
+    What the resource tools call into: a live ``ClientSession``, or an
+    :class:`~grasp_agents.mcp.pool.MCPClientPool` routing across several.
+    """
+
+    async def list_resources(
+        self, *, params: PaginatedRequestParams | None
+    ) -> ListResourcesResult: ...
+
+    async def list_resource_templates(
+        self, *, params: PaginatedRequestParams | None
+    ) -> ListResourceTemplatesResult: ...
+
+    async def read_resource(self, uri: AnyUrl) -> ReadResourceResult: ...
+
+
 class ListResourcesInput(BaseModel):
     cursor: str | None = None
     """Optional pagination cursor from a previous list_resources call."""
@@ -39,7 +61,7 @@ class MCPListResourcesTool(BaseTool[ListResourcesInput, str, None]):
 
     _copy_shared_attrs = frozenset({"_session"})
 
-    def __init__(self, *, session: ClientSession, server_name: str) -> None:
+    def __init__(self, *, session: MCPResourceSession, server_name: str) -> None:
         super().__init__(
             name=f"{server_name}_list_resources",
             description=(
@@ -64,7 +86,7 @@ class MCPListResourcesTool(BaseTool[ListResourcesInput, str, None]):
         del ctx, exec_id, progress_callback, path, agent_ctx
         params = PaginatedRequestParams(cursor=inp.cursor) if inp.cursor else None
         resources_result = await self._session.list_resources(params=params)
-        templates_result = await self._session.list_resource_templates()
+        templates_result = await self._session.list_resource_templates(params=None)
 
         lines: list[str] = []
 
@@ -102,7 +124,7 @@ class MCPReadResourceTool(BaseTool[ReadResourceInput, str, None]):
     def __init__(
         self,
         *,
-        session: ClientSession,
+        session: MCPResourceSession,
         server_name: str,
     ) -> None:
         super().__init__(
@@ -9,14 +9,24 @@ round-trips.
 
 This module owns:
 
-* The cached snapshot of ``resources/list`` (lazy + invalidatable).
+* The cached snapshot of ``resources/list`` (lazy + invalidatable),
+  indexed by URI and by a path trie, so directory-style queries cost
+  O(depth + results) rather than a scan of every resource.
 * URI ↔ Path translation for the configured scheme.
-* Convenience queries (lookup by URI, list-under-prefix, stat-by-URI).
+* Convenience queries (lookup by URI, list-under-prefix, stat-by-URI,
+  glob evaluated against the trie).
 
 The index does **not** perform reads or mutations; callers fetch
 content via :meth:`mcp.ClientSession.read_resource` and mutate via
 MCP tools. After any write/delete the caller must call
-:meth:`refresh` so subsequent metadata queries see the new state.
+:meth:`refresh` so subsequent metadata queries see the new state. A
+server's ``notifications/resources/list_changed`` (and
+``resources/updated`` for a URI under the index's scheme) marks the
+index stale the same way. Either way the next query re-lists (following
+``nextCursor`` pages) and applies only the difference to the trie: the
+listing itself is always whole, since MCP has no request for one
+resource's metadata — so even a ``resources/updated`` naming a single
+URI costs a full re-list.
 
 Resource entries are recorded with their POSIX-form :class:`pathlib.PurePosixPath`
 so address comparison is uniform regardless of the host platform —
@@ -26,6 +36,7 @@ MCP URIs are POSIX.
 from __future__ import annotations
 
 import asyncio
+import fnmatch
 from dataclasses import dataclass, field
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, Any
@@ -41,6 +52,8 @@ except ImportError as _err:  # pragma: no cover — same MCP-extra import path a
     raise ImportError(msg) from _err
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from .client import MCPClient
 
 
@@ -66,14 +79,83 @@ class ResourceEntry:
         return self.mtime_ms / 1000.0 if self.mtime_ms else 0.0
 
 
+class _TrieNode:
+    """One path segment of the resource trie; ``entry`` is set at resources."""
+
+    __slots__ = ("children", "entry")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.entry: ResourceEntry | None = None
+
+
+class _PathTrie:
+    """Resource entries keyed by their POSIX path segments."""
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+
+    def find(self, path: PurePosixPath) -> _TrieNode | None:
+        node = self.root
+        for part in path.parts:
+            child = node.children.get(part)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def insert(self, entry: ResourceEntry) -> None:
+        node = self.root
+        for part in entry.path.parts:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+        node.entry = entry
+
+    def remove(self, entry: ResourceEntry) -> None:
+        trail: list[tuple[_TrieNode, str]] = []
+        node = self.root
+        for part in entry.path.parts:
+            child = node.children.get(part)
+            if child is None:
+                return
+            trail.append((node, part))
+            node = child
+        node.entry = None
+        # Prune the now-empty branch so "is anything under here" stays O(depth).
+        for parent, part in reversed(trail):
+            child = parent.children[part]
+            if child.entry is not None or child.children:
+                break
+            del parent.children[part]
+
+    @staticmethod
+    def walk(
+        node: _TrieNode, *, include_hidden: bool = True
+    ) -> Iterator[tuple[tuple[str, ...], _TrieNode]]:
+        """``(relative parts, node)`` for every node strictly below ``node``."""
+        stack: list[tuple[tuple[str, ...], _TrieNode]] = [((), node)]
+        while stack:
+            rel, current = stack.pop()
+            for name, child in current.children.items():
+                if not include_hidden and name.startswith("."):
+                    continue
+                child_rel = (*rel, name)
+                yield child_rel, child
+                stack.append((child_rel, child))
+
+
 class MCPResourceIndex:
     """
     Cached view of ``resources/list`` for an :class:`MCPClient`.
 
     Lazy: nothing is fetched until the first ``load()``. The cache is
-    keyed by URI. Call :meth:`refresh` after any server-side mutation
-    (write, delete) you control; everything else trusts the cache for
-    the session.
+    keyed by URI and mirrored in a path trie for prefix, child and glob
+    queries. Call :meth:`refresh` after any server-side mutation (write,
+    delete) you control; a connected :class:`MCPClient` also marks the
+    index stale when the server announces a change. Everything else
+    trusts the cache for the session. :meth:`close` stops listening.
     """
 
     def __init__(
@@ -85,7 +167,14 @@ class MCPResourceIndex:
         self._client = client
         self._uri_scheme = uri_scheme
         self._cached: dict[str, ResourceEntry] | None = None
+        self._trie = _PathTrie()
+        self._stale = False
         self._lock = asyncio.Lock()
+        # Test doubles may not relay server notifications.
+        add_listener = getattr(client, "add_resource_listener", None)
+        self._listening = add_listener is not None
+        if add_listener is not None:
+            add_listener(self._on_resource_changed)
 
     @property
     def uri_scheme(self) -> str:
@@ -106,18 +195,47 @@ class MCPResourceIndex:
     # ---- Cache mechanics ----------------------------------------------------
 
     async def load(self) -> dict[str, ResourceEntry]:
-        """Return the cached index, fetching once on first access."""
-        if self._cached is not None:
+        """Return the cached index, fetching on first access or when stale."""
+        if self._cached is not None and not self._stale:
             return self._cached
         async with self._lock:
-            if self._cached is None:
-                self._cached = await self._fetch_uncached()
+            if self._cached is None or self._stale:
+                self._stale = False
+                self._cached = self._apply(await self._fetch_uncached())
             return self._cached
 
     async def refresh(self) -> None:
-        """Drop the cache. Next :meth:`load` re-fetches."""
+        """
+        Mark the cache stale. Next :meth:`load` re-lists and applies the
+        difference to the index.
+        """
         async with self._lock:
-            self._cached = None
+            self._stale = True
+
+    def close(self) -> None:
+        """Stop following the client's change notifications. Idempotent."""
+        if self._listening:
+            self._listening = False
+            self._client.remove_resource_listener(self._on_resource_changed)
+
+    def _on_resource_changed(self, uri: str | None) -> None:
+        # ``resources/list_changed`` (``uri=None``) or ``resources/updated``
+        # of a resource in this scheme: re-list on the next query (there is
+        # no per-resource metadata request to refresh just that entry).
+        if uri is None or uri.startswith(self._uri_scheme):
+            self._stale = True
+
+    def _apply(self, listing: dict[str, ResourceEntry]) -> dict[str, ResourceEntry]:
+        """Bring the trie from the cached listing to ``listing`` (a delta)."""
+        previous = self._cached or {}
+        for uri, entry in previous.items():
+            if uri not in listing:
+                self._trie.remove(entry)
+        for uri, entry in listing.items():
+            old = previous.get(uri)
+            if old is None or old != entry:
+                self._trie.insert(entry)
+        return listing
 
     # ---- Queries ------------------------------------------------------------
 
@@ -136,9 +254,17 @@ class MCPResourceIndex:
 
         Order is unspecified; callers sort as needed.
         """
-        prefix = self.make_uri(root).rstrip("/") + "/"
-        index = await self.load()
-        return [e for e in index.values() if e.uri.startswith(prefix)]
+        await self.load()
+        node = self._trie.find(PurePosixPath(root))
+        if node is None:
+            return []
+        return [n.entry for _, n in self._trie.walk(node) if n.entry is not None]
+
+    async def has_entries_under(self, root: PurePosixPath | str) -> bool:
+        """Whether any resource sits under ``root`` — O(depth)."""
+        await self.load()
+        node = self._trie.find(PurePosixPath(root))
+        return node is not None and bool(node.children)
 
     async def children_of(
         self, root: PurePosixPath | str, *, recursive: bool = False
@@ -149,17 +275,73 @@ class MCPResourceIndex:
         With ``recursive=False`` only the immediate children are returned
         (the same shape an OS ``list_dir`` would produce).
         """
-        root_posix = PurePosixPath(root)
-        out: list[ResourceEntry] = []
-        for entry in await self.list_under(root_posix):
-            try:
-                rel = entry.path.relative_to(root_posix)
-            except ValueError:
-                continue
-            if not recursive and len(rel.parts) != 1:
-                continue
-            out.append(entry)
-        return out
+        if recursive:
+            return await self.list_under(root)
+        await self.load()
+        node = self._trie.find(PurePosixPath(root))
+        if node is None:
+            return []
+        return [
+            child.entry for child in node.children.values() if child.entry is not None
+        ]
+
+    async def glob(
+        self,
+        root: PurePosixPath | str,
+        pattern: str,
+        *,
+        include_hidden: bool = False,
+    ) -> list[ResourceEntry]:
+        """
+        Non-directory entries under ``root`` whose relative path matches
+        ``pattern`` — the same matches as
+        :func:`~grasp_agents.file_backend.local.glob_filter_entries` over a
+        recursive listing, found by walking the trie.
+
+        Leading literal segments descend by key, ``**`` patterns are matched
+        segment by segment (pruning non-matching branches), and hidden
+        branches are skipped unless ``include_hidden``. Order is
+        unspecified.
+        """
+        await self.load()
+        node = self._trie.find(PurePosixPath(root))
+        if node is None:
+            return []
+
+        parts = pattern.split("/")
+        prefix: list[str] = []
+        for part in parts[:-1]:
+            if part in {"", ".", ".."} or _has_magic(part):
+                break
+            if not include_hidden and part.startswith("."):
+                return []
+            child = node.children.get(part)
+            if child is None:
+                return []
+            prefix.append(part)
+            node = child
+
+        matches: dict[str, ResourceEntry] = {}
+        if "**" in pattern:
+            _match_segments(
+                node,
+                parts[len(prefix) :],
+                0,
+                is_start=True,
+                include_hidden=include_hidden,
+                visited=set(),
+                out=matches,
+            )
+        else:
+            # Without ``**`` a ``*`` may span ``/`` (``fnmatch`` semantics),
+            # so only the literal prefix narrows the walk.
+            for rel, child in self._trie.walk(node, include_hidden=include_hidden):
+                entry = child.entry
+                if entry is None or entry.is_dir:
+                    continue
+                if fnmatch.fnmatchcase("/".join((*prefix, *rel)), pattern):
+                    matches[entry.uri] = entry
+        return list(matches.values())
 
     # ---- Internals ----------------------------------------------------------
 
@@ -185,6 +367,86 @@ class MCPResourceIndex:
         return index
 
 
+def _has_magic(segment: str) -> bool:
+    return any(c in segment for c in "*?[")
+
+
+def _match_segments(
+    node: _TrieNode,
+    parts: list[str],
+    i: int,
+    *,
+    is_start: bool,
+    include_hidden: bool,
+    visited: set[tuple[int, int]],
+    out: dict[str, ResourceEntry],
+) -> None:
+    """Trie form of ``file_backend.local._match_segments`` (``**`` globs)."""
+    key = (id(node), i)
+    if key in visited:
+        return
+    visited.add(key)
+
+    def emit(target: _TrieNode) -> None:
+        entry = target.entry
+        if entry is not None and not entry.is_dir:
+            out[entry.uri] = entry
+
+    def children() -> Iterator[tuple[str, _TrieNode]]:
+        for name, child in node.children.items():
+            if include_hidden or not name.startswith("."):
+                yield name, child
+
+    if i == len(parts):
+        if not is_start:
+            emit(node)
+        return
+    head = parts[i]
+    if head == "**":
+        if i + 1 == len(parts):
+            if not is_start:
+                emit(node)
+            for _, child in _PathTrie.walk(node, include_hidden=include_hidden):
+                emit(child)
+            return
+        _match_segments(
+            node,
+            parts,
+            i + 1,
+            is_start=is_start,
+            include_hidden=include_hidden,
+            visited=visited,
+            out=out,
+        )
+        for _, child in children():
+            _match_segments(
+                child,
+                parts,
+                i,
+                is_start=False,
+                include_hidden=include_hidden,
+                visited=visited,
+                out=out,
+            )
+        return
+    if _has_magic(head):
+        targets = [c for name, c in children() if fnmatch.fnmatchcase(name, head)]
+    else:
+        child = node.children.get(head)
+        hidden = head.startswith(".") and not include_hidden
+        targets = [child] if child is not None and not hidden else []
+    for child in targets:
+        _match_segments(
+            child,
+            parts,
+            i + 1,
+            is_start=False,
+            include_hidden=include_hidden,
+            visited=visited,
+            out=out,
+        )
+
+
 def _entry_from_resource(uri: str, resource: Resource, scheme: str) -> ResourceEntry:
     """Build a :class:`ResourceEntry` from an MCP resource block."""
     meta: dict[str, Any] = dict(resource.meta) if resource.meta else {}
@@ -44,7 +44,8 @@ def make_mcp_instructions_section(
     lifetime, so the section reflects whatever is wired *now*.
     Disconnected clients (no instructions, or never connected) are skipped.
     The section returns ``None`` when no client supplies instructions, so the
-    block is omitted from the prompt entirely.
+    block is omitted from the prompt entirely. The render is memoized on the
+    ``(name, instructions)`` of the current clients.
     """
 
     async def compute(  # noqa: RUF029
@@ -69,8 +70,13 @@ def make_mcp_instructions_section(
             return None
         return "\n\n".join([_BLOCK_HEADING, *blocks])
 
+    def cache_key(**_: Any) -> tuple[tuple[str, str | None], ...]:
+        current = clients() if callable(clients) else clients
+        return tuple((client.name, client.instructions) for client in current)
+
     return SystemPromptSection(
         name=section_name,
         compute=compute,
         cache_control=CacheControl(),
+        cache_key=cache_key,
     )
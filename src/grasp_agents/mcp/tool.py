@@ -2,7 +2,7 @@ import json
 import logging
 from datetime import timedelta
 from functools import cached_property
-from typing import Any
+from typing import Any, Protocol
 
 from pydantic import BaseModel
 
@@ -12,10 +12,10 @@ from grasp_agents.tools.base import BaseTool, ToolProgressCallback
 from grasp_agents.types.content import InputImage, InputText
 from grasp_agents.types.items import ToolOutputPart
 
-from .json_schema import json_schema_to_pydantic
+from .json_schema import cached_json_schema_to_pydantic
 
 try:
-    from mcp import ClientSession
+    from mcp.shared.session import ProgressFnT
     from mcp.types import CallToolResult as McpToolResult
     from mcp.types import (
         EmbeddedResource,
@@ -34,6 +34,23 @@ except ImportError as _err:
 logger = logging.getLogger(__name__)
 
 
+class MCPToolSession(Protocol):
+    """
+    What an :class:`MCPTool` calls into: a live ``ClientSession``, or an
+    :class:`~grasp_agents.mcp.pool.MCPClientPool` routing across several.
+    """
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        read_timeout_seconds: timedelta | None = None,
+        progress_callback: ProgressFnT | None = None,
+        *,
+        meta: dict[str, Any] | None = None,
+    ) -> McpToolResult: ...
+
+
 class MCPTool(BaseTool[BaseModel, McpToolResult, None]):
     """
     A tool backed by an MCP server.
@@ -49,7 +66,7 @@ class MCPTool(BaseTool[BaseModel, McpToolResult, None]):
     def __init__(
         self,
         *,
-        session: ClientSession,
+        session: MCPToolSession,
         tool_def: McpToolDef,
         timeout: float | None = 30.0,
     ) -> None:
@@ -62,7 +79,7 @@ class MCPTool(BaseTool[BaseModel, McpToolResult, None]):
         self._session = session
         self._tool_def = tool_def
 
-        self._in_type = json_schema_to_pydantic(
+        self._in_type = cached_json_schema_to_pydantic(
             tool_def.inputSchema, f"{tool_def.name}_input"
         )
         self._out_type = McpToolResult
@@ -74,7 +91,9 @@ class MCPTool(BaseTool[BaseModel, McpToolResult, None]):
     @cached_property
     def struct_output_schema(self) -> type[BaseModel] | None:
         return (
-            json_schema_to_pydantic(self._tool_def.outputSchema, f"{self.name}_output")
+            cached_json_schema_to_pydantic(
+                self._tool_def.outputSchema, f"{self.name}_output"
+            )
             if self._tool_def.outputSchema is not None
             else None
         )
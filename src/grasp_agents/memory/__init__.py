@@ -24,61 +24,120 @@ cross-session knowledge.
 
 from __future__ import annotations
 
-from .default_path import (
-    GRASP_HOME_DIR_NAME,
-    GRASP_MEMORY_ENV,
-    MEMDIR_DIR_NAME,
-    PROJECTS_DIR_NAME,
-    default_memdir_path,
-)
-from .injection import (
-    MEMORY_SECTION_NAME,
-    RELEVANT_MEMORIES_ATTACHMENT_NAME,
-    make_memory_section,
-    memory_system_prompt_section,
-    relevant_memories_attachment,
-    render_memory_index,
-    render_memory_instructions,
-)
-from .loader import (
-    INDEX_FILE_NAME,
-    MAX_INDEX_BYTES,
-    MAX_INDEX_LINES,
-    MAX_MEMORY_FILES,
-    load_memory_entry,
-    parse_memory_md,
-    scan_memdir,
-    truncate_index,
-)
-from .provider import (
-    DEFAULT_STALE_AFTER,
-    InMemoryMemoryProvider,
-    MemoryProvider,
-    MemorySelector,
-    MemorySnapshot,
-)
-from .selectors import (
-    DEFAULT_MAX_SELECT,
-    DEFAULT_MAX_TOKENS,
-    SELECT_MEMORIES_SYSTEM_PROMPT,
-    extract_latest_user_message,
-    extract_latest_user_text,
-    format_manifest,
-    make_llm_relevance_selector,
-)
-from .types import (
-    MEMORY_TYPES,
-    MemoryEntry,
-    MemoryError,  # noqa: A004
-    MemoryFormatError,
-    MemoryFrontmatter,
-    MemoryNotFoundError,
-    MemoryType,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .default_path import (
+        GRASP_HOME_DIR_NAME,
+        GRASP_MEMORY_ENV,
+        MEMDIR_DIR_NAME,
+        PROJECTS_DIR_NAME,
+        default_memdir_path,
+    )
+    from .injection import (
+        MEMORY_SECTION_NAME,
+        RELEVANT_MEMORIES_ATTACHMENT_NAME,
+        make_memory_section,
+        memory_system_prompt_section,
+        relevant_memories_attachment,
+        render_memory_index,
+        render_memory_instructions,
+    )
+    from .loader import (
+        INDEX_FILE_NAME,
+        MAX_INDEX_BYTES,
+        MAX_INDEX_LINES,
+        MAX_MEMORY_FILES,
+        load_memory_entry,
+        parse_memory_md,
+        scan_memdir,
+        truncate_index,
+    )
+    from .provider import (
+        DEFAULT_READ_CONCURRENCY,
+        DEFAULT_STALE_AFTER,
+        InMemoryMemoryProvider,
+        MemoryProvider,
+        MemorySelector,
+        MemorySnapshot,
+    )
+    from .selectors import (
+        DEFAULT_MAX_SELECT,
+        DEFAULT_MAX_TOKENS,
+        SELECT_MEMORIES_SYSTEM_PROMPT,
+        extract_latest_user_message,
+        extract_latest_user_text,
+        format_manifest,
+        make_llm_relevance_selector,
+    )
+    from .types import (
+        MEMORY_TYPES,
+        MemoryEntry,
+        MemoryError,  # noqa: A004
+        MemoryFormatError,
+        MemoryFrontmatter,
+        MemoryNotFoundError,
+        MemoryType,
+    )
+
+_LAZY: dict[str, str] = {
+    "GRASP_HOME_DIR_NAME": "default_path",
+    "GRASP_MEMORY_ENV": "default_path",
+    "MEMDIR_DIR_NAME": "default_path",
+    "PROJECTS_DIR_NAME": "default_path",
+    "default_memdir_path": "default_path",
+    "MEMORY_SECTION_NAME": "injection",
+    "RELEVANT_MEMORIES_ATTACHMENT_NAME": "injection",
+    "make_memory_section": "injection",
+    "memory_system_prompt_section": "injection",
+    "relevant_memories_attachment": "injection",
+    "render_memory_index": "injection",
+    "render_memory_instructions": "injection",
+    "INDEX_FILE_NAME": "loader",
+    "MAX_INDEX_BYTES": "loader",
+    "MAX_INDEX_LINES": "loader",
+    "MAX_MEMORY_FILES": "loader",
+    "load_memory_entry": "loader",
+    "parse_memory_md": "loader",
+    "scan_memdir": "loader",
+    "truncate_index": "loader",
+    "DEFAULT_READ_CONCURRENCY": "provider",
+    "DEFAULT_STALE_AFTER": "provider",
+    "InMemoryMemoryProvider": "provider",
+    "MemoryProvider": "provider",
+    "MemorySelector": "provider",
+    "MemorySnapshot": "provider",
+    "DEFAULT_MAX_SELECT": "selectors",
+    "DEFAULT_MAX_TOKENS": "selectors",
+    "SELECT_MEMORIES_SYSTEM_PROMPT": "selectors",
+    "extract_latest_user_message": "selectors",
+    "extract_latest_user_text": "selectors",
+    "format_manifest": "selectors",
+    "make_llm_relevance_selector": "selectors",
+    "MEMORY_TYPES": "types",
+    "MemoryEntry": "types",
+    "MemoryError": "types",
+    "MemoryFormatError": "types",
+    "MemoryFrontmatter": "types",
+    "MemoryNotFoundError": "types",
+    "MemoryType": "types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "DEFAULT_MAX_SELECT",
     "DEFAULT_MAX_TOKENS",
+    "DEFAULT_READ_CONCURRENCY",
     "DEFAULT_STALE_AFTER",
     "GRASP_HOME_DIR_NAME",
     "GRASP_MEMORY_ENV",
@@ -9,6 +9,7 @@ from grasp_agents.context.prompt_builder import InputAttachment, SystemPromptSec
 from .types import INDEX_FILE_NAME, MAX_INDEX_BYTES, MAX_INDEX_LINES, MEMORY_TYPES
 
 if TYPE_CHECKING:
+    from .provider import MemoryProvider
     from .types import MemoryEntry
 
 if TYPE_CHECKING:
@@ -108,6 +109,21 @@ def render_memory_index(
     return "\n".join(parts)
 
 
+class _SameObject:
+    """Cache-key part matching only the very object it wraps (by identity)."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _SameObject) and other.obj is self.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
 def make_memory_section(
     *, section_name: str = MEMORY_SECTION_NAME
 ) -> SystemPromptSection:
@@ -117,6 +133,12 @@ def make_memory_section(
     Emits two sub-blocks when ``ctx.memory`` is configured: the
     substrate instructions (taxonomy + frontmatter + index discipline)
     and the ``MEMORY.md`` index.
+
+    The render is memoized on the provider, its
+    :attr:`MemoryProvider.generation` and the agent's file-edit state, so
+    the memdir is only re-rendered after a :meth:`MemoryProvider.refresh`
+    and each agent still passes through ``load`` once (recording its read
+    of the index and, with ``refresh_on_write``, having its writes watched).
     """
 
     async def compute(
@@ -154,7 +176,24 @@ def make_memory_section(
             return None
         return "\n\n".join(blocks)
 
-    return SystemPromptSection(name=section_name, compute=compute)
+    def cache_key(
+        *,
+        ctx: SessionContext[Any] | None = None,
+        agent_ctx: AgentContext | None = None,
+        **_: Any,
+    ) -> tuple[MemoryProvider, int, bool, _SameObject | None] | None:
+        if ctx is None or ctx.memory is None:
+            return None
+        memory = ctx.memory
+        state = agent_ctx.file_edit_state if agent_ctx is not None else None
+        return (
+            memory,
+            memory.generation,
+            memory.selector is not None,
+            _SameObject(state) if state is not None else None,
+        )
+
+    return SystemPromptSection(name=section_name, compute=compute, cache_key=cache_key)
 
 
 memory_system_prompt_section = make_memory_section()
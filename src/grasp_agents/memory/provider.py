@@ -8,6 +8,10 @@ topic files with YAML frontmatter, freshness from mtime); the
 walks the filesystem; over MCP it walks an :class:`MCPResourceIndex`.
 The provider is identical across the two.
 
+Snapshots are rebuilt incrementally: a reload lists the memdir and
+re-reads (concurrently, with a bound) only the files whose listed mtime or
+size changed; unchanged topic files reuse their parsed entry.
+
 For tests / notebooks that don't want any I/O,
 :class:`InMemoryMemoryProvider` returns a fixed snapshot.
 """
@@ -17,6 +21,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -30,7 +35,7 @@ if TYPE_CHECKING:
     from collections.abc import Collection, Sequence
     from datetime import timedelta
 
-    from grasp_agents.file_backend.base import FileBackend
+    from grasp_agents.file_backend.base import FileBackend, FileEntry
     from grasp_agents.session_context import SessionContext
     from grasp_agents.tools.file_edit.session_state import FileEditSessionState
     from grasp_agents.types.items import InputItem
@@ -48,6 +53,27 @@ logger = logging.getLogger(__name__)
 DEFAULT_INDEX_CONTENT = "# Memory\n"
 
 
+# Topic files read at once when (re)loading a memdir.
+DEFAULT_READ_CONCURRENCY = 16
+
+
+@dataclass(frozen=True)
+class _FileStamp:
+    """What a listing says about a file: reuse a parse while it still holds."""
+
+    mtime: float
+    size: int | None
+
+    @classmethod
+    def of(cls, entry: FileEntry) -> _FileStamp:
+        return cls(mtime=entry.mtime, size=entry.size)
+
+    def matches(self, entry: FileEntry) -> bool:
+        return entry.mtime == self.mtime and (
+            entry.size is None or self.size is None or entry.size == self.size
+        )
+
+
 @dataclass(frozen=True)
 class MemorySnapshot:
     """
@@ -105,6 +131,15 @@ class MemoryProvider:
             load so the agent has a file to append topic pointers to. Best-
             effort: silently falls back to no index if the backend can't
             write (read-only / no write path). Set False for read-only memdirs.
+        read_concurrency: Maximum topic files read at once while loading.
+        refresh_on_write: When True, a ``Write`` / ``Edit`` / ``Delete`` under
+            the memdir by an agent whose :class:`FileEditSessionState` was
+            passed to :meth:`load` invalidates the snapshot, so the next load
+            picks the change up (re-reading only the touched files).
+            :meth:`close` stops watching those states.
+
+    Reloads are incremental: parsed topic files are cached by path and
+    listed mtime / size, and only new or changed files are re-read.
 
     Carries an optional relevance selector (:meth:`set_selector`)
     consumed by per-turn user-message attachments (e.g. the
@@ -122,6 +157,8 @@ class MemoryProvider:
         backend: FileBackend | None = None,
         stale_after: timedelta = DEFAULT_STALE_AFTER,
         auto_create_index: bool = True,
+        read_concurrency: int = DEFAULT_READ_CONCURRENCY,
+        refresh_on_write: bool = False,
     ) -> None:
         self._root: Path = (
             Path(root).expanduser() if root is not None else default_memdir_path()
@@ -129,14 +166,40 @@ class MemoryProvider:
         self._backend: FileBackend | None = backend
         self._stale_after = stale_after
         self._auto_create_index = auto_create_index
+        self._read_concurrency = read_concurrency
+        self._refresh_on_write = refresh_on_write
+        self._init_cache()
+        self._selector: MemorySelector | None = None
+
+    def _init_cache(self) -> None:
         self._cached: MemorySnapshot | None = None
+        self._stale = False
+        self._generation = 0
         self._lock = asyncio.Lock()
-        self._selector: MemorySelector | None = None
+        # Parsed topic files by path (``None``: unparseable at that stamp).
+        self._files: dict[Path, tuple[_FileStamp, MemoryEntry | None]] = {}
+        # (stamp, capped text, truncated) of the last index read.
+        self._index_file: tuple[_FileStamp, str, bool] | None = None
+        # (path, mtime) of the index the cached snapshot shows, recorded into
+        # each loading agent's session state as a read.
+        self._index_read: tuple[Path, float] | None = None
+        # Weak: a watch must not keep a finished agent's state alive.
+        self._watched: list[weakref.ref[FileEditSessionState]] = []
+        self._watch_roots: tuple[Path, ...] = ()
 
     @property
     def root(self) -> Path:
         return self._root
 
+    @property
+    def generation(self) -> int:
+        """
+        Snapshot watermark, bumped by every :meth:`refresh` (and every watched
+        write, see ``refresh_on_write``). Consumers that memoize renders of
+        the snapshot (the memory system-prompt section) key on it.
+        """
+        return self._generation
+
     def bind_backend(self, backend: FileBackend) -> None:
         """
         Bind a :class:`FileBackend` after construction. Called by the
@@ -149,7 +212,7 @@ class MemoryProvider:
         self, *, session_state: FileEditSessionState | None = None
     ) -> MemorySnapshot:
         """
-        Return a frozen memdir snapshot. Cached after the first call.
+        Return a frozen memdir snapshot. Cached until invalidated.
 
         Requires a :class:`FileBackend` to be bound (via ctor or
         :meth:`bind_backend`). The :class:`SessionContext` validator binds
@@ -157,11 +220,16 @@ class MemoryProvider:
         a context.
 
         ``session_state`` (the active agent's :class:`FileEditSessionState`,
-        from its :class:`AgentContext`) records the index read on a fresh
-        load, so the agent may ``Edit`` ``MEMORY.md`` without a redundant
-        ``Read``.
+        from its :class:`AgentContext`) records the index read — on a cached
+        load too, since the index is in every loading agent's prompt — so the
+        agent may ``Edit`` ``MEMORY.md`` without a redundant ``Read``. With
+        ``refresh_on_write`` it is also watched: the agent's own writes under
+        the memdir invalidate the snapshot.
         """
-        if self._cached is not None:
+        if self._refresh_on_write and session_state is not None:
+            self._watch(session_state)
+        if self._cached is not None and not self._stale:
+            self._record_index_read(session_state)
             return self._cached
         if self._backend is None:
             raise ValueError(
@@ -171,16 +239,54 @@ class MemoryProvider:
                 "backend onto the provider automatically."
             )
         async with self._lock:
-            if self._cached is None:
-                self._cached = await self._load_via_backend(
-                    self._backend, session_state=session_state
-                )
+            if self._cached is None or self._stale:
+                # Cleared first: a write landing mid-load re-marks it stale.
+                self._stale = False
+                self._cached = await self._load_via_backend(self._backend)
+            self._record_index_read(session_state)
             return self._cached
 
+    def _record_index_read(self, session_state: FileEditSessionState | None) -> None:
+        if session_state is not None and self._index_read is not None:
+            session_state.record_read(*self._index_read)
+
     async def refresh(self) -> None:
-        """Invalidate any cached snapshot."""
+        """
+        Invalidate the cached snapshot. The next :meth:`load` re-lists the
+        memdir and re-reads only files whose mtime or size changed.
+        """
         async with self._lock:
-            self._cached = None
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._stale = True
+        self._generation += 1
+
+    def _watch(self, session_state: FileEditSessionState) -> None:
+        self._watched = [ref for ref in self._watched if ref() is not None]
+        if any(ref() is session_state for ref in self._watched):
+            return
+        if not self._watch_roots:
+            # Tools record resolved paths; match the memdir either way.
+            self._watch_roots = tuple({self._root, self._root.resolve()})
+        session_state.add_write_listener(self._on_write)
+        self._watched.append(weakref.ref(session_state))
+
+    def close(self) -> None:
+        """
+        Stop watching the session states passed to :meth:`load` (see
+        ``refresh_on_write``): their writes no longer reach this provider.
+        Idempotent; a later ``load(session_state=...)`` watches afresh.
+        """
+        watched, self._watched = self._watched, []
+        for ref in watched:
+            state = ref()
+            if state is not None:
+                state.remove_write_listener(self._on_write)
+
+    def _on_write(self, path: Path) -> None:
+        if any(path.is_relative_to(root) for root in self._watch_roots):
+            self._invalidate()
 
     async def fetch_body(
         self, name: str, *, session_state: FileEditSessionState | None = None
@@ -290,72 +396,43 @@ class MemoryProvider:
 
     # ---- Internals -----------------------------------------------------------
 
-    async def _load_via_backend(
-        self, backend: FileBackend, *, session_state: FileEditSessionState | None = None
-    ) -> MemorySnapshot:
+    async def _load_via_backend(self, backend: FileBackend) -> MemorySnapshot:
         """
         Walk ``self._root`` via ``backend`` and return a frozen snapshot.
 
-        Filters out hidden dirs / non-``.md`` files; reads each topic
-        file via ``backend.read_text`` and parses its frontmatter; the
-        index is read separately. Returns an empty snapshot if the root
+        Filters out hidden dirs / non-``.md`` files; reads each new or
+        changed topic file via ``backend.read_text`` (at most
+        ``read_concurrency`` at once) and parses its frontmatter, reusing the
+        cached entry of every file whose listed mtime / size is unchanged;
+        the index is read separately. Returns an empty snapshot if the root
         doesn't exist on the backend.
 
-        The index read is recorded into the active agent's
-        :class:`FileEditSessionState` (it's always in the prompt, so the
-        agent may ``Edit`` it without a redundant ``Read``). Topic-file
-        reads are NOT recorded here — only their body, when surfaced via
+        The index read is kept for :meth:`load` to record into each loading
+        agent's :class:`FileEditSessionState` (it's always in the prompt, so
+        the agent may ``Edit`` it without a redundant ``Read``). Topic-file
+        reads are NOT recorded — only their body, when surfaced via
         :meth:`fetch_body`, is.
         """
-        from .loader import parse_memory_md, truncate_index  # noqa: PLC0415
-        from .types import (  # noqa: PLC0415
-            INDEX_FILE_NAME,
-            MAX_MEMORY_FILES,
-            MemoryEntry,
-            MemoryFormatError,
-        )
-
-        active_state = session_state
+        from .types import INDEX_FILE_NAME, MAX_MEMORY_FILES  # noqa: PLC0415
 
         root = self._root
-        index_text: str | None = None
-        index_mtime_ms: int | None = None
-        index_truncated = False
         index_path = root / INDEX_FILE_NAME
-        # Read the index if present. MCP backends have no real
-        # directory entries, so a ``backend.exists(root)`` gate would
-        # short-circuit empty memdirs; instead we just probe the index
-        # file directly and tolerate its absence.
-        if await backend.exists(index_path):
-            try:
-                raw, mtime = await backend.read_text(index_path)
-                index_text, index_truncated = truncate_index(raw)
-                index_mtime_ms = int(mtime * 1000)
-                if active_state is not None:
-                    active_state.record_read(index_path, mtime)
-            except (OSError, ValueError) as exc:
-                logger.warning(
-                    "MemoryProvider: failed to read index at %s: %s",
-                    index_path,
-                    exc,
-                )
-        elif self._auto_create_index:
-            index_text, index_mtime_ms = await self._create_index(
-                backend, index_path, active_state
-            )
-
         try:
             entries_listing = await backend.list_dir(root, recursive=True)
         except (OSError, ValueError) as exc:
             logger.warning("MemoryProvider: failed to list memdir %s: %s", root, exc)
             entries_listing = []
-        entries: list[MemoryEntry] = []
+
+        index_listed: FileEntry | None = None
+        topics: list[FileEntry] = []
         for entry in entries_listing:
             if entry.is_dir:
                 continue
             if not entry.name.endswith(".md"):
                 continue
             if entry.name == INDEX_FILE_NAME:
+                if entry.path == index_path:
+                    index_listed = entry
                 continue
             try:
                 rel = entry.path.relative_to(root)
@@ -363,30 +440,13 @@ class MemoryProvider:
                 continue
             if any(part.startswith(".") for part in rel.parts):
                 continue
-            try:
-                text, mtime = await backend.read_text(entry.path)
-            except (OSError, ValueError) as exc:
-                logger.warning("MemoryProvider: failed to read %s: %s", entry.path, exc)
-                continue
-            # NB: no ``record_read`` for topic files here. Only their
-            # ``name``/``description`` reach the prompt (via the index);
-            # the body is surfaced — and the read recorded — in
-            # :meth:`fetch_body` when the per-turn attachment pulls it.
-            # Pre-recording every body would let the agent ``Edit`` a
-            # file it never actually saw, defeating read-before-write.
-            try:
-                frontmatter, body = parse_memory_md(text, path=entry.path)
-            except MemoryFormatError:
-                logger.exception("Failed to load memory at %s", entry.path)
-                continue
-            entries.append(
-                MemoryEntry(
-                    frontmatter=frontmatter,
-                    body=body,
-                    path=entry.path,
-                    mtime_ms=int(mtime * 1000),
-                )
-            )
+            topics.append(entry)
+
+        self._index_read = None
+        index_text, index_mtime_ms, index_truncated = await self._load_index(
+            backend, index_path, index_listed
+        )
+        entries = await self._load_entries(backend, topics)
 
         entries.sort(key=lambda e: e.mtime_ms, reverse=True)
         if len(entries) > MAX_MEMORY_FILES:
@@ -401,11 +461,116 @@ class MemoryProvider:
             index_truncated=index_truncated,
         )
 
+    async def _load_index(
+        self,
+        backend: FileBackend,
+        index_path: Path,
+        listed: FileEntry | None,
+    ) -> tuple[str | None, int | None, bool]:
+        """``(text, mtime_ms, truncated)`` of ``MEMORY.md``, re-read if changed."""
+        from .loader import truncate_index  # noqa: PLC0415
+
+        cached = self._index_file
+        if listed is not None and cached is not None and cached[0].matches(listed):
+            stamp, text, truncated = cached
+            self._index_read = (index_path, stamp.mtime)
+            return text, int(stamp.mtime * 1000), truncated
+
+        self._index_file = None
+        # Read the index if present. MCP backends have no real
+        # directory entries, so a ``backend.exists(root)`` gate would
+        # short-circuit empty memdirs; instead we just probe the index
+        # file directly and tolerate its absence.
+        if await backend.exists(index_path):
+            try:
+                raw, mtime = await backend.read_text(index_path)
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    "MemoryProvider: failed to read index at %s: %s",
+                    index_path,
+                    exc,
+                )
+                return None, None, False
+            text, truncated = truncate_index(raw)
+            self._index_read = (index_path, mtime)
+            size = listed.size if listed is not None else None
+            self._index_file = (_FileStamp(mtime, size), text, truncated)
+            return text, int(mtime * 1000), truncated
+        if self._auto_create_index:
+            text, mtime_ms = await self._create_index(backend, index_path)
+            return text, mtime_ms, False
+        return None, None, False
+
+    async def _load_entries(
+        self, backend: FileBackend, topics: list[FileEntry]
+    ) -> list[MemoryEntry]:
+        """Topic entries for ``topics``, reading only uncached / changed files."""
+        previous = self._files
+        current: dict[Path, tuple[_FileStamp, MemoryEntry | None]] = {}
+        changed: list[FileEntry] = []
+        for listed in topics:
+            hit = previous.get(listed.path)
+            if hit is not None and hit[0].matches(listed):
+                current[listed.path] = hit
+            else:
+                changed.append(listed)
+
+        if await self._read_batch(backend, changed, current):
+            changed = []
+
+        semaphore = asyncio.Semaphore(max(1, self._read_concurrency))
+
+        async def read(listed: FileEntry) -> None:
+            async with semaphore:
+                try:
+                    text, mtime = await backend.read_text(listed.path)
+                except (OSError, ValueError) as exc:
+                    # Not cached: retried on the next load.
+                    logger.warning(
+                        "MemoryProvider: failed to read %s: %s", listed.path, exc
+                    )
+                    return
+            entry = _parse_entry(listed.path, text, mtime)
+            current[listed.path] = (_FileStamp.of(listed), entry)
+
+        await asyncio.gather(*(read(listed) for listed in changed))
+        # Deleted files drop out with the old mapping.
+        self._files = current
+        return [entry for _, entry in current.values() if entry is not None]
+
+    async def _read_batch(
+        self,
+        backend: FileBackend,
+        changed: list[FileEntry],
+        current: dict[Path, tuple[_FileStamp, MemoryEntry | None]],
+    ) -> bool:
+        """
+        Read all of ``changed`` with one :meth:`FileBackend.read_many` call
+        (one worker hop on the local backend). ``False`` if any file failed,
+        leaving the per-file reads to load the rest and log the failure.
+        """
+        if not changed:
+            return True
+        try:
+            results = await backend.read_many(
+                [listed.path for listed in changed],
+                max_concurrency=max(1, self._read_concurrency),
+            )
+        except (OSError, ValueError):
+            return False
+        for listed, (data, mtime) in zip(changed, results, strict=True):
+            # Decoded as ``read_text`` would: replacement chars, universal
+            # newlines.
+            text = data.decode("utf-8", errors="replace")
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            entry = _parse_entry(listed.path, text, mtime)
+            current[listed.path] = (_FileStamp.of(listed), entry)
+        return True
+
     async def _create_index(
         self,
         backend: FileBackend,
         index_path: Path,
-        active_state: FileEditSessionState | None,
     ) -> tuple[str | None, int | None]:
         """
         Bootstrap an empty ``MEMORY.md`` so the always-loaded index exists.
@@ -434,8 +599,7 @@ class MemoryProvider:
             )
             return None, None
 
-        if active_state is not None:
-            active_state.record_read(resolved, mtime)
+        self._index_read = (resolved, mtime)
         logger.info("MemoryProvider: created empty memory index at %s", index_path)
         return DEFAULT_INDEX_CONTENT, int(mtime * 1000)
 
@@ -456,8 +620,9 @@ class InMemoryMemoryProvider(MemoryProvider):
         self._backend = None
         self._stale_after = stale_after
         self._auto_create_index = False
-        self._cached: MemorySnapshot | None = None
-        self._lock = asyncio.Lock()
+        self._read_concurrency = DEFAULT_READ_CONCURRENCY
+        self._refresh_on_write = False
+        self._init_cache()
         self._selector: MemorySelector | None = None
         self._snapshot = build_snapshot(
             root=None,
@@ -510,6 +675,30 @@ def build_snapshot(
     )
 
 
+def _parse_entry(path: Path, text: str, mtime: float) -> MemoryEntry | None:
+    """
+    Parse a topic file read from ``path``; ``None`` (logged) if malformed.
+
+    NB: the provider does not ``record_read`` topic files. Only their
+    ``name``/``description`` reach the prompt (via the index); the body is
+    surfaced — and the read recorded — in :meth:`MemoryProvider.fetch_body`
+    when the per-turn attachment pulls it. Pre-recording every body would
+    let the agent ``Edit`` a file it never actually saw, defeating
+    read-before-write.
+    """
+    from .loader import parse_memory_md  # noqa: PLC0415
+    from .types import MemoryEntry, MemoryFormatError  # noqa: PLC0415
+
+    try:
+        frontmatter, body = parse_memory_md(text, path=path)
+    except MemoryFormatError:
+        logger.exception("Failed to load memory at %s", path)
+        return None
+    return MemoryEntry(
+        frontmatter=frontmatter, body=body, path=path, mtime_ms=int(mtime * 1000)
+    )
+
+
 def _freshness_warning(age_ms: int) -> str:
     age_days = age_ms // 86_400_000
     if age_days >= 1:
@@ -546,6 +735,7 @@ from .default_path import (  # noqa: E402  re-export for back-compat
 )
 
 __all__ = [
+    "DEFAULT_READ_CONCURRENCY",
     "DEFAULT_STALE_AFTER",
     "GRASP_HOME_DIR_NAME",
     "GRASP_MEMORY_ENV",
@@ -1,7 +1,31 @@
-from .parallel_processor import ParallelProcessor
-from .processor import Processor
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .parallel_processor import ParallelProcessor
+    from .processor import Processor
+    from .remote_processor import RemoteProcessor
+
+_LAZY: dict[str, str] = {
+    "ParallelProcessor": "parallel_processor",
+    "Processor": "processor",
+    "RemoteProcessor": "remote_processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "ParallelProcessor",
     "Processor",
+    "RemoteProcessor",
 ]
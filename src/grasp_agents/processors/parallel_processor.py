@@ -1,20 +1,25 @@
+from __future__ import annotations
+
 import logging
-from collections.abc import AsyncIterator, Sequence
 from itertools import chain
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from grasp_agents.durability.checkpoints import CheckpointKind, ParallelCheckpoint
-from grasp_agents.session_context import SessionContext
 from grasp_agents.types.errors import ProcInputValidationError, ProcRunError
 from grasp_agents.types.events import Event, ProcPacketOutEvent, ProcPayloadOutEvent
-from grasp_agents.types.io import ProcName
 from grasp_agents.types.packet import BranchError, Packet
 from grasp_agents.utils.callbacks import is_method_overridden
 from grasp_agents.utils.errors import format_error_chain, root_cause
-from grasp_agents.utils.streaming import stream_concurrent
+from grasp_agents.utils.streaming import DEFAULT_MAX_BUFFERED, stream_concurrent
 
 from .processor import Processor
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.io import ProcName
+
 logger = logging.getLogger(__name__)
 
 type OnError = Literal["raise", "drop", "keep"]
@@ -263,7 +268,9 @@ class ParallelProcessor[InT, OutT, CtxT](Processor[InT, OutT, CtxT]):
                 for i in pending_indices
             ]
 
-            merged = stream_concurrent(streams)
+            # Bounded per replica: a slow consumer slows the replicas down
+            # instead of buffering the whole fan-out.
+            merged = stream_concurrent(streams, max_buffered=DEFAULT_MAX_BUFFERED)
 
             try:
                 async for stream_idx, event in merged:
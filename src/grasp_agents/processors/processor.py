@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import logging
 from collections.abc import AsyncIterator, Callable, Mapping, Sequence
 from copy import deepcopy
@@ -19,8 +21,6 @@ from pydantic import ValidationError as PydanticValidationError
 
 from grasp_agents import grasp_logging
 from grasp_agents.durability.checkpoint_mixin import CheckpointPersistMixin
-from grasp_agents.durability.checkpoints import CheckpointKind
-from grasp_agents.hooks import RecipientSelector
 from grasp_agents.session_context import (
     DEFAULT_SESSION_KEY,
     SessionContext,
@@ -44,13 +44,15 @@ from grasp_agents.types.events import (
     ProcStreamingErrorData,
     ProcStreamingErrorEvent,
 )
-from grasp_agents.types.io import ProcName
 from grasp_agents.types.packet import Packet
 from grasp_agents.utils.callbacks import is_method_overridden
 from grasp_agents.utils.generics import AutoInstanceAttributesMixin
 
 if TYPE_CHECKING:
+    from grasp_agents.durability.checkpoints import CheckpointKind
+    from grasp_agents.hooks import RecipientSelector
     from grasp_agents.tools.processor_tool import ProcessorTool
+    from grasp_agents.types.io import ProcName
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +69,7 @@ def _record_retry_exception(
 def with_retry[F: Callable[..., AsyncIterator[Event[Any]]]](func: F) -> F:
     @wraps(func)
     async def wrapper(
-        self: "Processor[Any, Any, Any]", *args: Any, **kwargs: Any
+        self: Processor[Any, Any, Any], *args: Any, **kwargs: Any
     ) -> AsyncIterator[Event[Any]]:
         exec_id = self.generate_exec_id(kwargs.get("exec_id"))
         kwargs["exec_id"] = exec_id
@@ -219,7 +221,7 @@ class Processor[InT, OutT, CtxT](
         return self._checkpoint_number
 
     @property
-    def checkpoint_kind(self) -> "CheckpointKind | None":
+    def checkpoint_kind(self) -> CheckpointKind | None:
         return self._checkpoint_kind
 
     @property
@@ -662,7 +664,7 @@ class Processor[InT, OutT, CtxT](
         auto_background_at: float | None = None,
         blocks_final_answer: bool = True,
         max_inline_result_chars: int | None = None,
-    ) -> "ProcessorTool[InT, OutT, CtxT]":  # type: ignore[return-value]
+    ) -> ProcessorTool[InT, OutT, CtxT]:  # type: ignore[return-value]
         from grasp_agents.tools.processor_tool import (  # noqa: PLC0415
             ProcessorTool as _ProcessorTool,
         )
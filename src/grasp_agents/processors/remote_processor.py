@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from grasp_agents.types.events import Event, ProcPacketOutEvent, ProcPayloadOutEvent
+
+from .processor import Processor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
+    from grasp_agents.runtime.process_pool import ProcessPool, WorkerContext
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.io import ProcName
+
+
+class RemoteProcessor[InT, OutT, CtxT](Processor[InT, OutT, CtxT]):
+    """
+    A processor whose runs execute in a :class:`ProcessPool` worker.
+
+    Each run builds the actual processor in a worker with ``factory`` (a
+    picklable callable taking the :class:`WorkerContext`), runs it under this
+    processor's name and path, and streams its events back. As a
+    ``ParallelProcessor`` subprocessor every replica runs in the pool, spread
+    over the workers; checkpoints go to this processor's session store, so a
+    resumed run picks up exactly as an in-process one would.
+
+    The input/output types come from the subscription:
+    ``RemoteProcessor[Query, Answer, None](make_agent, pool=pool, name="agent")``.
+    """
+
+    # Generic in the mapped positions — redeclared so subscriptions resolve.
+    _generic_arg_to_instance_attr_map: ClassVar[dict[int, str]] = {
+        0: "_in_type",
+        1: "_out_type",
+    }
+
+    def __init__(
+        self,
+        factory: Callable[[WorkerContext], Processor[InT, OutT, Any]],
+        *,
+        pool: ProcessPool,
+        name: ProcName,
+        ctx: SessionContext[CtxT] | None = None,
+        max_retries: int = 0,
+        recipients: Sequence[ProcName] | None = None,
+        path: list[str] | None = None,
+        tracing_enabled: bool = True,
+        durability_enabled: bool = True,
+    ) -> None:
+        super().__init__(
+            name=name,
+            ctx=ctx,
+            max_retries=max_retries,
+            recipients=recipients,
+            path=path,
+            tracing_enabled=tracing_enabled,
+            durability_enabled=durability_enabled,
+        )
+        self._factory = factory
+        self._pool = pool
+
+    @property
+    def pool(self) -> ProcessPool:
+        return self._pool
+
+    def copy(self) -> Self:
+        # Replicas share the pool (and the factory) — only per-run identity
+        # (name, path) is the replica's own.
+        clone = copy.copy(self)
+        clone._path = list(self._path)  # noqa: SLF001
+        return clone
+
+    async def _process_stream(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[InT] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> AsyncIterator[Event[Any]]:
+        del chat_inputs, step
+        async for event in self._pool.run_stream(
+            self._factory,
+            name=self.name,
+            path=self._path,
+            in_args=in_args,
+            exec_id=exec_id,
+            ctx=self._ctx,
+            durable=self.durability_enabled,
+        ):
+            if (
+                isinstance(event, ProcPacketOutEvent)
+                and event.source == self.name
+                and event.exec_id == exec_id
+            ):
+                # The remote run's result packet — re-emitted as payloads so
+                # this run validates, routes and packs them like its own.
+                for payload in event.data.payloads:
+                    yield ProcPayloadOutEvent(
+                        data=payload, source=self.name, exec_id=exec_id
+                    )
+            else:
+                yield event
@@ -1,5 +1,26 @@
-from .event_bus import EventBus
-from .runner import Runner
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .event_bus import EventBus
+    from .runner import Runner
+
+_LAZY: dict[str, str] = {
+    "EventBus": "event_bus",
+    "Runner": "runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "EventBus",
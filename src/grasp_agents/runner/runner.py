@@ -1,8 +1,9 @@
+from __future__ import annotations
+
 import asyncio
 import logging
-from collections.abc import AsyncIterator, Sequence
 from functools import partial
-from typing import Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 from uuid import uuid4
 
 from pydantic import TypeAdapter
@@ -10,7 +11,6 @@ from pydantic import ValidationError as PydanticValidationError
 
 from grasp_agents.durability.checkpoint_mixin import CheckpointPersistMixin
 from grasp_agents.durability.checkpoints import CheckpointKind, RunnerCheckpoint
-from grasp_agents.processors.processor import Processor
 from grasp_agents.session_context import (
     DEFAULT_SESSION_KEY,
     SessionContext,
@@ -24,6 +24,11 @@ from grasp_agents.utils.generics import AutoInstanceAttributesMixin
 
 from .event_bus import EventBus
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from grasp_agents.processors.processor import Processor
+
 logger = logging.getLogger(__name__)
 
 START_PROC_NAME: Literal["*START*"] = "*START*"
@@ -126,7 +131,7 @@ class Runner[OutT, CtxT](AutoInstanceAttributesMixin, CheckpointPersistMixin):
                     exc_info=True,
                 )
 
-    async def __aenter__(self) -> "Runner[OutT, CtxT]":
+    async def __aenter__(self) -> Runner[OutT, CtxT]:
         return self
 
     async def __aexit__(self, *exc: object) -> None:
@@ -12,26 +12,73 @@ transport (quiescence or daemon). Termination is a policy, not a fork in the eng
 
 from __future__ import annotations
 
-from .driver import ActorDriver, Handler, Termination
-from .transport import (
-    CLOSED,
-    MAX_QUEUE_SIZE,
-    Closed,
-    HasDestination,
-    InProcessTransport,
-    Transport,
-    put_sentinel,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .driver import ActorDriver, Handler, Termination
+    from .process_pool import (
+        PARENT,
+        ProcessEnvelope,
+        ProcessPool,
+        RemoteBranchError,
+        SocketTransport,
+        WorkerContext,
+    )
+    from .transport import (
+        CLOSED,
+        MAX_QUEUE_SIZE,
+        Closed,
+        HasDestination,
+        InProcessTransport,
+        Transport,
+        put_sentinel,
+    )
+
+_LAZY: dict[str, str] = {
+    "ActorDriver": "driver",
+    "Handler": "driver",
+    "Termination": "driver",
+    "PARENT": "process_pool",
+    "ProcessEnvelope": "process_pool",
+    "ProcessPool": "process_pool",
+    "RemoteBranchError": "process_pool",
+    "SocketTransport": "process_pool",
+    "WorkerContext": "process_pool",
+    "CLOSED": "transport",
+    "MAX_QUEUE_SIZE": "transport",
+    "Closed": "transport",
+    "HasDestination": "transport",
+    "InProcessTransport": "transport",
+    "Transport": "transport",
+    "put_sentinel": "transport",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "CLOSED",
     "MAX_QUEUE_SIZE",
+    "PARENT",
     "ActorDriver",
     "Closed",
     "Handler",
     "HasDestination",
     "InProcessTransport",
+    "ProcessEnvelope",
+    "ProcessPool",
+    "RemoteBranchError",
+    "SocketTransport",
     "Termination",
     "Transport",
+    "WorkerContext",
     "put_sentinel",
 ]
@@ -0,0 +1,959 @@
+"""
+A process-pool backend for the actor runtime.
+
+Every processor normally runs in the caller's event loop, so the framework's own
+CPU work (validation, conversion, token counting, checkpoint encoding) across
+many parallel branches shares one core. :class:`ProcessPool` runs branches in
+worker processes instead:
+
+- **Transport.** Parent and workers exchange :class:`ProcessEnvelope` s through a
+  :class:`SocketTransport` — the :class:`~.transport.Transport` seam over a local
+  Unix socket, one length-prefixed pickle frame per envelope. Each side registers
+  its local recipients (the parent: one per running branch, plus
+  :data:`PARENT`; a worker: its own name) and routes everything else over the
+  connection it learned the recipient on. Flow control is per recipient: a
+  recipient whose queue fills up has its sender paused (and resumed once it
+  drains), so one slow branch holds back only its own events, never the socket
+  reader that also carries its siblings' events and the service replies.
+- **Branches.** :meth:`ProcessPool.run_stream` sends a run request to the
+  least-loaded worker, which builds the processor with a picklable *factory*,
+  runs it, and streams its events back; the parent yields them as they arrive.
+  A branch error, or the loss of its worker, is raised as
+  :class:`RemoteBranchError`.
+- **Shared services.** A worker's checkpoint store is a proxy that relays every
+  call to the parent's store, so branch checkpoints land exactly where an
+  in-process branch would write them; usage a branch records is relayed into
+  the parent session's ``usage_tracker`` as it happens, so rollups and
+  budgets see it; and the rate limiters passed to the pool pace requests
+  across all workers (a worker factory gets a proxy limiter from
+  :meth:`WorkerContext.rate_limiter` to hand to its LLM).
+
+:class:`~grasp_agents.processors.remote_processor.RemoteProcessor` is the
+processor front end: use it as a ``ParallelProcessor`` subprocessor (each replica
+runs in the pool) or as a team member.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import logging
+import multiprocessing
+import os
+import pickle  # noqa: S403 - frames only travel between a pool and its workers
+import shutil
+import struct
+import tempfile
+import traceback
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, Literal, Self, cast
+from uuid import uuid4
+
+from pydantic import BaseModel, PrivateAttr
+
+from grasp_agents.durability.checkpoint_store import CheckpointStore
+from grasp_agents.rate_limiting.rate_limiter import RateLimiter
+from grasp_agents.types.content import InputFile, InputImage
+from grasp_agents.usage_tracker import UsageTracker
+from grasp_agents.utils.errors import format_error_chain
+
+from .transport import MAX_QUEUE_SIZE, Closed, Transport, put_sentinel
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+    from multiprocessing.process import BaseProcess
+
+    from grasp_agents.processors.processor import Processor
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.events import Event
+    from grasp_agents.types.items import InputItem
+    from grasp_agents.types.response import ResponseUsage
+
+logger = logging.getLogger(__name__)
+
+PARENT: Final[str] = "parent"
+
+type StartMethod = Literal["spawn", "forkserver", "fork"]
+
+type EnvelopeKind = Literal[
+    "hello",
+    "run",
+    "cancel",
+    "event",
+    "usage",
+    "done",
+    "error",
+    "rpc",
+    "reply",
+    "shutdown",
+    "pause",
+    "resume",
+]
+
+# A frame is a 4-byte big-endian length followed by a pickled envelope.
+_HEADER = struct.Struct(">I")
+# Checkpoint-store methods a worker may invoke on the parent's store.
+_STORE_METHODS = frozenset(
+    {
+        "save",
+        "load",
+        "delete",
+        "list_keys",
+        "append_messages",
+        "read_messages",
+        "read_message_tail",
+        "rewrite_messages",
+        "truncate_messages",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessEnvelope:
+    """One message between the parent and a worker process."""
+
+    kind: EnvelopeKind
+    destination: str | None
+    id: str = ""
+    sender: str | None = None
+    payload: Any = None
+
+
+class RemoteBranchError(RuntimeError):
+    """A branch failed in (or with) its worker process."""
+
+    def __init__(self, message: str, *, remote_traceback: str = "") -> None:
+        super().__init__(message)
+        self.remote_traceback = remote_traceback
+
+
+def _parametrize(origin: Any, args: tuple[Any, ...]) -> Any:
+    return origin[args if len(args) > 1 else args[0]]
+
+
+class _FramePickler(pickle.Pickler):
+    """
+    Pickles parametrized pydantic generics (``Packet[Any]`` inside a
+    ``ProcPacketOutEvent``) by origin and type arguments: the class pydantic
+    creates for them isn't importable under its own name. Blob-backed image /
+    file parts go with their payload inline, since the receiving process may
+    have no ``BlobStore`` holding it.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, (InputImage, InputFile)) and obj.blob is not None:
+            return obj.inlined().__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        if isinstance(obj, type) and issubclass(obj, BaseModel):
+            meta = obj.__pydantic_generic_metadata__
+            if meta["origin"] is not None and meta["args"]:
+                return _parametrize, (meta["origin"], meta["args"])
+        return NotImplemented
+
+
+async def _write_frame(writer: asyncio.StreamWriter, envelope: ProcessEnvelope) -> None:
+    buf = io.BytesIO()
+    _FramePickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(envelope)
+    data = buf.getvalue()
+    writer.write(_HEADER.pack(len(data)) + data)
+    await writer.drain()
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> ProcessEnvelope:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return pickle.loads(await reader.readexactly(size))  # noqa: S301 - own workers
+
+
+class SocketTransport(Transport[ProcessEnvelope]):
+    """
+    Per-recipient routing across a local socket connection.
+
+    Envelopes for a locally :meth:`register` -ed recipient go to its queue;
+    anything else is written to the connection the recipient was last heard on
+    (an envelope's ``sender`` teaches the route), or to the ``default``
+    connection. Envelopes arriving for a recipient that is not registered (a
+    cancelled branch's stragglers) are dropped.
+
+    The connection reader never blocks on a slow recipient. Once a queue holds
+    ``max_queue_size`` envelopes, the peer that filled it is sent a ``pause``
+    for that recipient, and its :meth:`post` calls to that recipient wait
+    until a ``resume`` arrives (sent when the queue has drained to half). A
+    queue overshoots the bound by at most what was in flight when the pause
+    was sent.
+    """
+
+    def __init__(self, max_queue_size: int = MAX_QUEUE_SIZE) -> None:
+        super().__init__()
+        self._queues: dict[str, asyncio.Queue[ProcessEnvelope | Closed]] = {}
+        self._max_queue_size = max_queue_size
+        self._routes: dict[str, asyncio.StreamWriter] = {}
+        self._default: asyncio.StreamWriter | None = None
+        self._write_locks: dict[asyncio.StreamWriter, asyncio.Lock] = {}
+        self._readers: set[asyncio.Task[None]] = set()
+        # Inbound: local recipients over the high-water mark, with the
+        # connections their senders were paused on.
+        self._paused: dict[str, set[asyncio.StreamWriter]] = {}
+        # Outbound: remote recipients a peer paused; posts to them wait on
+        # the gate until it is set.
+        self._gates: dict[str, asyncio.Event] = {}
+        self._control: set[asyncio.Task[None]] = set()
+
+    def register(self, recipient: str) -> None:
+        self._queues.setdefault(recipient, asyncio.Queue())
+
+    def unregister(self, recipient: str) -> None:
+        """Drop ``recipient``'s queue; later envelopes for it are discarded."""
+        self._queues.pop(recipient, None)
+        # Release a sender paused on it: its stragglers are dropped anyway.
+        for writer in self._paused.pop(recipient, set()):
+            self._send_control(writer, "resume", recipient)
+        self._open_gate(recipient)
+
+    def connect(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        *,
+        default: bool = False,
+        on_close: Callable[[set[str]], None] | None = None,
+    ) -> None:
+        """
+        Serve one connection: deliver its inbound envelopes and learn routes.
+
+        ``on_close`` is called with the senders heard on the connection once it
+        ends (EOF or a broken pipe).
+        """
+        self._write_locks[writer] = asyncio.Lock()
+        if default:
+            self._default = writer
+        task = asyncio.create_task(self._read_loop(reader, writer, on_close))
+        self._readers.add(task)
+        task.add_done_callback(self._readers.discard)
+
+    async def _read_loop(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        on_close: Callable[[set[str]], None] | None,
+    ) -> None:
+        senders: set[str] = set()
+        gated: set[str] = set()
+        try:
+            await self._deliver_inbound(reader, writer, senders, gated)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for sender in senders:
+                if self._routes.get(sender) is writer:
+                    del self._routes[sender]
+            # Posts waiting on this peer's pause fail fast instead of hanging.
+            for recipient in gated:
+                self._open_gate(recipient)
+            for writers in self._paused.values():
+                writers.discard(writer)
+            self._write_locks.pop(writer, None)
+            if self._default is writer:
+                self._default = None
+            writer.close()
+            if on_close is not None:
+                on_close(senders)
+
+    async def _deliver_inbound(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        senders: set[str],
+        gated: set[str],
+    ) -> None:
+        while True:
+            envelope = await _read_frame(reader)
+            if envelope.kind == "pause":
+                self._gates.setdefault(envelope.payload, asyncio.Event())
+                gated.add(envelope.payload)
+                continue
+            if envelope.kind == "resume":
+                self._open_gate(envelope.payload)
+                continue
+            if envelope.sender is not None and envelope.sender not in senders:
+                senders.add(envelope.sender)
+                self._routes[envelope.sender] = writer
+            destination = envelope.destination or ""
+            queue = self._queues.get(destination)
+            if queue is None:
+                continue
+            queue.put_nowait(envelope)
+            if queue.qsize() >= self._max_queue_size:
+                paused = self._paused.setdefault(destination, set())
+                if writer not in paused:
+                    paused.add(writer)
+                    self._send_control(writer, "pause", destination)
+
+    def _send_control(
+        self, writer: asyncio.StreamWriter, kind: EnvelopeKind, recipient: str
+    ) -> None:
+        # Written from a task so the reader never waits on a write; tasks
+        # take the connection's (FIFO) write lock in creation order, so a
+        # pause and its resume arrive in order.
+        async def send() -> None:
+            lock = self._write_locks.get(writer)
+            if lock is None:
+                return
+            with contextlib.suppress(ConnectionError):
+                async with lock:
+                    await _write_frame(
+                        writer, ProcessEnvelope(kind, None, payload=recipient)
+                    )
+
+        task = asyncio.create_task(send())
+        self._control.add(task)
+        task.add_done_callback(self._control.discard)
+
+    def _open_gate(self, recipient: str) -> None:
+        gate = self._gates.pop(recipient, None)
+        if gate is not None:
+            gate.set()
+
+    def close_recipient(self, recipient: str) -> None:
+        """End ``recipient``'s consumption: its ``consume`` returns ``CLOSED``."""
+        queue = self._queues.get(recipient)
+        if queue is not None:
+            put_sentinel(queue)
+
+    async def post(self, envelope: ProcessEnvelope) -> None:
+        destination = envelope.destination or ""
+        queue = self._queues.get(destination)
+        if queue is not None:
+            queue.put_nowait(envelope)
+            return
+        gate = self._gates.get(destination)
+        if gate is not None:
+            await gate.wait()
+        writer = self._routes.get(destination, self._default)
+        lock = self._write_locks.get(writer) if writer is not None else None
+        if writer is None or lock is None:
+            raise ConnectionError(f"no route to {destination!r}")
+        async with lock:
+            await _write_frame(writer, envelope)
+
+    async def consume(self, recipient: str) -> ProcessEnvelope | Closed:
+        queue = self._queues[recipient]
+        envelope = await queue.get()
+        if recipient in self._paused and queue.qsize() <= self._max_queue_size // 2:
+            for writer in self._paused.pop(recipient):
+                self._send_control(writer, "resume", recipient)
+        return envelope
+
+    async def ack(self, recipient: str, envelope: ProcessEnvelope) -> None:
+        # ``consume`` already removed the envelope from the queue — nothing to do.
+        del recipient, envelope
+
+    async def has_pending(self, recipient: str) -> bool:
+        queue = self._queues.get(recipient)
+        return queue is not None and not queue.empty()
+
+    async def shutdown(self) -> None:
+        for queue in self._queues.values():
+            put_sentinel(queue)
+        for recipient in list(self._gates):
+            self._open_gate(recipient)
+        for task in [*self._readers, *self._control]:
+            task.cancel()
+
+
+# --- worker side ---
+
+
+type _RateSpec = tuple[float, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _RunRequest:
+    factory: Callable[[WorkerContext], Processor[Any, Any, Any]]
+    name: str
+    path: list[str]
+    in_args: list[Any] | None
+    exec_id: str
+    session_key: str
+    durable: bool
+
+
+class _RemoteCheckpointStore(CheckpointStore):
+    """A worker's view of the parent's checkpoint store for one branch."""
+
+    def __init__(self, call: Callable[..., Any], task_id: str) -> None:
+        self._call = call
+        self._task_id = task_id
+
+    async def _store(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call("store", self._task_id, method, args, kwargs)
+
+    async def save(self, key: str, data: bytes) -> None:
+        await self._store("save", key, data)
+
+    async def load(self, key: str) -> bytes | None:
+        return await self._store("load", key)
+
+    async def delete(self, key: str) -> None:
+        await self._store("delete", key)
+
+    async def list_keys(self, prefix: str) -> list[str]:
+        return await self._store("list_keys", prefix)
+
+    async def append_messages(
+        self, key: str, messages: Sequence[InputItem], *, version: int = 0
+    ) -> None:
+        await self._store("append_messages", key, list(messages), version=version)
+
+    async def read_messages(self, key: str, *, version: int = 0) -> list[InputItem]:
+        return await self._store("read_messages", key, version=version)
+
+    async def read_message_tail(
+        self, key: str, *, start: int, version: int = 0
+    ) -> list[InputItem]:
+        return await self._store("read_message_tail", key, start=start, version=version)
+
+    async def rewrite_messages(
+        self, key: str, messages: Sequence[InputItem], *, version: int = 0
+    ) -> None:
+        await self._store("rewrite_messages", key, list(messages), version=version)
+
+    async def truncate_messages(
+        self, key: str, *, message_count: int, version: int = 0
+    ) -> None:
+        await self._store(
+            "truncate_messages", key, message_count=message_count, version=version
+        )
+
+
+type _UsageRecord = tuple[str, ResponseUsage, str | None]
+
+
+class _RelayedUsageTracker(UsageTracker):
+    """A worker branch's ledger; records also queue up for the parent's."""
+
+    _unsent: list[_UsageRecord] = PrivateAttr(default_factory=list["_UsageRecord"])
+
+    def record(
+        self, agent_name: str, usage: ResponseUsage, *, model: str | None = None
+    ) -> None:
+        super().record(agent_name, usage, model=model)
+        self._unsent.append((agent_name, usage, model))
+
+    def take_unsent(self) -> list[_UsageRecord]:
+        unsent, self._unsent = self._unsent, []
+        return unsent
+
+
+class _RemoteRateLimiter[R](RateLimiter[R]):
+    """
+    Paces calls through the parent's limiter of the same name.
+
+    The request schedule (``rpm``) is shared by every worker; ``max_concurrency``
+    bounds this worker's own in-flight calls.
+    """
+
+    def __init__(
+        self, name: str, call: Callable[..., Any], rpm: float, max_concurrency: int
+    ) -> None:
+        super().__init__(rpm=rpm, max_concurrency=max_concurrency)
+        self._name = name
+        self._call = call
+
+    async def process(self, func_partial: Callable[[], Any]) -> R:
+        async with self._semaphore:
+            await self._call("rate_limit", self._name)
+            return await func_partial()
+
+
+class WorkerContext:
+    """What a branch factory gets in its worker process."""
+
+    def __init__(
+        self,
+        worker_name: str,
+        call: Callable[..., Any],
+        rate_limits: Mapping[str, _RateSpec],
+    ) -> None:
+        self._worker_name = worker_name
+        self._call = call
+        self._rate_limits = rate_limits
+        self._limiters: dict[str, RateLimiter[Any]] = {}
+
+    @property
+    def worker_name(self) -> str:
+        return self._worker_name
+
+    def rate_limiter(self, name: str) -> RateLimiter[Any]:
+        """
+        A limiter paced by the pool's shared limiter ``name`` — pass it as an
+        LLM's ``rate_limiter``. One instance per worker and name.
+        """
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            if name not in self._rate_limits:
+                raise KeyError(f"the process pool has no rate limiter {name!r}")
+            rpm, max_concurrency = self._rate_limits[name]
+            limiter = _RemoteRateLimiter[Any](name, self._call, rpm, max_concurrency)
+            self._limiters[name] = limiter
+        return limiter
+
+
+class _Worker:
+    """The worker-process end: runs branches and relays their service calls."""
+
+    def __init__(
+        self, name: str, transport: SocketTransport, rate_limits: Mapping[str, Any]
+    ) -> None:
+        self._name = name
+        self._transport = transport
+        self._context = WorkerContext(name, self._call, rate_limits)
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+        self._branches: dict[str, asyncio.Task[None]] = {}
+
+    async def _call(self, service: str, *args: Any, **kwargs: Any) -> Any:
+        call_id = uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_id] = future
+        try:
+            await self._transport.post(
+                ProcessEnvelope(
+                    "rpc",
+                    PARENT,
+                    id=call_id,
+                    sender=self._name,
+                    payload=(service, args, kwargs),
+                )
+            )
+            return await future
+        finally:
+            self._calls.pop(call_id, None)
+
+    async def serve(self) -> None:
+        await self._transport.post(ProcessEnvelope("hello", PARENT, sender=self._name))
+        try:
+            while True:
+                envelope = await self._transport.consume(self._name)
+                if isinstance(envelope, Closed) or envelope.kind == "shutdown":
+                    return
+                if envelope.kind == "run":
+                    task = asyncio.create_task(self._run(envelope.id, envelope.payload))
+                    self._branches[envelope.id] = task
+                    task.add_done_callback(
+                        lambda _, task_id=envelope.id: self._branches.pop(task_id, None)
+                    )
+                elif envelope.kind == "cancel":
+                    if (task := self._branches.get(envelope.id)) is not None:
+                        task.cancel()
+                elif envelope.kind == "reply":
+                    future = self._calls.get(envelope.id)
+                    if future is not None and not future.done():
+                        ok, value = envelope.payload
+                        if ok:
+                            future.set_result(value)
+                        else:
+                            future.set_exception(value)
+        finally:
+            for task in list(self._branches.values()):
+                task.cancel()
+            await asyncio.gather(*self._branches.values(), return_exceptions=True)
+
+    async def _run(self, task_id: str, request: _RunRequest) -> None:
+        from grasp_agents.session_context import SessionContext  # noqa: PLC0415
+
+        def reply(kind: EnvelopeKind, payload: Any = None) -> ProcessEnvelope:
+            return ProcessEnvelope(
+                kind, task_id, id=task_id, sender=self._name, payload=payload
+            )
+
+        usage = _RelayedUsageTracker()
+
+        async def flush_usage() -> None:
+            # Ahead of the event (or outcome) that follows, so the parent's
+            # budgets have seen the spend by the time it handles the event.
+            if records := usage.take_unsent():
+                await self._transport.post(reply("usage", records))
+
+        try:
+            proc = request.factory(self._context)
+            ctx: SessionContext[Any] = SessionContext(
+                session_key=request.session_key,
+                checkpoint_store=(
+                    _RemoteCheckpointStore(self._call, task_id)
+                    if request.durable
+                    else None
+                ),
+                usage_tracker=usage,
+            )
+            proc.name = request.name
+            proc.on_adopted(ctx=ctx, path=request.path)
+            async for event in proc.run_stream(
+                in_args=request.in_args, exec_id=request.exec_id, step=0
+            ):
+                await flush_usage()
+                await self._transport.post(reply("event", event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            payload = (
+                format_error_chain(err),
+                "".join(traceback.format_exception(err)),
+            )
+            with contextlib.suppress(ConnectionError):
+                await flush_usage()
+                await self._transport.post(reply("error", payload))
+        else:
+            with contextlib.suppress(ConnectionError):
+                await flush_usage()
+                await self._transport.post(reply("done"))
+
+
+async def _worker_serve(
+    address: str, name: str, rate_limits: Mapping[str, _RateSpec]
+) -> None:
+    reader, writer = await asyncio.open_unix_connection(address)
+    transport = SocketTransport()
+    transport.register(name)
+    # Losing the parent ends the worker: ``consume`` returns ``CLOSED``.
+    transport.connect(
+        reader,
+        writer,
+        default=True,
+        on_close=lambda _: transport.close_recipient(name),
+    )
+    try:
+        await _Worker(name, transport, rate_limits).serve()
+    finally:
+        writer.close()
+        await transport.shutdown()
+
+
+def _worker_main(address: str, name: str, rate_limits: Mapping[str, _RateSpec]) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_worker_serve(address, name, rate_limits))
+
+
+# --- parent side ---
+
+
+@dataclass(eq=False)
+class _WorkerHandle:
+    name: str
+    process: BaseProcess
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    alive: bool = True
+    branches: dict[str, SessionContext[Any]] = field(
+        default_factory=dict[str, "SessionContext[Any]"]
+    )
+
+
+class ProcessPool:
+    """
+    ``workers`` worker processes that run processor branches.
+
+    Start it with ``async with pool:`` (or :meth:`start` / :meth:`close`).
+    ``rate_limiters`` are shared by name: a worker factory obtains a proxy with
+    :meth:`WorkerContext.rate_limiter`, and every call through any worker's proxy
+    waits its turn on the parent's limiter. Workers are started with the
+    ``start_method`` multiprocessing context (``"spawn"`` by default — the only
+    one safe with a running event loop on every platform), so factories must be
+    importable, picklable callables (module-level functions or classes).
+
+    A branch runs under a fresh ``SessionContext`` in its worker. It carries
+    the session key, the relayed checkpoint store (when the branch is
+    durable) and a usage ledger relayed into the parent's ``usage_tracker``.
+    Nothing else of the parent session crosses the process boundary: its
+    ``state``, ``environment`` / ``file_backend``, ``memory``, ``skills``,
+    ``blob_store``, ``tool_cache``, ``approval_store`` and mailbox
+    ``transport`` hold live resources, and a branch that needs them must
+    build its own in the factory.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        rate_limiters: Mapping[str, RateLimiter[Any]] | None = None,
+        start_method: StartMethod = "spawn",
+        start_timeout: float = 60.0,
+    ) -> None:
+        self._size = workers if workers is not None else os.cpu_count() or 1
+        if self._size < 1:
+            raise ValueError(f"ProcessPool needs at least one worker, got {workers}")
+        self._rate_limiters = dict(rate_limiters or {})
+        self._start_method: StartMethod = start_method
+        self._start_timeout = start_timeout
+        self._transport: SocketTransport | None = None
+        self._server: asyncio.Server | None = None
+        self._socket_dir: Path | None = None
+        self._workers: dict[str, _WorkerHandle] = {}
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._rpcs: set[asyncio.Task[None]] = set()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def live_workers(self) -> int:
+        return sum(w.alive for w in self._workers.values())
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Spawn the workers and wait until every one has connected."""
+        if self._transport is not None:
+            return
+        transport = SocketTransport()
+        transport.register(PARENT)
+        self._transport = transport
+        # Unix socket paths are short-limited; keep the directory near the root.
+        self._socket_dir = Path(tempfile.mkdtemp(prefix="grasp-pool-"))
+        address = str(self._socket_dir / "pool.sock")
+
+        def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            transport.connect(reader, writer, on_close=self._on_worker_lost)
+
+        self._server = await asyncio.start_unix_server(accept, path=address)
+        self._dispatcher = asyncio.create_task(self._dispatch(), name="process-pool")
+
+        context = multiprocessing.get_context(self._start_method)
+        # Every concrete context has ``Process``; the stubs type the union as
+        # the base context, which does not.
+        process_type = cast(
+            "type[BaseProcess]",
+            context.Process,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        )
+        specs = {
+            name: (limiter.rpm, limiter.max_concurrency)
+            for name, limiter in self._rate_limiters.items()
+        }
+        for i in range(self._size):
+            name = f"worker-{i}"
+            process = process_type(
+                target=_worker_main,
+                args=(address, name, specs),
+                name=f"grasp-{name}",
+                daemon=True,
+            )
+            process.start()
+            self._workers[name] = _WorkerHandle(name=name, process=process)
+        try:
+            async with asyncio.timeout(self._start_timeout):
+                for worker in self._workers.values():
+                    await self._await_ready(worker)
+        except BaseException:
+            await self.close()
+            raise
+        logger.info("ProcessPool: %d workers ready", self._size)
+
+    @staticmethod
+    async def _await_ready(worker: _WorkerHandle) -> None:
+        # A worker that dies before connecting (e.g. its entry point fails to
+        # import) fails the start at once instead of at the timeout.
+        while not worker.ready.is_set():
+            if worker.process.exitcode is not None:
+                raise RemoteBranchError(
+                    f"{worker.name} exited with code {worker.process.exitcode} "
+                    "before connecting"
+                )
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(0.1):
+                    await worker.ready.wait()
+
+    async def close(self) -> None:
+        """Stop the workers (cancelling running branches) and clean up."""
+        transport = self._transport
+        if transport is None:
+            return
+        for worker in self._workers.values():
+            if worker.alive:
+                with contextlib.suppress(ConnectionError):
+                    await transport.post(ProcessEnvelope("shutdown", worker.name))
+        for worker in self._workers.values():
+            await asyncio.to_thread(worker.process.join, 5.0)
+            if worker.process.is_alive():
+                worker.process.kill()
+                await asyncio.to_thread(worker.process.join, 5.0)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatcher
+        for task in list(self._rpcs):
+            task.cancel()
+        await transport.shutdown()
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+        self._transport = None
+        self._server = None
+        self._dispatcher = None
+        self._workers = {}
+
+    async def run_stream(
+        self,
+        factory: Callable[[WorkerContext], Processor[Any, Any, Any]],
+        *,
+        name: str,
+        path: Sequence[str],
+        in_args: list[Any] | None,
+        exec_id: str,
+        ctx: SessionContext[Any],
+        durable: bool = True,
+    ) -> AsyncIterator[Event[Any]]:
+        """
+        Run ``factory``'s processor as ``name`` under ``path`` in a worker and
+        yield its events (ending with its ``ProcPacketOutEvent``).
+
+        The branch's checkpoint store calls go to ``ctx.checkpoint_store``
+        (when ``durable``), and its usage is recorded on ``ctx.usage_tracker``;
+        its session key is ``ctx.session_key``.
+        """
+        transport = self._transport
+        if transport is None:
+            raise RuntimeError("ProcessPool is not started; use `async with pool:`")
+        worker = self._pick()
+        task_id = uuid4().hex
+        transport.register(task_id)
+        worker.branches[task_id] = ctx
+        request = _RunRequest(
+            factory=factory,
+            name=name,
+            path=list(path),
+            in_args=in_args,
+            exec_id=exec_id,
+            session_key=ctx.session_key,
+            durable=durable and ctx.checkpoint_store is not None,
+        )
+        finished = False
+        try:
+            await transport.post(
+                ProcessEnvelope(
+                    "run", worker.name, id=task_id, sender=PARENT, payload=request
+                )
+            )
+            while True:
+                envelope = await transport.consume(task_id)
+                if isinstance(envelope, Closed):
+                    raise RemoteBranchError("the process pool was closed")
+                if envelope.kind == "event":
+                    yield envelope.payload
+                elif envelope.kind == "usage":
+                    for agent_name, usage, model in envelope.payload:
+                        ctx.usage_tracker.record(agent_name, usage, model=model)
+                elif envelope.kind == "done":
+                    finished = True
+                    return
+                elif envelope.kind == "error":
+                    finished = True
+                    message, remote_tb = envelope.payload
+                    raise RemoteBranchError(
+                        f"branch {name!r} failed in {worker.name}: {message}",
+                        remote_traceback=remote_tb,
+                    )
+        finally:
+            worker.branches.pop(task_id, None)
+            transport.unregister(task_id)
+            if not finished and worker.alive:
+                with contextlib.suppress(ConnectionError):
+                    await transport.post(
+                        ProcessEnvelope("cancel", worker.name, id=task_id)
+                    )
+
+    def _pick(self) -> _WorkerHandle:
+        alive = [w for w in self._workers.values() if w.alive]
+        if not alive:
+            raise RemoteBranchError("no live worker in the process pool")
+        return min(alive, key=lambda w: len(w.branches))
+
+    def _on_worker_lost(self, senders: set[str]) -> None:
+        transport = self._transport
+        for name in senders:
+            worker = self._workers.get(name)
+            if worker is None or not worker.alive:
+                continue
+            worker.alive = False
+            if transport is None or not worker.branches:
+                continue
+            logger.warning(
+                "ProcessPool: %s exited with %d running branches",
+                name,
+                len(worker.branches),
+            )
+            for task_id in worker.branches:
+                lost = ProcessEnvelope(
+                    "error",
+                    task_id,
+                    id=task_id,
+                    payload=(f"worker {name} exited", ""),
+                )
+                self._spawn(transport.post(lost))
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._rpcs.add(task)
+        task.add_done_callback(self._rpcs.discard)
+
+    async def _dispatch(self) -> None:
+        """Serve the parent recipient: worker hellos and service calls."""
+        transport = self._transport
+        assert transport is not None
+        while True:
+            envelope = await transport.consume(PARENT)
+            if isinstance(envelope, Closed):
+                return
+            if envelope.kind == "hello" and envelope.sender in self._workers:
+                self._workers[envelope.sender].ready.set()
+            elif envelope.kind == "rpc":
+                self._spawn(self._serve_rpc(transport, envelope))
+
+    async def _serve_rpc(
+        self, transport: SocketTransport, envelope: ProcessEnvelope
+    ) -> None:
+        service, args, kwargs = envelope.payload
+        try:
+            value = await self._service(service, *args, **kwargs)
+        except Exception as err:
+            payload: tuple[bool, Any] = (False, err)
+        else:
+            payload = (True, value)
+        reply_to, call_id = envelope.sender, envelope.id
+        try:
+            await transport.post(
+                ProcessEnvelope("reply", reply_to, id=call_id, payload=payload)
+            )
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            failure = RemoteBranchError(f"unpicklable {service} reply: {err}")
+            await transport.post(
+                ProcessEnvelope("reply", reply_to, id=call_id, payload=(False, failure))
+            )
+
+    async def _service(self, service: str, *args: Any) -> Any:
+        if service == "rate_limit":
+            (name,) = args
+            await self._rate_limiters[name].process(partial(asyncio.sleep, 0))
+            return None
+        if service == "store":
+            task_id, method, m_args, m_kwargs = args
+            if method not in _STORE_METHODS:
+                raise ValueError(f"not a checkpoint store method: {method!r}")
+            ctx = next(
+                (
+                    w.branches[task_id]
+                    for w in self._workers.values()
+                    if task_id in w.branches
+                ),
+                None,
+            )
+            if ctx is None or ctx.checkpoint_store is None:
+                raise RemoteBranchError(f"no checkpoint store for branch {task_id}")
+            return await getattr(ctx.checkpoint_store, method)(*m_args, **m_kwargs)
+        raise ValueError(f"unknown process pool service: {service!r}")
@@ -147,6 +147,18 @@ class Transport[E](ABC):
         not yet acked) — the signal quiescence detection reads.
         """
 
+    async def wait_for_arrival(self, recipient: str, timeout: float) -> None:  # noqa: ASYNC109
+        """
+        Sleep until something may have been posted to ``recipient``, at most
+        ``timeout`` seconds — what a consumer polling :meth:`has_pending` waits
+        on between checks. May return early spuriously; callers re-check.
+
+        Defaults to a plain sleep (no arrival signal). Mailbox transports
+        override it to wake on a post.
+        """
+        del recipient
+        await asyncio.sleep(timeout)
+
     @abstractmethod
     async def shutdown(self) -> None:
         """
@@ -45,8 +45,11 @@ if TYPE_CHECKING:
         build_seatbelt_profile,
         seatbelt_argv,
     )
+    from .local.snapshot import LocalSnapshotEnvironment, LocalSnapshotStore
     from .local.srt import SrtExecBackend, build_srt_settings, srt_argv
     from .local.supervisor import ExecSpec, ProcessSupervisor, SupervisorLimits
+    from .local.venv_cache import VenvTemplateCache
+    from .snapshot_store import ChunkedSnapshotStore, SnapshottingEnvironment
 
 
 _LAZY: dict[str, str] = {
@@ -68,12 +71,17 @@ _LAZY: dict[str, str] = {
     "LocalExecBackend": "local.exec",
     "LocalEnvironment": "local.environment",
     "local_environment": "local.environment",
+    "LocalSnapshotEnvironment": "local.snapshot",
+    "LocalSnapshotStore": "local.snapshot",
     "SeatbeltExecBackend": "local.seatbelt",
     "build_seatbelt_profile": "local.seatbelt",
     "seatbelt_argv": "local.seatbelt",
     "SrtExecBackend": "local.srt",
     "build_srt_settings": "local.srt",
     "srt_argv": "local.srt",
+    "VenvTemplateCache": "local.venv_cache",
+    "ChunkedSnapshotStore": "snapshot_store",
+    "SnapshottingEnvironment": "snapshot_store",
 }
 
 
@@ -88,6 +96,7 @@ def __getattr__(name: str) -> Any:
 
 
 __all__ = [
+    "ChunkedSnapshotStore",
     "E2BEnvironment",
     "E2BEnvironmentConfig",
     "E2BExecBackend",
@@ -103,15 +112,19 @@ __all__ = [
     "FilesystemConfig",
     "LocalEnvironment",
     "LocalExecBackend",
+    "LocalSnapshotEnvironment",
+    "LocalSnapshotStore",
     "NetworkConfig",
     "NetworkPolicy",
     "ProcessSupervisor",
     "SandboxPolicy",
     "SeatbeltExecBackend",
     "SnapshotCapable",
+    "SnapshottingEnvironment",
     "SrtExecBackend",
     "SupervisorLimits",
     "TerminationReason",
+    "VenvTemplateCache",
     "build_seatbelt_profile",
     "build_srt_settings",
     "e2b_environment",
@@ -74,6 +74,9 @@ class ExecConfig(BaseModel):
     # Opt in to the framework creating the ``python`` venv (if absent) and
     # installing missing ``packages`` into it. Off by default.
     provision: bool = False
+    # Directory of prebuilt venv templates that provisioned venvs are cloned
+    # from (see ``VenvTemplateCache``); ``None`` builds each venv from scratch.
+    venv_cache_dir: str | None = None
     env: dict[str, str] = Field(default_factory=dict)
     # ``None`` (omitted in JSON) keeps the secret-scrub denylist
     # (``DEFAULT_ENV_SCRUB``); an explicit ``[]`` disables scrubbing.
@@ -127,6 +130,7 @@ class EnvironmentConfig(BaseModel):
             python=ex.python,
             packages=ex.packages,
             provision=ex.provision,
+            venv_cache=ex.venv_cache_dir,
             supervisor=supervisor,
         )
 
@@ -8,11 +8,21 @@ handle: it cannot exist without an entered :class:`E2BEnvironment`.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import io
 import shlex
+import tarfile
+import uuid
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING
 
-from e2b import AsyncSandbox, CommandExitException
+from e2b import (
+    AsyncSandbox,
+    CommandExitException,
+    NotFoundException,
+    SandboxException,
+)
 
 from grasp_agents.file_backend.base import (
     FileBackend,
@@ -33,10 +43,16 @@ from ._handle import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from grasp_agents.file_backend.base import GrepOutputMode
     from grasp_agents.file_backend.paths import AccessMode
     from grasp_agents.sandbox.policy import SandboxPolicy
 
+# File bytes fetched per bulk-read command. The archive travels base64-encoded
+# through one command's stdout, which must finish inside the command timeout.
+READ_MANY_MAX_BYTES = 16 * 1024 * 1024
+
 
 class E2BFileBackend(FileBackend):
     """
@@ -113,7 +129,10 @@ class E2BFileBackend(FileBackend):
         return resolved
 
     async def stat(self, path: Path) -> FileStat:
-        info = await self._holder.require().files.get_info(wire(path))
+        try:
+            info = await self._holder.require().files.get_info(wire(path))
+        except NotFoundException as exc:
+            raise FileNotFoundError(wire(path)) from exc
         return FileStat(
             mtime=mtime(info),
             mode=int(getattr(info, "mode", 0o644) or 0o644),
@@ -137,10 +156,72 @@ class E2BFileBackend(FileBackend):
 
     async def read_bytes(self, path: Path) -> tuple[bytes, float]:
         sb = self._holder.require()
-        content = await sb.files.read(wire(path), "bytes")
-        info = await sb.files.get_info(wire(path))
+        try:
+            content = await sb.files.read(wire(path), "bytes")
+            info = await sb.files.get_info(wire(path))
+        except NotFoundException as exc:
+            raise FileNotFoundError(wire(path)) from exc
         return bytes(content), mtime(info)
 
+    async def read_many(
+        self, paths: Sequence[Path], *, max_concurrency: int = 16
+    ) -> list[tuple[bytes, float]]:
+        """
+        Bulk download: a ``tar`` of the paths, streamed back base64-encoded
+        over one command, instead of two round trips per file. The paths are
+        grouped by their :meth:`stat_many` sizes so no command carries more
+        than :data:`READ_MANY_MAX_BYTES`; a file larger than that is read on
+        its own. The path list travels as a NUL-separated file so no name is
+        shell-interpolated. Mtimes come from the archive (whole seconds). A
+        failed or timed-out command raises :class:`OSError`.
+        """
+        if len(paths) <= 1:
+            return await super().read_many(paths, max_concurrency=max_concurrency)
+        stats = await self.stat_many(paths, max_concurrency=max_concurrency)
+        out: list[tuple[bytes, float]] = []
+        for group in _size_groups(paths, stats, READ_MANY_MAX_BYTES):
+            if len(group) == 1:
+                out.extend(
+                    await super().read_many(group, max_concurrency=max_concurrency)
+                )
+            else:
+                out.extend(await self._read_archive(group))
+        return out
+
+    async def _read_archive(self, paths: Sequence[Path]) -> list[tuple[bytes, float]]:
+        sb = self._holder.require()
+        wanted = [wire(p) for p in paths]
+        list_file = f"/tmp/.grasp-read-many-{uuid.uuid4().hex}"
+        q = shlex.quote(list_file)
+        try:
+            # e2b types write()'s data param as a bare ``IO`` (-> ``IO[Unknown]``).
+            await sb.files.write(list_file, "\0".join(wanted).encode())  # pyright: ignore[reportUnknownMemberType]
+            stdout, code = await _run_capture(
+                sb,
+                f"tar -cf - --null -T {q} 2>/dev/null | base64 -w0; rm -f {q}",
+                cwd="/",
+            )
+        except SandboxException as exc:
+            raise OSError(f"remote bulk read failed: {exc}") from exc
+        try:
+            archive = tarfile.open(  # noqa: SIM115
+                fileobj=io.BytesIO(base64.b64decode(stdout, validate=True))
+            )
+        except (binascii.Error, tarfile.TarError) as exc:
+            raise OSError(f"remote bulk read failed (exit {code})") from exc
+        with archive:
+            members = {
+                "/" + m.name.lstrip("/"): m for m in archive.getmembers() if m.isfile()
+            }
+            out: list[tuple[bytes, float]] = []
+            for name in wanted:
+                member = members.get(name)
+                extracted = archive.extractfile(member) if member else None
+                if member is None or extracted is None:
+                    raise FileNotFoundError(name)
+                out.append((extracted.read(), float(member.mtime)))
+        return out
+
     async def write_bytes(
         self,
         path: Path,
@@ -174,6 +255,7 @@ class E2BFileBackend(FileBackend):
                     path=p,
                     is_dir=is_dir(e),
                     mtime=mtime(e),
+                    size=getattr(e, "size", None),
                 )
             )
         return out
@@ -236,6 +318,28 @@ class E2BFileBackend(FileBackend):
         return _parse_grep(stdout, output_mode)
 
 
+def _size_groups(
+    paths: Sequence[Path], stats: Sequence[FileStat | None], max_bytes: int
+) -> list[list[Path]]:
+    """
+    Split ``paths`` (in order) into runs of at most ``max_bytes`` in total.
+    An unknown size counts as zero: the read itself reports the missing file.
+    """
+    groups: list[list[Path]] = []
+    current: list[Path] = []
+    total = 0
+    for path, st in zip(paths, stats, strict=True):
+        size = st.size if st is not None else 0
+        if current and total + size > max_bytes:
+            groups.append(current)
+            current, total = [], 0
+        current.append(path)
+        total += size
+    if current:
+        groups.append(current)
+    return groups
+
+
 async def _run_capture(
     sandbox: AsyncSandbox, command: str, *, cwd: str, timeout: float = 60.0
 ) -> tuple[str, int]:
@@ -46,6 +46,8 @@ if TYPE_CHECKING:
     from grasp_agents.file_backend.base import FileBackend
     from grasp_agents.sandbox.exec_backend import ExecBackend
 
+    from .venv_cache import VenvTemplateCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -109,10 +111,13 @@ def local_environment(
     python: str | Path | None = None,
     packages: Sequence[str] = (),
     provision: bool = False,
+    venv_cache: VenvTemplateCache | Path | str | None = None,
     kernel_setup_code: str = "",
     kernel_startup_timeout: float = DEFAULT_KERNEL_STARTUP_TIMEOUT,
     limits: ResourceLimits | None = None,
     supervisor: ProcessSupervisor | None = None,
+    snapshot_dir: Path | str | None = None,
+    snapshot_exclude: Sequence[str] = (".venv", "__pycache__"),
 ) -> LocalEnvironment:
     """
     Build a co-located host filesystem + exec pair sharing one policy.
@@ -175,6 +180,12 @@ def local_environment(
             Idempotent: an existing venv at that path is reused. To run against
             an environment you manage yourself instead, leave ``provision``
             off and point ``python`` at it.
+        venv_cache: Provision new venvs by cloning a prebuilt template from
+            this :class:`~grasp_agents.sandbox.local.venv_cache.VenvTemplateCache`
+            (or a cache at this directory) instead of building them: the first
+            environment for a given base interpreter + ``packages`` builds the
+            template, later ones are linked from it in well under a second.
+            Only used with ``provision=True`` when the venv does not exist yet.
         kernel_setup_code: Code run once at code-interpreter (``RunPython``)
             kernel startup, in its own execution — empty by default (the
             framework imposes nothing). Pass e.g. ``"%matplotlib inline"`` to
@@ -189,9 +200,21 @@ def local_environment(
             Mutually exclusive with ``supervisor``. See :class:`ResourceLimits`.
             (Local family only; E2B allocates resources per-VM at template build.)
         supervisor: Shared :class:`ProcessSupervisor` for the exec backend.
+        snapshot_dir: Make the environment
+            :class:`~grasp_agents.sandbox.environment.SnapshotCapable`: the
+            ``allowed_roots`` are snapshotted into a content-addressed store at
+            this directory (see
+            :class:`~grasp_agents.sandbox.local.snapshot.LocalSnapshotStore`),
+            costing roughly what changed since the previous snapshot. Off by
+            default.
+        snapshot_exclude: ``fnmatch`` patterns for entry names the snapshots
+            skip (and restores leave alone). Defaults to the provisioned venv
+            and bytecode caches.
 
     Returns:
-        A :class:`LocalEnvironment` exposing ``file_backend`` + ``exec_backend``.
+        A :class:`LocalEnvironment` exposing ``file_backend`` + ``exec_backend``
+        (a :class:`~grasp_agents.sandbox.local.snapshot.LocalSnapshotEnvironment`
+        when ``snapshot_dir`` is given).
 
     """
     roots = tuple(Path(r).expanduser() for r in allowed_roots)
@@ -234,7 +257,9 @@ def local_environment(
     if provision:
         if not roots:
             raise ValueError("provision=True requires at least one allowed_root")
-        resolved_python = _provision_python_env(python, packages, roots[0] / ".venv")
+        resolved_python = _provision_python_env(
+            python, packages, roots[0] / ".venv", venv_cache=venv_cache
+        )
     exec_backend = _build_exec_backend(
         confinement,
         policy=policy,
@@ -244,6 +269,20 @@ def local_environment(
     )
     if packages:
         _verify_packages(resolve_python(resolved_python), packages)
+    if snapshot_dir is not None:
+        from .snapshot import (  # noqa: PLC0415
+            LocalSnapshotEnvironment,
+            LocalSnapshotStore,
+        )
+
+        return LocalSnapshotEnvironment(
+            policy=policy,
+            file_backend=file_backend,
+            exec_backend=exec_backend,
+            snapshot_store=LocalSnapshotStore(
+                snapshot_dir, roots=roots, exclude=snapshot_exclude
+            ),
+        )
     return LocalEnvironment(
         policy=policy, file_backend=file_backend, exec_backend=exec_backend
     )
@@ -383,14 +422,14 @@ def _verify_packages(python: str, packages: Sequence[str]) -> None:
         )
 
 
-def _venv_interpreter(venv_dir: Path) -> Path:
+def venv_interpreter(venv_dir: Path) -> Path:
     """The interpreter path inside a venv created at ``venv_dir``."""
     if sys.platform == "win32":
         return venv_dir / "Scripts" / "python.exe"
     return venv_dir / "bin" / "python"
 
 
-def _install_missing(python: str, packages: Sequence[str]) -> list[str]:
+def install_missing(python: str, packages: Sequence[str]) -> list[str]:
     """
     ``pip install`` the ``packages`` not already present in ``python``.
 
@@ -429,7 +468,7 @@ for name in mods:
 """
 
 
-def _warmup_venv(python: str, packages: Sequence[str]) -> None:
+def warmup_venv(python: str, packages: Sequence[str]) -> None:
     """
     Pre-import the venv's packages once so the first ``RunPython`` kernel launch
     and first cell don't pay the cold tax.
@@ -457,8 +496,28 @@ def _warmup_venv(python: str, packages: Sequence[str]) -> None:
     logger.info("provision: import warm-up done in %.1fs", time.monotonic() - t0)
 
 
+def _venv_base(python: str | Path | None) -> str:
+    """The interpreter a provisioned venv is created from (see below)."""
+    if python is None:
+        return sys.executable
+    candidate = Path(python).expanduser()
+    if candidate.is_file():
+        return str(candidate)
+    logger.warning(
+        "provision: configured python %r does not exist; using %s "
+        "as the base for the agent's venv.",
+        str(python),
+        sys.executable,
+    )
+    return sys.executable
+
+
 def _provision_python_env(
-    python: str | Path | None, packages: Sequence[str], venv_dir: Path
+    python: str | Path | None,
+    packages: Sequence[str],
+    venv_dir: Path,
+    *,
+    venv_cache: VenvTemplateCache | Path | str | None = None,
 ) -> str:
     """
     Create the agent's dedicated venv at ``venv_dir`` and return its interpreter.
@@ -468,26 +527,28 @@ def _provision_python_env(
     if it points to a real interpreter, only selects the base to clone from
     (i.e. the venv's Python version); otherwise ``sys.executable`` is used (and
     the unusable value is logged). Missing ``packages`` are then installed into
-    the venv. Idempotent: an existing venv at ``venv_dir`` is reused.
+    the venv. Idempotent: an existing venv at ``venv_dir`` is reused. With a
+    ``venv_cache``, a venv not yet on disk is cloned from the cached template.
     """
-    interpreter = _venv_interpreter(venv_dir)
+    interpreter = venv_interpreter(venv_dir)
     created = not interpreter.is_file()
     if not created:
         # Reuse an existing venv as-is (e.g. on resume); only top up packages.
         logger.info("provision: reusing the existing venv at %s", venv_dir)
+    elif venv_cache is not None and not venv_dir.exists():
+        from .venv_cache import VenvTemplateCache  # noqa: PLC0415
+
+        if not isinstance(venv_cache, VenvTemplateCache):
+            venv_cache = VenvTemplateCache(venv_cache)
+        base = _venv_base(python)
+        logger.info(
+            "provision: cloning the agent's venv at %s from the template cache",
+            venv_dir,
+        )
+        # The template is installed, compiled and warmed up already.
+        return venv_cache.provision(base, packages, venv_dir)
     else:
-        base = sys.executable
-        if python is not None:
-            candidate = Path(python).expanduser()
-            if candidate.is_file():
-                base = str(candidate)
-            else:
-                logger.warning(
-                    "provision: configured python %r does not exist; using %s "
-                    "as the base for the agent's venv.",
-                    str(python),
-                    sys.executable,
-                )
+        base = _venv_base(python)
         logger.info(
             "provision: creating the agent's venv at %s from %s", venv_dir, base
         )
@@ -495,13 +556,19 @@ def _provision_python_env(
             subprocess.run([base, "-m", "venv", str(venv_dir)], check=True)
         except (OSError, subprocess.SubprocessError) as exc:
             raise ValueError(f"failed to create venv at {venv_dir}: {exc}") from exc
-    installed = _install_missing(str(interpreter), packages)
+    installed = install_missing(str(interpreter), packages)
     # Warm imports only when the venv is fresh or just changed (the cold,
     # crash-prone case); a pure reuse (resume) already ran the interpreter in a
     # prior session, so skip the warm-up to keep resumes fast.
     if packages and (created or installed):
-        _warmup_venv(str(interpreter), packages)
+        warmup_venv(str(interpreter), packages)
     return str(interpreter)
 
 
-__all__ = ["LocalEnvironment", "local_environment"]
+__all__ = [
+    "LocalEnvironment",
+    "install_missing",
+    "local_environment",
+    "venv_interpreter",
+    "warmup_venv",
+]
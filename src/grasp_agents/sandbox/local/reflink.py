@@ -0,0 +1,66 @@
+"""
+Whole-file copy-on-write clones (reflinks).
+
+:func:`reflink` clones ``src`` to ``dst`` so both share extents until one is
+written: ``ioctl(FICLONE)`` on Linux (btrfs, XFS, overlayfs) and
+``clonefile(2)`` on macOS (APFS). A filesystem that cannot clone raises an
+:class:`OSError` whose ``errno`` is in :data:`NO_REFLINK_ERRNOS`; callers fall
+back to a copy (or a hard link) on those and treat anything else as a real
+failure.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# ioctl(dest_fd, FICLONE, src_fd) — whole-file reflink on btrfs / XFS / overlayfs.
+_FICLONE = 0x40049409
+
+# Errors meaning "this filesystem cannot reflink"; anything else is a real failure.
+NO_REFLINK_ERRNOS = frozenset(
+    {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+)
+
+
+def _clone_linux(src: Path, dst: Path) -> None:
+    import fcntl  # noqa: PLC0415
+
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+@functools.cache
+def _darwin_clonefile() -> Any:
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    clonefile = libc.clonefile
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    return clonefile
+
+
+def _clone_darwin(src: Path, dst: Path) -> None:
+    dst.unlink(missing_ok=True)  # clonefile(2) refuses an existing target
+    if _darwin_clonefile()(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), str(dst))
+
+
+def reflink(src: Path, dst: Path) -> None:
+    """Clone ``src`` to ``dst`` copy-on-write, or raise :class:`OSError`."""
+    if sys.platform.startswith("linux"):
+        _clone_linux(src, dst)
+    elif sys.platform == "darwin":
+        _clone_darwin(src, dst)
+    else:
+        raise OSError(errno.EOPNOTSUPP, "reflink unsupported")
+
+
+__all__ = ["NO_REFLINK_ERRNOS", "reflink"]
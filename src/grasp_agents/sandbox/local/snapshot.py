@@ -0,0 +1,461 @@
+"""
+Copy-on-write workspace snapshots for the local environment.
+
+:class:`LocalSnapshotStore` captures the trees under a set of roots into a
+content-addressed object store and restores them by diffing, so both
+operations cost roughly what changed since the last one rather than the size of
+the workspace:
+
+- **Snapshot** walks the roots with :func:`os.scandir`. A file whose
+  ``(size, mtime_ns, inode)`` matches the previous snapshot reuses its recorded
+  digest without being read; changed files are cloned into the store (a
+  reflink on filesystems that support it — btrfs, XFS, APFS — else a copy),
+  hashed from the clone and filed under their SHA-256. Identical contents are
+  stored once across every snapshot. The tree is recorded as a JSON manifest
+  whose hash is the snapshot ref.
+- **Restore** diffs the live tree against a manifest: extra entries are
+  removed, files whose ``(size, mtime_ns)`` already match are left alone, and
+  only the rest are cloned back from the store (via a temp file and
+  :func:`os.replace`, so a half-restored file is never visible).
+
+Files are cloned, never hard-linked: commands run by the exec backend write
+files in place, and a shared inode would let them corrupt the store.
+
+:func:`~grasp_agents.sandbox.local.environment.local_environment` builds a
+:class:`LocalSnapshotEnvironment` (a
+:class:`~grasp_agents.sandbox.environment.SnapshotCapable` environment) when
+given ``snapshot_dir``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fnmatch
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from grasp_agents.sandbox.environment import SnapshotCapable
+from grasp_agents.sandbox.snapshot_manifests import SnapshotManifests
+
+from .environment import LocalEnvironment
+from .reflink import NO_REFLINK_ERRNOS, reflink
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from grasp_agents.file_backend.base import FileBackend
+    from grasp_agents.sandbox.exec_backend import ExecBackend
+    from grasp_agents.sandbox.policy import SandboxPolicy
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_REF_PREFIX = "local:"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class _FileEntry:
+    digest: str
+    size: int
+    mode: int
+    mtime_ns: int
+    ino: int
+
+    def to_json(self) -> list[Any]:
+        return [self.digest, self.size, self.mode, self.mtime_ns, self.ino]
+
+    @classmethod
+    def from_json(cls, raw: Sequence[Any]) -> Self:
+        digest, size, mode, mtime_ns, ino = raw
+        return cls(digest=digest, size=size, mode=mode, mtime_ns=mtime_ns, ino=ino)
+
+
+@dataclass(slots=True)
+class _Tree:
+    """One root's entries, keyed by POSIX path relative to the root."""
+
+    files: dict[str, _FileEntry]
+    dirs: dict[str, int]  # rel path -> mode
+    links: dict[str, str]  # rel path -> link target
+
+
+@dataclass(slots=True)
+class _Scan:
+    """The live state of one root: lstat results, not yet hashed."""
+
+    files: dict[str, os.stat_result]
+    dirs: dict[str, int]
+    links: dict[str, str]
+
+
+def _file_digest(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class LocalSnapshotStore:
+    """
+    Content-addressed snapshots of the directory trees under ``roots``.
+
+    Layout under ``store_dir``: ``objects/<2 hex>/<62 hex>`` file contents,
+    ``manifests/<hex>.json`` one per snapshot, and ``HEAD`` naming the latest
+    manifest (used to seed the change detector after a restart). A
+    ``store_dir`` inside one of the roots is skipped by the walk, as is any
+    entry whose name matches an ``exclude`` pattern (``fnmatch``, e.g.
+    ``".venv"``, ``"*.pyc"``) — excluded paths are not captured, and restore
+    leaves them alone unless their directory did not exist at snapshot time.
+
+    Operations are serialized and run off the event loop.
+    """
+
+    def __init__(
+        self,
+        store_dir: Path | str,
+        *,
+        roots: Sequence[Path | str],
+        exclude: Sequence[str] = (),
+    ) -> None:
+        self._store_dir = Path(store_dir).expanduser().resolve()
+        self._roots = tuple(Path(r).expanduser().resolve() for r in roots)
+        self._exclude = tuple(exclude)
+        self._manifests = SnapshotManifests(
+            self._store_dir,
+            blobs_dir=self._store_dir / "objects",
+            ref_prefix=SNAPSHOT_REF_PREFIX,
+            kind="local",
+            version=MANIFEST_VERSION,
+        )
+        self._lock = asyncio.Lock()
+        # Last known (size, mtime_ns, ino) -> digest per absolute path; the
+        # change detector that keeps snapshots proportional to what changed.
+        self._known: dict[str, _FileEntry] | None = None
+        self._reflink: bool | None = None  # None = untested
+
+    @property
+    def store_dir(self) -> Path:
+        return self._store_dir
+
+    @property
+    def roots(self) -> tuple[Path, ...]:
+        return self._roots
+
+    async def snapshot(self) -> str:
+        """Capture the roots and return the snapshot's ref."""
+        async with self._lock:
+            return await asyncio.to_thread(self._snapshot_sync)
+
+    async def restore(self, ref: str) -> None:
+        """Rewind the roots to the snapshot ``ref``."""
+        async with self._lock:
+            await asyncio.to_thread(self._restore_sync, ref)
+
+    async def gc(self, keep: Iterable[str]) -> int:
+        """
+        Delete every snapshot not in ``keep`` and the objects only they used.
+
+        Returns the number of objects removed.
+        """
+        keep_ids = {self._manifests.manifest_id(ref) for ref in keep}
+        async with self._lock:
+            return await asyncio.to_thread(self._gc_sync, keep_ids)
+
+    def refs(self) -> list[str]:
+        """Refs of every snapshot currently in the store."""
+        return self._manifests.refs()
+
+    # --- snapshot ---
+
+    def _snapshot_sync(self) -> str:
+        self._manifests.blobs_dir.mkdir(parents=True, exist_ok=True)
+        known = self._known_entries()
+        fresh: dict[str, _FileEntry] = {}
+        trees: dict[str, Any] = {}
+        ingested = 0
+        for root in self._roots:
+            scan = self._scan(root)
+            files: dict[str, _FileEntry] = {}
+            for rel, st in scan.files.items():
+                path = root / rel
+                prev = known.get(str(path))
+                if (
+                    prev is not None
+                    and prev.size == st.st_size
+                    and prev.mtime_ns == st.st_mtime_ns
+                    and prev.ino == st.st_ino
+                    and self._has_object(prev.digest)
+                ):
+                    digest = prev.digest
+                else:
+                    try:
+                        digest = self._ingest(path)
+                    except FileNotFoundError:
+                        continue  # deleted mid-walk
+                    ingested += 1
+                entry = _FileEntry(
+                    digest=digest,
+                    size=st.st_size,
+                    mode=stat.S_IMODE(st.st_mode),
+                    mtime_ns=st.st_mtime_ns,
+                    ino=st.st_ino,
+                )
+                files[rel] = entry
+                fresh[str(path)] = entry
+            trees[str(root)] = {
+                "files": {rel: e.to_json() for rel, e in sorted(files.items())},
+                "dirs": dict(sorted(scan.dirs.items())),
+                "links": dict(sorted(scan.links.items())),
+            }
+
+        manifest_id = self._manifests.write(trees)
+        self._manifests.set_head(manifest_id)
+        self._known = fresh
+        logger.debug(
+            "snapshot %s: %d files, %d ingested", manifest_id[:12], len(fresh), ingested
+        )
+        return self._manifests.ref(manifest_id)
+
+    def _ingest(self, path: Path) -> str:
+        """
+        Clone ``path`` into the store and return its digest. Hashing the clone
+        (not the source) keeps digest and stored bytes consistent even if the
+        file is being written concurrently.
+        """
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=".ingest.", dir=self._manifests.blobs_dir
+        )
+        os.close(fd)
+        tmp = Path(tmp_name)
+        try:
+            self._clone(path, tmp)
+            digest = _file_digest(tmp)
+            self._file_object(tmp, digest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return digest
+
+    def _file_object(self, tmp: Path, digest: str) -> None:
+        obj = self._manifests.blob_path(digest)
+        if obj.exists():
+            tmp.unlink()
+            return
+        obj.parent.mkdir(exist_ok=True)
+        tmp.chmod(0o444)
+        tmp.replace(obj)
+
+    # --- restore ---
+
+    def _restore_sync(self, ref: str) -> None:
+        manifest_id = self._manifests.manifest_id(ref)
+        trees = self._load_manifest(manifest_id)
+        restored: dict[str, _FileEntry] = {}
+        for root in self._roots:
+            tree = trees.get(str(root))
+            if tree is None:
+                continue  # root added after the snapshot: leave it alone
+            root.mkdir(parents=True, exist_ok=True)
+            self._restore_root(root, tree, restored)
+        self._manifests.set_head(manifest_id)
+        self._known = restored
+
+    def _restore_root(
+        self, root: Path, tree: _Tree, restored: dict[str, _FileEntry]
+    ) -> None:
+        scan = self._scan(root)
+
+        # Remove what the snapshot does not have, or has as another kind.
+        for rel in scan.files.keys() - tree.files.keys():
+            (root / rel).unlink(missing_ok=True)
+        for rel, target in scan.links.items():
+            if tree.links.get(rel) != target:
+                (root / rel).unlink(missing_ok=True)
+        for rel in sorted(scan.dirs.keys() - tree.dirs.keys(), reverse=True):
+            path = root / rel
+            if not self._store_dir.is_relative_to(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+        for rel in tree.dirs:
+            (root / rel).mkdir(parents=True, exist_ok=True)
+
+        for rel, entry in tree.files.items():
+            path = root / rel
+            st = scan.files.get(rel)
+            if (
+                st is None
+                or st.st_size != entry.size
+                or st.st_mtime_ns != entry.mtime_ns
+            ):
+                self._materialize(entry, path)
+                st = path.lstat()
+            elif stat.S_IMODE(st.st_mode) != entry.mode:
+                path.chmod(entry.mode)
+            restored[str(path)] = _FileEntry(
+                digest=entry.digest,
+                size=entry.size,
+                mode=entry.mode,
+                mtime_ns=st.st_mtime_ns,
+                ino=st.st_ino,
+            )
+
+        for rel, target in tree.links.items():
+            if scan.links.get(rel) != target:
+                (root / rel).symlink_to(target)
+
+        # Directory modes last, so a read-only directory is filled first.
+        for rel, mode in tree.dirs.items():
+            if scan.dirs.get(rel) != mode:
+                (root / rel).chmod(mode)
+
+    def _materialize(self, entry: _FileEntry, path: Path) -> None:
+        obj = self._manifests.blob_path(entry.digest)
+        if not obj.is_file():
+            raise FileNotFoundError(
+                f"snapshot object {entry.digest} missing from "
+                f"{self._manifests.blobs_dir}"
+            )
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        os.close(fd)
+        tmp = Path(tmp_name)
+        try:
+            self._clone(obj, tmp)
+            tmp.chmod(entry.mode)
+            os.utime(tmp, ns=(entry.mtime_ns, entry.mtime_ns))
+            tmp.replace(path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    # --- gc ---
+
+    def _gc_sync(self, keep_ids: set[str]) -> int:
+        # The change detector may point at collected objects; it re-checks
+        # ``_has_object`` before trusting an entry.
+        removed, _ = self._manifests.gc(
+            keep_ids,
+            lambda manifest_id: (
+                e.digest
+                for tree in self._load_manifest(manifest_id).values()
+                for e in tree.files.values()
+            ),
+        )
+        return removed
+
+    # --- helpers ---
+
+    def _scan(self, root: Path) -> _Scan:
+        scan = _Scan(files={}, dirs={}, links={})
+        if not root.is_dir():
+            return scan
+        stack: list[tuple[Path, str]] = [(root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if self._excluded(entry.name):
+                        continue
+                    rel = prefix + entry.name
+                    if entry.is_symlink():
+                        scan.links[rel] = str(Path(entry.path).readlink())
+                    elif entry.is_dir(follow_symlinks=False):
+                        path = Path(entry.path)
+                        if path == self._store_dir:
+                            continue
+                        scan.dirs[rel] = stat.S_IMODE(entry.stat().st_mode)
+                        stack.append((path, rel + "/"))
+                    elif entry.is_file(follow_symlinks=False):
+                        scan.files[rel] = entry.stat(follow_symlinks=False)
+                    # sockets / fifos / devices are not workspace content
+        return scan
+
+    def _excluded(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self._exclude)
+
+    def _clone(self, src: Path, dst: Path) -> None:
+        if self._reflink is not False:
+            try:
+                reflink(src, dst)
+            except OSError as err:
+                if err.errno not in NO_REFLINK_ERRNOS:
+                    raise
+                if self._reflink is None:
+                    logger.info(
+                        "snapshot store %s: reflinks unsupported (%s); copying",
+                        self._store_dir,
+                        err.strerror,
+                    )
+                self._reflink = False
+            else:
+                self._reflink = True
+                return
+        shutil.copyfile(src, dst)
+
+    def _has_object(self, digest: str) -> bool:
+        return self._manifests.blob_path(digest).is_file()
+
+    def _load_manifest(self, manifest_id: str) -> dict[str, _Tree]:
+        return {
+            root: _Tree(
+                files={
+                    rel: _FileEntry.from_json(e) for rel, e in tree["files"].items()
+                },
+                dirs=tree["dirs"],
+                links=tree["links"],
+            )
+            for root, tree in self._manifests.read(manifest_id).items()
+        }
+
+    def _known_entries(self) -> dict[str, _FileEntry]:
+        if self._known is None:
+            self._known = {}
+            with contextlib.suppress(OSError, KeyError, ValueError):
+                head = self._manifests.read_head()
+                trees = self._load_manifest(head) if head is not None else {}
+                for root, tree in trees.items():
+                    for rel, entry in tree.files.items():
+                        self._known[str(Path(root) / rel)] = entry
+        return self._known
+
+
+class LocalSnapshotEnvironment(LocalEnvironment, SnapshotCapable):
+    """
+    A :class:`LocalEnvironment` whose workspace can be snapshotted and restored
+    through a :class:`LocalSnapshotStore` — which makes it
+    :class:`~grasp_agents.sandbox.environment.SnapshotCapable`, so checkpoints
+    record filesystem refs (see ``SessionContext.fs_snapshot_policy``).
+    Built by :func:`~grasp_agents.sandbox.local.environment.local_environment`
+    when ``snapshot_dir`` is given.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: SandboxPolicy,
+        file_backend: FileBackend,
+        exec_backend: ExecBackend | None,
+        snapshot_store: LocalSnapshotStore,
+    ) -> None:
+        super().__init__(
+            policy=policy, file_backend=file_backend, exec_backend=exec_backend
+        )
+        self._snapshot_store = snapshot_store
+
+    @property
+    def snapshot_store(self) -> LocalSnapshotStore:
+        return self._snapshot_store
+
+    async def snapshot(self) -> str:
+        return await self._snapshot_store.snapshot()
+
+    async def restore(self, ref: str) -> None:
+        await self._snapshot_store.restore(ref)
+
+
+__all__ = ["LocalSnapshotEnvironment", "LocalSnapshotStore"]
@@ -0,0 +1,367 @@
+"""
+A cache of prebuilt, provisioned venvs that agent environments are cloned from.
+
+``provision=True`` gives every agent environment its own venv, and building one
+is slow: ``python -m venv``, a ``pip install`` of the requested packages and an
+import warm-up take minutes for a numpy/pandas stack. :class:`VenvTemplateCache`
+pays that once per *template* — a fully provisioned venv keyed by the base
+interpreter, the package set and the platform, with its ``site-packages``
+byte-compiled — and provisions each environment by cloning the template:
+
+- files are **reflinked** where the filesystem supports it (btrfs, XFS, APFS),
+  so the clone is private copy-on-write storage; otherwise they are copied.
+  They are never hard-linked: a clone is agent-writable, and an in-place write
+  (an edited ``.py``, ``pip install --force-reinstall``) to a shared inode
+  would reach the template and every later clone;
+- directories are created fresh and symlinks recreated, so the clone's tree is
+  its own;
+- the few files that record the venv's location (``pyvenv.cfg`` and the
+  shebangs / activation scripts under ``bin``) are rewritten for the new path.
+
+Cloning costs one walk of the template plus one reflink or copy per file.
+Each template carries a manifest digest over its entries' paths, sizes, modes
+and mtimes, re-checked on every clone; a template that no longer matches (a
+file was written in place, chmod-ed or went missing) is rebuilt. Templates are
+evicted least-recently-used beyond ``max_templates``.
+
+Pass a cache (or a cache directory) to
+:func:`~grasp_agents.sandbox.local.environment.local_environment` as
+``venv_cache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import stat
+import subprocess  # noqa: S404 - trusted interpreter, no shell
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from grasp_agents.file_backend.atomic_write import atomic_write_bytes
+
+from .environment import install_missing, venv_interpreter, warmup_venv
+from .reflink import NO_REFLINK_ERRNOS, reflink
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_FORMAT_VERSION = 2
+
+LinkMode = Literal["auto", "reflink", "copy"]
+
+_META = "template.json"
+_VENV = "venv"
+# Files that record the venv's own path and are rewritten on clone; anything
+# larger under ``bin`` is a binary (an interpreter copy, a launcher).
+_REWRITE_MAX_BYTES = 1 << 20
+_READ_ONLY = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+# One template entry: (posix rel path, kind, size, mode, mtime ns, symlink
+# target). The mtime catches a file rewritten in place at the same size.
+type _Entry = tuple[str, str, int, int, int, str]
+
+
+def template_key(base: str | Path, packages: Sequence[str]) -> str:
+    """
+    The cache key for a venv built from ``base`` with ``packages``.
+
+    Covers the resolved base interpreter and its size / mtime (so upgrading it
+    in place invalidates its templates), the whitespace-stripped, de-duplicated package
+    specs (order-insensitive) and the OS / machine.
+    """
+    real = Path(base).expanduser().resolve()
+    st = real.stat()
+    spec = {
+        "format": TEMPLATE_FORMAT_VERSION,
+        "base": [str(real), st.st_size, st.st_mtime_ns],
+        "packages": sorted({"".join(p.split()) for p in packages if p.strip()}),
+        "platform": [sys.platform, platform.machine()],
+    }
+    raw = json.dumps(spec, sort_keys=True).encode()
+    return hashlib.sha256(raw).hexdigest()[:32]
+
+
+def _scan(root: Path) -> list[_Entry]:
+    """Every entry under ``root``, sorted by path (parents before children)."""
+    entries: list[_Entry] = []
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                rel = prefix + entry.name
+                st = entry.stat(follow_symlinks=False)
+                mode = stat.S_IMODE(st.st_mode)
+                if entry.is_symlink():
+                    target = str(Path(entry.path).readlink())
+                    entries.append((rel, "l", 0, 0, 0, target))
+                elif entry.is_dir(follow_symlinks=False):
+                    entries.append((rel, "d", 0, mode, 0, ""))
+                    stack.append((Path(entry.path), rel + "/"))
+                elif entry.is_file(follow_symlinks=False):
+                    entries.append((rel, "f", st.st_size, mode, st.st_mtime_ns, ""))
+    entries.sort()
+    return entries
+
+
+def _digest(entries: Sequence[_Entry]) -> str:
+    h = hashlib.sha256()
+    for entry in entries:
+        h.update(json.dumps(entry).encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _records_location(rel: str) -> bool:
+    top, _, rest = rel.partition("/")
+    return rel == "pyvenv.cfg" or (top in {"bin", "Scripts"} and "/" not in rest)
+
+
+class VenvTemplateCache:
+    """
+    Prebuilt venv templates under ``cache_dir``, cloned per environment.
+
+    Layout: ``<cache_dir>/<key>/venv`` is a template (see :func:`template_key`)
+    and ``<cache_dir>/<key>/template.json`` its metadata, whose mtime is the
+    template's last use. Templates are built in a staging directory and renamed
+    into place, so concurrent processes never see a half-built one (the loser
+    of a build race discards its copy).
+
+    ``link_mode`` chooses how template files reach a clone: ``"auto"`` (the
+    default) and ``"reflink"`` reflink where supported and copy otherwise;
+    ``"copy"`` always copies.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        *,
+        max_templates: int = 8,
+        link_mode: LinkMode = "auto",
+    ) -> None:
+        if max_templates < 1:
+            raise ValueError(f"max_templates must be >= 1, got {max_templates}")
+        self._cache_dir = Path(cache_dir).expanduser().resolve()
+        self._max_templates = max_templates
+        self._link_mode: LinkMode = link_mode
+        # Resolved strategy once a clone has probed the filesystem.
+        self._strategy: Literal["reflink", "copy"] | None = (
+            None if link_mode == "auto" else link_mode
+        )
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def templates(self) -> list[str]:
+        """Keys of the cached templates, most recently used first."""
+        if not self._cache_dir.is_dir():
+            return []
+        found: list[tuple[float, str]] = []
+        for entry in os.scandir(self._cache_dir):
+            meta = Path(entry.path) / _META
+            if entry.is_dir() and not entry.name.startswith("."):
+                try:
+                    found.append((meta.stat().st_mtime, entry.name))
+                except FileNotFoundError:
+                    continue
+        return [key for _, key in sorted(found, reverse=True)]
+
+    def evict(self, key: str) -> None:
+        """Drop the template ``key`` (no-op if absent)."""
+        path = self._cache_dir / key
+        if not path.is_dir():
+            return
+        # Rename first so a concurrent clone fails cleanly instead of copying a
+        # half-deleted tree, then delete at leisure.
+        trash = Path(tempfile.mkdtemp(prefix=".evict-", dir=self._cache_dir))
+        try:
+            path.rename(trash / key)
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(trash, ignore_errors=True)
+
+    def provision(
+        self, base: str | Path, packages: Sequence[str], venv_dir: Path
+    ) -> str:
+        """
+        Materialize a venv for ``base`` + ``packages`` at ``venv_dir`` (which
+        must not exist) and return its interpreter, building the template first
+        on a cache miss.
+        """
+        key = template_key(base, packages)
+        try:
+            return self._provision(key, str(base), packages, venv_dir)
+        except FileNotFoundError:
+            # The template was evicted by another process mid-clone; rebuild.
+            logger.info("venv cache: template %s vanished; retrying", key)
+            return self._provision(key, str(base), packages, venv_dir)
+
+    def _provision(
+        self, key: str, base: str, packages: Sequence[str], venv_dir: Path
+    ) -> str:
+        template = self._cache_dir / key
+        entries = self._verified_entries(template)
+        if entries is None:
+            self._build(key, base, packages)
+            entries = self._verified_entries(template)
+            if entries is None:
+                raise ValueError(f"venv template {key} failed verification")
+        self._clone(template, entries, venv_dir)
+        os.utime(template / _META)
+        return str(venv_interpreter(venv_dir))
+
+    # --- templates ---
+
+    def _verified_entries(self, template: Path) -> list[_Entry] | None:
+        """The template's entries if it exists and matches its manifest."""
+        try:
+            meta = json.loads((template / _META).read_bytes())
+            entries = _scan(template / _VENV)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if meta.get("format") == TEMPLATE_FORMAT_VERSION and meta.get(
+            "digest"
+        ) == _digest(entries):
+            return entries
+        logger.warning(
+            "venv cache: template %s failed its integrity check; rebuilding",
+            template.name,
+        )
+        self.evict(template.name)
+        return None
+
+    def _build(self, key: str, base: str, packages: Sequence[str]) -> None:
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(
+            tempfile.mkdtemp(prefix=f".build-{key[:12]}-", dir=self._cache_dir)
+        )
+        venv = staging / _VENV
+        logger.info("venv cache: building template %s from %s", key, base)
+        t0 = time.monotonic()
+        try:
+            self._create_venv(base, packages, venv)
+            entries = _scan(venv)
+            for rel, kind, _, mode, _, _ in entries:
+                if kind == "f":
+                    (venv / rel).chmod(mode & _READ_ONLY)
+            entries = _scan(venv)
+            meta: dict[str, Any] = {
+                "format": TEMPLATE_FORMAT_VERSION,
+                "key": key,
+                "base": base,
+                "packages": list(packages),
+                "build_path": str(venv),
+                "files": sum(kind == "f" for _, kind, *_ in entries),
+                "digest": _digest(entries),
+            }
+            atomic_write_bytes(staging / _META, json.dumps(meta, indent=1).encode())
+            try:
+                staging.rename(self._cache_dir / key)
+            except OSError:
+                logger.info("venv cache: template %s was built concurrently", key)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        logger.info(
+            "venv cache: built template %s in %.1fs", key, time.monotonic() - t0
+        )
+        for stale in self.templates()[self._max_templates :]:
+            logger.info("venv cache: evicting least recently used template %s", stale)
+            self.evict(stale)
+
+    def _create_venv(self, base: str, packages: Sequence[str], venv: Path) -> None:
+        """Create, install into, byte-compile and warm up a venv at ``venv``."""
+        try:
+            subprocess.run([base, "-m", "venv", str(venv)], check=True)
+        except (OSError, subprocess.SubprocessError) as exc:
+            raise ValueError(f"failed to create venv at {venv}: {exc}") from exc
+        interpreter = str(venv_interpreter(venv))
+        install_missing(interpreter, packages)
+        lib = next((venv / d for d in ("lib", "Lib") if (venv / d).is_dir()), None)
+        if lib is not None:
+            # Best-effort: a stray unparsable test file must not fail the build.
+            subprocess.run(
+                [interpreter, "-m", "compileall", "-q", "-j", "0", str(lib)],
+                check=False,
+                capture_output=True,
+            )
+        if packages:
+            warmup_venv(interpreter, packages)
+
+    # --- cloning ---
+
+    def _clone(self, template: Path, entries: Sequence[_Entry], venv_dir: Path) -> None:
+        meta = json.loads((template / _META).read_bytes())
+        venv_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(
+            tempfile.mkdtemp(prefix=f".{venv_dir.name}.clone-", dir=venv_dir.parent)
+        )
+        try:
+            self._populate(template / _VENV, entries, staging, meta, venv_dir)
+            staging.rename(venv_dir)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def _populate(
+        self,
+        src_root: Path,
+        entries: Sequence[_Entry],
+        dst_root: Path,
+        meta: dict[str, Any],
+        venv_dir: Path,
+    ) -> None:
+        old = os.fsencode(meta["build_path"])
+        new = os.fsencode(venv_dir)
+        for rel, kind, size, mode, _, target in entries:
+            src, dst = src_root / rel, dst_root / rel
+            if kind == "d":
+                dst.mkdir(mode=mode | stat.S_IWUSR)
+            elif kind == "l":
+                dst.symlink_to(target)
+            elif size <= _REWRITE_MAX_BYTES and _records_location(rel):
+                dst.write_bytes(src.read_bytes().replace(old, new))
+                dst.chmod(mode | stat.S_IWUSR)
+            else:
+                self._link(src, dst, mode)
+
+    def _link(self, src: Path, dst: Path, mode: int) -> None:
+        if self._strategy in {None, "reflink"}:
+            try:
+                reflink(src, dst)
+            except OSError as err:
+                if err.errno not in NO_REFLINK_ERRNOS:
+                    raise
+                dst.unlink(missing_ok=True)
+                logger.info(
+                    "venv cache %s: falling back to copy clones (%s)",
+                    self._cache_dir,
+                    err.strerror,
+                )
+                self._strategy = "copy"
+            else:
+                self._strategy = "reflink"
+                self._copy_meta(src, dst, mode)
+                return
+        shutil.copyfile(src, dst)
+        self._copy_meta(src, dst, mode)
+
+    @staticmethod
+    def _copy_meta(src: Path, dst: Path, mode: int) -> None:
+        # Keep mtimes so the template's timestamp-checked ``.pyc`` stay valid.
+        st = src.stat()
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+        dst.chmod(mode | stat.S_IWUSR)
+
+
+__all__ = ["TEMPLATE_FORMAT_VERSION", "VenvTemplateCache", "template_key"]
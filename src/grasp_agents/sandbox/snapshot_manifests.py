@@ -0,0 +1,157 @@
+"""
+The bookkeeping shared by the content-addressed snapshot stores.
+
+Both :class:`~grasp_agents.sandbox.local.snapshot.LocalSnapshotStore` (whole
+files, cloned locally) and
+:class:`~grasp_agents.sandbox.snapshot_store.ChunkedSnapshotStore` (chunks, over
+any ``FileBackend``) keep their blobs under ``<2 hex>/<62 hex>`` paths and
+describe each snapshot with a JSON manifest named by its SHA-256.
+:class:`SnapshotManifests` owns that common part of a store directory: the
+manifests, the ``HEAD`` pointer to the latest snapshot, the ref syntax, and
+garbage collection of manifests and the blobs only they reference. What a
+manifest's trees hold is up to each store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from grasp_agents.file_backend.atomic_write import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+
+class SnapshotManifests:
+    """
+    Manifests (``manifests/<hex>.json``), ``HEAD`` and blob GC under
+    ``store_dir``, for refs of the form ``<ref_prefix><hex>``.
+
+    ``kind`` names the store in error messages ("not a <kind> snapshot ref");
+    ``blobs_dir`` is where the store files its content (``<2 hex>/<62 hex>``);
+    ``version`` is stamped into, and required of, every manifest.
+    """
+
+    def __init__(
+        self,
+        store_dir: Path,
+        *,
+        blobs_dir: Path,
+        ref_prefix: str,
+        kind: str,
+        version: int,
+    ) -> None:
+        self._store_dir = store_dir
+        self._blobs_dir = blobs_dir
+        self._dir = store_dir / "manifests"
+        self._head = store_dir / "HEAD"
+        self._ref_prefix = ref_prefix
+        self._kind = kind
+        self._version = version
+
+    @property
+    def blobs_dir(self) -> Path:
+        return self._blobs_dir
+
+    def blob_path(self, digest: str) -> Path:
+        return self._blobs_dir / digest[:2] / digest[2:]
+
+    # --- refs ---
+
+    def ref(self, manifest_id: str) -> str:
+        return self._ref_prefix + manifest_id
+
+    def is_ref(self, ref: str) -> bool:
+        return ref.startswith(self._ref_prefix)
+
+    def manifest_id(self, ref: str) -> str:
+        if not self.is_ref(ref):
+            raise ValueError(f"not a {self._kind} snapshot ref: {ref!r}")
+        return ref.removeprefix(self._ref_prefix)
+
+    def refs(self) -> list[str]:
+        """Refs of every snapshot currently in the store."""
+        if not self._dir.is_dir():
+            return []
+        return sorted(self.ref(p.stem) for p in self._dir.glob("*.json"))
+
+    # --- manifests ---
+
+    def write(self, trees: dict[str, Any]) -> str:
+        """
+        Store a manifest of ``trees`` (root -> JSON-able tree) and return its
+        id. Identical trees yield the same id and are written once.
+        """
+        self._dir.mkdir(parents=True, exist_ok=True)
+        body = json.dumps(
+            {"version": self._version, "roots": trees},
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode()
+        manifest_id = hashlib.sha256(body).hexdigest()
+        path = self._dir / f"{manifest_id}.json"
+        if not path.exists():
+            atomic_write_bytes(path, body, mode=0o644)
+        return manifest_id
+
+    def read(self, manifest_id: str) -> dict[str, Any]:
+        """
+        The trees of manifest ``manifest_id``, by root. Raises ``KeyError`` for
+        an unknown snapshot, ``ValueError`` for another manifest version.
+        """
+        path = self._dir / f"{manifest_id}.json"
+        try:
+            raw = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            raise KeyError(f"unknown snapshot: {self.ref(manifest_id)}") from None
+        if raw.get("version") != self._version:
+            raise ValueError(
+                f"unsupported snapshot manifest version {raw.get('version')!r}"
+            )
+        return raw["roots"]
+
+    # --- HEAD ---
+
+    def read_head(self) -> str | None:
+        try:
+            return self._head.read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def set_head(self, manifest_id: str) -> None:
+        self._store_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self._head, manifest_id.encode(), mode=0o644)
+
+    # --- gc ---
+
+    def gc(
+        self, keep_ids: set[str], referenced: Callable[[str], Iterable[str]]
+    ) -> tuple[int, set[str]]:
+        """
+        Delete every manifest not in ``keep_ids`` (and ``HEAD`` if it names
+        one), then every blob no kept manifest references — ``referenced`` maps
+        a manifest id to its blob digests. Returns the number of blobs removed
+        and the digests still live.
+        """
+        live: set[str] = set()
+        if self._dir.is_dir():
+            for manifest in self._dir.glob("*.json"):
+                if manifest.stem not in keep_ids:
+                    manifest.unlink()
+                    continue
+                live.update(referenced(manifest.stem))
+        if self.read_head() not in keep_ids:
+            self._head.unlink(missing_ok=True)
+        removed = 0
+        for bucket in self._blobs_dir.glob("??"):
+            for blob in bucket.iterdir():
+                if bucket.name + blob.name not in live:
+                    blob.unlink()
+                    removed += 1
+        return removed, live
+
+
+__all__ = ["SnapshotManifests"]
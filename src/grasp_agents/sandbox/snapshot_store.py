@@ -0,0 +1,618 @@
+"""
+A chunked, content-addressed workspace snapshot store over any ``FileBackend``.
+
+:class:`ChunkedSnapshotStore` snapshots the trees under a backend's roots into a
+local blob store, so turn-level snapshotting pays for what changed rather than
+for the whole workspace every time:
+
+- Files are split into content-defined chunks (FastCDC: a gear rolling hash
+  with normalized cut masks), and every chunk is stored once under its SHA-256.
+  An edit in the middle of a large file re-stores only the chunks around it;
+  unchanged files (same size and mtime as the previous snapshot — to the
+  nanosecond where the backend reports it) are not read at all.
+- Each snapshot is a JSON manifest (per file: mtime, mode, size, chunk list)
+  named by its hash — the ref recorded in the checkpoint (``cas:<hex>``).
+- :meth:`~ChunkedSnapshotStore.restore` diffs the live tree against the
+  manifest and writes back only files that differ.
+- :meth:`~ChunkedSnapshotStore.gc_unreferenced` keeps the snapshots still
+  referenced from a :class:`~grasp_agents.durability.CheckpointStore` key space
+  and deletes the rest, with the chunks only they used.
+
+The store talks to the workspace only through the ``FileBackend`` surface, so it
+works for remote sandboxes too: changed files are fetched with
+:meth:`~grasp_agents.file_backend.base.FileBackend.read_many`, which
+:class:`~grasp_agents.sandbox.e2b.file_backend.E2BFileBackend` serves as a single
+bulk download. Wrap an environment in :class:`SnapshottingEnvironment` to make
+it :class:`SnapshotCapable` through this store. (For a purely local workspace,
+:class:`~grasp_agents.sandbox.local.snapshot.LocalSnapshotStore` clones whole
+files with reflinks instead.)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import hashlib
+import itertools
+import json
+import logging
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from grasp_agents.file_backend.atomic_write import atomic_write_bytes
+
+from .environment import ExecutionEnvironment, SnapshotCapable
+from .snapshot_manifests import SnapshotManifests
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from grasp_agents.durability.checkpoint_store import CheckpointStore
+    from grasp_agents.file_backend.base import FileBackend
+
+    from .exec_backend import ExecBackend
+    from .policy import SandboxPolicy
+
+logger = logging.getLogger(__name__)
+
+CAS_REF_PREFIX = "cas:"
+MANIFEST_VERSION = 1
+
+_MASK64 = (1 << 64) - 1
+# Gear table: 256 fixed pseudo-random 64-bit words. Derived from SHA-256 so chunk
+# boundaries (and therefore dedup) are stable across processes and versions.
+_GEAR = tuple(
+    int.from_bytes(hashlib.sha256(i.to_bytes(2, "big")).digest()[:8], "big")
+    for i in range(256)
+)
+
+
+def chunk_boundaries(
+    data: bytes, *, min_size: int, avg_size: int, max_size: int
+) -> list[int]:
+    """
+    End offsets of ``data``'s content-defined chunks (FastCDC).
+
+    No cut is taken in a chunk's first ``min_size`` bytes (they are not even
+    hashed); up to ``avg_size`` a stricter mask applies and past it a looser
+    one, which pulls chunk sizes towards ``avg_size`` (a power of two); a chunk
+    never exceeds ``max_size``. Because cuts depend only on nearby content, an
+    insertion shifts boundaries only locally.
+    """
+    bits = avg_size.bit_length() - 1
+    # Masks test the hash's high bits — the ones mixing the last 64 bytes.
+    mask_s = ((1 << (bits + 1)) - 1) << (64 - bits - 1)
+    mask_l = ((1 << (bits - 1)) - 1) << (64 - bits + 1)
+    ends: list[int] = []
+    start, n = 0, len(data)
+    while start < n:
+        if n - start <= min_size:
+            ends.append(n)
+            break
+        end = min(start + max_size, n)
+        start = _cut_point(
+            data, start + min_size, min(start + avg_size, end), end, mask_s, mask_l
+        )
+        ends.append(start)
+    return ends
+
+
+def _cut_point(
+    data: bytes, i: int, normal: int, end: int, mask_s: int, mask_l: int
+) -> int:
+    gear = _GEAR
+    h = 0
+    for b in data[i:normal]:
+        h = ((h << 1) + gear[b]) & _MASK64
+        i += 1
+        if not h & mask_s:
+            return i
+    for b in data[i:end]:
+        h = ((h << 1) + gear[b]) & _MASK64
+        i += 1
+        if not h & mask_l:
+            return i
+    return end
+
+
+@dataclass(frozen=True, slots=True)
+class _FileRecord:
+    mtime: float
+    mode: int
+    size: int
+    chunks: tuple[str, ...]
+    mtime_ns: int | None = None
+
+    def to_json(self) -> list[Any]:
+        raw = [self.mtime, self.mode, self.size, list(self.chunks)]
+        if self.mtime_ns is not None:
+            raw.append(self.mtime_ns)
+        return raw
+
+    @classmethod
+    def from_json(cls, raw: Sequence[Any]) -> Self:
+        mtime, mode, size, chunks, *rest = raw
+        return cls(
+            mtime=mtime,
+            mode=mode,
+            size=size,
+            chunks=tuple(chunks),
+            mtime_ns=rest[0] if rest else None,
+        )
+
+    def matches(self, live: _LiveFile) -> bool:
+        """
+        Whether ``live`` still looks like the file this record describes. Size
+        is compared too, so a rewrite within a backend's mtime granularity
+        (whole seconds on E2B) is caught unless it keeps the length.
+        """
+        if live.size is not None and live.size != self.size:
+            return False
+        if live.mtime_ns is not None and self.mtime_ns is not None:
+            return live.mtime_ns == self.mtime_ns
+        return live.mtime == self.mtime
+
+
+@dataclass(frozen=True, slots=True)
+class _LiveFile:
+    mtime: float
+    size: int | None
+    mtime_ns: int | None
+
+
+@dataclass(slots=True)
+class _LiveTree:
+    """The workspace as listed: file stamps and directories, by absolute path."""
+
+    files: dict[str, _LiveFile]
+    dirs: set[str]
+
+
+class ChunkedSnapshotStore:
+    """
+    Content-addressed, chunk-deduplicated snapshots of a ``FileBackend``'s
+    trees, kept under the local directory ``store_dir``.
+
+    ``roots`` default to the backend's ``allowed_roots``; entries with a path
+    segment matching an ``exclude`` pattern (``fnmatch``) are neither captured
+    nor touched on restore, nor is a ``store_dir`` lying inside a root. Chunk
+    sizes are FastCDC parameters (``avg_chunk_size`` a power of two).
+
+    Layout: ``chunks/<2 hex>/<62 hex>``, ``manifests/<hex>.json`` (one per
+    snapshot), ``index.json`` (what the workspace held at the last snapshot or
+    restore — the change detector) and ``HEAD`` (the latest snapshot). Operations
+    are serialized; local I/O and chunking run off the event loop.
+
+    The backend's ``FileBackend.delete`` removes files only, so directories
+    created after a snapshot survive its restore (emptied of snapshot-unknown
+    files).
+    """
+
+    def __init__(
+        self,
+        backend: FileBackend,
+        store_dir: Path | str,
+        *,
+        roots: Sequence[Path] | None = None,
+        exclude: Sequence[str] = (),
+        min_chunk_size: int = 2 * 1024,
+        avg_chunk_size: int = 8 * 1024,
+        max_chunk_size: int = 64 * 1024,
+        read_batch_size: int = 256,
+        max_concurrency: int = 16,
+    ) -> None:
+        if avg_chunk_size & (avg_chunk_size - 1) or avg_chunk_size < 64:
+            raise ValueError(
+                f"avg_chunk_size must be a power of two >= 64, got {avg_chunk_size}"
+            )
+        if not 0 < min_chunk_size < avg_chunk_size < max_chunk_size:
+            raise ValueError(
+                "chunk sizes must satisfy 0 < min_chunk_size < avg_chunk_size "
+                f"< max_chunk_size, got {min_chunk_size}, {avg_chunk_size}, "
+                f"{max_chunk_size}"
+            )
+        self._backend = backend
+        self._store_dir = Path(store_dir).expanduser().resolve()
+        self._roots = tuple(roots) if roots is not None else None
+        self._exclude = tuple(exclude)
+        self._chunk_sizes = (min_chunk_size, avg_chunk_size, max_chunk_size)
+        self._read_batch_size = read_batch_size
+        self._max_concurrency = max_concurrency
+        self._manifests = SnapshotManifests(
+            self._store_dir,
+            blobs_dir=self._store_dir / "chunks",
+            ref_prefix=CAS_REF_PREFIX,
+            kind="chunked",
+            version=MANIFEST_VERSION,
+        )
+        self._lock = asyncio.Lock()
+        self._index: dict[str, _FileRecord] | None = None
+
+    @property
+    def backend(self) -> FileBackend:
+        return self._backend
+
+    @property
+    def store_dir(self) -> Path:
+        return self._store_dir
+
+    @property
+    def roots(self) -> tuple[Path, ...]:
+        if self._roots is not None:
+            return self._roots
+        return tuple(self._backend.allowed_roots)
+
+    async def snapshot(self) -> str:
+        """Capture the roots and return the snapshot's ref."""
+        async with self._lock:
+            return await self._snapshot()
+
+    async def restore(self, ref: str) -> None:
+        """Rewind the roots to the snapshot ``ref``."""
+        manifest_id = self._manifests.manifest_id(ref)
+        async with self._lock:
+            await self._restore(manifest_id)
+
+    async def gc(self, keep: Iterable[str]) -> int:
+        """
+        Delete every snapshot not in ``keep`` (refs of other stores are ignored)
+        and the chunks only they used. Returns the number of chunks removed.
+        """
+        keep_ids = {
+            self._manifests.manifest_id(ref)
+            for ref in keep
+            if self._manifests.is_ref(ref)
+        }
+        async with self._lock:
+            removed, index = await asyncio.to_thread(
+                self._gc_sync, keep_ids, await self._load_index()
+            )
+            self._index = index
+            return removed
+
+    async def gc_unreferenced(self, store: CheckpointStore, prefix: str = "") -> int:
+        """
+        Garbage-collect against a checkpoint store's key space: keep the
+        snapshots referenced by any record under ``prefix`` (see
+        :func:`~grasp_agents.durability.read_fs_snapshot_refs`) plus the latest
+        one, which may not be recorded yet. Returns the number of chunks removed.
+        """
+        from grasp_agents.durability.session_history import (  # noqa: PLC0415
+            read_fs_snapshot_refs,
+        )
+
+        keep = await read_fs_snapshot_refs(store, prefix)
+        head = await asyncio.to_thread(self._manifests.read_head)
+        if head is not None:
+            keep.add(self._manifests.ref(head))
+        return await self.gc(keep)
+
+    def refs(self) -> list[str]:
+        """Refs of every snapshot currently in the store."""
+        return self._manifests.refs()
+
+    # --- snapshot ---
+
+    async def _snapshot(self) -> str:
+        index = await self._load_index()
+        live = await self._walk()
+        fresh = {
+            path: replace(index[path], mtime=stamp.mtime, mtime_ns=stamp.mtime_ns)
+            for path, stamp in live.files.items()
+            if path in index and index[path].matches(stamp)
+        }
+        changed = [Path(p) for p in live.files if p not in fresh]
+        for start in range(0, len(changed), self._read_batch_size):
+            batch = changed[start : start + self._read_batch_size]
+            contents = await self._read_batch(batch)
+            modes = await self._modes(list(contents))
+            records = await asyncio.to_thread(self._store_files, contents, modes)
+            for path, record in records.items():
+                stamp = live.files[str(path)]
+                fresh[str(path)] = replace(
+                    record, mtime=stamp.mtime, mtime_ns=stamp.mtime_ns
+                )
+
+        trees: dict[str, Any] = {}
+        for root in self.roots:
+            base = str(root).rstrip("/") + "/"
+            trees[str(root)] = {
+                "files": {
+                    p[len(base) :]: r.to_json()
+                    for p, r in sorted(fresh.items())
+                    if p.startswith(base)
+                },
+                "dirs": sorted(d[len(base) :] for d in live.dirs if d.startswith(base)),
+            }
+        manifest_id = await asyncio.to_thread(self._commit_snapshot, trees, fresh)
+        self._index = fresh
+        logger.debug(
+            "snapshot %s: %d files, %d read", manifest_id[:12], len(fresh), len(changed)
+        )
+        return self._manifests.ref(manifest_id)
+
+    async def _read_batch(self, paths: list[Path]) -> dict[Path, bytes]:
+        if not paths:
+            return {}
+        try:
+            results = await self._backend.read_many(
+                paths, max_concurrency=self._max_concurrency
+            )
+            return {p: data for p, (data, _) in zip(paths, results, strict=True)}
+        except OSError:
+            pass
+        # Something vanished (or the bulk path failed): fall back to per-file
+        # reads, skipping files deleted since the walk.
+        out: dict[Path, bytes] = {}
+        for path in paths:
+            try:
+                out[path], _ = await self._backend.read_bytes(path)
+            except FileNotFoundError:
+                continue
+        return out
+
+    async def _modes(self, paths: list[Path]) -> list[int]:
+        stats = await self._backend.stat_many(
+            paths, max_concurrency=self._max_concurrency
+        )
+        return [st.mode & 0o7777 if st is not None else 0o644 for st in stats]
+
+    def _store_files(
+        self, contents: dict[Path, bytes], modes: list[int]
+    ) -> dict[Path, _FileRecord]:
+        self._manifests.blobs_dir.mkdir(parents=True, exist_ok=True)
+        min_size, avg_size, max_size = self._chunk_sizes
+        records: dict[Path, _FileRecord] = {}
+        for (path, data), mode in zip(contents.items(), modes, strict=True):
+            digests: list[str] = []
+            start = 0
+            for end in chunk_boundaries(
+                data, min_size=min_size, avg_size=avg_size, max_size=max_size
+            ):
+                chunk = data[start:end]
+                digest = hashlib.sha256(chunk).hexdigest()
+                target = self._manifests.blob_path(digest)
+                if not target.exists():
+                    target.parent.mkdir(exist_ok=True)
+                    atomic_write_bytes(target, chunk, mode=0o444)
+                digests.append(digest)
+                start = end
+            records[path] = _FileRecord(
+                mtime=0.0, mode=mode, size=len(data), chunks=tuple(digests)
+            )
+        return records
+
+    def _commit_snapshot(
+        self, trees: dict[str, Any], index: dict[str, _FileRecord]
+    ) -> str:
+        manifest_id = self._manifests.write(trees)
+        self._save_index(index)
+        self._manifests.set_head(manifest_id)
+        return manifest_id
+
+    # --- restore ---
+
+    async def _restore(self, manifest_id: str) -> None:
+        trees = await asyncio.to_thread(self._load_manifest, manifest_id)
+        index = await self._load_index()
+        live = await self._walk()
+        wanted: dict[str, _FileRecord] = {}
+        wanted_dirs: list[Path] = []
+        for root in self.roots:
+            tree = trees.get(str(root))
+            if tree is None:
+                continue  # root added after the snapshot: leave it alone
+            files, dirs = tree
+            wanted.update({str(root / rel): rec for rel, rec in files.items()})
+            wanted_dirs.extend(root / rel for rel in dirs)
+        restored_roots = tuple(
+            str(root).rstrip("/") + "/" for root in self.roots if str(root) in trees
+        )
+
+        for path in live.files:
+            if path not in wanted and path.startswith(restored_roots):
+                await self._backend.delete(Path(path))
+                index.pop(path, None)
+        for directory in sorted(wanted_dirs):
+            if str(directory) not in live.dirs:
+                await self._backend.mkdir(directory)
+
+        limiter = asyncio.Semaphore(self._max_concurrency)
+
+        async def _write(path: str, record: _FileRecord) -> None:
+            # Assemble under the limiter too, so at most ``max_concurrency``
+            # files are held in memory at once.
+            async with limiter:
+                data = await asyncio.to_thread(self._assemble, record)
+                mtime = await self._backend.write_bytes(
+                    Path(path), data, mode=record.mode
+                )
+            index[path] = _FileRecord(
+                mtime=mtime, mode=record.mode, size=record.size, chunks=record.chunks
+            )
+
+        stale = [
+            (path, record)
+            for path, record in wanted.items()
+            if not self._unchanged(path, record, index, live)
+        ]
+        await asyncio.gather(*itertools.starmap(_write, stale))
+
+        await asyncio.to_thread(self._save_index, index, manifest_id)
+        self._index = index
+        logger.debug("restore %s: %d files rewritten", manifest_id[:12], len(stale))
+
+    @staticmethod
+    def _unchanged(
+        path: str,
+        record: _FileRecord,
+        index: dict[str, _FileRecord],
+        live: _LiveTree,
+    ) -> bool:
+        known = index.get(path)
+        return (
+            known is not None
+            and path in live.files
+            and known.matches(live.files[path])
+            and known.chunks == record.chunks
+        )
+
+    def _assemble(self, record: _FileRecord) -> bytes:
+        parts: list[bytes] = []
+        for digest in record.chunks:
+            try:
+                parts.append(self._manifests.blob_path(digest).read_bytes())
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"snapshot chunk {digest} missing from {self._manifests.blobs_dir}"
+                ) from None
+        return b"".join(parts)
+
+    # --- gc ---
+
+    def _gc_sync(
+        self, keep_ids: set[str], index: dict[str, _FileRecord]
+    ) -> tuple[int, dict[str, _FileRecord]]:
+        removed, live = self._manifests.gc(keep_ids, self._manifest_chunks)
+        # Forget index entries whose chunks are gone, so the next snapshot
+        # re-reads those files instead of referencing collected chunks.
+        index = {
+            path: record
+            for path, record in index.items()
+            if all(digest in live for digest in record.chunks)
+        }
+        self._save_index(index)
+        return removed, index
+
+    # --- helpers ---
+
+    async def _walk(self) -> _LiveTree:
+        live = _LiveTree(files={}, dirs=set())
+        store = str(self._store_dir)
+        for root in self.roots:
+            if not await self._backend.exists(root):
+                continue
+            for entry in await self._backend.list_dir(root, recursive=True):
+                path = str(entry.path)
+                rel = entry.path.relative_to(root)
+                if path == store or path.startswith(store + "/"):
+                    continue
+                if any(self._excluded(part) for part in rel.parts):
+                    continue
+                if entry.is_dir:
+                    live.dirs.add(path)
+                else:
+                    live.files[path] = _LiveFile(
+                        mtime=entry.mtime, size=entry.size, mtime_ns=entry.mtime_ns
+                    )
+        return live
+
+    def _excluded(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self._exclude)
+
+    def _load_manifest(
+        self, manifest_id: str
+    ) -> dict[str, tuple[dict[str, _FileRecord], list[str]]]:
+        return {
+            root: (
+                {rel: _FileRecord.from_json(r) for rel, r in tree["files"].items()},
+                tree["dirs"],
+            )
+            for root, tree in self._manifests.read(manifest_id).items()
+        }
+
+    def _manifest_chunks(self, manifest_id: str) -> Iterable[str]:
+        for files, _ in self._load_manifest(manifest_id).values():
+            for record in files.values():
+                yield from record.chunks
+
+    async def _load_index(self) -> dict[str, _FileRecord]:
+        if self._index is None:
+            self._index = await asyncio.to_thread(self._read_index)
+        return dict(self._index)
+
+    def _read_index(self) -> dict[str, _FileRecord]:
+        try:
+            raw = json.loads((self._store_dir / "index.json").read_bytes())
+            return {p: _FileRecord.from_json(r) for p, r in raw.items()}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(
+        self, index: dict[str, _FileRecord], head: str | None = None
+    ) -> None:
+        self._store_dir.mkdir(parents=True, exist_ok=True)
+        body = json.dumps(
+            {p: r.to_json() for p, r in index.items()}, separators=(",", ":")
+        ).encode()
+        atomic_write_bytes(self._store_dir / "index.json", body, mode=0o644)
+        if head is not None:
+            self._manifests.set_head(head)
+
+
+class SnapshottingEnvironment(ExecutionEnvironment, SnapshotCapable):
+    """
+    Any :class:`ExecutionEnvironment` made :class:`SnapshotCapable` through a
+    :class:`ChunkedSnapshotStore` over its file backend.
+
+    Policy, backends and lifecycle delegate to ``inner``; :meth:`snapshot` /
+    :meth:`restore` go to the store (overriding a native snapshot, e.g. E2B's
+    whole-VM one, with an incremental one)::
+
+        env = SnapshottingEnvironment(e2b_environment(...), store_dir=".snapshots")
+    """
+
+    def __init__(
+        self,
+        inner: ExecutionEnvironment,
+        *,
+        store_dir: Path | str,
+        exclude: Sequence[str] = (),
+        **store_kwargs: Any,
+    ) -> None:
+        self._inner = inner
+        self._store = ChunkedSnapshotStore(
+            inner.file_backend, store_dir, exclude=exclude, **store_kwargs
+        )
+
+    @property
+    def inner(self) -> ExecutionEnvironment:
+        return self._inner
+
+    @property
+    def snapshot_store(self) -> ChunkedSnapshotStore:
+        return self._store
+
+    @property
+    def policy(self) -> SandboxPolicy:
+        return self._inner.policy
+
+    @property
+    def file_backend(self) -> FileBackend:
+        return self._inner.file_backend
+
+    @property
+    def exec_backend(self) -> ExecBackend | None:
+        return self._inner.exec_backend
+
+    async def __aenter__(self) -> Self:
+        await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self._inner.__aexit__(*exc)
+
+    async def snapshot(self) -> str:
+        return await self._store.snapshot()
+
+    async def restore(self, ref: str) -> None:
+        await self._store.restore(ref)
+
+
+__all__ = [
+    "CAS_REF_PREFIX",
+    "ChunkedSnapshotStore",
+    "SnapshottingEnvironment",
+    "chunk_boundaries",
+]
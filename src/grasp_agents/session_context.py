@@ -24,6 +24,8 @@ from .runtime import Transport
 from .sandbox.environment import ExecutionEnvironment, SnapshotCapable
 from .sandbox.exec_backend import ExecBackend
 from .skills.registry import SkillRegistry
+from .tools.result_cache import ToolResultCache
+from .types.blobs import BlobStore
 from .types.io import ProcName
 from .types.message import TeamMessage
 from .types.response import Response
@@ -171,6 +173,19 @@ class SessionContext[CtxT](BaseModel):
     # below enforces that linkage.
     memory: MemoryProvider | None = Field(default=None, exclude=True)
 
+    # Content-addressed store for large image / file payloads. When set,
+    # agents swap such parts of their inputs and tool results for blob
+    # references as they enter the transcript, so the payload is stored,
+    # checkpointed and provider-encoded once instead of on every turn. Keep
+    # the same root across runs: a resumed transcript resolves its references
+    # against it.
+    blob_store: BlobStore | None = Field(default=None, exclude=True)
+
+    # Memoized results of idempotent tools, shared by every agent of the
+    # session. Only tools that opt in (``BaseTool.memoize``) consult it; a
+    # served result is flagged on its ``ToolOutputEvent`` (``memoized``).
+    tool_cache: ToolResultCache | None = Field(default=None, exclude=True)
+
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
     _ambient_tokens: list[contextvars.Token[Any]] = PrivateAttr(
@@ -14,13 +14,14 @@ from __future__ import annotations
 import importlib
 from typing import TYPE_CHECKING, Any
 
+from .catalog import SkillCatalog
 from .injection import (
     make_skills_section,
     render_available_skills_block,
     render_skill_instructions,
     skills_system_prompt_section,
 )
-from .loader import discover_skills, load_skill_md, parse_skill_md
+from .loader import discover_skills, find_skill_files, load_skill_md, parse_skill_md
 from .registry import SkillRegistry, match_invocation_wrapper
 from .slash import (
     ParsedSlashCommand,
@@ -59,6 +60,7 @@ def __getattr__(name: str) -> Any:
 __all__ = [
     "ParsedSlashCommand",
     "Skill",
+    "SkillCatalog",
     "SkillError",
     "SkillFilter",
     "SkillFormatError",
@@ -66,6 +68,7 @@ __all__ = [
     "SkillNotFoundError",
     "SkillRegistry",
     "discover_skills",
+    "find_skill_files",
     "list_skills",
     "load_skill",
     "load_skill_md",
@@ -0,0 +1,116 @@
+"""
+Precomputed ``<available_skills>`` catalog.
+
+Rendering the catalog is a pure function of each skill, so a
+:class:`SkillCatalog` renders every skill's ``<skill>`` element once and keeps
+the fragments. The skills system-prompt section then joins precomputed strings
+(or returns the prebuilt whole catalog when no filter applies) instead of
+re-escaping every skill on every render.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .types import Skill, SkillFilter
+
+
+def render_skill_entry(skill: Skill, *, include_license: bool = False) -> str:
+    """Render one skill's ``<skill>`` element of the catalog."""
+    lines: list[str] = [
+        "  <skill>",
+        f"    <name>{escape(skill.name)}</name>",
+        f"    <description>{escape(skill.description)}</description>",
+    ]
+    if skill.frontmatter.compatibility:
+        lines.append(
+            f"    <compatibility>{escape(skill.frontmatter.compatibility)}"
+            "</compatibility>"
+        )
+    if skill.frontmatter.allowed_tools:
+        lines.append(
+            f"    <allowed-tools>{escape(skill.frontmatter.allowed_tools)}"
+            "</allowed-tools>"
+        )
+    if include_license and skill.frontmatter.license:
+        lines.append(f"    <license>{escape(skill.frontmatter.license)}</license>")
+    lines.append("  </skill>")
+    return "\n".join(lines)
+
+
+def join_catalog(entries: Iterable[str], injected: Iterable[tuple[str, str]]) -> str:
+    """
+    Assemble rendered entries and ``(name, body)`` injected bodies into the
+    catalog text; ``""`` when there are no entries.
+    """
+    lines = list(entries)
+    if not lines:
+        return ""
+    parts = ["<available_skills>", *lines, "</available_skills>"]
+    for name, body in injected:
+        parts.extend(["", f"## Skill: {name}", "", body])
+    return "\n".join(parts)
+
+
+@dataclass(frozen=True)
+class SkillCatalog:
+    """
+    The rendered catalog of a registry's model-visible skills at one
+    :attr:`~grasp_agents.skills.SkillRegistry.version`.
+
+    Built by :attr:`SkillRegistry.catalog`, which reuses the fragments of
+    skills unchanged since the previous build.
+    """
+
+    version: int
+    skills: tuple[Skill, ...]
+    entries: Mapping[str, str]
+    text: str = field(repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        skills: Iterable[Skill],
+        *,
+        version: int = 0,
+        previous: SkillCatalog | None = None,
+    ) -> SkillCatalog:
+        visible = tuple(s for s in skills if not s.disable_model_invocation)
+        reuse: dict[str, tuple[Skill, str]] = {}
+        if previous is not None:
+            reuse = {s.name: (s, previous.entries[s.name]) for s in previous.skills}
+        entries: dict[str, str] = {}
+        for skill in visible:
+            hit = reuse.get(skill.name)
+            entries[skill.name] = (
+                hit[1]
+                if hit is not None and hit[0] is skill
+                else render_skill_entry(skill)
+            )
+        return cls(
+            version=version,
+            skills=visible,
+            entries=entries,
+            text=join_catalog(
+                entries.values(),
+                ((s.name, s.body) for s in visible if s.inject_body),
+            ),
+        )
+
+    def render(self, skill_filter: SkillFilter | None = None) -> str:
+        """The catalog text, narrowed to ``skill_filter`` when given."""
+        if skill_filter is None:
+            return self.text
+        allowed = [s for s in self.skills if skill_filter.allows(s.name)]
+        return join_catalog(
+            (self.entries[s.name] for s in allowed),
+            ((s.name, s.body) for s in allowed if s.inject_body),
+        )
+
+    def __len__(self) -> int:
+        return len(self.skills)
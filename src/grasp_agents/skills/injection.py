@@ -2,17 +2,19 @@ from __future__ import annotations
 
 from importlib.resources import files
 from typing import TYPE_CHECKING, Any
-from xml.sax.saxutils import escape
 
 from grasp_agents.context.prompt_builder import SystemPromptSection
 
+from .catalog import join_catalog, render_skill_entry
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from grasp_agents.agent.agent_context import AgentContext
     from grasp_agents.session_context import SessionContext
 
-    from .types import Skill
+    from .registry import SkillRegistry
+    from .types import Skill, SkillFilter
 
 SKILLS_SECTION_NAME = "skills"
 
@@ -27,10 +29,6 @@ LOAD_INSTRUCTION = (
 )
 
 
-def _xml_escape(value: str) -> str:
-    return escape(value)
-
-
 def render_skill_instructions() -> str:
     """
     Render the skill-instructions sub-block.
@@ -62,43 +60,14 @@ def render_available_skills_block(
 
     The output is just the XML (and any injected bodies) — instructions
     on how to invoke skills live in :func:`render_skill_instructions`.
+    A registry's precomputed :attr:`SkillRegistry.catalog` renders the same
+    text without re-rendering unchanged skills.
     """
     visible = [s for s in skills if not s.disable_model_invocation]
-    if not visible:
-        return ""
-
-    lines: list[str] = ["<available_skills>"]
-    for skill in visible:
-        skill_lines: list[str] = [
-            "  <skill>",
-            f"    <name>{_xml_escape(skill.name)}</name>",
-            f"    <description>{_xml_escape(skill.description)}</description>",
-        ]
-        if skill.frontmatter.compatibility:
-            skill_lines.append(
-                "    <compatibility>"
-                f"{_xml_escape(skill.frontmatter.compatibility)}"
-                "</compatibility>"
-            )
-        if skill.frontmatter.allowed_tools:
-            skill_lines.append(
-                "    <allowed-tools>"
-                f"{_xml_escape(skill.frontmatter.allowed_tools)}"
-                "</allowed-tools>"
-            )
-        if include_license and skill.frontmatter.license:
-            skill_lines.append(
-                f"    <license>{_xml_escape(skill.frontmatter.license)}</license>"
-            )
-        skill_lines.append("  </skill>")
-        lines.extend(skill_lines)
-    lines.append("</available_skills>")
-
-    for skill in visible:
-        if skill.inject_body:
-            lines.extend(["", f"## Skill: {skill.name}", "", skill.body])
-
-    return "\n".join(lines)
+    return join_catalog(
+        (render_skill_entry(s, include_license=include_license) for s in visible),
+        ((s.name, s.body) for s in visible if s.inject_body),
+    )
 
 
 def make_skills_section(
@@ -116,6 +85,12 @@ def make_skills_section(
     Returns ``None`` when ``ctx.skills`` is unset or every registered
     skill has ``disable_model_invocation = true`` (the model would have
     nothing to load, so the instructions become misleading).
+
+    The render is memoized on the registry, its :attr:`SkillRegistry.version`
+    and the agent's skill filter, so the catalog is rebuilt only after a
+    ``register`` / ``refresh`` actually changes it — and then from the
+    registry's precomputed :attr:`SkillRegistry.catalog`, which re-renders
+    only the changed skills.
     """
 
     async def compute(  # noqa: RUF029
@@ -128,18 +103,24 @@ def make_skills_section(
         del exec_id
         if ctx is None or ctx.skills is None:
             return None
-        visible = ctx.skills.visible
         skill_filter = agent_ctx.skill_filter if agent_ctx is not None else None
-        if skill_filter is not None:
-            visible = skill_filter.apply(visible)
-        if not visible:
-            return None
-        catalog = render_available_skills_block(visible)
+        catalog = ctx.skills.catalog.render(skill_filter)
         if not catalog:
             return None
         return f"{render_skill_instructions()}\n\n{catalog}"
 
-    return SystemPromptSection(name=section_name, compute=compute)
+    def cache_key(
+        *,
+        ctx: SessionContext[Any] | None = None,
+        agent_ctx: AgentContext | None = None,
+        **_: Any,
+    ) -> tuple[SkillRegistry, int, SkillFilter | None] | None:
+        if ctx is None or ctx.skills is None:
+            return None
+        skill_filter = agent_ctx.skill_filter if agent_ctx is not None else None
+        return ctx.skills, ctx.skills.version, skill_filter
+
+    return SystemPromptSection(name=section_name, compute=compute, cache_key=cache_key)
 
 
 skills_system_prompt_section = make_skills_section()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Any
@@ -77,6 +78,36 @@ def load_skill_md(path: Path) -> Skill:
     return Skill(frontmatter=frontmatter, body=body, path=path)
 
 
+def find_skill_files(source: Path | str) -> list[Path]:
+    """
+    The ``SKILL.md`` paths :func:`discover_skills` would load from ``source``.
+
+    Walks with :func:`os.scandir` and reads no file, so a caller keeping
+    per-file fingerprints can stat these and re-parse only what changed.
+    Raises :class:`SkillFormatError` when ``source`` does not exist.
+    """
+    path = Path(source).expanduser()
+
+    if path.is_file():
+        return [path]
+
+    if not path.is_dir():
+        raise SkillFormatError(path, "Skill source path does not exist")
+
+    direct = path / SKILL_FILE_NAME
+    if direct.is_file():
+        return [direct]
+
+    with os.scandir(path) as it:
+        children = sorted(entry.name for entry in it if entry.is_dir())
+    found: list[Path] = []
+    for name in children:
+        skill_md = path / name / SKILL_FILE_NAME
+        if skill_md.is_file():
+            found.append(skill_md)
+    return found
+
+
 def discover_skills(source: Path | str) -> list[Skill]:
     """
     Resolve ``source`` to a list of :class:`Skill` objects.
@@ -91,28 +122,26 @@ def discover_skills(source: Path | str) -> list[Skill]:
     strict to be about that — :func:`load_skill_md` raises directly when given
     a single explicit path.
     """
-    path = Path(source).expanduser()
-
-    if path.is_file():
-        return [load_skill_md(path)]
-
-    if not path.is_dir():
-        raise SkillFormatError(path, "Skill source path does not exist")
-
-    direct = path / SKILL_FILE_NAME
-    if direct.is_file():
-        return [load_skill_md(direct)]
+    files = find_skill_files(source)
+    if is_explicit_skill_source(source):
+        return [load_skill_md(files[0])]
 
     skills: list[Skill] = []
-    for child in sorted(path.iterdir()):
-        if not child.is_dir():
-            continue
-        skill_md = child / SKILL_FILE_NAME
-        if not skill_md.is_file():
-            continue
+    for skill_md in files:
         try:
             skills.append(load_skill_md(skill_md))
         except SkillFormatError:
             logger.exception("Failed to load skill at %s", skill_md)
 
     return skills
+
+
+def is_explicit_skill_source(source: Path | str) -> bool:
+    """
+    Whether ``source`` names one skill (a ``SKILL.md`` or its directory).
+
+    Such a source fails loudly on a malformed file; a parent directory of
+    skills logs and skips its malformed children instead.
+    """
+    path = Path(source).expanduser()
+    return path.is_file() or (path / SKILL_FILE_NAME).is_file()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import inspect
 import logging
 import re
@@ -12,8 +14,13 @@ from grasp_agents.context.system_reminder import (
 )
 from grasp_agents.selector import Selector
 
-from .loader import discover_skills
-from .types import SkillNotFoundError
+from .catalog import SkillCatalog
+from .loader import (
+    find_skill_files,
+    is_explicit_skill_source,
+    load_skill_md,
+)
+from .types import SkillFormatError, SkillNotFoundError
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Mapping, Sequence
@@ -43,6 +50,15 @@ _INVOCATION_RE = re.compile(
 
 _NAMED_ARG_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
 
+# Seconds between fingerprint scans of a watched registry.
+DEFAULT_WATCH_INTERVAL = 2.0
+
+# ``(st_mtime_ns, st_size)`` of a ``SKILL.md``.
+type _Fingerprint = tuple[int, int]
+# Per source: each ``SKILL.md`` -> (fingerprint, parsed skill or ``None`` for a
+# file that failed to parse — not retried until its fingerprint changes).
+type _SourceFiles = dict[Path, tuple[_Fingerprint, Skill | None]]
+
 
 def match_invocation_wrapper(text: str) -> str | None:
     """
@@ -59,10 +75,17 @@ class SkillRegistry:
     """
     In-memory registry keyed by skill name.
 
-    Frozen at session start. Newly-authored skills are picked up only on the
-    next session's rescan; mid-session edits to *existing* skill bodies are
-    visible on the next ``load_skill`` call (the tool re-reads the file).
-
+    Discovered skills are fingerprinted per file (``mtime`` and size), so
+    :meth:`refresh` re-stats every known ``SKILL.md`` but re-parses only the
+    files that changed; :meth:`arefresh` does the same walk off the event
+    loop. Without a refresh the catalog stays as it was at session start —
+    :meth:`start_watching` polls the fingerprints in the background and
+    applies changes as they land. Mid-session edits to *existing* skill
+    bodies are visible on the next ``load_skill`` call either way (the tool
+    re-reads the file).
+
+    The rendered ``<available_skills>`` block is kept precomputed
+    (:attr:`catalog`) and rebuilt incrementally when the catalog changes.
     Optionally carries a relevance selector (:meth:`set_selector`) that the
     skills system-prompt section consults before rendering the catalog.
     """
@@ -73,7 +96,16 @@ class SkillRegistry:
         # discovered under a source path — preserved across ``refresh``.
         self._programmatic: dict[str, Skill] = {}
         self._sources: list[Path] = []
+        # Per-source discovery state, replaced source by source on refresh.
+        self._source_skills: dict[Path, list[Skill]] = {}
+        self._source_files: dict[Path, _SourceFiles] = {}
         self._selector: SkillSelector | None = None
+        # Bumped whenever the catalog changes; consumers (the skills
+        # system-prompt section) key memoized renders on it.
+        self._version = 0
+        self._catalog: SkillCatalog | None = None
+        self._refresh_lock: asyncio.Lock | None = None
+        self._watch_task: asyncio.Task[None] | None = None
         for skill in skills:
             self.register(skill)
 
@@ -84,45 +116,119 @@ class SkillRegistry:
         registry.add_source(source)
         return registry
 
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every catalog change."""
+        return self._version
+
     @property
     def sources(self) -> list[Path]:
         return list(self._sources)
 
+    @property
+    def catalog(self) -> SkillCatalog:
+        """
+        The precomputed catalog of model-visible skills at :attr:`version`.
+
+        Rebuilt on first access after a change, re-rendering only the skills
+        that differ from the previous build.
+        """
+        catalog = self._catalog
+        if catalog is None or catalog.version != self._version:
+            catalog = self._catalog = SkillCatalog.build(
+                self._by_name.values(), version=self._version, previous=catalog
+            )
+        return catalog
+
     def add_source(self, source: Path | str) -> list[Skill]:
         """
         Register every skill found under ``source`` and remember the path.
 
-        Subsequent :meth:`refresh` calls re-walk all known sources.
+        Subsequent :meth:`refresh` calls re-walk all known sources. Fails like
+        :func:`discover_skills` on a missing source or a malformed explicit
+        ``SKILL.md``.
         """
         path = Path(source).expanduser().resolve()
         if path not in self._sources:
             self._sources.append(path)
-        added: list[Skill] = []
-        for skill in discover_skills(path):
+        added, files = _scan_source(path, self._source_files.get(path, {}), strict=True)
+        self._source_skills[path] = added
+        self._source_files[path] = files
+        for skill in added:
             self._register_discovered(skill)
-            added.append(skill)
         return added
 
     def refresh(self) -> None:
         """
         Re-walk all known sources and replace the discovered catalog.
 
+        Only ``SKILL.md`` files whose fingerprint changed are re-parsed.
         Programmatically-registered skills are kept. A source that can no
         longer be walked (vanished directory, permission change) is skipped
         with a warning rather than failing the whole refresh.
         """
+        if self._sources:
+            self._apply(_scan_sources(self._sources, self._source_files))
+
+    async def arefresh(self) -> None:
+        """:meth:`refresh` with the filesystem walk run in a worker thread."""
         if not self._sources:
             return
-        new_by_name: dict[str, Skill] = dict(self._programmatic)
-        for source in self._sources:
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            scanned = await asyncio.to_thread(
+                _scan_sources, list(self._sources), dict(self._source_files)
+            )
+            self._apply(scanned)
+
+    def start_watching(self, poll_interval: float = DEFAULT_WATCH_INTERVAL) -> None:
+        """
+        Keep the catalog current in the background: every ``poll_interval``
+        seconds, :meth:`arefresh` (a stat per ``SKILL.md``; parses only on
+        change). Call from a running event loop; :meth:`stop_watching` ends it.
+        """
+        if self._watch_task is not None and not self._watch_task.done():
+            return
+        self._watch_task = asyncio.create_task(
+            self._watch(poll_interval), name="skill-registry-watch"
+        )
+
+    async def stop_watching(self) -> None:
+        task, self._watch_task = self._watch_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    @property
+    def watching(self) -> bool:
+        return self._watch_task is not None and not self._watch_task.done()
+
+    async def _watch(self, poll_interval: float) -> None:
+        while True:
+            await asyncio.sleep(poll_interval)
             try:
-                discovered = discover_skills(source)
+                await self.arefresh()
             except Exception:
-                logger.warning(
-                    "Skipping skill source %s during refresh", source, exc_info=True
-                )
+                logger.warning("Skill registry refresh failed", exc_info=True)
+
+    def _apply(
+        self, scanned: dict[Path, tuple[list[Skill], _SourceFiles] | None]
+    ) -> None:
+        # Sources added while a threaded scan ran are absent from ``scanned``
+        # and keep their current state.
+        for source, result in scanned.items():
+            if source not in self._sources:
                 continue
-            for skill in discovered:
+            skills, files = result if result is not None else ([], {})
+            self._source_skills[source] = skills
+            self._source_files[source] = files
+
+        new_by_name: dict[str, Skill] = dict(self._programmatic)
+        for source in self._sources:
+            for skill in self._source_skills.get(source, ()):
                 if skill.name in new_by_name:
                     existing = new_by_name[skill.name]
                     if existing.path != skill.path:
@@ -134,6 +240,8 @@ class SkillRegistry:
                             existing.path,
                         )
                 new_by_name[skill.name] = skill
+        if new_by_name != self._by_name:
+            self._version += 1
         self._by_name = new_by_name
 
     def register(self, skill: Skill) -> None:
@@ -151,6 +259,7 @@ class SkillRegistry:
                 existing.path,
             )
         self._by_name[skill.name] = skill
+        self._version += 1
 
     def get(self, name: str) -> Skill:
         skill = self._by_name.get(name)
@@ -177,7 +286,7 @@ class SkillRegistry:
     @property
     def visible(self) -> list[Skill]:
         """Skills the LLM can see and call (model_invocation not disabled)."""
-        return [s for s in self._by_name.values() if not s.disable_model_invocation]
+        return list(self.catalog.skills)
 
     # ---- Catalog selector ----------------------------------------------------
 
@@ -240,6 +349,60 @@ class SkillRegistry:
         )
 
 
+def _fingerprint(path: Path) -> _Fingerprint:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _scan_source(
+    source: Path, known: _SourceFiles, *, strict: bool = False
+) -> tuple[list[Skill], _SourceFiles]:
+    """
+    Discover ``source`` like :func:`discover_skills`, reusing every skill in
+    ``known`` whose file fingerprint is unchanged. With ``strict``, a malformed
+    explicit ``SKILL.md`` raises instead of being logged and skipped.
+    """
+    explicit = is_explicit_skill_source(source)
+    skills: list[Skill] = []
+    files: _SourceFiles = {}
+    for skill_md in find_skill_files(source):
+        try:
+            fingerprint = _fingerprint(skill_md)
+        except OSError:
+            continue  # removed mid-walk
+        hit = known.get(skill_md)
+        if hit is not None and hit[0] == fingerprint:
+            skill = hit[1]
+        else:
+            try:
+                skill = load_skill_md(skill_md)
+            except SkillFormatError:
+                if strict and explicit:
+                    raise
+                logger.exception("Failed to load skill at %s", skill_md)
+                skill = None
+        files[skill_md] = (fingerprint, skill)
+        if skill is not None:
+            skills.append(skill)
+    return skills, files
+
+
+def _scan_sources(
+    sources: Sequence[Path], known: Mapping[Path, _SourceFiles]
+) -> dict[Path, tuple[list[Skill], _SourceFiles] | None]:
+    """Scan every source; ``None`` marks one that could not be walked."""
+    scanned: dict[Path, tuple[list[Skill], _SourceFiles] | None] = {}
+    for source in sources:
+        try:
+            scanned[source] = _scan_source(source, known.get(source, {}))
+        except Exception:
+            logger.warning(
+                "Skipping skill source %s during refresh", source, exc_info=True
+            )
+            scanned[source] = None
+    return scanned
+
+
 def substitute_args(body: str, args: str | Mapping[str, str] | None) -> str:
     """
     Substitute ``$ARGUMENTS`` / ``$ARG_NAME`` placeholders in a skill body.
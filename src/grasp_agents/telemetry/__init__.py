@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .decorators import (
     ATTR_FAILED_ATTEMPTS,
     SpanKind,
@@ -7,12 +12,33 @@ from .decorators import (
     stamp_session_attributes,
     traced,
 )
-from .setup import (
-    SessionSpanProcessor,
-    add_exporter,
-    add_otlp_http_exporter,
-    init_tracing,
-)
+
+if TYPE_CHECKING:
+    from .setup import (
+        SessionSpanProcessor,
+        add_exporter,
+        add_otlp_http_exporter,
+        init_tracing,
+    )
+
+# The tracing setup needs the OpenTelemetry *SDK*, which is far heavier than
+# the API the decorators use; it loads on first access of one of these names.
+_LAZY: dict[str, str] = {
+    "SessionSpanProcessor": "setup",
+    "add_exporter": "setup",
+    "add_otlp_http_exporter": "setup",
+    "init_tracing": "setup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "ATTR_FAILED_ATTEMPTS",
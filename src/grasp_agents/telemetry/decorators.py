@@ -26,6 +26,8 @@ from opentelemetry.context import (
 from opentelemetry.trace.propagation import set_span_in_context
 from pydantic import BaseModel
 
+from grasp_agents.grasp_logging import redact_secrets
+
 logger = getLogger(__name__)
 
 # The plain-string twin of the context-api key above, read by older OTel
@@ -430,7 +432,9 @@ def _handle_span_input(
                 default=str,
                 indent=2,
             )
-            span.set_attribute(ATTR_ENTITY_INPUT, _truncate_if_needed(json_input))
+            span.set_attribute(
+                ATTR_ENTITY_INPUT, _truncate_if_needed(redact_secrets(json_input))
+            )
     except (TypeError, ValueError, RecursionError) as e:
         # Telemetry serialization must never fail the traced call. json.dumps
         # raises ValueError on circular refs and RecursionError on deeply
@@ -452,7 +456,9 @@ def _handle_span_output(
                 default=str,
                 indent=2,
             )
-            span.set_attribute(ATTR_ENTITY_OUTPUT, _truncate_if_needed(json_output))
+            span.set_attribute(
+                ATTR_ENTITY_OUTPUT, _truncate_if_needed(redact_secrets(json_output))
+            )
     except (TypeError, ValueError, RecursionError) as e:
         # Telemetry serialization must never fail the traced call. json.dumps
         # raises ValueError on circular refs and RecursionError on deeply
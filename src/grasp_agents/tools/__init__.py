@@ -9,6 +9,7 @@ Built-in tool packages for grasp-agents.
 - :class:`RunCell` — execute a notebook code cell in a live kernel.
 - :class:`RunPython` — run ad-hoc Python in a live kernel (code-interpreter).
 - :class:`KillTask` — stop any backgrounded tool call by its ``task_id``.
+- :class:`ToolResultCache` — session-wide memo of idempotent tool results.
 
 These are imported lazily (PEP 562) so importing :mod:`grasp_agents.tools`
 doesn't pull in the file tools (and their ripgrep-availability checks) or the
@@ -35,6 +36,7 @@ if TYPE_CHECKING:
     from .function_tool import FunctionTool, function_tool
     from .notebook_exec import RunCell, RunCellInput
     from .processor_tool import ProcessorTool
+    from .result_cache import ToolResultCache
     from .task_tools import KillTask
 
 
@@ -58,6 +60,7 @@ _LAZY: dict[str, str] = {
     "RunCell": "notebook_exec",
     "RunCellInput": "notebook_exec",
     "KillTask": "task_tools",
+    "ToolResultCache": "result_cache",
 }
 
 
@@ -89,6 +92,7 @@ __all__ = [
     "RunPython",
     "RunPythonInput",
     "ToolProgressCallback",
+    "ToolResultCache",
     "bash_tools",
     "function_tool",
 ]
@@ -1,10 +1,11 @@
+from __future__ import annotations
+
 import asyncio
 import copy as copy_mod
 import logging
 import posixpath
 import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Sequence
 from pathlib import PurePosixPath
 from typing import (
     TYPE_CHECKING,
@@ -19,23 +20,31 @@ from typing import (
 from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from grasp_agents import grasp_logging
-from grasp_agents.session_context import SessionContext
 from grasp_agents.telemetry import SpanKind, traced
 from grasp_agents.types.events import (
     Event,
     ToolErrorEvent,
     ToolErrorInfo,
+    ToolOutputEvent,
     ToolStreamEvent,
 )
 from grasp_agents.utils.errors import format_error_chain
 from grasp_agents.utils.generics import AutoInstanceAttributesMixin
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Hashable, Sequence
+
     from grasp_agents.agent.agent_context import AgentContext
     from grasp_agents.durability.checkpoints import CheckpointKind
+    from grasp_agents.session_context import SessionContext
+
+    from .result_cache import ToolResultCache
 
 logger = logging.getLogger(__name__)
 
+# Session cache, entry key, dependency fingerprint, write generation.
+type _MemoProbe = tuple[ToolResultCache, str, Hashable, int]
+
 
 class NamedToolChoice(BaseModel):
     name: str
@@ -85,6 +94,19 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
     # search results, command output, a third-party or MCP server. Default
     # False (the tool returns the agent's / app's own trusted output).
     untrusted_output: bool = False
+    # Cap on how many calls of this tool one foreground batch runs at once
+    # (e.g. a rate-limited API); ``None`` (default) leaves it uncapped apart
+    # from the agent's own ``max_tool_concurrency``.
+    max_concurrency: int | None = None
+    # When True, a repeat call with the same validated input may be answered
+    # from the session's ``SessionContext.tool_cache`` (if one is set) instead
+    # of executing — while :meth:`memo_fingerprint` is unchanged, ``memo_ttl``
+    # seconds have not passed (``None``: no expiry) and no overlapping write
+    # has run since. Only for tools whose result is a function of their input,
+    # their :meth:`memo_scope` and the state the fingerprint captures. Tools
+    # sharing a name and a scope share entries.
+    memoize: bool = False
+    memo_ttl: float | None = None
 
     def __init__(
         self,
@@ -97,6 +119,9 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         max_inline_result_chars: int | None = None,
         has_progress_log: bool = False,
         untrusted_output: bool | None = None,
+        max_concurrency: int | None = None,
+        memoize: bool | None = None,
+        memo_ttl: float | None = None,
         tracing_enabled: bool = True,
         tracing_exclude_input_fields: set[str] | None = None,
     ) -> None:
@@ -153,12 +178,20 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         self.has_progress_log = has_progress_log
         if untrusted_output is not None:
             self.untrusted_output = untrusted_output
+        if max_concurrency is not None:
+            if max_concurrency < 1:
+                raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+            self.max_concurrency = max_concurrency
+        if memoize is not None:
+            self.memoize = memoize
+        if memo_ttl is not None:
+            self.memo_ttl = memo_ttl
         self.tracing_enabled = tracing_enabled
         self.tracing_exclude_input_fields = tracing_exclude_input_fields
         self.durability_enabled = True
         self._llm_in_type: type[BaseModel] | None = None
 
-    def on_adopted(self, parent: "Any") -> None:
+    def on_adopted(self, parent: Any) -> None:
         """
         Lifecycle hook fired when this tool is attached to a parent
         :class:`Processor`.
@@ -209,7 +242,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> OutT:
         pass
 
@@ -221,10 +254,8 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> AsyncIterator[Event[Any]]:
-        from grasp_agents.types.events import ToolOutputEvent  # noqa: PLC0415
-
         out = await self._run(
             inp,
             ctx=ctx,
@@ -235,6 +266,105 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         )
         yield ToolOutputEvent(data=out, source=self.name, exec_id=exec_id)
 
+    # --- Memoization ---
+
+    def memo_scope(self) -> Hashable:
+        """
+        This instance's configuration that shapes its result beyond the
+        input (a redactor, output caps, …); part of the cache key, so
+        differently configured instances of a tool never serve each other's
+        results. The default ``()`` means the name and input decide it.
+        """
+        return ()
+
+    async def memo_fingerprint(
+        self,
+        inp: InT,
+        *,
+        ctx: SessionContext[CtxT] | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> Hashable:
+        """
+        Fingerprint of the external state a memoized result depends on (file
+        mtimes, a backend generation counter, …); a cached result is served
+        only while it is unchanged. The default ``()`` means the result
+        depends on the input alone. Raising skips the cache for this call —
+        the tool executes and reports the problem itself — so an override
+        should run the same access checks the call would.
+        """
+        del inp, ctx, agent_ctx
+        return ()
+
+    async def on_memo_hit(
+        self,
+        inp: InT,
+        result: OutT,
+        fingerprint: Hashable,
+        *,
+        ctx: SessionContext[CtxT] | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> None:
+        """
+        Replay the per-agent bookkeeping an executed call would have done
+        (e.g. ``Read`` recording the read for read-before-write) when
+        ``result`` is served from the cache. No-op by default.
+        """
+        del inp, result, fingerprint, ctx, agent_ctx
+
+    async def _memo_probe(
+        self,
+        inp: InT,
+        *,
+        ctx: SessionContext[CtxT] | None,
+        agent_ctx: AgentContext | None,
+    ) -> _MemoProbe | None:
+        """
+        The session cache, key and current fingerprint, if this call uses
+        it, and the cache's write generation before the call runs.
+        """
+        cache = ctx.tool_cache if ctx is not None else None
+        if cache is None or not self.memoize:
+            return None
+        generation = cache.generation
+        try:
+            fingerprint = await self.memo_fingerprint(inp, ctx=ctx, agent_ctx=agent_ctx)
+        except Exception:
+            logger.debug("tool %s: no memo fingerprint", self.name, exc_info=True)
+            return None
+        key = cache.make_key(self.name, inp, self.memo_scope())
+        return cache, key, fingerprint, generation
+
+    def _memo_store(
+        self,
+        probe: _MemoProbe,
+        inp: InT,
+        result: OutT,
+        ctx: SessionContext[CtxT] | None,
+    ) -> None:
+        cache, key, fingerprint, generation = probe
+        root = key_root(ctx)
+        # ``since``: a write that overlapped this call may have landed after
+        # the result was computed, so the store is skipped then.
+        cache.put(
+            key,
+            result,
+            fingerprint,
+            read_keys=[
+                absolute_key(k, root) for k in self.concurrency_read_keys(inp) or ()
+            ],
+            ttl=self.memo_ttl,
+            since=generation,
+        )
+
+    def _memo_invalidate(self, inp: InT, ctx: SessionContext[CtxT] | None) -> None:
+        """Drop cached results this call's exclusive keys may have changed."""
+        cache = ctx.tool_cache if ctx is not None else None
+        if cache is None:
+            return
+        if keys := self.concurrency_conflict_keys(inp):
+            root = key_root(ctx)
+            cache.invalidate([absolute_key(k, root) for k in keys])
+
     # --- Error handling ---
 
     def _on_error_impl(self, error: Exception) -> ToolErrorInfo:
@@ -301,7 +431,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> OutT | ToolErrorInfo:
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
@@ -311,6 +441,15 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
                     inp.model_dump_json(), full=grasp_logging.LOG_TOOL_INPUT
                 ),
             )
+        probe = await self._memo_probe(inp, ctx=ctx, agent_ctx=agent_ctx)
+        if probe is not None:
+            hit, cached = probe[0].get(probe[1], probe[2])
+            if hit:
+                await self.on_memo_hit(
+                    inp, cached, probe[2], ctx=ctx, agent_ctx=agent_ctx
+                )
+                logger.info("tool %s served from memo", self.name)
+                return cached
         t0 = time.monotonic()
         try:
             coro = self._run(
@@ -327,6 +466,10 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
                 result = await coro
         except Exception as e:
             return self._on_error(e)
+        finally:
+            self._memo_invalidate(inp, ctx)
+        if probe is not None:
+            self._memo_store(probe, inp, result, ctx)
         logger.info("tool %s ok in %.2fs", self.name, time.monotonic() - t0)
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
@@ -346,7 +489,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> AsyncIterator[Event[Any]]:
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
@@ -356,6 +499,18 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
                     inp.model_dump_json(), full=grasp_logging.LOG_TOOL_INPUT
                 ),
             )
+        probe = await self._memo_probe(inp, ctx=ctx, agent_ctx=agent_ctx)
+        if probe is not None:
+            hit, cached = probe[0].get(probe[1], probe[2])
+            if hit:
+                await self.on_memo_hit(
+                    inp, cached, probe[2], ctx=ctx, agent_ctx=agent_ctx
+                )
+                logger.info("tool %s served from memo", self.name)
+                yield ToolOutputEvent(
+                    data=cached, source=self.name, exec_id=exec_id, memoized=True
+                )
+                return
         stream = self._run_stream(
             inp,
             ctx=ctx,
@@ -364,8 +519,17 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
             path=path,
             agent_ctx=agent_ctx,
         )
-        async for event in self._stream_with_timeout(stream, exec_id=exec_id):
-            yield event
+        last: Event[Any] | None = None
+        try:
+            async for event in self._stream_with_timeout(stream, exec_id=exec_id):
+                last = event
+                yield event
+        finally:
+            self._memo_invalidate(inp, ctx)
+        # The tool's own terminal event comes last (nested events bubble
+        # before it); a failure ends in a ToolErrorEvent and isn't cached.
+        if probe is not None and isinstance(last, ToolOutputEvent):
+            self._memo_store(probe, inp, last.data, ctx)
 
     # --- Public API ---
 
@@ -376,7 +540,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         ctx: SessionContext[CtxT] | None = None,
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
         **kwargs: Any,
     ) -> OutT | ToolErrorInfo:
         inp = TypeAdapter(self.in_type).validate_python(kwargs)
@@ -397,7 +561,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> OutT | ToolErrorInfo:
         return await self._run_with_timeout(
             inp,
@@ -417,7 +581,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         exec_id: str | None = None,
         progress_callback: ToolProgressCallback | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
     ) -> AsyncIterator[Event[Any]]:
         dest = agent_ctx.agent_name if agent_ctx else None
         async for event in self._run_stream_with_timeout(
@@ -442,11 +606,25 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         Keys this call needs **exclusive** use of while it runs — filesystem
         paths it writes, or any other hierarchical resource identifier it must
         not share with a concurrent call. ``None`` (default) means no
-        exclusivity is needed and the call is freely parallelizable. The agent
-        loop runs a foreground batch **serially** when two calls declare
-        overlapping keys (the same key, or one nesting under another), so
-        conflicting operations cannot interleave. File writers return their
-        target path; read-only tools declare nothing.
+        exclusivity is needed and the call is freely parallelizable. In a
+        foreground batch the agent loop runs a call only after every earlier
+        call whose keys (exclusive or :meth:`concurrency_read_keys`) overlap
+        these — the same key, or one nesting under another — so conflicting
+        operations cannot interleave; unrelated calls still run concurrently.
+        File writers return their target path; read-only tools declare nothing.
+        """
+        del inp
+        return None
+
+    def concurrency_read_keys(self, inp: InT) -> list[str] | None:
+        """
+        Keys this call reads and must see in a consistent state — shared, not
+        exclusive. Calls that only read overlapping keys run concurrently; a
+        read is ordered against any earlier call in the batch holding an
+        overlapping exclusive key (:meth:`concurrency_conflict_keys`), and a
+        later writer waits for it. ``None`` (default) declares no reads: the
+        call may observe a concurrent write mid-flight. File readers return
+        the path they read.
         """
         del inp
         return None
@@ -471,7 +649,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         return False
 
     @property
-    def checkpoint_kind(self) -> "CheckpointKind | None":
+    def checkpoint_kind(self) -> CheckpointKind | None:
         """
         :class:`CheckpointKind` of the processor this tool wraps, if any.
 
@@ -488,7 +666,7 @@ class BaseTool[InT: BaseModel, OutT, CtxT](AutoInstanceAttributesMixin, ABC):
         ctx: SessionContext[CtxT] | None = None,
         exec_id: str | None = None,
         path: list[str] | None = None,
-        agent_ctx: "AgentContext | None" = None,
+        agent_ctx: AgentContext | None = None,
         tool_call_arguments: str | None = None,
     ) -> AsyncIterator[Event[Any]]:
         """
@@ -555,13 +733,28 @@ def _key_parts(key: str) -> tuple[str, ...]:
     return PurePosixPath(posixpath.normpath(key)).parts
 
 
-def _keys_overlap(a: str, b: str) -> bool:
+def key_root(ctx: SessionContext[Any] | None) -> str | None:
+    """The session file backend's :attr:`FileBackend.relative_root`, if any."""
+    backend = ctx.file_backend if ctx is not None else None
+    root = backend.relative_root if backend is not None else None
+    return root.as_posix() if root is not None else None
+
+
+def absolute_key(key: str, root: str | None) -> str:
+    """``key`` joined onto ``root`` (see :func:`key_root`) when relative."""
+    if root is None or posixpath.isabs(key):
+        return key
+    return posixpath.join(root, key)
+
+
+def keys_overlap(a: str, b: str) -> bool:
     """
     True if two exclusivity keys collide: the same key, or one nests under the
     other (a prefix of POSIX-path parts — so ``/x`` conflicts with ``/x/a``;
-    flat keys conflict only when equal). Keys are normalized lexically, and a
-    relative key collides with an absolute one whose tail it matches —
-    best-effort without a backend root; a false positive only serializes the
+    flat keys conflict only when equal). Keys are normalized lexically.
+    Callers make relative keys absolute first (:func:`absolute_key`); one
+    left relative (no backend root) collides with an absolute key whose tail
+    it matches — best-effort, and a false positive only serializes the
     batch. ``"/"`` claims global exclusivity (mutating exec tools).
     """
     pa = _key_parts(a)
@@ -579,21 +772,48 @@ def _keys_overlap(a: str, b: str) -> bool:
     return False
 
 
-def batch_has_concurrency_conflict(
-    calls: Sequence[tuple[BaseTool[Any, Any, Any], BaseModel]],
+def _calls_conflict(
+    a: tuple[list[str], list[str]], b: tuple[list[str], list[str]]
 ) -> bool:
+    """Whether two ``(exclusive, read)`` key sets collide (read/read is fine)."""
+    a_excl, a_read = a
+    b_excl, b_read = b
+    return any(
+        keys_overlap(x, y)
+        for xs, ys in ((a_excl, b_excl), (a_excl, b_read), (a_read, b_excl))
+        for x in xs
+        for y in ys
+    )
+
+
+def tool_call_dependencies(
+    calls: Sequence[tuple[BaseTool[Any, Any, Any], BaseModel]],
+    *,
+    root: str | None = None,
+) -> list[list[int]]:
     """
-    True if any two calls in a foreground batch declare overlapping exclusivity
-    keys (:meth:`BaseTool.concurrency_conflict_keys`) — the loop then runs the
-    batch serially instead of concurrently.
+    For each call in a foreground batch, the indices of the earlier calls it
+    must wait for: those whose keys conflict with its own — overlapping
+    exclusive keys (:meth:`BaseTool.concurrency_conflict_keys`), or an
+    exclusive key overlapping a read key
+    (:meth:`BaseTool.concurrency_read_keys`). Reads never conflict with reads.
+    Conflicting calls thus run in the order the model issued them, and calls
+    without a path between them in this graph run concurrently. Relative keys
+    are resolved against ``root`` (the backend's, see :func:`key_root`) first.
     """
     declared = [
-        list(keys)
+        (
+            [absolute_key(k, root) for k in tool.concurrency_conflict_keys(inp) or ()],
+            [absolute_key(k, root) for k in tool.concurrency_read_keys(inp) or ()],
+        )
         for tool, inp in calls
-        if (keys := tool.concurrency_conflict_keys(inp))
     ]
-    for i in range(len(declared)):
-        for j in range(i + 1, len(declared)):
-            if any(_keys_overlap(x, y) for x in declared[i] for y in declared[j]):
-                return True
-    return False
+    return [
+        [
+            i
+            for i in range(j)
+            if (declared[i][0] or declared[j][0])
+            and _calls_conflict(declared[i], declared[j])
+        ]
+        for j in range(len(declared))
+    ]
@@ -303,24 +303,25 @@ class RunPython(BaseTool[RunPythonInput, list[InputText | InputImage], Any]):
             else None
         )
 
+        candidates = [
+            base / p if not p.is_absolute() and base is not None else p
+            for p in map(Path, raw_paths)
+        ]
+        validated = await backend.validate_many(
+            candidates, must_exist=True, dotfile_overrides=overrides
+        )
+
         lines: list[str] = []
         n_files = 0
-        for raw in raw_paths:
+        for raw, resolved in zip(raw_paths, validated, strict=True):
             if n_files >= self._max_artifact_files:
                 lines.append(
                     f"… (artifact limit {self._max_artifact_files} reached; "
                     "remaining not shown)"
                 )
                 break
-            p = Path(raw)
-            if not p.is_absolute() and base is not None:
-                p = base / p
-            try:
-                resolved = await backend.validate_path(
-                    p, must_exist=True, dotfile_overrides=overrides
-                )
-            except PathAccessError as exc:
-                lines.append(f"- {raw} — not accessible: {exc}")
+            if isinstance(resolved, PathAccessError):
+                lines.append(f"- {raw} — not accessible: {resolved}")
                 continue
             st = await backend.stat(resolved)
             if await _is_directory(backend, resolved, st):
@@ -328,16 +329,17 @@ class RunPython(BaseTool[RunPythonInput, list[InputText | InputImage], Any]):
                 entries.sort(key=lambda e: e.mtime, reverse=True)
                 if not entries:
                     lines.append(f"- {resolved}/ — (empty directory)")
-                for entry in entries:
-                    if n_files >= self._max_artifact_files:
-                        lines.append(
-                            f"… (artifact limit {self._max_artifact_files} reached)"
-                        )
-                        break
+                shown = entries[: max(0, self._max_artifact_files - n_files)]
+                stats = await backend.stat_many([e.path for e in shown])
+                for entry, entry_st in zip(shown, stats, strict=True):
+                    if entry_st is None:  # vanished since the listing
+                        continue
+                    lines.append(_file_reference_line(entry.path, entry_st))
+                    n_files += 1
+                if len(shown) < len(entries):
                     lines.append(
-                        _file_reference_line(entry.path, await backend.stat(entry.path))
+                        f"… (artifact limit {self._max_artifact_files} reached)"
                     )
-                    n_files += 1
             else:
                 lines.append(_file_reference_line(resolved, st))
                 n_files += 1
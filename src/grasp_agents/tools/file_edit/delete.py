@@ -152,6 +152,6 @@ class DeleteTool(BaseTool[DeleteInput, DeleteResult, Any]):
 
         await backend.delete(resolved)
         if state is not None:
-            state.read_file_state.pop(resolved, None)
+            state.record_delete(resolved)
 
         return DeleteResult(path=str(resolved), deleted=True)
@@ -28,7 +28,7 @@ read-before-write check.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel, Field
 
@@ -36,7 +36,10 @@ from grasp_agents.file_backend.paths import PathAccessError, has_binary_extensio
 from grasp_agents.tools.base import BaseTool, ToolProgressCallback
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from grasp_agents.agent.agent_context import AgentContext
+    from grasp_agents.file_backend.base import FileBackend
     from grasp_agents.session_context import SessionContext
 
     from .redact import SecretRedactor
@@ -159,6 +162,8 @@ class ReadTool(BaseTool[ReadInput, ReadResult, Any]):
         "when more lines exist than were returned — page with `offset`)."
     )
     untrusted_output = True
+    # Exact: a served result is keyed on the file's current mtime and size.
+    memoize = True
 
     def __init__(
         self,
@@ -175,18 +180,49 @@ class ReadTool(BaseTool[ReadInput, ReadResult, Any]):
         self._max_read_chars = max_read_chars
         self._max_file_bytes = max_file_bytes
 
-    async def _run(
+    def memo_scope(self) -> Hashable:
+        from .redact import redactor_memo_scope  # noqa: PLC0415
+
+        return (
+            redactor_memo_scope(self._redactor),
+            self._max_read_chars,
+            self._max_file_bytes,
+        )
+
+    async def memo_fingerprint(
         self,
         inp: ReadInput,
         *,
         ctx: SessionContext[Any] | None = None,
-        exec_id: str | None = None,
-        progress_callback: ToolProgressCallback | None = None,
-        path: list[str] | None = None,
         agent_ctx: AgentContext | None = None,
-    ) -> ReadResult:
-        del exec_id, progress_callback, path
+    ) -> Hashable:
+        # Same access checks as a real read, then the file's current version.
+        backend, resolved = await self._resolve(inp, ctx, agent_ctx)
+        stat = await backend.stat(resolved)
+        return resolved, stat.mtime, stat.size
 
+    async def on_memo_hit(
+        self,
+        inp: ReadInput,
+        result: ReadResult,
+        fingerprint: Hashable,
+        *,
+        ctx: SessionContext[Any] | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> None:
+        # A served read still counts as this agent having read the file
+        # (read-before-write + staleness baseline).
+        del inp, result, ctx
+        if agent_ctx is not None:
+            resolved, mtime, _ = cast("tuple[Path, float, int]", fingerprint)
+            agent_ctx.file_edit_state.record_read(resolved, mtime)
+
+    async def _resolve(
+        self,
+        inp: ReadInput,
+        ctx: SessionContext[Any] | None,
+        agent_ctx: AgentContext | None,
+    ) -> tuple[FileBackend, Path]:
         if ctx is None or ctx.file_backend is None:
             raise ValueError(
                 "Read requires ctx.file_backend. Wire a FileBackend on "
@@ -214,6 +250,25 @@ class ReadTool(BaseTool[ReadInput, ReadResult, Any]):
             )
         except PathAccessError as exc:
             raise ValueError(str(exc)) from exc
+        return backend, resolved
+
+    def concurrency_read_keys(self, inp: ReadInput) -> list[str] | None:
+        return [inp.path]
+
+    async def _run(
+        self,
+        inp: ReadInput,
+        *,
+        ctx: SessionContext[Any] | None = None,
+        exec_id: str | None = None,
+        progress_callback: ToolProgressCallback | None = None,
+        path: list[str] | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> ReadResult:
+        del exec_id, progress_callback, path
+
+        backend, resolved = await self._resolve(inp, ctx, agent_ctx)
+        state = agent_ctx.file_edit_state if agent_ctx is not None else None
 
         # A notebook is JSON; show its cell-structured view (never raw JSON)
         # so the model can target cells by id in a subsequent NotebookEdit.
@@ -86,6 +86,9 @@ class ReadImageTool(BaseTool[ReadImageInput, list[InputText | InputImage], Any])
         super().__init__(timeout=timeout)
         self._max_image_bytes = max_image_bytes
 
+    def concurrency_read_keys(self, inp: ReadImageInput) -> list[str] | None:
+        return [inp.path]
+
     async def _run(
         self,
         inp: ReadImageInput,
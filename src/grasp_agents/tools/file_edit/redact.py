@@ -23,7 +23,9 @@ Consumers with higher-risk workloads can plug in a richer implementation
 
 from __future__ import annotations
 
+import itertools
 import re
+import weakref
 from typing import Protocol, runtime_checkable
 
 
@@ -109,3 +111,26 @@ class DefaultSecretRedactor:
         for _kind, pattern, replacement in _PATTERNS:
             text = pattern.sub(replacement, text)
         return text
+
+
+_STATELESS_REDACTORS: tuple[type, ...] = (NullRedactor, DefaultSecretRedactor)
+_redactor_serials: weakref.WeakKeyDictionary[object, int] = weakref.WeakKeyDictionary()
+_next_serial = itertools.count(1)
+
+
+def redactor_memo_scope(redactor: SecretRedactor) -> str:
+    """
+    Identity of ``redactor`` for a memoized tool's ``memo_scope``: the
+    built-in redactors are stateless, so any two of a type redact alike;
+    any other redactor is told apart per instance (by a serial, never an
+    ``id`` that a later object could reuse).
+    """
+    if type(redactor) in _STATELESS_REDACTORS:
+        return type(redactor).__qualname__
+    try:
+        serial = _redactor_serials.get(redactor)
+        if serial is None:
+            serial = _redactor_serials[redactor] = next(_next_serial)
+    except TypeError:  # not weak-referenceable: pinned to this object's id
+        return f"{type(redactor).__qualname__}@{id(redactor):x}"
+    return f"{type(redactor).__qualname__}#{serial}"
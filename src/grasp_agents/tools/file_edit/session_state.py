@@ -28,6 +28,10 @@ What is **deliberately absent** — and why:
 - **No consecutive-read loop counter.** ``AgentLoop.max_turns`` bounds
   true runaway; per-tool loop detection would interfere with legitimate
   re-reads.
+
+Write listeners (:meth:`FileEditSessionState.add_write_listener`) are not
+state: they let a cache over files the agent edits (e.g. the memory
+snapshot) invalidate exactly the paths the agent's own tools changed.
 """
 
 from __future__ import annotations
@@ -37,7 +41,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
 # Cap on ``read_file_state`` to bound memory growth on long sessions.
 # Eviction policy: oldest-first (dict insertion order in Python 3.7+).
@@ -66,6 +70,23 @@ class FileEditSessionState:
 
     read_file_state_cap: int = DEFAULT_READ_FILE_STATE_CAP
 
+    # Called with the resolved path after every recorded write / delete.
+    _write_listeners: list[Callable[[Path], None]] = field(
+        default_factory=list["Callable[[Path], None]"],
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def add_write_listener(self, listener: Callable[[Path], None]) -> None:
+        """Call ``listener(path)`` whenever a tool writes or deletes ``path``."""
+        if listener not in self._write_listeners:
+            self._write_listeners.append(listener)
+
+    def remove_write_listener(self, listener: Callable[[Path], None]) -> None:
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+
     def record_read(self, resolved_path: Path, mtime: float) -> None:
         """Record a successful ``Read`` — updates ``read_file_state``."""
         self.read_file_state[resolved_path] = ReadRecord(mtime=mtime)
@@ -84,6 +105,16 @@ class FileEditSessionState:
         from the first edit's pre-write record.
         """
         self.read_file_state[resolved_path] = ReadRecord(mtime=mtime)
+        self._notify_write(resolved_path)
+
+    def record_delete(self, resolved_path: Path) -> None:
+        """Forget ``resolved_path`` after a successful ``Delete``."""
+        self.read_file_state.pop(resolved_path, None)
+        self._notify_write(resolved_path)
+
+    def _notify_write(self, resolved_path: Path) -> None:
+        for listener in tuple(self._write_listeners):
+            listener(resolved_path)
 
     def add_dotfile_override(self, resolved_path: Path) -> None:
         self.dotfile_overrides.add(resolved_path)
@@ -29,8 +29,10 @@ from grasp_agents.file_backend.paths import PathAccessError
 from grasp_agents.tools.base import BaseTool, ToolProgressCallback
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from grasp_agents.agent.agent_context import AgentContext
-    from grasp_agents.file_backend.base import FileStat
+    from grasp_agents.file_backend.base import FileBackend, FileStat
     from grasp_agents.session_context import SessionContext
 
 
@@ -56,6 +58,9 @@ def _is_directory(stat: FileStat) -> bool:
 # the shape of the repo" against "context bloat". Callers raise via the
 # constructor when a larger budget is needed.
 DEFAULT_HEAD_LIMIT = 250
+# How long a memoized search result may be served (seconds) when
+# memoization is opted into.
+DEFAULT_MEMO_TTL = 30.0
 
 
 class GlobInput(BaseModel):
@@ -109,29 +114,43 @@ class GlobTool(BaseTool[GlobInput, GlobResult, Any]):
         "``truncated``."
     )
 
+    # Search trees have no cheap content fingerprint: a memoized result is
+    # keyed on the (re-validated) root and bounded by ``memo_ttl`` and by the
+    # session's own writes, so a change made elsewhere (another process, an
+    # editor) goes unseen until it expires. Hence opt-in (``memoize=True``).
+    memo_ttl = DEFAULT_MEMO_TTL
+
     def __init__(
         self,
         *,
         head_limit: int = DEFAULT_HEAD_LIMIT,
         include_hidden: bool = False,
         timeout: float | None = None,
+        memoize: bool = False,
     ) -> None:
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, memoize=memoize)
         self._head_limit = head_limit
         self._include_hidden = include_hidden
 
-    async def _run(
+    def memo_scope(self) -> Hashable:
+        return self._head_limit, self._include_hidden
+
+    async def memo_fingerprint(
         self,
         inp: GlobInput,
         *,
         ctx: SessionContext[Any] | None = None,
-        exec_id: str | None = None,
-        progress_callback: ToolProgressCallback | None = None,
-        path: list[str] | None = None,
         agent_ctx: AgentContext | None = None,
-    ) -> GlobResult:
-        del exec_id, progress_callback, path
+    ) -> Hashable:
+        _, resolved = await self._resolve_root(inp, ctx, agent_ctx)
+        return resolved
 
+    async def _resolve_root(
+        self,
+        inp: GlobInput,
+        ctx: SessionContext[Any] | None,
+        agent_ctx: AgentContext | None,
+    ) -> tuple[FileBackend, Path]:
         if ctx is None or ctx.file_backend is None:
             raise ValueError(
                 "Glob requires ctx.file_backend. Wire a FileBackend on "
@@ -161,6 +180,25 @@ class GlobTool(BaseTool[GlobInput, GlobResult, Any]):
             )
         except PathAccessError as exc:
             raise ValueError(str(exc)) from exc
+        return backend, resolved
+
+    def concurrency_read_keys(self, inp: GlobInput) -> list[str] | None:
+        # No ``path`` searches the default root — treat it as the workspace.
+        return [inp.path or "/"]
+
+    async def _run(
+        self,
+        inp: GlobInput,
+        *,
+        ctx: SessionContext[Any] | None = None,
+        exec_id: str | None = None,
+        progress_callback: ToolProgressCallback | None = None,
+        path: list[str] | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> GlobResult:
+        del exec_id, progress_callback, path
+
+        backend, resolved = await self._resolve_root(inp, ctx, agent_ctx)
 
         stat = await backend.stat(resolved)
         if not _is_directory(stat):
@@ -41,11 +41,17 @@ from grasp_agents.file_backend.paths import PathAccessError
 from grasp_agents.tools.base import BaseTool, ToolProgressCallback
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from grasp_agents.agent.agent_context import AgentContext
+    from grasp_agents.file_backend.base import FileBackend
     from grasp_agents.session_context import SessionContext
     from grasp_agents.tools.file_edit.redact import SecretRedactor
 
 DEFAULT_HEAD_LIMIT = 250
+# How long a memoized search result may be served (seconds) when
+# memoization is opted into.
+DEFAULT_MEMO_TTL = 30.0
 
 # Cap on total bytes we'll read from rg's stdout. A runaway match could
 # return hundreds of MB; refuse with guidance to narrow the query.
@@ -450,13 +456,20 @@ class GrepTool(BaseTool[GrepInput, GrepResult, Any]):
     )
     untrusted_output = True
 
+    # Search trees have no cheap content fingerprint: a memoized result is
+    # keyed on the (re-validated) root and bounded by ``memo_ttl`` and by the
+    # session's own writes, so a change made elsewhere (another process, an
+    # editor) goes unseen until it expires. Hence opt-in (``memoize=True``).
+    memo_ttl = DEFAULT_MEMO_TTL
+
     def __init__(
         self,
         *,
         timeout: float | None = None,
         redactor: SecretRedactor | None = None,
+        memoize: bool = False,
     ) -> None:
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, memoize=memoize)
         # Same redaction pass Read applies — content mode returns file
         # contents, so it must not leak what Read would have redacted. Pass
         # NullRedactor to opt out.
@@ -466,18 +479,29 @@ class GrepTool(BaseTool[GrepInput, GrepResult, Any]):
 
         self._redactor: SecretRedactor = redactor or DefaultSecretRedactor()
 
-    async def _run(
+    def memo_scope(self) -> Hashable:
+        from grasp_agents.tools.file_edit.redact import (  # noqa: PLC0415
+            redactor_memo_scope,
+        )
+
+        return redactor_memo_scope(self._redactor)
+
+    async def memo_fingerprint(
         self,
         inp: GrepInput,
         *,
         ctx: SessionContext[Any] | None = None,
-        exec_id: str | None = None,
-        progress_callback: ToolProgressCallback | None = None,
-        path: list[str] | None = None,
         agent_ctx: AgentContext | None = None,
-    ) -> GrepResult:
-        del exec_id, progress_callback, path
+    ) -> Hashable:
+        _, resolved = await self._resolve_root(inp, ctx, agent_ctx)
+        return resolved
 
+    async def _resolve_root(
+        self,
+        inp: GrepInput,
+        ctx: SessionContext[Any] | None,
+        agent_ctx: AgentContext | None,
+    ) -> tuple[FileBackend, Path]:
         if ctx is None or ctx.file_backend is None:
             raise ValueError(
                 "Grep requires ctx.file_backend. Wire a FileBackend on "
@@ -507,6 +531,25 @@ class GrepTool(BaseTool[GrepInput, GrepResult, Any]):
             )
         except PathAccessError as exc:
             raise ValueError(str(exc)) from exc
+        return backend, resolved
+
+    def concurrency_read_keys(self, inp: GrepInput) -> list[str] | None:
+        # No ``path`` searches the default root — treat it as the workspace.
+        return [inp.path or "/"]
+
+    async def _run(
+        self,
+        inp: GrepInput,
+        *,
+        ctx: SessionContext[Any] | None = None,
+        exec_id: str | None = None,
+        progress_callback: ToolProgressCallback | None = None,
+        path: list[str] | None = None,
+        agent_ctx: AgentContext | None = None,
+    ) -> GrepResult:
+        del exec_id, progress_callback, path
+
+        backend, resolved = await self._resolve_root(inp, ctx, agent_ctx)
 
         raw = await backend.grep(
             root=resolved,
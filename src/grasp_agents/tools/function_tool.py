@@ -33,6 +33,8 @@ from pydantic import BaseModel, create_model
 from grasp_agents.tools.base import BaseTool, ToolProgressCallback
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from grasp_agents.agent.agent_context import AgentContext
     from grasp_agents.session_context import SessionContext
 
@@ -93,6 +95,8 @@ class FunctionTool(BaseTool[BaseModel, Any, Any]):
         blocks_final_answer: bool = True,
         max_inline_result_chars: int | None = None,
         untrusted_output: bool = False,
+        memoize: bool = False,
+        memo_ttl: float | None = None,
     ) -> None:
         super().__init__(
             name=name,
@@ -102,6 +106,8 @@ class FunctionTool(BaseTool[BaseModel, Any, Any]):
             blocks_final_answer=blocks_final_answer,
             max_inline_result_chars=max_inline_result_chars,
             untrusted_output=untrusted_output,
+            memoize=memoize,
+            memo_ttl=memo_ttl,
         )
         self._fn = fn
         self._resolved_in_type = input_model
@@ -118,6 +124,10 @@ class FunctionTool(BaseTool[BaseModel, Any, Any]):
     def in_type(self) -> type[BaseModel]:
         return self._resolved_in_type
 
+    def memo_scope(self) -> Hashable:
+        # Two functions registered under one tool name must not share results.
+        return f"{self._fn.__module__}.{self._fn.__qualname__}"
+
     async def _run(
         self,
         inp: BaseModel,
@@ -156,6 +166,8 @@ def function_tool(
     blocks_final_answer: bool = True,
     max_inline_result_chars: int | None = None,
     untrusted_output: bool = False,
+    memoize: bool = False,
+    memo_ttl: float | None = None,
 ) -> Any: ...
 
 
@@ -170,6 +182,8 @@ def function_tool(
     blocks_final_answer: bool = True,
     max_inline_result_chars: int | None = None,
     untrusted_output: bool = False,
+    memoize: bool = False,
+    memo_ttl: float | None = None,
 ) -> Any:
     """
     Create a BaseTool from a function.
@@ -181,6 +195,10 @@ def function_tool(
 
         @function_tool(name="calculator", timeout=5.0)
         async def add(a: int, b: int) -> int: ...
+
+    ``memoize=True`` declares the function deterministic: with a
+    ``SessionContext.tool_cache`` set, a repeat call with the same arguments
+    is answered from the cache (for ``memo_ttl`` seconds, if given).
     """
 
     def _wrap(f: Any) -> FunctionTool:
@@ -205,6 +223,8 @@ def function_tool(
             blocks_final_answer=blocks_final_answer,
             max_inline_result_chars=max_inline_result_chars,
             untrusted_output=untrusted_output,
+            memoize=memoize,
+            memo_ttl=memo_ttl,
         )
 
     if fn is not None:
@@ -1,15 +1,20 @@
-from collections.abc import AsyncIterator
-from typing import Any, ClassVar
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import BaseModel
 
-from grasp_agents.agent.agent_context import AgentContext
-from grasp_agents.durability.checkpoints import CheckpointKind
-from grasp_agents.processors.processor import Processor
-from grasp_agents.session_context import SessionContext
 from grasp_agents.tools.base import BaseTool, ToolProgressCallback
 from grasp_agents.types.events import Event, ProcPacketOutEvent, ToolOutputEvent
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from grasp_agents.agent.agent_context import AgentContext
+    from grasp_agents.durability.checkpoints import CheckpointKind
+    from grasp_agents.processors.processor import Processor
+    from grasp_agents.session_context import SessionContext
+
 
 class ProcessorTool[InT: BaseModel, OutT, CtxT](BaseTool[InT, OutT, CtxT]):
     """A tool that wraps a processor (or agent) for use inside an agent loop."""
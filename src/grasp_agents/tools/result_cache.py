@@ -0,0 +1,248 @@
+"""
+Session-wide memoization of idempotent tool results.
+
+Agents re-``Read`` the same file, re-``Grep`` the same pattern and re-call the
+same deterministic function across turns, branches and team members. A
+:class:`ToolResultCache` set on ``SessionContext.tool_cache`` lets a tool that
+declares itself memoizable (:attr:`BaseTool.memoize`) answer such a repeat from
+the previous result instead of executing again.
+
+An entry is keyed by the tool name, the instance's configuration that shapes
+its result (:meth:`BaseTool.memo_scope` — e.g. ``Read``'s redactor and size
+caps) and its canonicalized validated input, and is only served while three
+things hold:
+
+* the tool's **dependency fingerprint** (:meth:`BaseTool.memo_fingerprint` —
+  e.g. the resolved path and its backend ``mtime`` for ``Read``) is unchanged;
+* its **TTL** (:attr:`BaseTool.memo_ttl`), if any, has not elapsed;
+* no call holding an overlapping **exclusive key**
+  (:meth:`BaseTool.concurrency_conflict_keys` — a ``Write`` of the path, a
+  ``Bash`` command's ``"/"``) has finished since. Entries remember the
+  tool's :meth:`BaseTool.concurrency_read_keys` for this; a result whose
+  call overlapped such a write is not stored at all, since it may predate
+  the write.
+
+The cache is bounded by the serialized size of what it holds (``max_chars``:
+each entry's key plus its result rendered as JSON); the least recently used
+entries go first, and a result larger than the whole bound is not stored. A
+served result is marked on its :class:`ToolOutputEvent` (``memoized=True``), so
+consumers can tell a replay from an execution.
+
+Results are usually mutable models, so a mutable result is copied on the way in
+(the tool's caller keeps the original and may change it) and on every hit (the
+agent that is served it may change it). Immutable results — strings, bytes,
+numbers and tuples of them — are stored and served as-is.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .base import keys_overlap
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+# Serialized characters held across all entries.
+DEFAULT_MAX_CHARS = 16_000_000
+# Recent writes remembered for :meth:`ToolResultCache.put`'s ``since`` check;
+# a call that outlives more writes than this is not stored.
+_WRITE_LOG_SIZE = 256
+
+
+_IMMUTABLE_ATOMS = (str, bytes, int, float, complex, bool, type(None))
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    value: Any
+    fingerprint: Hashable
+    read_keys: tuple[str, ...]
+    expires_at: float | None
+    size: int
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_ATOMS):
+        return True
+    if isinstance(value, tuple | frozenset):
+        return all(_is_immutable(v) for v in value)  # pyright: ignore[reportUnknownVariableType]
+    return False
+
+
+def _serialized_size(value: Any) -> int:
+    """Characters of ``value`` rendered as JSON (its ``repr`` if it has none)."""
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class ToolResultCache:
+    """
+    Bounded, session-scoped store of memoized tool results.
+
+    Share one instance across the agents of a session by setting it on
+    ``SessionContext.tool_cache``; tools consult it only when they opt in
+    via :attr:`BaseTool.memoize`.
+    """
+
+    def __init__(self, *, max_chars: int = DEFAULT_MAX_CHARS) -> None:
+        if max_chars < 1:
+            raise ValueError(f"max_chars must be >= 1, got {max_chars}")
+        self._max_chars = max_chars
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._chars = 0
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+        self._writes: deque[tuple[int, tuple[str, ...]]] = deque(maxlen=_WRITE_LOG_SIZE)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def generation(self) -> int:
+        """Count of writes :meth:`invalidate` has seen (see ``put``'s ``since``)."""
+        return self._generation
+
+    @property
+    def size_chars(self) -> int:
+        """Serialized size of the held entries (bounded by ``max_chars``)."""
+        return self._chars
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(tool_name: str, inp: BaseModel, scope: Hashable = ()) -> str:
+        """
+        Tool name + the tool instance's ``scope`` (its ``repr``) + the
+        validated input as canonical (key-sorted) JSON.
+        """
+        payload = json.dumps(
+            inp.model_dump(mode="json"),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return f"{tool_name}:{scope!r}:{payload}"
+
+    def get(self, key: str, fingerprint: Hashable) -> tuple[bool, Any]:
+        """
+        ``(True, result)`` for a live entry under ``key`` recorded with the
+        same ``fingerprint``, else ``(False, None)``. A mutable result is
+        a copy, so a caller mutating it can't corrupt later hits.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (
+            entry.fingerprint != fingerprint
+            or (entry.expires_at is not None and time.monotonic() >= entry.expires_at)
+        ):
+            self._drop(key)
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        if _is_immutable(entry.value):
+            return True, entry.value
+        return True, copy.deepcopy(entry.value)
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        fingerprint: Hashable,
+        *,
+        read_keys: Iterable[str] = (),
+        ttl: float | None = None,
+        since: int | None = None,
+    ) -> None:
+        """
+        Record ``value`` for ``key``, evicting the least recently used
+        entries past ``max_chars``.
+
+        ``since`` is the :attr:`generation` read before ``value`` was
+        computed: if a write overlapping ``read_keys`` was invalidated after
+        it, ``value`` may predate that write and is not recorded.
+        """
+        read_keys = tuple(read_keys)
+        if since is not None and self._written_since(since, read_keys):
+            return
+        self._drop(key)
+        size = len(key) + _serialized_size(value)
+        if size > self._max_chars:
+            return
+        self._entries[key] = _Entry(
+            value=value if _is_immutable(value) else copy.deepcopy(value),
+            fingerprint=fingerprint,
+            read_keys=read_keys,
+            expires_at=time.monotonic() + ttl if ttl is not None else None,
+            size=size,
+        )
+        self._chars += size
+        while self._chars > self._max_chars:
+            _, evicted = self._entries.popitem(last=False)
+            self._chars -= evicted.size
+
+    def invalidate(self, keys: Iterable[str]) -> int:
+        """
+        Drop entries whose read keys overlap any of ``keys`` (the exclusive
+        keys of a call that just ran). Returns how many were dropped.
+        """
+        written = tuple(keys)
+        if not written:
+            return 0
+        self._generation += 1
+        self._writes.append((self._generation, written))
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if any(keys_overlap(r, w) for r in entry.read_keys for w in written)
+        ]
+        for key in stale:
+            self._drop(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._chars = 0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._chars -= entry.size
+
+    def _written_since(self, generation: int, read_keys: tuple[str, ...]) -> bool:
+        if not read_keys or generation == self._generation:
+            return False
+        if self._generation - generation > len(self._writes):
+            return True  # the log no longer reaches back that far
+        return any(
+            keys_overlap(r, w)
+            for gen, written in self._writes
+            if gen > generation
+            for w in written
+            for r in read_keys
+        )
+
+
+__all__ = ["DEFAULT_MAX_CHARS", "ToolResultCache"]
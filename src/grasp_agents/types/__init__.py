@@ -1,3 +1,4 @@
+from .blobs import BlobNotFoundError, BlobRef, BlobStore
 from .content import (
     Annotation,
     AnnotationContainerFileCitation,
@@ -120,6 +121,9 @@ __all__ = [
     "BackgroundTaskCompletedEvent",
     "BackgroundTaskInfo",
     "BackgroundTaskLaunchedEvent",
+    "BlobNotFoundError",
+    "BlobRef",
+    "BlobStore",
     "BranchError",
     "CompactionEvent",
     "CompactionInfo",
@@ -0,0 +1,258 @@
+"""
+Content-addressed storage for large content-part payloads.
+
+An image's base64 data or a file's inline ``file_data`` can run to megabytes.
+Inline in an ``InputItem`` it is re-serialized into every checkpoint write,
+re-encoded by the provider converter on every turn and re-sized by token
+counting. A :class:`BlobStore` takes such payloads out of the transcript:
+:meth:`BlobStore.offload` swaps a part's payload for a :class:`BlobRef` (its
+sha256 and length) and stores the payload once under ``root`` — the same image
+seen by several agents, or carried turn after turn, is one file and one string
+in memory.
+
+A blob-backed part resolves its payload through whichever store open in this
+process holds the digest (:func:`find_blob_store`), so a transcript restored
+from a checkpoint resolves against the session's store. A process without one
+cannot resolve it: a part handed to another process goes as a copy with its
+payload inline (``InputImage.inlined`` / ``InputFile.inlined`` — the process
+pool's frames do this for every part they carry). Values derived from a
+payload — a provider's encoding of it, a token estimate — are memoized per blob
+with :meth:`BlobStore.memo` and share the payload's bounded in-memory cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict
+
+from grasp_agents.file_backend.atomic_write import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from os import PathLike
+
+    from .content import InputPart
+    from .items import InputItem
+
+# Payloads at least this many characters long are offloaded.
+DEFAULT_MIN_BLOB_CHARS = 32 * 1024
+# Budget (in characters / bytes) for payloads and memoized values in memory.
+DEFAULT_MAX_CACHED_CHARS = 256 * 1024 * 1024
+
+# Cache kind of a payload itself (memoized values use their own kinds).
+_PAYLOAD = "payload"
+
+_LIVE_STORES: weakref.WeakSet[BlobStore] = weakref.WeakSet()
+
+
+class BlobRef(BaseModel):
+    """A content part's payload, stored out of line by content hash."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # sha256 hex digest of the UTF-8 payload.
+    digest: str
+    # Payload length in characters — sizes the part without loading it.
+    size: int
+
+
+class BlobNotFoundError(LookupError):
+    """No open :class:`BlobStore` holds a referenced payload."""
+
+
+class BlobStore:
+    """
+    Local-disk, content-addressed store for large part payloads.
+
+    Payloads live at ``<root>/<digest[:2]>/<digest>`` and are written once
+    (atomically, ``fsync``-ed) no matter how often they are offloaded.
+    Recently used payloads and values memoized from them are kept in memory up
+    to ``max_cached_chars``; an evicted payload is re-read from disk.
+
+    Set one on ``SessionContext.blob_store`` and agents offload large image /
+    file parts of their inputs and tool results as they enter the transcript.
+    """
+
+    def __init__(
+        self,
+        root: str | PathLike[str],
+        *,
+        min_chars: int = DEFAULT_MIN_BLOB_CHARS,
+        max_cached_chars: int = DEFAULT_MAX_CACHED_CHARS,
+    ) -> None:
+        if min_chars < 1:
+            raise ValueError(f"min_chars must be >= 1, got {min_chars}")
+        self._root = Path(root).resolve()
+        self._min_chars = min_chars
+        self._max_cached_chars = max_cached_chars
+        self._cache: OrderedDict[tuple[str, str], tuple[Any, int]] = OrderedDict()
+        self._cached_chars = 0
+        self._known: set[str] = set()
+        # Offloading runs on worker threads; resolution on the event loop.
+        self._lock = threading.Lock()
+        _LIVE_STORES.add(self)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def min_chars(self) -> int:
+        return self._min_chars
+
+    def put(self, payload: str) -> BlobRef:
+        """Store ``payload`` (if not already stored) and return its reference."""
+        data = payload.encode("utf-8")
+        ref = BlobRef(digest=hashlib.sha256(data).hexdigest(), size=len(payload))
+        if not self.has(ref):
+            path = self._path(ref.digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(path, data)
+            with self._lock:
+                self._known.add(ref.digest)
+        self._remember((ref.digest, _PAYLOAD), payload)
+        return ref
+
+    def has(self, ref: BlobRef) -> bool:
+        with self._lock:
+            if ref.digest in self._known:
+                return True
+        if not self._path(ref.digest).is_file():
+            return False
+        with self._lock:
+            self._known.add(ref.digest)
+        return True
+
+    def get(self, ref: BlobRef) -> str:
+        """The payload ``ref`` points to (:class:`BlobNotFoundError` if absent)."""
+        return self.memo(ref, _PAYLOAD, lambda payload: payload)
+
+    def memo[T](self, ref: BlobRef, kind: str, compute: Callable[[str], T]) -> T:
+        """
+        ``compute(payload)``, computed once per blob and ``kind``.
+
+        Holds the result in the bounded cache alongside the payloads, so e.g. a
+        provider's encoding of an image is built once for however many turns
+        (and agents) send it. Raises :class:`BlobNotFoundError` when the
+        payload is not in this store.
+        """
+        key = (ref.digest, kind)
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                return hit[0]
+        payload = self._load(ref) if kind == _PAYLOAD else self.get(ref)
+        value = compute(payload)
+        self._remember(key, value)
+        return value
+
+    async def offload[I: InputItem](self, items: Sequence[I]) -> list[I]:
+        """
+        ``items`` with large image / file payloads moved into this store.
+
+        Items without a part over ``min_chars`` are returned as-is (same
+        objects); the rest are copies whose parts carry a :class:`BlobRef`.
+        Hashing and writing happen in one worker-thread hop.
+        """
+        return await asyncio.to_thread(self._offload_items, items)
+
+    async def offload_parts[P: InputPart](self, parts: Sequence[P]) -> list[P]:
+        """Like :meth:`offload`, for a bare list of content parts."""
+        return await asyncio.to_thread(self._offload_parts, parts)
+
+    # --- Internals ---
+
+    def _path(self, digest: str) -> Path:
+        return self._root / digest[:2] / digest
+
+    def _load(self, ref: BlobRef) -> str:
+        try:
+            data = self._path(ref.digest).read_bytes()
+        except FileNotFoundError:
+            raise BlobNotFoundError(
+                f"Blob {ref.digest} is not in the store at {self._root}"
+            ) from None
+        return data.decode("utf-8")
+
+    def _remember(self, key: tuple[str, str], value: Any) -> None:
+        cost = len(value) if isinstance(value, (str, bytes)) else 1
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cached_chars -= old[1]
+            self._cache[key] = (value, cost)
+            self._cached_chars += cost
+            while self._cached_chars > self._max_cached_chars and len(self._cache) > 1:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cached_chars -= evicted
+
+    def _offload_items[I: InputItem](self, items: Sequence[I]) -> list[I]:
+        # Local import: items imports content, which imports this module.
+        from .items import FunctionToolOutputItem, InputMessageItem  # noqa: PLC0415
+
+        result: list[I] = []
+        for item in items:
+            if isinstance(item, InputMessageItem):
+                parts = self._offload_parts(item.content)
+                if any(p is not q for p, q in zip(parts, item.content, strict=True)):
+                    item = item.model_copy(update={"content": parts})  # noqa: PLW2901
+            elif isinstance(item, FunctionToolOutputItem) and isinstance(
+                item.output, list
+            ):
+                parts = self._offload_parts(item.output)
+                if any(p is not q for p, q in zip(parts, item.output, strict=True)):
+                    item = item.model_copy(update={"output": parts})  # noqa: PLW2901
+            result.append(item)
+        return result
+
+    def _offload_parts[P: InputPart](self, parts: Sequence[P]) -> list[P]:
+        # Local import: content imports this module.
+        from .content import InputFile, InputImage  # noqa: PLC0415
+
+        result: list[P] = []
+        for part in parts:
+            if (
+                isinstance(part, InputImage)
+                and part.is_base64
+                and part.image_url is not None
+                and len(part.image_url) >= self._min_chars
+            ):
+                payload = part.base64_data
+                assert payload is not None
+                ref = self.put(payload)
+                part = part.model_copy(update={"image_url": None, "blob": ref})  # noqa: PLW2901
+            elif (
+                isinstance(part, InputFile)
+                and part.file_data is not None
+                and len(part.file_data) >= self._min_chars
+            ):
+                ref = self.put(part.file_data)
+                part = part.model_copy(update={"file_data": None, "blob": ref})  # noqa: PLW2901
+            result.append(part)
+        return result
+
+
+def find_blob_store(ref: BlobRef) -> BlobStore:
+    """
+    The :class:`BlobStore` open in this process holding ``ref``'s payload.
+
+    Raises:
+        BlobNotFoundError: No open store holds it (e.g. in a process the part
+            was sent to without being inlined first).
+
+    """
+    for store in list(_LIVE_STORES):
+        if store.has(ref):
+            return store
+    raise BlobNotFoundError(
+        f"Blob {ref.digest} is not in any open BlobStore — open the store the "
+        "transcript was offloaded to (e.g. as SessionContext.blob_store)"
+    )
@@ -34,6 +34,8 @@ from openai.types.responses.response_reasoning_item import (
 )
 from pydantic import BaseModel, Field, model_validator
 
+from .blobs import BlobRef, find_blob_store
+
 # === Input content parts ===
 
 ImageDetail = Literal["low", "medium", "high", "ultra_high", "auto", "original"]
@@ -118,7 +120,10 @@ class InputImage(ResponseInputImage):
     """
     Image content in a user/system/developer message.
 
-    Supports URL, base64, or file_id.
+    Supports URL, base64, or file_id. Base64 data may be held out of line as a
+    ``blob`` (see :class:`~grasp_agents.types.blobs.BlobStore`): read it with
+    :attr:`base64_data` / :meth:`to_str` / :meth:`decoded_bytes` rather than
+    ``image_url``.
     """
 
     # OpenResponses fields (InputImageContent):
@@ -134,17 +139,23 @@ class InputImage(ResponseInputImage):
     mime_type: str | None = None
     provider_specific_fields: dict[str, Any] | None = None
     cache_control: CacheControl | None = None
+    # The base64 data, stored out of line (``image_url`` is then ``None``).
+    blob: BlobRef | None = None
 
     @model_validator(mode="before")
     @classmethod
     def _check_exclusive_fields(cls, data: dict[str, Any]) -> dict[str, Any]:
-        image_url = data.get("image_url")
-        file_id = data.get("file_id")
-
-        if (image_url is not None) and (file_id is not None):
-            raise ValueError("InputImageContent cannot have both image_url and file_id")
-        if (image_url is None) and (file_id is None):
-            raise ValueError("InputImageContent must have either image_url or file_id")
+        provided = [
+            f for f in ("image_url", "file_id", "blob") if data.get(f) is not None
+        ]
+        if len(provided) > 1:
+            raise ValueError(
+                f"InputImageContent cannot have both {provided[0]} and {provided[1]}"
+            )
+        if not provided:
+            raise ValueError(
+                "InputImageContent must have one of image_url, file_id or blob"
+            )
 
         return data
 
@@ -156,6 +167,8 @@ class InputImage(ResponseInputImage):
 
     @property
     def is_base64(self) -> bool:
+        if self.blob is not None:
+            return self.mime_type is not None
         return (
             self.image_url is not None
             and self.mime_type is not None
@@ -164,6 +177,29 @@ class InputImage(ResponseInputImage):
             )
         )
 
+    @property
+    def base64_data(self) -> str | None:
+        """The raw base64 payload of a base64 image (inline or out of line)."""
+        if self.blob is not None:
+            return find_blob_store(self.blob).get(self.blob)
+        if not self.is_base64 or self.image_url is None:
+            return None
+        return self.image_url.removeprefix(
+            BASE64_DATA_PREFIX.format(mime_type=self.mime_type)
+        )
+
+    def decoded_bytes(self) -> bytes | None:
+        """
+        The decoded image bytes of a base64 image (``None`` for a URL / file id).
+
+        Decoded once per out-of-line blob; an inline image is decoded per call.
+        """
+        if self.blob is not None:
+            return find_blob_store(self.blob).memo(self.blob, "bytes", base64.b64decode)
+        if self.image_url is None or not self.image_url.startswith("data:"):
+            return None
+        return _decode_file_data(self.image_url)
+
     @property
     def is_url(self) -> bool:
         return self.image_url is not None and not self.image_url.startswith("data:")
@@ -177,10 +213,25 @@ class InputImage(ResponseInputImage):
             return self.file_id
         if self.image_url is not None:
             return self.image_url
+        if self.blob is not None:
+            # The data URL, built once per blob and MIME type.
+            prefix = BASE64_DATA_PREFIX.format(mime_type=self.mime_type)
+            return find_blob_store(self.blob).memo(
+                self.blob, f"data_url:{prefix}", lambda data: prefix + data
+            )
         raise ValueError(
-            "Invalid InputImageContent: must have either image_url or file_id"
+            "Invalid InputImageContent: must have one of image_url, file_id or blob"
         )
 
+    def inlined(self) -> "InputImage":
+        """
+        This image with an out-of-line payload put back into ``image_url`` —
+        for handing it to a process that may have no store holding the blob.
+        """
+        if self.blob is None:
+            return self
+        return self.model_copy(update={"image_url": self.to_str(), "blob": None})
+
     @classmethod
     def from_base64(
         cls,
@@ -243,7 +294,8 @@ class InputFile(ResponseInputFile):
     """
     File content in a user/system/developer message.
 
-    Supports base64 data, URL, or file_id.
+    Supports base64 data, URL, or file_id. Base64 data may be held out of line
+    as a ``blob``: read it with :attr:`inline_data` rather than ``file_data``.
     """
 
     # OpenResponses fields (InputFileContent):
@@ -259,26 +311,54 @@ class InputFile(ResponseInputFile):
 
     provider_specific_fields: dict[str, Any] | None = None
     cache_control: CacheControl | None = None
+    # The ``file_data`` payload, stored out of line (``file_data`` is then
+    # ``None``).
+    blob: BlobRef | None = None
 
     @model_validator(mode="before")
     @classmethod
     def _check_exclusive_fields(cls, data: dict[str, Any]) -> dict[str, Any]:
-        file_data = data.get("file_data")
-        file_url = data.get("file_url")
-        file_id = data.get("file_id")
-
-        provided_fields = [f for f in [file_data, file_url, file_id] if f is not None]
+        provided_fields = [
+            f
+            for f in ("file_data", "file_url", "file_id", "blob")
+            if data.get(f) is not None
+        ]
         if len(provided_fields) != 1:
             raise ValueError(
                 "InputFileContent must have exactly one of file_data, "
-                "file_url, or file_id"
+                "file_url, file_id or blob"
             )
 
         return data
 
     @property
     def is_base64(self) -> bool:
-        return self.file_data is not None
+        return self.file_data is not None or self.blob is not None
+
+    @property
+    def inline_data(self) -> str | None:
+        """The ``file_data`` payload, whether inline or out of line."""
+        if self.blob is not None:
+            return find_blob_store(self.blob).get(self.blob)
+        return self.file_data
+
+    def inlined(self) -> "InputFile":
+        """This file with an out-of-line payload put back into ``file_data``."""
+        if self.blob is None:
+            return self
+        return self.model_copy(update={"file_data": self.inline_data, "blob": None})
+
+    def decoded_bytes(self) -> bytes | None:
+        """
+        The decoded bytes of an inline file (a raw base64 or data-URI payload).
+
+        Decoded once per out-of-line blob; inline data is decoded per call.
+        """
+        if self.blob is not None:
+            return find_blob_store(self.blob).memo(
+                self.blob, "bytes", _decode_file_data
+            )
+        return _decode_file_data(self.file_data) if self.file_data else None
 
     @property
     def is_url(self) -> bool:
@@ -318,6 +398,12 @@ class InputFile(ResponseInputFile):
         return cls(file_data=data, filename=path.name)
 
 
+def _decode_file_data(data: str) -> bytes:
+    if data.startswith("data:") and "," in data:
+        data = data.split(",", 1)[1]
+    return base64.b64decode(data)
+
+
 # === Outputs ===
 
 # --- Annotations/citations ---
@@ -20,6 +20,10 @@ from .response import Response
 
 
 class Event[T](BaseModel, frozen=True):
+    # Validators are built on an event type's first use, not at import: most
+    # processes only ever emit a handful of the types defined here.
+    model_config = ConfigDict(defer_build=True)
+
     type: str
     id: str = Field(default_factory=lambda: str(uuid4())[:8])
     created_at: float = Field(default_factory=lambda: datetime.now(UTC).timestamp())
@@ -71,6 +75,9 @@ class ToolOutputItemEvent(Event[FunctionToolOutputItem], frozen=True):
 
 class ToolOutputEvent(Event[Any], frozen=True):
     type: Literal["tool.output"] = "tool.output"
+    # True when ``data`` was served from the session's tool-result cache
+    # instead of executing the tool (see ``BaseTool.memoize``).
+    memoized: bool = False
 
 
 class ToolStreamEvent(Event[Any], frozen=True):
@@ -8,7 +8,6 @@ without pulling Textual into the dependency graph.
 
 from __future__ import annotations
 
-import base64
 import io
 import json
 import pathlib
@@ -496,12 +495,12 @@ def render_input_image(image: InputImage) -> RenderableType:
     them as ``InputImage`` parts; this decodes and renders them.
     """
     url = image.image_url or ""
-    if url.startswith("data:"):
+    if url.startswith("data:") or image.blob is not None:
         try:
-            payload = base64.b64decode(url.split(",", 1)[1])
+            payload = image.decoded_bytes()
         except Exception:
             return Text("[image: unreadable data uri]", style=PALETTE["muted"])
-        return _image_renderable(payload)
+        return _image_renderable(payload or b"")
     if url and not image.is_url and pathlib.Path(url).exists():
         return _image_renderable(url)
     return Text(f"[image: {url or 'attached'}]", style=PALETTE["muted"])
@@ -627,9 +626,8 @@ else:
             if isinstance(src, str):
                 return PILImage.open(src)
             url = src.image_url or ""
-            if url.startswith("data:"):
-                payload = base64.b64decode(url.split(",", 1)[1])
-                return PILImage.open(io.BytesIO(payload))
+            if url.startswith("data:") or src.blob is not None:
+                return PILImage.open(io.BytesIO(src.decoded_bytes() or b""))
             if url and not src.is_url and pathlib.Path(url).exists():
                 return PILImage.open(url)
         except Exception:
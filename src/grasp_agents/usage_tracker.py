@@ -1,21 +1,169 @@
 import logging
-from collections import defaultdict
-from collections.abc import Sequence
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import cache
 
-from litellm import cost_per_token
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from .types.response import Response, ResponseUsage
 
 logger = logging.getLogger(__name__)
 
+# Token count used to probe litellm for a model's unit prices. Well below any
+# tier threshold (the smallest litellm ships is 128k), so the probe always
+# lands in the base tier.
+_PROBE_TOKENS = 1_000
+
+_TIER_THRESHOLD_RE = re.compile(r"_above_(\d+)k_tokens$")
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """
+    Per-token prices of one model's base tier, resolved once from litellm.
+
+    ``tier_threshold`` is the input-token count above which litellm switches
+    to tiered (``*_above_<N>k_tokens``) prices; usages past it, or for a model
+    whose pricing litellm can't express linearly (``linear=False``), are
+    priced by litellm directly.
+    """
+
+    input_cost: float = 0.0
+    cached_input_cost: float = 0.0
+    cache_write_cost: float = 0.0
+    output_cost: float = 0.0
+    tier_threshold: int | None = None
+    linear: bool = True
+
+    def cost(self, usage: ResponseUsage) -> float | None:
+        """Cost of ``usage`` at these prices; ``None`` when not linear here."""
+        if not self.linear:
+            return None
+        if self.tier_threshold is not None and usage.input_tokens > self.tier_threshold:
+            return None
+        cached = usage.input_tokens_details.cached_tokens
+        written = usage.input_tokens_details.cache_write_tokens
+        uncached = usage.input_tokens - cached - written
+        if uncached < 0:
+            return None
+        return (
+            uncached * self.input_cost
+            + cached * self.cached_input_cost
+            + written * self.cache_write_cost
+            + usage.output_tokens * self.output_cost
+        )
+
+
+def _litellm_cost(
+    model_name: str,
+    litellm_provider: str | None,
+    *,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cached_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float:
+    # litellm is imported on first pricing, not with the module: it is slow
+    # to import and most processes never price a usage.
+    from litellm import cost_per_token  # noqa: PLC0415
+
+    prompt_cost, completion_cost = cost_per_token(
+        model=model_name,
+        prompt_tokens=input_tokens,
+        completion_tokens=output_tokens,
+        cache_read_input_tokens=cached_tokens,
+        cache_creation_input_tokens=cache_write_tokens,
+        custom_llm_provider=litellm_provider,
+    )
+    return prompt_cost + completion_cost
+
+
+def _tier_threshold(model_name: str, litellm_provider: str | None) -> int | None:
+    """Smallest ``*_above_<N>k_tokens`` threshold in the model's price entry."""
+    from litellm import get_model_info  # noqa: PLC0415
+
+    try:
+        info = get_model_info(model=model_name, custom_llm_provider=litellm_provider)
+    except Exception:
+        return None
+    thresholds = [
+        int(m.group(1)) * 1000
+        for key, value in info.items()
+        if value and (m := _TIER_THRESHOLD_RE.search(key))
+    ]
+    return min(thresholds) if thresholds else None
+
+
+@cache
+def resolve_model_pricing(
+    model_name: str, litellm_provider: str | None
+) -> ModelPricing | None:
+    """
+    Resolve (and memoize) a model's :class:`ModelPricing`; ``None`` when
+    litellm has no pricing data for it.
+
+    The unit prices are probed through litellm's own ``cost_per_token``, so
+    they carry its provider-specific conventions (e.g. cache reads billed as
+    a subset of the input) rather than a re-implementation of them. After
+    registering custom prices with litellm, call
+    ``resolve_model_pricing.cache_clear()``.
+    """
+    n = _PROBE_TOKENS
+    try:
+        base = _litellm_cost(model_name, litellm_provider, input_tokens=n)
+        output = _litellm_cost(model_name, litellm_provider, output_tokens=n)
+        cached = _litellm_cost(
+            model_name, litellm_provider, input_tokens=n, cached_tokens=n
+        )
+        written = _litellm_cost(
+            model_name, litellm_provider, input_tokens=n, cache_write_tokens=n
+        )
+    except Exception:
+        logger.warning(
+            "No pricing data for model %s (provider %s); cost not tracked",
+            model_name,
+            litellm_provider,
+        )
+        return None
+
+    pricing = ModelPricing(
+        input_cost=base / n,
+        cached_input_cost=cached / n,
+        cache_write_cost=written / n,
+        output_cost=output / n,
+        tier_threshold=_tier_threshold(model_name, litellm_provider),
+    )
+    # Cross-check one mixed usage: a model whose price isn't a sum of
+    # per-kind unit prices falls back to per-call litellm pricing.
+    mixed = ResponseUsage(input_tokens=3 * n, output_tokens=n)
+    mixed.input_tokens_details.cached_tokens = n
+    mixed.input_tokens_details.cache_write_tokens = n
+    expected = _litellm_cost(
+        model_name,
+        litellm_provider,
+        input_tokens=3 * n,
+        output_tokens=n,
+        cached_tokens=n,
+        cache_write_tokens=n,
+    )
+    estimate = pricing.cost(mixed) or 0.0
+    if abs(estimate - expected) > 1e-9 * max(1.0, abs(expected)):
+        return ModelPricing(linear=False)
+    return pricing
+
 
 def add_cost_to_usage(
     usage: ResponseUsage,
     model_name: str,
     litellm_provider: str | None,
 ) -> None:
-    """Stamp ``usage.cost`` from litellm pricing data (no-op when unmapped)."""
+    """
+    Stamp ``usage.cost`` from litellm pricing data (no-op when unmapped).
+
+    Prices are resolved once per model (:func:`resolve_model_pricing`), so a
+    response costs a few multiplications rather than a litellm lookup.
+    """
     # Prefixed names like "openai/gpt-4o" (OpenRouter-style): use the prefix
     # as the provider hint only when none was given. With an explicit
     # provider, the full (possibly prefixed) name is what litellm expects —
@@ -23,16 +171,24 @@ def add_cost_to_usage(
     if "/" in model_name and litellm_provider is None:
         litellm_provider, model_name = model_name.split("/", 1)
 
+    pricing = resolve_model_pricing(model_name, litellm_provider)
+    if pricing is None:
+        return
+
+    cost = pricing.cost(usage)
+    if cost is not None:
+        usage.cost = cost
+        return
+
     try:
-        prompt_cost, completion_cost = cost_per_token(
-            model=model_name,
-            prompt_tokens=usage.input_tokens,
-            completion_tokens=usage.output_tokens,
-            cache_read_input_tokens=usage.input_tokens_details.cached_tokens,
-            cache_creation_input_tokens=usage.input_tokens_details.cache_write_tokens,
-            custom_llm_provider=litellm_provider,
+        usage.cost = _litellm_cost(
+            model_name,
+            litellm_provider,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cached_tokens=usage.input_tokens_details.cached_tokens,
+            cache_write_tokens=usage.input_tokens_details.cache_write_tokens,
         )
-        usage.cost = prompt_cost + completion_cost
     except Exception:
         logger.warning(
             "No pricing data for model %s (provider %s); cost not tracked",
@@ -41,8 +197,99 @@ def add_cost_to_usage(
         )
 
 
+type BudgetCallback = Callable[[UsageBudget], None]
+
+
+class UsageBudget:
+    """
+    A token / cost ceiling on one usage scope, checked as usage is recorded.
+
+    ``scope`` is an agent name, a rollup scope (see
+    :meth:`UsageTracker.set_parent`), or ``None`` for the whole session.
+    Spend is measured from the scope's total when the budget was added, so a
+    budget bounds only what is spent after it. The first record that reaches
+    either limit sets :attr:`exceeded` and calls ``on_exceeded`` once.
+    """
+
+    def __init__(
+        self,
+        *,
+        scope: str | None,
+        max_tokens: int | None,
+        max_cost: float | None,
+        on_exceeded: BudgetCallback | None,
+        baseline: ResponseUsage,
+    ) -> None:
+        self.scope = scope
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.on_exceeded = on_exceeded
+        self._baseline_tokens = baseline.total_tokens
+        self._baseline_cost = baseline.cost or 0.0
+        self.spent_tokens = 0
+        self.spent_cost = 0.0
+        self.exceeded = False
+
+    def observe(self, scope_total: ResponseUsage) -> None:
+        """Update spend from the scope's running total; fire once when over."""
+        self.spent_tokens = scope_total.total_tokens - self._baseline_tokens
+        self.spent_cost = (scope_total.cost or 0.0) - self._baseline_cost
+        if self.exceeded:
+            return
+        over_tokens = self.max_tokens is not None and (
+            self.spent_tokens >= self.max_tokens
+        )
+        over_cost = self.max_cost is not None and self.spent_cost >= self.max_cost
+        if not (over_tokens or over_cost):
+            return
+        self.exceeded = True
+        if self.on_exceeded is not None:
+            try:
+                self.on_exceeded(self)
+            except Exception:
+                logger.exception("Usage budget callback failed (scope %s)", self.scope)
+
+
 class UsageTracker(BaseModel):
+    """
+    Session usage ledger.
+
+    Running totals are kept per agent (``usages``), per model
+    (``model_usages``), per rollup scope (``scope_usages`` — e.g. a team over
+    its members, see :meth:`set_parent`; a scope may roll up into several)
+    and for the whole session
+    (``total``), all updated as each response is recorded — reading any of
+    them is O(1). Budgets (:meth:`add_budget`) are evaluated on record and
+    fire a callback when crossed, so callers need not poll. The ledger
+    itself (not the budgets, which hold callbacks) round-trips through
+    ``model_dump`` / ``model_validate``; a dump that predates the running
+    totals has ``total`` and the rollups rebuilt from ``usages`` (per-model
+    totals can't be recovered and start empty).
+    """
+
     usages: dict[str, ResponseUsage] = Field(default_factory=dict)
+    model_usages: dict[str, ResponseUsage] = Field(default_factory=dict)
+    scope_usages: dict[str, ResponseUsage] = Field(default_factory=dict)
+    parents: dict[str, list[str]] = Field(default_factory=dict)
+    total: ResponseUsage = Field(default_factory=ResponseUsage)
+
+    _budgets: list[UsageBudget] = PrivateAttr(default_factory=list[UsageBudget])
+
+    @model_validator(mode="after")
+    def _rebuild_missing_totals(self) -> "UsageTracker":
+        rebuild_total = "total" not in self.model_fields_set
+        rebuild_scopes = "scope_usages" not in self.model_fields_set
+        if not (rebuild_total or rebuild_scopes):
+            return self
+        for agent_name, usage in self.usages.items():
+            if rebuild_total:
+                self.total += usage
+            if rebuild_scopes:
+                for scope in self._ancestors(agent_name):
+                    self.scope_usages[scope] = (
+                        self.scope_usages.get(scope, ResponseUsage()) + usage
+                    )
+        return self
 
     def update(
         self,
@@ -60,16 +307,109 @@ class UsageTracker(BaseModel):
                         model_name=model_name,
                         litellm_provider=litellm_provider,
                     )
-                if agent_name not in self.usages:
-                    self.usages[agent_name] = ResponseUsage()
-                self.usages[agent_name] += response.usage
+                self.record(agent_name, usage, model=model_name or response.model)
+
+    def record(
+        self, agent_name: str, usage: ResponseUsage, *, model: str | None = None
+    ) -> None:
+        """Add ``usage`` to the agent, model, rollup and session totals."""
+        self.usages[agent_name] = self.usages.get(agent_name, ResponseUsage()) + usage
+        if model:
+            self.model_usages[model] = (
+                self.model_usages.get(model, ResponseUsage()) + usage
+            )
+        scopes = self._ancestors(agent_name)
+        for scope in scopes:
+            self.scope_usages[scope] = (
+                self.scope_usages.get(scope, ResponseUsage()) + usage
+            )
+        self.total += usage
+
+        for budget in self._budgets:
+            if budget.scope is None:
+                budget.observe(self.total)
+            elif budget.scope == agent_name or budget.scope in scopes:
+                budget.observe(self.usage_for(budget.scope))
 
     @property
     def total_usage(self) -> ResponseUsage:
-        return sum((usage for usage in self.usages.values()), ResponseUsage())
+        return self.total
+
+    def usage_for(self, scope: str | None) -> ResponseUsage:
+        """
+        Running total of ``scope``: a rollup scope, else an agent name;
+        ``None`` is the whole session.
+        """
+        if scope is None:
+            return self.total
+        if scope in self.scope_usages:
+            return self.scope_usages[scope]
+        return self.usages.get(scope, ResponseUsage())
+
+    # ---- Rollups and budgets -------------------------------------------------
+
+    def set_parent(self, child: str, parent: str) -> None:
+        """
+        Roll ``child``'s usage (an agent or a scope) up into ``parent`` —
+        e.g. a team member into its team, a team into an enclosing one.
+        Applies to usage recorded from now on. A scope can have several
+        parents (a member of two teams counts toward both); each ancestor is
+        charged once per record even when reachable along several paths.
+        """
+        if child == parent or child in self._ancestors(parent):
+            raise ValueError(f"Usage scope {parent!r} is nested under {child!r}.")
+        parents = self.parents.setdefault(child, [])
+        if parent not in parents:
+            parents.append(parent)
+
+    def remove_parent(self, child: str, parent: str) -> None:
+        """Stop rolling ``child``'s usage up into ``parent`` (no-op if not set)."""
+        parents = self.parents.get(child)
+        if parents is None or parent not in parents:
+            return
+        parents.remove(parent)
+        if not parents:
+            del self.parents[child]
+
+    def add_budget(
+        self,
+        *,
+        scope: str | None = None,
+        max_tokens: int | None = None,
+        max_cost: float | None = None,
+        on_exceeded: BudgetCallback | None = None,
+    ) -> UsageBudget:
+        """Register a :class:`UsageBudget` on ``scope`` (session when ``None``)."""
+        budget = UsageBudget(
+            scope=scope,
+            max_tokens=max_tokens,
+            max_cost=max_cost,
+            on_exceeded=on_exceeded,
+            baseline=self.usage_for(scope),
+        )
+        self._budgets.append(budget)
+        return budget
+
+    def remove_budget(self, budget: UsageBudget) -> None:
+        if budget in self._budgets:
+            self._budgets.remove(budget)
+
+    def _ancestors(self, name: str) -> list[str]:
+        chain: list[str] = []
+        pending = list(self.parents.get(name, ()))
+        while pending:
+            parent = pending.pop(0)
+            if parent in chain:
+                continue
+            chain.append(parent)
+            pending.extend(self.parents.get(parent, ()))
+        return chain
 
     def reset(self) -> None:
-        self.usages = defaultdict(ResponseUsage)
+        self.usages = {}
+        self.model_usages = {}
+        self.scope_usages = {}
+        self.total = ResponseUsage()
 
     def print_usage(self) -> None:
         usage = self.total_usage
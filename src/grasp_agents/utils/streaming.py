@@ -1,15 +1,100 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterable, AsyncIterator
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Mapping, Sequence
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from logging import getLogger
-from typing import Any
+from typing import Any, Literal
 
-from grasp_agents.types.events import Event
+from grasp_agents.types.events import Event, LLMStreamEvent, ToolStreamEvent
+from grasp_agents.types.llm_events import (
+    FunctionCallArgumentsDelta,
+    OutputMessageRefusalPartDelta,
+    OutputMessageTextPartTextDelta,
+    ReasoningContentPartTextDelta,
+    ReasoningSummaryPartTextDelta,
+)
 
 logger = getLogger(__name__)
 
+type OverflowPolicy = Literal["block", "drop_deltas", "coalesce"]
+
+# Per-producer backlog the framework's own fan-outs (parallel replicas, tool
+# batches) allow before a producer waits for the consumer.
+DEFAULT_MAX_BUFFERED = 256
+
+# Streamed LLM deltas: incremental text the completed output item repeats.
+_LLM_DELTAS = (
+    OutputMessageTextPartTextDelta,
+    OutputMessageRefusalPartDelta,
+    ReasoningContentPartTextDelta,
+    ReasoningSummaryPartTextDelta,
+    FunctionCallArgumentsDelta,
+)
+# Fields two deltas may differ in and still belong to the same part.
+_MERGED_FIELDS = frozenset({"delta", "logprobs", "sequence_number"})
+
+
+def is_delta_event(item: object) -> bool:
+    """
+    Whether ``item`` is an incremental event a slow consumer can lose.
+
+    Streamed LLM text / argument deltas (the completed output item carries the
+    full content) and :class:`ToolStreamEvent` live output (the terminal
+    :class:`ToolOutputEvent` carries the result).
+    """
+    if isinstance(item, LLMStreamEvent):
+        return isinstance(item.data, _LLM_DELTAS)
+    return isinstance(item, ToolStreamEvent)
+
+
+def coalesce_deltas(first: object, second: object) -> Any | None:
+    """
+    Merge two consecutive deltas of the same part into one, or ``None``.
+
+    LLM deltas merge when they continue the same output item / content part;
+    plain-text :class:`ToolStreamEvent` output merges per tool stream and task.
+    The merged event keeps the first event's id and timestamp.
+    """
+    if type(first) is not type(second):
+        return None
+    if isinstance(first, LLMStreamEvent) and isinstance(second, LLMStreamEvent):
+        a, b = first.data, second.data
+        if (
+            type(a) is not type(b)
+            or not isinstance(a, _LLM_DELTAS)
+            or not isinstance(b, _LLM_DELTAS)
+            or (first.source, first.exec_id) != (second.source, second.exec_id)
+        ):
+            return None
+        if any(
+            getattr(a, name) != getattr(b, name)
+            for name in type(a).model_fields
+            if name not in _MERGED_FIELDS
+        ):
+            return None
+        update: dict[str, Any] = {
+            "delta": a.delta + b.delta,
+            "sequence_number": b.sequence_number,
+        }
+        if isinstance(a, OutputMessageTextPartTextDelta) and isinstance(
+            b, OutputMessageTextPartTextDelta
+        ):
+            update["logprobs"] = [*a.logprobs, *b.logprobs]
+        return first.model_copy(update={"data": a.model_copy(update=update)})
+    if (
+        type(first) is ToolStreamEvent
+        and type(second) is ToolStreamEvent
+        and isinstance(first.data, str)
+        and isinstance(second.data, str)
+        and (first.source, first.exec_id, first.destination, first.task_id)
+        == (second.source, second.exec_id, second.destination, second.task_id)
+    ):
+        return first.model_copy(update={"data": first.data + second.data})
+    return None
+
 
 @dataclass(frozen=True, slots=True)
 class PumpError:
@@ -19,7 +104,12 @@ class PumpError:
     exception: BaseException
 
 
-type _QueueItem[T] = tuple[int, T] | PumpError | None
+@dataclass(eq=False, slots=True)
+class _Buffer[T]:
+    """One producer's pending items, bounded by ``max_buffered``."""
+
+    items: deque[T] = field(default_factory=deque[T])
+    space: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 class ConcurrentStream[T]:
@@ -28,6 +118,29 @@ class ConcurrentStream[T]:
 
     After iteration completes, :attr:`errors` contains one :class:`PumpError`
     per failed pump so callers can react (retry, inject error messages, etc.).
+
+    Each producer buffers into its own queue. With ``max_buffered`` set, that
+    queue holds at most ``max_buffered`` items, so a long fan-out runs in
+    memory bounded by ``max_buffered`` per running producer, and a chatty
+    producer can't crowd out the rest: it hits its own bound while the others
+    keep flowing. What a full producer does with its next item is the
+    ``overflow`` policy:
+
+    - ``"block"`` — wait for the consumer (backpressure);
+    - ``"drop_deltas"`` — discard the item if ``is_delta(item)`` (by default
+      :func:`is_delta_event`: streamed LLM and tool-output deltas, which the
+      final events repeat), otherwise wait;
+    - ``"coalesce"`` — merge the item into the last buffered one with
+      ``coalesce`` (by default :func:`coalesce_deltas`), otherwise wait.
+
+    :attr:`dropped` and :attr:`coalesced` count what the policy absorbed.
+
+    Scheduling: ``max_concurrency`` caps how many producers run at once;
+    ``after[i]`` lists earlier producers that must finish (successfully or
+    not) before producer ``i`` starts; ``groups[i]`` names a group whose
+    ``group_limits`` entry caps its concurrently-running members. A producer
+    takes no slot while it waits on ``after``, so an ordered chain never
+    starves the rest.
     """
 
     def __init__(
@@ -35,10 +148,39 @@ class ConcurrentStream[T]:
         generators: list[AsyncIterator[T]],
         *,
         max_concurrency: int | None = None,
+        max_buffered: int | None = None,
+        overflow: OverflowPolicy = "block",
+        is_delta: Callable[[T], bool] = is_delta_event,
+        coalesce: Callable[[T, T], T | None] = coalesce_deltas,
+        after: Sequence[Sequence[int]] | None = None,
+        groups: Sequence[str | None] | None = None,
+        group_limits: Mapping[str, int] | None = None,
     ) -> None:
+        if max_buffered is not None and max_buffered < 1:
+            raise ValueError(f"max_buffered must be >= 1, got {max_buffered}")
+        if after is not None:
+            if len(after) != len(generators):
+                raise ValueError("after must have one entry per generator")
+            for idx, deps in enumerate(after):
+                if any(not 0 <= dep < idx for dep in deps):
+                    raise ValueError(
+                        f"after[{idx}] may only name earlier generators, got "
+                        f"{list(deps)}"
+                    )
+        if groups is not None and len(groups) != len(generators):
+            raise ValueError("groups must have one entry per generator")
         self._generators = generators
         self._errors: list[PumpError] = []
         self._max_concurrency = max_concurrency
+        self._max_buffered = max_buffered
+        self._overflow: OverflowPolicy = overflow
+        self._is_delta = is_delta
+        self._coalesce = coalesce
+        self._after = after
+        self._groups = groups
+        self._group_limits = dict(group_limits or {})
+        self._dropped = 0
+        self._coalesced = 0
 
     @property
     def errors(self) -> list[PumpError]:
@@ -48,12 +190,43 @@ class ConcurrentStream[T]:
     def failed_indices(self) -> list[int]:
         return [e.index for e in self._errors]
 
+    @property
+    def dropped(self) -> int:
+        """Items discarded under ``overflow="drop_deltas"``."""
+        return self._dropped
+
+    @property
+    def coalesced(self) -> int:
+        """Items merged into a buffered one under ``overflow="coalesce"``."""
+        return self._coalesced
+
+    async def _put(self, buf: _Buffer[T], item: T) -> bool:
+        """Buffer ``item`` per the overflow policy; False if it was absorbed."""
+        limit = self._max_buffered
+        while limit is not None and len(buf.items) >= limit:
+            if self._overflow == "drop_deltas" and self._is_delta(item):
+                self._dropped += 1
+                return False
+            if self._overflow == "coalesce":
+                merged = self._coalesce(buf.items[-1], item)
+                if merged is not None:
+                    buf.items[-1] = merged
+                    self._coalesced += 1
+                    return False
+            buf.space.clear()
+            await buf.space.wait()
+        buf.items.append(item)
+        return True
+
     async def __aiter__(self) -> AsyncIterator[tuple[int, T]]:
         generators = self._generators
         if not generators:
             return
 
-        queue: asyncio.Queue[_QueueItem[T]] = asyncio.Queue()
+        buffers = [_Buffer[T]() for _ in generators]
+        # Arrival order: a producer index per buffered item, or a pump error.
+        ready: deque[int | PumpError] = deque()
+        wakeup = asyncio.Event()
         pumps_left = len(generators)
         errors = self._errors
         # ``max_concurrency=1`` runs the generators serially — each fully drained
@@ -63,18 +236,36 @@ class ConcurrentStream[T]:
             if self._max_concurrency is not None
             else None
         )
+        group_sems = {
+            group: asyncio.Semaphore(limit)
+            for group, limit in self._group_limits.items()
+        }
+        finished = [asyncio.Event() for _ in generators]
+
+        def limiters(idx: int) -> list[asyncio.Semaphore]:
+            # Always global before group, so two producers can't each hold
+            # the slot the other is waiting for.
+            out = [sem] if sem is not None else []
+            group = self._groups[idx] if self._groups is not None else None
+            if group is not None and group in group_sems:
+                out.append(group_sems[group])
+            return out
 
         async def drain(gen: AsyncIterator[T], idx: int) -> None:
             async for item in gen:
-                await queue.put((idx, item))
+                if await self._put(buffers[idx], item):
+                    ready.append(idx)
+                    wakeup.set()
 
         async def pump(gen: AsyncIterator[T], idx: int) -> None:
             nonlocal pumps_left
             try:
-                if sem is not None:
-                    async with sem:
-                        await drain(gen, idx)
-                else:
+                if self._after is not None:
+                    for dep in self._after[idx]:
+                        await finished[dep].wait()
+                async with AsyncExitStack() as stack:
+                    for limiter in limiters(idx):
+                        await stack.enter_async_context(limiter)
                     await drain(gen, idx)
 
             except asyncio.CancelledError:
@@ -82,31 +273,50 @@ class ConcurrentStream[T]:
 
             except Exception as e:
                 logger.warning("stream_concurrent pump %d failed: %r", idx, e)
-                await queue.put(PumpError(idx, e))
+                ready.append(PumpError(idx, e))
 
             finally:
+                finished[idx].set()
                 pumps_left -= 1
-                if pumps_left == 0:
-                    await queue.put(None)
+                wakeup.set()
 
         async with asyncio.TaskGroup() as tg:
             for idx, gen in enumerate(generators):
                 tg.create_task(pump(gen, idx))
 
             while True:
-                msg = await queue.get()
-                if msg is None:
-                    break
-                if isinstance(msg, PumpError):
-                    errors.append(msg)
+                if not ready:
+                    if pumps_left == 0:
+                        break
+                    wakeup.clear()
+                    await wakeup.wait()
+                    continue
+                entry = ready.popleft()
+                if isinstance(entry, PumpError):
+                    errors.append(entry)
                     continue
-                yield msg
+                buf = buffers[entry]
+                item = buf.items.popleft()
+                buf.space.set()
+                yield entry, item
+
+        if self._dropped or self._coalesced:
+            logger.debug(
+                "stream_concurrent: %d deltas dropped, %d coalesced",
+                self._dropped,
+                self._coalesced,
+            )
 
 
 def stream_concurrent[T](
     generators: list[AsyncIterator[T]],
     *,
     max_concurrency: int | None = None,
+    max_buffered: int | None = None,
+    overflow: OverflowPolicy = "block",
+    after: Sequence[Sequence[int]] | None = None,
+    groups: Sequence[str | None] | None = None,
+    group_limits: Mapping[str, int] | None = None,
 ) -> ConcurrentStream[T]:
     """
     Create a :class:`ConcurrentStream` that merges *generators*.
@@ -114,16 +324,29 @@ def stream_concurrent[T](
     ``max_concurrency`` caps how many run at once; ``1`` runs them serially
     (each fully drained before the next), e.g. to keep conflicting operations
     from interleaving. ``None`` (default) runs them all concurrently.
+    ``max_buffered`` bounds each generator's backlog and ``overflow`` picks what
+    happens beyond it (see :class:`ConcurrentStream`); ``None`` (default) leaves
+    the backlog unbounded. ``after`` orders a generator behind earlier ones
+    and ``groups`` / ``group_limits`` cap named subsets (see
+    :class:`ConcurrentStream`).
 
     Usage::
 
-        stream = stream_concurrent(generators)
+        stream = stream_concurrent(generators, max_buffered=64)
         async for idx, item in stream:
             ...
         for err in stream.errors:
             handle(err.index, err.exception)
     """
-    return ConcurrentStream(generators, max_concurrency=max_concurrency)
+    return ConcurrentStream(
+        generators,
+        max_concurrency=max_concurrency,
+        max_buffered=max_buffered,
+        overflow=overflow,
+        after=after,
+        groups=groups,
+        group_limits=group_limits,
+    )
 
 
 class MissingFinalEventError(RuntimeError):
@@ -131,14 +354,28 @@ class MissingFinalEventError(RuntimeError):
 
 
 class EventStream[F](AsyncIterator[Event[Any]]):
+    """
+    An event iterator that remembers the final event of type ``final_type``.
+
+    :meth:`drain` keeps the events it consumes in :attr:`events` — all of them
+    by default, or only the last ``retain`` (``0`` keeps none), so draining a
+    long stream can run in bounded memory.
+    """
+
     def __init__(
-        self, source: AsyncIterable[Event[Any]], final_type: type[F] = object
+        self,
+        source: AsyncIterable[Event[Any]],
+        final_type: type[F] = object,
+        *,
+        retain: int | None = None,
     ) -> None:
+        if retain is not None and retain < 0:
+            raise ValueError(f"retain must be >= 0, got {retain}")
         self._aiter: AsyncIterator[Event[Any]] = source.__aiter__()
         self._final_type: type[F] = final_type
         self._final_event: Event[F]
         self._final_event_set: bool = False
-        self._events: list[Event[Any]] = []
+        self._events: deque[Event[Any]] = deque(maxlen=retain)
 
     @property
     def final_type(self) -> type[F]:
@@ -146,7 +383,7 @@ class EventStream[F](AsyncIterator[Event[Any]]):
 
     @property
     def events(self) -> list[Event[Any]]:
-        return self._events
+        return list(self._events)
 
     def __aiter__(self) -> EventStream[F]:
         return self
@@ -162,7 +399,7 @@ class EventStream[F](AsyncIterator[Event[Any]]):
     async def drain(self) -> list[Event[Any]]:
         async for event in self:
             self._events.append(event)
-        return self._events
+        return list(self._events)
 
     async def final_event(self) -> Event[F]:
         async for _ in self:
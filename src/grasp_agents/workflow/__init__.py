@@ -1,6 +1,28 @@
-from .looped_workflow import LoopedWorkflow
-from .sequential_workflow import SequentialWorkflow
-from .workflow_processor import WorkflowProcessor
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .looped_workflow import LoopedWorkflow
+    from .sequential_workflow import SequentialWorkflow
+    from .workflow_processor import WorkflowProcessor
+
+_LAZY: dict[str, str] = {
+    "LoopedWorkflow": "looped_workflow",
+    "SequentialWorkflow": "sequential_workflow",
+    "WorkflowProcessor": "workflow_processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = attr  # cache for next access
+    return attr
+
 
 __all__ = [
     "LoopedWorkflow",
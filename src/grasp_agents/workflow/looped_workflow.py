@@ -1,19 +1,24 @@
-from collections.abc import AsyncIterator, Sequence
+from __future__ import annotations
+
 from itertools import pairwise
 from logging import getLogger
-from typing import Any, cast, final
+from typing import TYPE_CHECKING, Any, cast, final
 
-from grasp_agents.hooks import WorkflowLoopTerminator
-from grasp_agents.processors.processor import Processor
-from grasp_agents.session_context import SessionContext
 from grasp_agents.types.errors import WorkflowConstructionError
 from grasp_agents.types.events import Event, ProcPacketOutEvent, ProcPayloadOutEvent
-from grasp_agents.types.io import ProcName
 from grasp_agents.types.packet import Packet
 from grasp_agents.utils.callbacks import is_method_overridden
 
 from .workflow_processor import WorkflowProcessor
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from grasp_agents.hooks import WorkflowLoopTerminator
+    from grasp_agents.processors.processor import Processor
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.io import ProcName
+
 logger = getLogger(__name__)
 
 
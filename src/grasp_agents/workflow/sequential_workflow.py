@@ -1,17 +1,22 @@
+from __future__ import annotations
+
 import logging
-from collections.abc import AsyncIterator, Sequence
 from itertools import pairwise
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from grasp_agents.processors.processor import Processor
-from grasp_agents.session_context import SessionContext
 from grasp_agents.types.errors import WorkflowConstructionError
 from grasp_agents.types.events import Event, ProcPacketOutEvent, ProcPayloadOutEvent
-from grasp_agents.types.io import ProcName
 from grasp_agents.types.packet import Packet
 
 from .workflow_processor import WorkflowProcessor
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from grasp_agents.processors.processor import Processor
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.io import ProcName
+
 logger = logging.getLogger(__name__)
 
 
@@ -1,17 +1,22 @@
+from __future__ import annotations
+
 import logging
 from abc import ABC
-from collections.abc import Sequence
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from grasp_agents.durability.checkpoints import CheckpointKind, WorkflowCheckpoint
 from grasp_agents.processors.processor import Processor
-from grasp_agents.session_context import SessionContext
 from grasp_agents.telemetry import SpanKind
 from grasp_agents.types.errors import WorkflowConstructionError
-from grasp_agents.types.io import ProcName
-from grasp_agents.types.packet import Packet
 from grasp_agents.utils.callbacks import is_method_overridden
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from grasp_agents.session_context import SessionContext
+    from grasp_agents.types.io import ProcName
+    from grasp_agents.types.packet import Packet
+
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,162 @@
+"""
+Tests for the SQLite-backed approval store: the ApprovalStore contract,
+durability across instances, cross-instance (cross-process) resolution and
+clearing of pending requests, and TTL expiry.
+
+Two store instances on one database file stand in for two processes — each
+has its own connection and owner id, exactly as separate processes would.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+import grasp_agents
+from grasp_agents.agent.approval_store import (
+    ApprovalAllow,
+    ApprovalDeny,
+    ApprovalScope,
+    ApprovalStore,
+    PendingApproval,
+)
+from grasp_agents.agent.sqlite_approval_store import SqliteApprovalStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.asyncio
+
+
+def _pending(call_id: str = "c1", *, session_key: str = "s1") -> PendingApproval:
+    return PendingApproval(
+        session_key=session_key,
+        call_id=call_id,
+        tool_name="echo",
+        arguments='{"text": "hi"}',
+        approval_key="echo",
+    )
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Path:
+    return tmp_path / "state" / "approvals.db"
+
+
+def _open(path: Path, **kwargs: float) -> SqliteApprovalStore:
+    return SqliteApprovalStore(path, poll_interval=0.01, **kwargs)
+
+
+async def test_is_approval_store(db: Path) -> None:
+    store: ApprovalStore = _open(db)
+    assert isinstance(store, ApprovalStore)
+    assert grasp_agents.agent.SqliteApprovalStore is SqliteApprovalStore
+
+
+async def test_submit_and_resolve_locally(db: Path) -> None:
+    store = _open(db)
+    fut = await store.submit_pending(_pending())
+    assert [p.call_id for p in await store.list_pending("s1")] == ["c1"]
+
+    assert await store.resolve("s1", "c1", ApprovalAllow()) is True
+    assert fut.result() == ApprovalAllow()
+    assert await store.list_pending("s1") == []
+    assert await store.resolve("s1", "c1", ApprovalAllow()) is False
+    await store.close()
+
+
+async def test_allowlists_persist_across_instances(db: Path) -> None:
+    store = _open(db)
+    await store.submit_pending(_pending("c1"))
+    await store.resolve("s1", "c1", ApprovalAllow(scope=ApprovalScope.SESSION))
+    await store.add_persistent("global")
+    await store.close()
+
+    reopened = _open(db)
+    assert await reopened.is_pre_approved("echo", session_key="s1")
+    assert not await reopened.is_pre_approved("echo", session_key="s2")
+    assert await reopened.is_pre_approved("global", session_key="s2")
+
+    await reopened.clear_session("s1")
+    assert not await reopened.is_pre_approved("echo", session_key="s1")
+    await reopened.close()
+
+
+async def test_decision_from_another_process_completes_future(db: Path) -> None:
+    worker = _open(db)
+    ui = _open(db)
+    fut = await worker.submit_pending(_pending())
+
+    (pending,) = await ui.list_pending("s1")
+    assert pending == _pending()
+    assert await ui.resolve("s1", "c1", ApprovalDeny(reason="no")) is True
+
+    assert await asyncio.wait_for(fut, timeout=5) == ApprovalDeny(reason="no")
+    # The decided row is gone once the submitter has consumed it.
+    assert await ui.list_pending("s1") == []
+    assert await ui.resolve("s1", "c1", ApprovalAllow()) is False
+    await worker.close()
+    await ui.close()
+
+
+async def test_scoped_allow_from_another_process_updates_allowlist(
+    db: Path,
+) -> None:
+    worker = _open(db)
+    ui = _open(db)
+    fut = await worker.submit_pending(_pending())
+    await ui.resolve("s1", "c1", ApprovalAllow(scope=ApprovalScope.ALWAYS))
+
+    await asyncio.wait_for(fut, timeout=5)
+    assert await worker.is_pre_approved("echo", session_key="other")
+    await worker.close()
+    await ui.close()
+
+
+async def test_clear_session_elsewhere_cancels_future(db: Path) -> None:
+    worker = _open(db)
+    ui = _open(db)
+    fut = await worker.submit_pending(_pending())
+    await ui.clear_session("s1")
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(fut, timeout=5)
+    await worker.close()
+    await ui.close()
+
+
+async def test_session_ttl_expires_approvals(db: Path) -> None:
+    store = _open(db, session_ttl=0.05)
+    await store.add_session("s1", "echo")
+    assert await store.is_pre_approved("echo", session_key="s1")
+
+    await asyncio.sleep(0.1)
+    assert not await store.is_pre_approved("echo", session_key="s1")
+    assert await store.purge_expired() == 1
+    await store.close()
+
+
+async def test_pending_ttl_drops_abandoned_requests(db: Path) -> None:
+    abandoned = _open(db)
+    await abandoned.submit_pending(_pending())
+    await abandoned.close()  # the submitter "dies" without resolving
+
+    store = _open(db, pending_ttl=0.05)
+    assert len(await store.list_pending("s1")) == 1
+    await asyncio.sleep(0.1)
+    assert await store.list_pending("s1") == []
+    assert await store.purge_expired() == 1
+    await store.close()
+
+
+async def test_local_pending_ttl_purge_cancels_own_future(db: Path) -> None:
+    store = _open(db, pending_ttl=0.05)
+    fut = await store.submit_pending(_pending())
+    await asyncio.sleep(0.1)
+    assert await store.purge_expired() == 1
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(fut, timeout=5)
+    await store.close()
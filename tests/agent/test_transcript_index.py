@@ -0,0 +1,190 @@
+"""
+The transcript's incremental invariant index:
+
+* pairing validation, turn boundaries and answered calls match a full rescan
+  across any mix of appends, truncations and direct ``messages`` assignment
+* truncation rewinds the index (checkpoints) instead of rebuilding it
+* validation after an append touches only the new items
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from grasp_agents.agent.llm_agent_transcript import LLMAgentTranscript
+from grasp_agents.context.compaction import (
+    _turn_boundaries,  # pyright: ignore[reportPrivateUsage]
+    count_turns,
+)
+from grasp_agents.types.content import OutputMessageText
+from grasp_agents.types.errors import TranscriptInvariantError
+from grasp_agents.types.items import (
+    FunctionToolCallItem,
+    FunctionToolOutputItem,
+    InputItem,
+    InputMessageItem,
+    OutputMessageItem,
+    ReasoningItem,
+)
+
+
+def _user(text: str = "hi") -> InputMessageItem:
+    return InputMessageItem.from_text(text, role="user")
+
+
+def _call(call_id: str) -> FunctionToolCallItem:
+    return FunctionToolCallItem(call_id=call_id, name="echo", arguments="{}")
+
+
+def _result(call_id: str) -> FunctionToolOutputItem:
+    return FunctionToolOutputItem.from_tool_result(call_id=call_id, output="ok")
+
+
+def _answer() -> OutputMessageItem:
+    return OutputMessageItem(
+        content=[OutputMessageText(text="done")], status="completed"
+    )
+
+
+def _tool_turn(*call_ids: str) -> list[InputItem]:
+    return [
+        ReasoningItem(),
+        *(_call(c) for c in call_ids),
+        *(_result(c) for c in call_ids),
+    ]
+
+
+def _pairing_ok(messages: list[InputItem]) -> bool:
+    """The original full-scan validation."""
+    open_calls: list[str] = []
+    for item in messages:
+        if isinstance(item, FunctionToolCallItem):
+            open_calls.append(item.call_id)
+        elif isinstance(item, FunctionToolOutputItem):
+            if item.call_id in open_calls:
+                open_calls.remove(item.call_id)
+        elif isinstance(item, InputMessageItem) and open_calls:
+            return False
+    return not open_calls
+
+
+def _is_valid(transcript: LLMAgentTranscript) -> bool:
+    try:
+        transcript.validate_tool_call_pairing()
+    except TranscriptInvariantError:
+        return False
+    return True
+
+
+def _check(transcript: LLMAgentTranscript) -> None:
+    messages = transcript.messages
+    assert _is_valid(transcript) == _pairing_ok(messages)
+    assert list(transcript.turn_boundaries) == _turn_boundaries(messages)
+    for start in (0, *_turn_boundaries(messages)):
+        assert transcript.count_turns(start) == count_turns(messages[start:])
+    answered = {m.call_id for m in messages if isinstance(m, FunctionToolOutputItem)}
+    for call_id in ("a", "b", "c", "d"):
+        assert transcript.has_tool_result(call_id) == (call_id in answered)
+
+
+class TestIncrementalIndex:
+    def test_valid_log_passes(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), *_tool_turn("a", "b"), _answer()])
+        transcript.validate_tool_call_pairing()
+        assert transcript.count_turns() == 3
+        assert not transcript.owes_response
+
+    def test_dangling_call_raises(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), _call("a")])
+        assert transcript.owes_response
+        with pytest.raises(TranscriptInvariantError, match="unresolved"):
+            transcript.validate_tool_call_pairing()
+
+        transcript.update([_result("a")])
+        transcript.validate_tool_call_pairing()
+
+    def test_wedged_input_raises_until_truncated_away(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), _call("a"), _user("wedged"), _result("a")])
+        with pytest.raises(TranscriptInvariantError, match="'user' message"):
+            transcript.validate_tool_call_pairing()
+
+        transcript.truncate(2)
+        transcript.update([_result("a")])
+        transcript.validate_tool_call_pairing()
+
+    def test_truncate_rewinds_answered_calls(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), *_tool_turn("a"), _user(), *_tool_turn("b")])
+        assert transcript.has_tool_result("b")
+
+        transcript.truncate(4)
+        assert transcript.has_tool_result("a")
+        assert not transcript.has_tool_result("b")
+        _check(transcript)
+
+    def test_direct_assignment_rebuilds(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), *_tool_turn("a")])
+        transcript.validate_tool_call_pairing()
+
+        transcript.messages = [_user(), _call("b")]
+        assert not transcript.has_tool_result("a")
+        with pytest.raises(TranscriptInvariantError):
+            transcript.validate_tool_call_pairing()
+
+    def test_validation_scans_only_new_items(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), *_tool_turn("a")] * 50)
+        transcript.validate_tool_call_pairing()
+
+        scanned: list[int] = []
+        index = transcript._index  # pyright: ignore[reportPrivateUsage]
+        push = index._push  # pyright: ignore[reportPrivateUsage]
+
+        def counting_push(i: int, item: InputItem) -> None:
+            scanned.append(i)
+            push(i, item)
+
+        index._push = counting_push  # type: ignore[method-assign]  # pyright: ignore[reportPrivateUsage]
+        transcript.update([_user(), _answer()])
+        transcript.validate_tool_call_pairing()
+        transcript.validate_tool_call_pairing()
+        assert scanned == [200, 201]
+
+    def test_count_turns_from_an_interior_cut(self) -> None:
+        transcript = LLMAgentTranscript()
+        transcript.update([_user(), *_tool_turn("a"), _answer()])
+        messages = transcript.messages
+        for start in range(len(messages)):
+            assert transcript.count_turns(start, 4) == count_turns(messages[start:4])
+
+    def test_equality_ignores_index_state(self) -> None:
+        items = [_user(), *_tool_turn("a")]
+        indexed = LLMAgentTranscript(messages=list(items))
+        indexed.validate_tool_call_pairing()
+        assert indexed == LLMAgentTranscript(messages=list(items))
+
+    def test_matches_full_scan_under_random_edits(self) -> None:
+        rng = random.Random(7)  # noqa: S311 - deterministic fixture data
+        transcript = LLMAgentTranscript()
+        pool: list[InputItem] = [
+            _user(),
+            _answer(),
+            ReasoningItem(),
+            *(_call(c) for c in "abcd"),
+            *(_result(c) for c in "abcd"),
+        ]
+        for _ in range(400):
+            op = rng.random()
+            if op < 0.65:
+                transcript.update(rng.choices(pool, k=rng.randint(1, 4)))
+            elif op < 0.9:
+                transcript.truncate(rng.randint(0, len(transcript.messages)))
+            else:
+                transcript.messages = transcript.messages[: rng.randint(0, 20)]
+            _check(transcript)
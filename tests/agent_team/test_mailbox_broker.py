@@ -0,0 +1,152 @@
+"""
+Pushed mailbox wake-ups: with a ``MailboxNotifier``, a post wakes parked
+consumers at once — directly in-process, and across transports (processes)
+through a ``MailboxBroker`` — while a missing broker degrades to polling.
+
+Two ``CheckpointMailboxTransport``s over one store stand in for two processes
+sharing a ``FileCheckpointStore``: each has its own notifier connection and
+arrival flags, exactly as separate processes would.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import socket
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grasp_agents.durability import InMemoryCheckpointStore
+from grasp_agents.inbox import AgentInbox
+from grasp_agents.mailbox import CheckpointMailboxTransport
+from grasp_agents.mailbox_broker import MailboxBroker, MailboxNotifier
+from grasp_agents.types.message import TeamMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets"),
+]
+
+# Long enough that only a pushed wake can deliver within the test timeouts.
+_SLOW_POLL = 30.0
+
+
+@pytest.fixture
+def sock() -> Iterator[Path]:
+    # Unix socket paths are length-limited; pytest's tmp_path can exceed it.
+    root = Path(tempfile.mkdtemp(prefix="gamb"))
+    yield root / "mailbox.sock"
+    shutil.rmtree(root, ignore_errors=True)
+
+
+def _msg(text: str = "hi") -> TeamMessage:
+    return TeamMessage.from_text(sender="alice", to="bob", text=text)
+
+
+async def test_local_post_wakes_parked_consumer_without_broker(sock: Path) -> None:
+    notifier = MailboxNotifier(sock)  # nothing listens at ``sock``
+    transport = CheckpointMailboxTransport(
+        InMemoryCheckpointStore(),
+        session_key="s",
+        poll_interval=_SLOW_POLL,
+        notifier=notifier,
+    )
+    consumer = asyncio.create_task(transport.consume("bob"))
+    await asyncio.sleep(0.01)
+    await transport.post(_msg())
+
+    message = await asyncio.wait_for(consumer, timeout=2)
+    assert isinstance(message, TeamMessage)
+    assert message.text == "hi"
+    await notifier.close()
+
+
+async def test_post_in_one_process_wakes_consumer_in_another(sock: Path) -> None:
+    store = InMemoryCheckpointStore()
+    async with MailboxBroker(sock):
+        sender_notifier = MailboxNotifier(sock)
+        receiver_notifier = MailboxNotifier(sock, poll_interval=_SLOW_POLL)
+        sender = CheckpointMailboxTransport(
+            store, session_key="s", notifier=sender_notifier
+        )
+        receiver = CheckpointMailboxTransport(
+            store, session_key="s", poll_interval=_SLOW_POLL, notifier=receiver_notifier
+        )
+        consumer = asyncio.create_task(receiver.consume("bob"))
+        await asyncio.sleep(0.05)  # parked, subscribed
+        assert receiver_notifier.connected
+
+        await sender.post(_msg())
+        message = await asyncio.wait_for(consumer, timeout=2)
+        assert isinstance(message, TeamMessage)
+
+        await sender_notifier.close()
+        await receiver_notifier.close()
+
+
+async def test_resident_inbox_wait_wakes_on_remote_post(sock: Path) -> None:
+    store = InMemoryCheckpointStore()
+    async with MailboxBroker(sock):
+        notifiers = [MailboxNotifier(sock), MailboxNotifier(sock)]
+        sender, receiver = (
+            CheckpointMailboxTransport(store, session_key="s", notifier=n)
+            for n in notifiers
+        )
+        inbox = AgentInbox(transport=receiver, recipient="bob")
+        waiter = asyncio.create_task(inbox.wait(timeout=_SLOW_POLL))
+        await asyncio.sleep(0.05)
+
+        await sender.post(_msg())
+        await asyncio.wait_for(waiter, timeout=2)
+        assert await inbox.has_pending()
+
+        for notifier in notifiers:
+            await notifier.close()
+
+
+async def test_missing_broker_falls_back_to_polling(sock: Path) -> None:
+    store = InMemoryCheckpointStore()
+    notifier = MailboxNotifier(sock)
+    sender = CheckpointMailboxTransport(store, session_key="s")
+    receiver = CheckpointMailboxTransport(
+        store, session_key="s", poll_interval=0.02, notifier=notifier
+    )
+    consumer = asyncio.create_task(receiver.consume("bob"))
+    await asyncio.sleep(0.05)
+    await sender.post(_msg())
+
+    assert isinstance(await asyncio.wait_for(consumer, timeout=2), TeamMessage)
+    assert not notifier.connected
+    await notifier.close()
+
+
+async def test_notifier_can_start_the_broker(sock: Path) -> None:
+    first = MailboxNotifier(sock, start_broker=True)
+    second = MailboxNotifier(sock, start_broker=True)
+    woken = asyncio.Event()
+
+    await first.subscribe("topic", woken.set)
+    await second.publish("topic")
+    await asyncio.wait_for(woken.wait(), timeout=2)
+
+    assert sock.exists()
+    await second.close()
+    await first.close()  # stops the broker it started
+    assert not sock.exists()
+
+
+async def test_broker_replaces_stale_socket_but_not_live_one(sock: Path) -> None:
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(sock))  # bound but never listening: a crashed broker's file
+    stale.close()
+
+    async with MailboxBroker(sock) as broker:
+        assert broker.is_serving
+        with pytest.raises(FileExistsError):
+            await MailboxBroker(sock).start()
@@ -24,8 +24,10 @@ from grasp_agents.context.compaction import (
     DEFAULT_MAX_INPUT_TOKENS,
     CollapseToolOutputsProjector,
     ContextBudget,
+    collapse_tool_output_edits,
     collapse_tool_outputs,
 )
+from grasp_agents.hooks import ViewEditor
 from grasp_agents.llm import count_input_tokens
 from grasp_agents.session_context import SessionContext
 from grasp_agents.tools.base import BaseTool
@@ -134,6 +136,25 @@ def test_collapses_older_outputs_keeps_recent() -> None:
     assert c2.text == "B" * 5000  # recent → verbatim
 
 
+def test_edits_name_only_the_collapsed_positions() -> None:
+    msgs = [
+        _call("c1"),
+        _result("c1", "A" * 5000),
+        _call("c2"),
+        _result("c2", "B" * 5000),
+    ]
+    edits = collapse_tool_output_edits(
+        msgs, keep_recent_turns=1, head_chars=100, tail_chars=50
+    )
+    assert list(edits) == [1]
+    out = collapse_tool_outputs(
+        msgs, keep_recent_turns=1, head_chars=100, tail_chars=50
+    )
+    assert out[1] == edits[1]
+    assert out[0] is msgs[0]
+    assert out[3] is msgs[3]
+
+
 def test_recent_window_is_kept_verbatim() -> None:
     # Fewer turns than keep_recent_turns ⇒ nothing is old ⇒ no collapse.
     msgs = [_call("c1"), _result("c1", BIG)]
@@ -229,6 +250,17 @@ async def test_projector_is_budget_gated() -> None:
     assert NOTICE in c1.text  # old output collapsed once over budget
 
 
+@pytest.mark.asyncio
+async def test_projector_edits_are_budget_gated() -> None:
+    msgs = [_call("c1"), _result("c1", BIG), _call("c2"), _result("c2", BIG)]
+    projector = CollapseToolOutputsProjector(budget=_budget(1), keep_recent_turns=1)
+    assert isinstance(projector, ViewEditor)
+    assert await projector.edits(msgs, exec_id="x", input_tokens=0) == {}
+    edits = await projector.edits(msgs, exec_id="x", input_tokens=OVER)
+    assert list(edits) == [1]
+    assert NOTICE in edits[1].text  # pyright: ignore[reportAttributeAccessIssue]
+
+
 @pytest.mark.asyncio
 async def test_projector_proactive_ignores_budget() -> None:
     msgs = [_call("c1"), _result("c1", BIG), _call("c2"), _result("c2", BIG)]
@@ -13,6 +13,7 @@ from collections.abc import Sequence
 
 import pytest
 
+from grasp_agents.agent.context_window import ContextWindowManager
 from grasp_agents.agent.llm_agent_transcript import LLMAgentTranscript
 from grasp_agents.context.projection import apply_folds, repair_tool_call_pairing
 from grasp_agents.context.system_reminder import wrap_in_system_reminder
@@ -23,6 +24,7 @@ from grasp_agents.types.items import (
     InputItem,
     InputMessageItem,
 )
+from tests._helpers import MockLLM
 
 
 def _user(text: str) -> InputMessageItem:
@@ -107,6 +109,19 @@ def test_multiple_open_calls_all_resolved() -> None:
     _assert_valid(repaired)
 
 
+def test_repeated_call_id_resolved_per_call() -> None:
+    # Two open calls share an id; one result pairs, the other is stubbed.
+    messages = [_call("c1"), _call("c1"), _result("c1"), _user("next")]
+    repaired = repair_tool_call_pairing(messages)
+    assert _output_call_ids(repaired) == ["c1", "c1"]
+
+
+def test_accepts_an_iterable() -> None:
+    head = [_user("sys")]
+    body = [_call("c1"), _result("c1")]
+    assert repair_tool_call_pairing(iter([*head, *body])) == [*head, *body]
+
+
 def test_empty_view() -> None:
     assert repair_tool_call_pairing([]) == []
 
@@ -188,3 +203,68 @@ def test_fold_preserves_tool_pairing() -> None:
     out = apply_folds(messages, [FoldSpec(start=1, end=3, summary="used a tool")])
     _assert_valid(out)
     assert repair_tool_call_pairing(out) == out  # nothing to repair
+
+
+# --- ContextWindowManager: cached folded view ---
+
+
+def _manager(
+    messages: list[InputItem],
+) -> tuple[ContextWindowManager, LLMAgentTranscript]:
+    transcript = LLMAgentTranscript(messages=messages)
+    return (
+        ContextWindowManager(transcript=transcript, llm=MockLLM(), source="a"),
+        transcript,
+    )
+
+
+@pytest.mark.asyncio
+async def test_folded_view_is_extended_on_append() -> None:
+    cw, transcript = _manager([_user(c) for c in "abcd"])
+    cw.folds = [FoldSpec(start=0, end=2, summary="S")]
+    first = await cw.project_view(exec_id="x")
+    summary_item = first[0]
+
+    transcript.update([_user("e")])
+    second = await cw.project_view(exec_id="x")
+    assert _summary(second) == [_sum("S"), "c", "d", "e"]
+    assert second[0] is summary_item  # the fold was not re-applied
+
+
+@pytest.mark.asyncio
+async def test_folded_view_rebuilt_on_truncation_and_new_fold() -> None:
+    cw, transcript = _manager([_user(c) for c in "abcd"])
+    cw.folds = [FoldSpec(start=0, end=2, summary="S")]
+    await cw.project_view(exec_id="x")
+
+    transcript.truncate(3)
+    transcript.update([_user("x")])
+    assert _summary(await cw.project_view(exec_id="x")) == [_sum("S"), "c", "x"]
+
+    cw.folds.append(FoldSpec(start=2, end=3, summary="T"))
+    assert _summary(await cw.project_view(exec_id="x")) == [
+        _sum("S"),
+        _sum("T"),
+        "x",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_view_editor_applies_edits_without_touching_cache() -> None:
+    class _Upper:
+        async def __call__(
+            self, messages: list[InputItem], *, exec_id: str, input_tokens: int
+        ) -> Sequence[InputItem]:
+            raise AssertionError("edits() should be used instead")
+
+        async def edits(
+            self, messages: Sequence[InputItem], *, exec_id: str, input_tokens: int
+        ) -> dict[int, InputItem]:
+            return {len(messages) - 1: _user("EDITED")}
+
+    cw, _ = _manager([_user(c) for c in "abc"])
+    cw.folds = [FoldSpec(start=0, end=1, summary="S")]
+    cw.add_view_projector(_Upper())
+    assert _summary(await cw.project_view(exec_id="x")) == [_sum("S"), "b", "EDITED"]
+    # The cached folded body is unchanged; the next view re-applies the edit.
+    assert _summary(await cw.project_view(exec_id="x")) == [_sum("S"), "b", "EDITED"]
@@ -22,7 +22,11 @@ from typing import Any
 import pytest
 from pydantic import BaseModel, Field
 
-from grasp_agents.context.prompt_builder import PromptBuilder, SystemPromptSection
+from grasp_agents.context.prompt_builder import (
+    PromptBuilder,
+    SystemPromptSection,
+    static_cache_key,
+)
 from grasp_agents.session_context import SessionContext
 from grasp_agents.types.content import (
     CacheControl,
@@ -373,3 +377,103 @@ class TestSystemPrompt:
         assert parts[1].cache_control == CacheControl(ttl="1h")
         # No provider-specific field is set on either part.
         assert all(p.provider_specific_fields is None for p in parts)
+
+
+class TestSectionCache:
+    """Memoized section renders keyed on a declared ``cache_key``."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_key_reuses_render(self):
+        builder = _make_builder(str, sys_prompt="Base.")
+        calls: list[int] = []
+        version = {"v": 0}
+
+        def compute(**_: Any) -> str:
+            calls.append(version["v"])
+            return f"Block v{version['v']}."
+
+        builder.add_system_prompt_section(
+            SystemPromptSection(
+                name="versioned",
+                compute=compute,
+                cache_key=lambda **_: version["v"],
+            )
+        )
+        first = await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c1")
+        second = await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c2")
+        assert first is not None
+        assert second is not None
+        assert calls == [0]
+        # Same part object — the emitted bytes cannot drift.
+        assert second[1] is first[1]
+
+        version["v"] = 1
+        third = await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c3")
+        assert third is not None
+        assert third[1].text == "Block v1."
+        assert calls == [0, 1]
+
+        stats = builder.section_stats["versioned"]
+        assert (stats.computes, stats.hits) == (2, 1)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    @pytest.mark.asyncio
+    async def test_uncached_section_recomputes_but_keeps_identical_part(self):
+        builder = _make_builder(str)
+        calls: list[None] = []
+
+        def compute(**_: Any) -> str:
+            calls.append(None)
+            return "Stable."
+
+        builder.add_system_prompt_section(
+            SystemPromptSection(name="plain", compute=compute)
+        )
+        first = await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c1")
+        second = await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c2")
+        assert first is not None
+        assert second is not None
+        assert len(calls) == 2
+        assert second[0] is first[0]
+        assert builder.section_stats["plain"].hits == 0
+
+    @pytest.mark.asyncio
+    async def test_none_key_forces_recompute(self):
+        builder = _make_builder(str)
+        calls: list[None] = []
+
+        def compute(**_: Any) -> str:
+            calls.append(None)
+            return "Block."
+
+        builder.add_system_prompt_section(
+            SystemPromptSection(
+                name="opt_out", compute=compute, cache_key=lambda **_: None
+            )
+        )
+        await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c1")
+        await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c2")
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_replaced_section_and_invalidation_drop_cached_render(self):
+        builder = _make_builder(str)
+        builder.add_system_prompt_section(
+            SystemPromptSection(
+                name="s", compute=lambda **_: "old", cache_key=static_cache_key
+            )
+        )
+        await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c1")
+
+        builder.add_system_prompt_section(
+            SystemPromptSection(
+                name="s", compute=lambda **_: "new", cache_key=static_cache_key
+            )
+        )
+        parts = await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c2")
+        assert parts is not None
+        assert [p.text for p in parts] == ["new"]
+
+        builder.invalidate_section_cache("s")
+        await builder.build_system_prompt_parts(ctx=_ctx(), exec_id="c3")
+        assert builder.section_stats["s"].computes == 3
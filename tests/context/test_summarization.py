@@ -8,6 +8,8 @@ originals, fold persistence across resume, rollback dropping folds past the
 rewind point, and the context-window-error recovery path.
 """
 
+import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -34,6 +36,7 @@ from grasp_agents.types.folds import FoldSpec
 from grasp_agents.types.items import (
     FunctionToolCallItem,
     FunctionToolOutputItem,
+    InputItem,
     InputMessageItem,
     OutputMessageItem,
     ReasoningItem,
@@ -259,6 +262,157 @@ async def test_compaction_gate_measures_post_projection_view() -> None:
     assert projected < raw  # the big old output is collapsed before the gate reads it
 
 
+# --- Speculative (background) summarization ---
+
+
+class _GatedSummarizer:
+    """Counts calls; each summary resolves only once ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.tasks: list[asyncio.Task[Any]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, messages: Sequence[InputItem]) -> str:
+        self.calls.append(len(messages))
+        if (task := asyncio.current_task()) is not None:
+            self.tasks.append(task)
+        await self.release.wait()
+        return f"SUMMARY-{len(self.calls)}"
+
+
+def _speculative(summarizer: _GatedSummarizer) -> SummarizingCompactor:
+    return SummarizingCompactor(
+        summarizer=summarizer,
+        budget=_budget(100),
+        keep_recent_turns=2,
+        speculate_at=0.5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_speculation_starts_past_watermark_only() -> None:
+    summarizer = _GatedSummarizer()
+    comp = _speculative(summarizer)
+    msgs = [_user(BIGMSG) for _ in range(10)]
+
+    assert await comp(msgs, input_tokens=40, folds=[], exec_id="x") is None
+    await asyncio.sleep(0)
+    assert summarizer.calls == []
+
+    assert await comp(msgs, input_tokens=60, folds=[], exec_id="x") is None
+    assert await comp(msgs, input_tokens=70, folds=[], exec_id="x") is None
+    await asyncio.sleep(0)
+    assert summarizer.calls == [8]  # one speculation, reused across turns
+    comp.cancel_speculation()
+
+
+@pytest.mark.asyncio
+async def test_speculation_applied_at_fold_point() -> None:
+    summarizer = _GatedSummarizer()
+    comp = _speculative(summarizer)
+    msgs = [_user(BIGMSG) for _ in range(10)]
+
+    await comp(msgs, input_tokens=60, folds=[], exec_id="x")
+    msgs.append(_user(BIGMSG))  # the log grows; the speculated range is intact
+    summarizer.release.set()
+
+    fold = await comp(msgs, input_tokens=200, folds=[], exec_id="x")
+    assert fold == FoldSpec(start=0, end=8, summary="SUMMARY-1")
+    assert len(summarizer.calls) == 1  # no second summarizer call
+
+
+@pytest.mark.asyncio
+async def test_speculation_discarded_after_rewrite() -> None:
+    summarizer = _GatedSummarizer()
+    comp = _speculative(summarizer)
+    msgs = [_user(BIGMSG) for _ in range(10)]
+
+    await comp(msgs, input_tokens=60, folds=[], exec_id="x")
+    await asyncio.sleep(0)
+    speculation = comp._speculation  # pyright: ignore[reportPrivateUsage]
+    assert speculation is not None
+
+    # A rollback truncates the range and new items take its place.
+    msgs[5:] = [_user(BIGMSG) for _ in range(5)]
+    summarizer.release.set()
+
+    fold = await comp(msgs, input_tokens=200, folds=[], exec_id="x")
+    assert fold == FoldSpec(start=0, end=8, summary="SUMMARY-2")
+    await asyncio.sleep(0)
+    assert speculation.task.cancelled()
+    assert len(summarizer.calls) == 2  # recomputed synchronously
+
+
+@pytest.mark.asyncio
+async def test_speculation_discarded_after_new_fold() -> None:
+    summarizer = _GatedSummarizer()
+    comp = _speculative(summarizer)
+    msgs = [_user(BIGMSG) for _ in range(12)]
+
+    await comp(msgs, input_tokens=60, folds=[], exec_id="x")
+    await asyncio.sleep(0)
+    summarizer.release.set()
+
+    folds = [FoldSpec(start=0, end=3, summary="prev")]
+    fold = await comp(msgs, input_tokens=200, folds=folds, exec_id="x")
+    assert fold is not None
+    assert fold.start == 3
+    assert len(summarizer.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_speculation_cancels_task() -> None:
+    summarizer = _GatedSummarizer()
+    comp = _speculative(summarizer)
+    msgs = [_user(BIGMSG) for _ in range(10)]
+
+    await comp(msgs, input_tokens=60, folds=[], exec_id="x")
+    speculation = comp._speculation  # pyright: ignore[reportPrivateUsage]
+    assert speculation is not None
+
+    comp.cancel_speculation()
+    await asyncio.sleep(0)
+    assert speculation.task.cancelled()
+    assert comp._speculation is None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_speculation_cancelled_when_run_ends() -> None:
+    summarizer = _GatedSummarizer()  # never released: the summary stays in flight
+    comp = SummarizingCompactor(
+        summarizer=summarizer,
+        budget=_budget(6000),
+        keep_recent_turns=1,
+        speculate_at=0.1,
+    )
+    llm = MockLLM(
+        responses_queue=[
+            _tool_call_response("big", "{}", "c1"),
+            _tool_call_response("big", "{}", "c2"),
+            _tool_call_response("big", "{}", "c3"),
+            _text_response("done"),
+        ]
+    )
+    agent = LLMAgent[str, str, None](
+        name="a", ctx=SessionContext(), llm=llm, tools=[_BigTool()]
+    )
+    agent.add_compactor(comp)
+
+    await agent.run("go")
+    await asyncio.sleep(0)
+
+    assert summarizer.calls  # a speculation was started mid-run
+    assert comp._speculation is None  # pyright: ignore[reportPrivateUsage]
+    assert summarizer.tasks
+    assert all(task.cancelled() for task in summarizer.tasks)
+
+
+def test_speculate_at_validated() -> None:
+    with pytest.raises(ValueError, match="speculate_at"):
+        SummarizingCompactor(summarizer=_GatedSummarizer(), speculate_at=1.5)
+
+
 # --- Compaction bundle ---
 
 
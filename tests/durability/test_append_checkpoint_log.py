@@ -9,17 +9,22 @@ watermark, torn-tail tolerance, in-place file appends, and agent resume parity.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from grasp_agents.durability import (
     AgentCheckpoint,
+    BinaryCodec,
+    CheckpointKind,
     CheckpointStore,
     FileCheckpointStore,
     InMemoryCheckpointStore,
     StepWatermark,
 )
+from grasp_agents.durability.checkpoint_mixin import AgentCheckpointPersistMixin
+from grasp_agents.durability.checkpoints import AgentContextState
+from grasp_agents.session_context import SessionContext
 from grasp_agents.types.items import InputItem, InputMessageItem
 from tests.durability.test_sessions import (  # type: ignore[attr-defined]  # pyright: ignore[reportPrivateUsage]
     _make_agent,
@@ -48,11 +53,13 @@ def _texts(messages: Sequence[InputItem]) -> list[str]:
     return [m.text for m in messages if isinstance(m, InputMessageItem)]
 
 
-@pytest.fixture(params=["memory", "file"])
+@pytest.fixture(params=["memory", "file", "file-binary"])
 def store(request: pytest.FixtureRequest, tmp_path: Path) -> CheckpointStore:
     kind: str = request.param
     if kind == "memory":
         return InMemoryCheckpointStore()
+    if kind == "file-binary":
+        return FileCheckpointStore(tmp_path, codec=BinaryCodec())
     return FileCheckpointStore(tmp_path)
 
 
@@ -290,3 +297,149 @@ async def test_reset_transcript_rewrites_log(tmp_path: Path) -> None:
     assert user_texts == ["second message"]  # the first run's records are gone
     # The superseded generation-0 file is removed.
     assert await store.read_messages("sess/agent/test_agent") == []
+
+
+# ---------------------------------------------------------------------------
+# Delta saves: cursor-driven appends, spliced head, cached context state
+# ---------------------------------------------------------------------------
+
+
+class _Holder(AgentCheckpointPersistMixin):
+    _checkpoint_kind = CheckpointKind.AGENT
+
+    def __init__(self) -> None:
+        self._path = ["test_agent"]
+        self._checkpoint_number = 0
+
+
+class _RecordingStore(InMemoryCheckpointStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.appended: list[int] = []
+        self.rewritten: list[int] = []
+        # ``None`` for a full read, else a tail read's start.
+        self.reads: list[int | None] = []
+
+    async def append_messages(
+        self, key: str, messages: Sequence[InputItem], *, version: int = 0
+    ) -> None:
+        self.appended.append(len(messages))
+        await super().append_messages(key, messages, version=version)
+
+    async def rewrite_messages(
+        self, key: str, messages: Sequence[InputItem], *, version: int = 0
+    ) -> None:
+        self.rewritten.append(len(messages))
+        await super().rewrite_messages(key, messages, version=version)
+
+    async def read_messages(self, key: str, *, version: int = 0) -> list[InputItem]:
+        self.reads.append(None)
+        return await super().read_messages(key, version=version)
+
+    async def read_message_tail(
+        self, key: str, *, start: int, version: int = 0
+    ) -> list[InputItem]:
+        self.reads.append(start)
+        return await super().read_message_tail(key, start=start, version=version)
+
+
+def _head(state: AgentContextState) -> AgentCheckpoint:
+    return AgentCheckpoint(
+        session_key="s1",
+        processor_name="test_agent",
+        current=StepWatermark(turn=2, step=1, agent_ctx_state=state),
+        step_watermarks=[StepWatermark(step=0, agent_ctx_state=state)],
+        output="done",
+    )
+
+
+async def test_live_transcript_saves_append_only_the_delta() -> None:
+    store = _RecordingStore()
+    ctx = SessionContext[None](checkpoint_store=store, session_key="s1")
+    holder = _Holder()
+    live = _msgs("a", "b")
+
+    await holder._serialize_agent_checkpoint(ctx, _head(AgentContextState()), live)
+    live.extend(_msgs("c"))
+    await holder._serialize_agent_checkpoint(ctx, _head(AgentContextState()), live)
+
+    assert store.appended == [2, 1]
+    assert store.rewritten == []
+    loaded = await load_agent_checkpoint(store, KEY)
+    assert loaded is not None
+    assert _texts(loaded.messages) == ["a", "b", "c"]
+
+
+async def test_reload_by_the_writer_decodes_only_the_tail() -> None:
+    store = _RecordingStore()
+    ctx = SessionContext[None](checkpoint_store=store, session_key="s1")
+    writer = _Holder()
+    live = _msgs("a", "b")
+    await writer._serialize_agent_checkpoint(ctx, _head(AgentContextState()), live)
+
+    reloaded = await writer._deserialize_agent_checkpoint(ctx)
+    assert reloaded is not None
+    assert _texts(reloaded.messages) == ["a", "b"]
+    assert store.reads == [2]
+
+    # Another instance has no cursor over the log: it reads it whole.
+    fresh = await _Holder()._deserialize_agent_checkpoint(ctx)
+    assert fresh is not None
+    assert _texts(fresh.messages) == ["a", "b"]
+    assert store.reads == [2, None]
+
+
+async def test_spliced_head_matches_a_full_dump() -> None:
+    store = InMemoryCheckpointStore()
+    ctx = SessionContext[None](checkpoint_store=store, session_key="s1")
+    state = AgentContextState(read_file_state={"/a.py": 1.5}, shell_cwd="/w")
+    checkpoint = _head(state)
+
+    await _Holder()._serialize_agent_checkpoint(ctx, checkpoint, _msgs("x"))
+
+    blob = await store.load(KEY)
+    assert blob is not None
+    assert AgentCheckpoint.model_validate_json(blob) == checkpoint
+
+
+async def test_unchanged_context_state_is_serialized_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ctx = SessionContext[None](
+        checkpoint_store=InMemoryCheckpointStore(), session_key="s1"
+    )
+    holder = _Holder()
+    dumps: list[AgentContextState] = []
+    dump = AgentContextState.model_dump_json
+
+    def counting_dump(self: AgentContextState, **kwargs: Any) -> str:
+        dumps.append(self)
+        return dump(self, **kwargs)
+
+    monkeypatch.setattr(AgentContextState, "model_dump_json", counting_dump)
+    live = _msgs("a")
+    state = AgentContextState(shell_cwd="/w")
+    for _ in range(3):
+        await holder._serialize_agent_checkpoint(ctx, _head(state), live)
+    # An equal state object (a fresh snapshot) reuses the cached form too.
+    await holder._serialize_agent_checkpoint(
+        ctx, _head(AgentContextState(shell_cwd="/w")), live
+    )
+    assert dumps == [state]
+
+    await holder._serialize_agent_checkpoint(
+        ctx, _head(AgentContextState(shell_cwd="/elsewhere")), live
+    )
+    assert len(dumps) == 2
+
+
+async def test_agent_context_snapshot_is_reused_while_clean() -> None:
+    agent, _ = _make_agent([_text_response("one")])
+    agent_ctx = agent._agent_ctx  # pyright: ignore[reportPrivateUsage]
+    first = agent_ctx.snapshot()
+    assert agent_ctx.snapshot() is first
+
+    agent_ctx.shell_state.cwd = "/elsewhere"
+    changed = agent_ctx.snapshot()
+    assert changed is not first
+    assert changed.shell_cwd == "/elsewhere"
@@ -0,0 +1,173 @@
+"""
+Message-log codecs: binary frames, zstd, out-of-line parts, partial decode.
+
+Covers :class:`BinaryCodec` through :class:`FileCheckpointStore` (the codec is
+chosen per store), reading logs that mix JSON lines and binary frames, torn /
+missing-blob tolerance, and ``read_message_tail`` skipping the head of a log.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grasp_agents.durability import (
+    BinaryCodec,
+    CheckpointSchemaError,
+    CheckpointStore,
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+)
+from grasp_agents.durability.codec import decode_message_log, encode_messages
+from grasp_agents.types.items import (
+    InputImage,
+    InputItem,
+    InputMessageItem,
+    InputText,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.asyncio
+
+KEY = "s1/agent/a"
+
+_IMAGE_URL = "data:image/png;base64," + "iVBORw0KGgo" * 2000
+
+
+def _msgs(*texts: str) -> list[InputItem]:
+    return [InputMessageItem.from_text(t, role="user") for t in texts]
+
+
+def _texts(messages: list[InputItem]) -> list[str]:
+    return [m.text for m in messages if isinstance(m, InputMessageItem)]
+
+
+def _image_msg(caption: str) -> InputMessageItem:
+    return InputMessageItem(
+        role="user",
+        content=[InputText(text=caption), InputImage(image_url=_IMAGE_URL)],
+    )
+
+
+def _blob_files(root: Path) -> list[Path]:
+    return [p for p in (root / ".blobs").rglob("*") if p.is_file()]
+
+
+async def test_binary_log_round_trips(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, codec=BinaryCodec(body="json"))
+    messages = [*_msgs("a"), _image_msg("b")]
+    await store.append_messages(KEY, messages)
+
+    assert (tmp_path / "s1/agent/a.jsonl").read_bytes()[0] == 0  # a binary frame
+    assert await store.read_messages(KEY) == messages
+
+
+async def test_large_parts_are_stored_out_of_line_once(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, codec=BinaryCodec(inline_limit=1024))
+    messages = [_image_msg("one"), _image_msg("two")]
+    await store.append_messages(KEY, messages)
+    await store.append_messages("s2/agent/b", [_image_msg("three")])
+
+    # One blob for the image, shared by both records and both sessions.
+    assert len(_blob_files(tmp_path)) == 1
+    log = (tmp_path / "s1/agent/a.jsonl").read_bytes()
+    assert len(log) < len(_IMAGE_URL)
+    assert await store.read_messages(KEY) == messages
+    # Blob files are not checkpoint keys.
+    assert await store.list_keys("") == []
+
+
+async def test_zstd_compresses_frames_and_blobs(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    store = FileCheckpointStore(
+        tmp_path, codec=BinaryCodec(compression="zstd", inline_limit=8000)
+    )
+    await store.append_messages(KEY, [*_msgs("x" * 5000), _image_msg("img")])
+
+    (blob,) = _blob_files(tmp_path)
+    assert blob.stat().st_size < len(_IMAGE_URL) // 10
+    assert (tmp_path / "s1/agent/a.jsonl").stat().st_size < 1000
+    assert _texts(await store.read_messages(KEY)) == ["x" * 5000, "img"]
+
+
+async def test_msgpack_body_round_trips(tmp_path: Path) -> None:
+    pytest.importorskip("msgpack")
+    store = FileCheckpointStore(tmp_path, codec=BinaryCodec(body="msgpack"))
+    messages = [*_msgs("a"), _image_msg("b")]
+    await store.append_messages(KEY, messages)
+
+    assert await store.read_messages(KEY) == messages
+
+
+async def test_json_log_stays_readable_after_switching_codec(tmp_path: Path) -> None:
+    await FileCheckpointStore(tmp_path).append_messages(KEY, _msgs("old"))
+
+    store = FileCheckpointStore(tmp_path, codec=BinaryCodec(inline_limit=1024))
+    await store.append_messages(KEY, [_image_msg("new")])
+
+    assert _texts(await store.read_messages(KEY)) == ["old", "new"]
+
+
+async def test_torn_frame_is_discarded(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, codec=BinaryCodec())
+    await store.append_messages(KEY, _msgs("a", "b"))
+    log_path = tmp_path / "s1/agent/a.jsonl"
+    intact = log_path.read_bytes()
+
+    await store.append_messages(KEY, _msgs("c"))
+    torn = log_path.read_bytes()[:-3]
+    log_path.write_bytes(torn)
+    assert _texts(await store.read_messages(KEY)) == ["a", "b"]
+
+    # A frame whose payload no longer matches its checksum ends the log too.
+    corrupt = bytearray(torn + b"xyz")
+    corrupt[len(intact) + 12] ^= 0xFF
+    log_path.write_bytes(bytes(corrupt))
+    assert _texts(await store.read_messages(KEY)) == ["a", "b"]
+
+
+async def test_record_with_missing_blob_ends_the_log(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, codec=BinaryCodec(inline_limit=1024))
+    await store.append_messages(KEY, [*_msgs("a"), _image_msg("b"), *_msgs("c")])
+    for blob in _blob_files(tmp_path):
+        blob.unlink()
+
+    assert _texts(await store.read_messages(KEY)) == ["a"]
+
+
+async def test_newer_frame_version_is_a_schema_error() -> None:
+    frame = bytearray(BinaryCodec(body="json").encode(_msgs("a")).records)
+    frame[1] = 99
+
+    with pytest.raises(CheckpointSchemaError):
+        decode_message_log(bytes(frame))
+
+
+async def test_start_skips_records_without_decoding_them() -> None:
+    binary = BinaryCodec(body="json").encode(_msgs("b", "c")).records
+    log = b"not json at all\n" + encode_messages(_msgs("a")) + binary
+
+    assert decode_message_log(log) == []  # the bad first record ends a full read
+    assert _texts(decode_message_log(log, start=1)) == ["a", "b", "c"]
+    assert _texts(decode_message_log(log, start=3)) == ["c"]
+
+
+@pytest.mark.parametrize("kind", ["memory", "file", "file-binary"])
+async def test_read_message_tail(kind: str, tmp_path: Path) -> None:
+    store: CheckpointStore
+    if kind == "memory":
+        store = InMemoryCheckpointStore()
+    elif kind == "file":
+        store = FileCheckpointStore(tmp_path)
+    else:
+        store = FileCheckpointStore(tmp_path, codec=BinaryCodec())
+    await store.append_messages(KEY, _msgs("a", "b", "c"), version=1)
+
+    assert _texts(await store.read_message_tail(KEY, start=1, version=1)) == [
+        "b",
+        "c",
+    ]
+    assert await store.read_message_tail(KEY, start=3, version=1) == []
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import gc
+import os
+import stat
 from typing import TYPE_CHECKING
 
 import pytest
 
 from grasp_agents.durability import CheckpointStore, FileCheckpointStore
+from grasp_agents.durability import file_checkpoint_store as fcs
+from grasp_agents.types.items import InputMessageItem
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from grasp_agents.types.items import InputItem
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -198,3 +205,160 @@ async def test_symlink_escape_is_caught(tmp_path: Path) -> None:
         for p in outside.glob("*"):
             p.unlink()
         outside.rmdir()
+
+
+# ---------------------------------------------------------------------------
+# Group commit
+# ---------------------------------------------------------------------------
+
+
+def _msgs(*texts: str) -> list[InputItem]:
+    return [InputMessageItem.from_text(t, role="user") for t in texts]
+
+
+def _texts(messages: list[InputItem]) -> list[str]:
+    return [m.text or "" for m in messages if isinstance(m, InputMessageItem)]
+
+
+def _record_fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, int]]:
+    """Patch ``os.fsync``; record ``("dir" | "file", inode)`` per call."""
+    calls: list[tuple[str, int]] = []
+    real_fsync = os.fsync
+
+    def fsync(fd: int) -> None:
+        st = os.fstat(fd)
+        calls.append(("dir" if stat.S_ISDIR(st.st_mode) else "file", st.st_ino))
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    return calls
+
+
+@pytest.mark.skipif(os.name == "nt", reason="directory fsync is POSIX-only")
+async def test_concurrent_appends_share_one_fsync_per_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = FileCheckpointStore(tmp_path)
+    calls = _record_fsyncs(monkeypatch)
+
+    await asyncio.gather(
+        *(store.append_messages(f"s/a{i % 4}", _msgs(f"m{i}")) for i in range(20))
+    )
+
+    # One batch: each of the 4 logs once, plus the new ``s/`` directory and
+    # the root that gained it — instead of 20 serial fsyncs.
+    assert sorted(kind for kind, _ in calls) == ["dir", "dir"] + ["file"] * 4
+    for k in range(4):
+        got = _texts(await store.read_messages(f"s/a{k}"))
+        assert got == [f"m{i}" for i in range(k, 20, 4)]
+
+
+async def test_commit_window_coalesces_staggered_appends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = FileCheckpointStore(tmp_path, commit_window=0.2)
+    await store.append_messages("s/a", _msgs("created"))
+    calls = _record_fsyncs(monkeypatch)
+
+    first = store.submit_messages("s/a", _msgs("one"))
+    await asyncio.sleep(0.01)
+    second = store.submit_messages("s/a", _msgs("two"))
+    await asyncio.gather(first, second)
+
+    assert calls == [("file", (tmp_path / "s" / "a.jsonl").stat().st_ino)]
+    assert _texts(await store.read_messages("s/a")) == ["created", "one", "two"]
+
+
+async def test_head_save_is_a_barrier_for_earlier_appends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A head pipelined right behind its log append must not be renamed into
+    place before the append is durable — else a crash could keep the head
+    and lose the log tail it acknowledges.
+    """
+    store = FileCheckpointStore(tmp_path)
+    await store.append_messages("s/a", _msgs("old"))
+    log_ino = (tmp_path / "s" / "a.jsonl").stat().st_ino
+    events: list[object] = []
+    calls = _record_fsyncs(monkeypatch)
+    real_write = fcs.atomic_write_bytes
+
+    def recording_write(path: Path, data: bytes, **kwargs: object) -> None:
+        events.append(("replace", path.name, list(calls)))
+        real_write(path, data, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(fcs, "atomic_write_bytes", recording_write)
+
+    ack = store.submit_messages("s/a", _msgs("new"))
+    await store.save("s/a", b"{}")
+    await ack
+
+    assert events == [("replace", "a.json", [("file", log_ino)])]
+
+
+async def test_failed_write_fails_only_its_own_ack(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path)
+    (tmp_path / "blocker").write_bytes(b"not a directory")
+
+    good, bad = await asyncio.gather(
+        store.append_messages("s/a", _msgs("ok")),
+        store.append_messages("blocker/a", _msgs("lost")),
+        return_exceptions=True,
+    )
+
+    assert good is None
+    assert isinstance(bad, OSError)
+    assert _texts(await store.read_messages("s/a")) == ["ok"]
+
+
+async def test_log_handles_are_bounded_and_reopened(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, max_open_logs=2)
+    for key in ("s/a", "s/b", "s/c", "s/a"):
+        await store.append_messages(key, _msgs(key))
+    assert len(store._committer.logs) == 2  # pyright: ignore[reportPrivateUsage]
+    assert _texts(await store.read_messages("s/a")) == ["s/a", "s/a"]
+
+    # A rewrite replaces the file: later appends must not reach the old inode.
+    await store.rewrite_messages("s/a", _msgs("fresh"))
+    await store.append_messages("s/a", _msgs("after"))
+    assert _texts(await store.read_messages("s/a")) == ["fresh", "after"]
+
+    await store.aclose()
+    assert len(store._committer.logs) == 0  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_appends_follow_a_log_replaced_by_another_store(
+    tmp_path: Path,
+) -> None:
+    writer = FileCheckpointStore(tmp_path)
+    other = FileCheckpointStore(tmp_path)
+    await writer.append_messages("s/a", _msgs("old"))
+
+    await other.rewrite_messages("s/a", _msgs("fresh"))
+    await writer.append_messages("s/a", _msgs("after"))
+    assert _texts(await other.read_messages("s/a")) == ["fresh", "after"]
+
+    await other.delete("s/a")
+    await writer.append_messages("s/a", _msgs("recreated"))
+    assert _texts(await other.read_messages("s/a")) == ["recreated"]
+
+
+async def test_unclosed_store_releases_its_log_handles(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path)
+    await store.append_messages("s/a", _msgs("x"))
+    fd = store._committer.logs.fd(tmp_path / "s" / "a.jsonl")  # pyright: ignore[reportPrivateUsage]
+    assert fd is not None
+
+    del store
+    gc.collect()
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+
+async def test_flush_waits_for_submitted_writes(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, commit_window=0.05)
+    ack = store.submit_messages("s/a", _msgs("queued"))
+    await store.flush()
+    assert ack.done()
+    assert _texts(await store.read_messages("s/a")) == ["queued"]
@@ -0,0 +1,279 @@
+"""
+Out-of-line image / file payloads (:class:`BlobStore`):
+
+* payloads are stored once by content hash and resolve through any open store
+  on the same root (e.g. after a checkpoint round trip)
+* small parts pass through untouched (same objects)
+* provider converters emit the same request for a blob-backed part as for the
+  inline one, and derived encodings are memoized per blob
+* token estimates size blob-backed files from the ref, without loading them
+* the agent loop offloads large tool-result parts when ``ctx.blob_store`` is set
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grasp_agents.agent.agent_loop import AgentLoop
+from grasp_agents.agent.llm_agent_transcript import LLMAgentTranscript
+from grasp_agents.llm.token_counting import (
+    _file_tokens,  # pyright: ignore[reportPrivateUsage]
+)
+from grasp_agents.llm_providers.anthropic.response_to_provider_inputs import (
+    items_to_provider_inputs as anthropic_items_to_inputs,
+)
+from grasp_agents.llm_providers.gemini.response_to_provider_inputs import (
+    _file_to_part,  # pyright: ignore[reportPrivateUsage]
+)
+from grasp_agents.llm_providers.openai_completions.response_to_provider_inputs import (
+    items_to_provider_inputs as completions_items_to_inputs,
+)
+from grasp_agents.llm_providers.openai_responses.response_to_provider_inputs import (
+    items_to_provider_inputs as responses_items_to_inputs,
+)
+from grasp_agents.session_context import SessionContext
+from grasp_agents.tools.function_tool import function_tool
+from grasp_agents.types import BlobNotFoundError, BlobRef, BlobStore
+from grasp_agents.types.content import InputFile, InputImage, InputText
+from grasp_agents.types.items import (
+    FunctionToolCallItem,
+    FunctionToolOutputItem,
+    InputMessageItem,
+)
+from tests._helpers import MockLLM, _make_agent_loop
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_PNG_B64 = base64.b64encode(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64).decode()
+_IMAGE_URL = f"data:image/png;base64,{_PNG_B64}"
+_PDF_B64 = base64.b64encode(b"%PDF-1.4 " + b"x" * 20000).decode()
+
+
+def _store(tmp_path: Path) -> BlobStore:
+    return BlobStore(tmp_path / "blobs", min_chars=1024)
+
+
+def _msg() -> InputMessageItem:
+    return InputMessageItem(
+        role="user",
+        content=[
+            InputText(text="look"),
+            InputImage(image_url=_IMAGE_URL),
+            InputFile(filename="doc.pdf", file_data=_PDF_B64),
+        ],
+    )
+
+
+async def _offloaded(store: BlobStore) -> InputMessageItem:
+    (msg,) = await store.offload([_msg()])
+    return msg
+
+
+def _blob_files(store: BlobStore) -> list[Path]:
+    return [p for p in store.root.rglob("*") if p.is_file()]
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class TestBlobStore:
+    def test_put_is_content_addressed(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        ref = store.put("payload")
+        assert store.put("payload") == ref
+        assert ref.size == len("payload")
+        assert len(_blob_files(store)) == 1
+        assert store.get(ref) == "payload"
+
+    def test_missing_blob_raises(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        ref = BlobRef(digest="0" * 64, size=1)
+        assert not store.has(ref)
+        with pytest.raises(BlobNotFoundError):
+            store.get(ref)
+
+    def test_memo_computes_once(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        ref = store.put("abc")
+        calls: list[str] = []
+
+        def compute(payload: str) -> str:
+            calls.append(payload)
+            return payload.upper()
+
+        assert store.memo(ref, "upper", compute) == "ABC"
+        assert store.memo(ref, "upper", compute) == "ABC"
+        assert calls == ["abc"]
+
+    def test_evicted_payload_is_reloaded_from_disk(self, tmp_path: Path) -> None:
+        store = BlobStore(tmp_path, min_chars=1, max_cached_chars=10)
+        first = store.put("a" * 8)
+        store.put("b" * 8)  # evicts the first payload from memory
+        assert store.get(first) == "a" * 8
+
+
+class TestOffload:
+    @pytest.mark.asyncio
+    async def test_large_parts_become_refs(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+
+        image, file = msg.images[0], msg.files[0]
+        assert image.image_url is None
+        assert image.blob is not None
+        assert image.mime_type == "image/png"
+        assert image.base64_data == _PNG_B64
+        assert image.to_str() == _IMAGE_URL
+        assert image.decoded_bytes() == base64.b64decode(_PNG_B64)
+        assert file.file_data is None
+        assert file.inline_data == _PDF_B64
+        assert len(_blob_files(store)) == 2
+
+    @pytest.mark.asyncio
+    async def test_small_parts_pass_through(self, tmp_path: Path) -> None:
+        store = BlobStore(tmp_path, min_chars=10**9)
+        original = _msg()
+        (msg,) = await store.offload([original])
+        assert msg is original
+        assert _blob_files(store) == []
+
+    @pytest.mark.asyncio
+    async def test_tool_output_parts_are_offloaded(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        output = FunctionToolOutputItem(
+            call_id="c1", output=[InputImage(image_url=_IMAGE_URL)]
+        )
+        (item,) = await store.offload([output])
+        assert isinstance(item.output, list)
+        assert isinstance(item.output[0], InputImage)
+        assert item.output[0].blob is not None
+
+    @pytest.mark.asyncio
+    async def test_derived_encodings_are_memoized(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        image = msg.images[0]
+        assert image.to_str() is image.to_str()
+        assert image.decoded_bytes() is image.decoded_bytes()
+
+    @pytest.mark.asyncio
+    async def test_refs_resolve_after_a_round_trip(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        dumped = msg.model_dump_json()
+        assert _PNG_B64 not in dumped
+
+        restored = InputMessageItem.model_validate_json(dumped)
+        # A fresh store on the same root (e.g. a resumed session) resolves it.
+        del store
+        fresh = _store(tmp_path)
+        assert restored.images[0].blob is not None
+        assert fresh.has(restored.images[0].blob)
+        assert restored.images[0].to_str() == _IMAGE_URL
+
+
+# ---------------------------------------------------------------------------
+# Consumers
+# ---------------------------------------------------------------------------
+
+
+class TestConsumers:
+    @pytest.mark.asyncio
+    async def test_anthropic_request_matches_inline(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        assert anthropic_items_to_inputs([msg]) == anthropic_items_to_inputs([_msg()])
+
+    @pytest.mark.asyncio
+    async def test_completions_request_matches_inline(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        assert completions_items_to_inputs([msg]) == completions_items_to_inputs(
+            [_msg()]
+        )
+
+    @pytest.mark.asyncio
+    async def test_responses_request_matches_inline(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        (param,) = responses_items_to_inputs([msg])
+        (inline,) = responses_items_to_inputs([_msg()])
+        assert param == inline
+        assert "blob" not in str(param)
+
+    @pytest.mark.asyncio
+    async def test_gemini_file_part_matches_inline(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        part = _file_to_part(msg.files[0])
+        assert part.inline_data is not None
+        assert part.inline_data.data == base64.b64decode(_PDF_B64)
+
+    @pytest.mark.asyncio
+    async def test_file_tokens_use_ref_size(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        msg = await _offloaded(store)
+        assert _file_tokens(msg.files[0]) == _file_tokens(_msg().files[0])
+
+
+# ---------------------------------------------------------------------------
+# Agent loop
+# ---------------------------------------------------------------------------
+
+
+@function_tool
+async def screenshot(n: int = 0) -> str:
+    del n
+    return ""
+
+
+def _loop(ctx: SessionContext[None]) -> AgentLoop[None]:
+    transcript = LLMAgentTranscript()
+    transcript.messages = [InputMessageItem.from_text("sys", role="system")]
+    return _make_agent_loop(
+        agent_name="test",
+        llm=MockLLM(model_name="mock", responses_queue=[]),
+        transcript=transcript,
+        ctx=ctx,
+        tools=[screenshot],
+        max_turns=10,
+        stream_llm=False,
+    )
+
+
+class TestAgentLoopOffload:
+    @pytest.mark.asyncio
+    async def test_tool_result_image_enters_transcript_by_ref(
+        self, tmp_path: Path
+    ) -> None:
+        ctx = SessionContext[None](state=None, blob_store=_store(tmp_path))
+        loop = _loop(ctx)
+        call = FunctionToolCallItem(call_id="c1", name="screenshot", arguments="{}")
+
+        item = await loop._convert_tool_output(  # pyright: ignore[reportPrivateUsage]
+            [InputImage(image_url=_IMAGE_URL)], call, exec_id="t"
+        )
+
+        assert isinstance(item.output, list)
+        image = item.output[0]
+        assert isinstance(image, InputImage)
+        assert image.blob is not None
+        assert image.to_str() == _IMAGE_URL
+
+    @pytest.mark.asyncio
+    async def test_no_store_keeps_parts_inline(self) -> None:
+        loop = _loop(SessionContext[None](state=None))
+        call = FunctionToolCallItem(call_id="c1", name="screenshot", arguments="{}")
+
+        item = await loop._convert_tool_output(  # pyright: ignore[reportPrivateUsage]
+            [InputImage(image_url=_IMAGE_URL)], call, exec_id="t"
+        )
+
+        assert isinstance(item.output, list)
+        assert item.output[0] == InputImage(image_url=_IMAGE_URL)
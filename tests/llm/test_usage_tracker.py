@@ -227,3 +227,176 @@ class TestCacheWriteTokens:
 
         assert total.input_tokens_details.cached_tokens == 15
         assert total.input_tokens_details.cache_write_tokens == 20
+
+
+class TestRunningTotals:
+    def test_totals_maintained_per_agent_model_and_session(self):
+        tracker = UsageTracker()
+
+        tracker.update("agent_a", [_make_response(usage=_make_response_usage(100, 50))])
+        tracker.update("agent_b", [_make_response(usage=_make_response_usage(200, 80))])
+
+        assert tracker.total.input_tokens == 300
+        assert tracker.total_usage is tracker.total
+        assert tracker.model_usages["test-model"].output_tokens == 130
+
+    def test_rollup_into_parent_scopes(self):
+        tracker = UsageTracker()
+        tracker.set_parent("alice", "team")
+        tracker.set_parent("team", "org")
+
+        tracker.update("alice", [_make_response(usage=_make_response_usage(100, 50))])
+        tracker.update("bob", [_make_response(usage=_make_response_usage(10, 5))])
+
+        assert tracker.usage_for("team").total_tokens == 150
+        assert tracker.usage_for("org").total_tokens == 150
+        assert tracker.usage_for("bob").total_tokens == 15
+        assert tracker.usage_for(None).total_tokens == 165
+
+    def test_cyclic_parent_rejected(self):
+        tracker = UsageTracker()
+        tracker.set_parent("alice", "team")
+        with pytest.raises(ValueError, match="nested"):
+            tracker.set_parent("team", "alice")
+
+    def test_member_of_two_teams_rolls_up_into_both(self):
+        tracker = UsageTracker()
+        tracker.set_parent("alice", "team_a")
+        tracker.set_parent("alice", "team_b")
+        tracker.set_parent("team_a", "org")
+        tracker.set_parent("team_b", "org")
+
+        tracker.update("alice", [_make_response(usage=_make_response_usage(100, 50))])
+
+        assert tracker.usage_for("team_a").total_tokens == 150
+        assert tracker.usage_for("team_b").total_tokens == 150
+        # Reachable twice, charged once.
+        assert tracker.usage_for("org").total_tokens == 150
+
+        tracker.remove_parent("alice", "team_a")
+        tracker.update("alice", [_make_response(usage=_make_response_usage(10, 5))])
+        assert tracker.usage_for("team_a").total_tokens == 150
+        assert tracker.usage_for("team_b").total_tokens == 165
+
+    def test_round_trips_through_serialization(self):
+        tracker = UsageTracker()
+        tracker.set_parent("alice", "team")
+        tracker.update("alice", [_make_response(usage=_make_response_usage(100, 50))])
+
+        restored = UsageTracker.model_validate_json(tracker.model_dump_json())
+
+        assert restored.total.total_tokens == 150
+        assert restored.usage_for("team").total_tokens == 150
+        restored.update("alice", [_make_response(usage=_make_response_usage(1, 1))])
+        assert restored.usage_for("team").total_tokens == 152
+
+    def test_dump_without_running_totals_is_rebuilt_from_usages(self):
+        restored = UsageTracker.model_validate(
+            {
+                "usages": {
+                    "alice": {"input_tokens": 5, "output_tokens": 3, "total_tokens": 8},
+                    "bob": {"input_tokens": 2, "output_tokens": 1, "total_tokens": 3},
+                },
+                "parents": {"alice": ["team"]},
+            }
+        )
+
+        assert restored.total_usage.input_tokens == 7
+        assert restored.total_usage.total_tokens == 11
+        assert restored.usage_for("team").total_tokens == 8
+        fired: list[int] = []
+        restored.add_budget(
+            scope="team", max_tokens=5, on_exceeded=lambda b: fired.append(1)
+        )
+        restored.update("alice", [_make_response(usage=_make_response_usage(4, 2))])
+        assert restored.usage_for("team").total_tokens == 14
+        assert fired == [1]
+
+    def test_empty_dump_keeps_zero_totals(self):
+        assert UsageTracker.model_validate({}).total == ResponseUsage()
+
+
+class TestBudgets:
+    def test_budget_fires_once_on_crossing(self):
+        tracker = UsageTracker()
+        tracker.update("agent_a", [_make_response(usage=_make_response_usage(500, 0))])
+        fired: list[int] = []
+        budget = tracker.add_budget(
+            max_tokens=200, on_exceeded=lambda b: fired.append(b.spent_tokens)
+        )
+
+        tracker.update("agent_a", [_make_response(usage=_make_response_usage(100, 50))])
+        assert not budget.exceeded
+        tracker.update("agent_a", [_make_response(usage=_make_response_usage(40, 10))])
+        tracker.update("agent_a", [_make_response(usage=_make_response_usage(40, 10))])
+
+        # Baseline excludes the 500 tokens spent before the budget was added.
+        assert budget.exceeded
+        assert fired == [200]
+        assert budget.spent_tokens == 250
+
+    def test_scoped_budget_ignores_other_agents(self):
+        tracker = UsageTracker()
+        tracker.set_parent("alice", "team")
+        budget = tracker.add_budget(scope="team", max_tokens=100)
+
+        tracker.update("bob", [_make_response(usage=_make_response_usage(500, 0))])
+        assert not budget.exceeded
+        tracker.update("alice", [_make_response(usage=_make_response_usage(80, 20))])
+        assert budget.exceeded
+
+    def test_removed_budget_stops_observing(self):
+        tracker = UsageTracker()
+        budget = tracker.add_budget(max_tokens=10)
+        tracker.remove_budget(budget)
+
+        tracker.update("agent_a", [_make_response(usage=_make_response_usage(100, 0))])
+        assert not budget.exceeded
+
+
+class TestModelPricing:
+    def test_cached_pricing_matches_litellm(self):
+        from litellm import cost_per_token
+
+        from grasp_agents.usage_tracker import add_cost_to_usage
+
+        usage = ResponseUsage(
+            input_tokens=12_345,
+            output_tokens=678,
+            input_tokens_details=InputTokensDetails(
+                cached_tokens=5_000, cache_write_tokens=200
+            ),
+        )
+        add_cost_to_usage(
+            usage, model_name="claude-sonnet-4-5", litellm_provider="anthropic"
+        )
+        prompt_cost, completion_cost = cost_per_token(
+            model="claude-sonnet-4-5",
+            prompt_tokens=12_345,
+            completion_tokens=678,
+            cache_read_input_tokens=5_000,
+            cache_creation_input_tokens=200,
+            custom_llm_provider="anthropic",
+        )
+        assert usage.cost == pytest.approx(prompt_cost + completion_cost)
+
+    def test_tiered_usage_priced_by_litellm(self):
+        from litellm import cost_per_token
+
+        from grasp_agents.usage_tracker import add_cost_to_usage, resolve_model_pricing
+
+        pricing = resolve_model_pricing("claude-sonnet-4-5", "anthropic")
+        assert pricing is not None
+        assert pricing.tier_threshold is not None
+
+        usage = ResponseUsage(input_tokens=pricing.tier_threshold + 1, output_tokens=10)
+        add_cost_to_usage(
+            usage, model_name="claude-sonnet-4-5", litellm_provider="anthropic"
+        )
+        prompt_cost, completion_cost = cost_per_token(
+            model="claude-sonnet-4-5",
+            prompt_tokens=pricing.tier_threshold + 1,
+            completion_tokens=10,
+            custom_llm_provider="anthropic",
+        )
+        assert usage.cost == pytest.approx(prompt_cost + completion_cost)
@@ -13,7 +13,14 @@ from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
-from mcp.types import CallToolResult, TextResourceContents
+from mcp import ClientSession
+from mcp.types import (
+    CallToolResult,
+    Resource,
+    ResourceListChangedNotification,
+    ServerNotification,
+    TextResourceContents,
+)
 from mcp.types import Tool as McpToolDef
 from pydantic import BaseModel
 
@@ -22,8 +29,13 @@ from grasp_agents.file_backend.mcp import MCPFileBackend
 from grasp_agents.file_backend.paths import PathAccessError
 from grasp_agents.llm_providers.litellm import LiteLLM
 from grasp_agents.mcp.client import MCPClient, MCPServerSSE, MCPServerStdio
-from grasp_agents.mcp.json_schema import json_schema_to_pydantic
+from grasp_agents.mcp.json_schema import (
+    cached_json_schema_to_pydantic,
+    json_schema_to_pydantic,
+)
+from grasp_agents.mcp.pool import MCPClientPool
 from grasp_agents.mcp.resource import MCPListResourcesTool, MCPReadResourceTool
+from grasp_agents.mcp.resource_index import MCPResourceIndex
 from grasp_agents.mcp.spec import MCPClientSpec
 from grasp_agents.mcp.tool import MCPTool
 from grasp_agents.tools.base import BaseTool
@@ -363,6 +375,13 @@ class TestJsonSchemaToPydantic:
         instance = model(value="auto")
         assert isinstance(instance.value, Enum)
 
+    def test_cached_conversion_shares_model(self) -> None:
+        schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+        first = cached_json_schema_to_pydantic(schema, "CachedInput")
+        reordered = {"properties": {"a": {"type": "integer"}}, "type": "object"}
+        assert cached_json_schema_to_pydantic(reordered, "CachedInput") is first
+        assert cached_json_schema_to_pydantic(schema, "OtherInput") is not first
+
     def test_ref_cache_returns_same_type(self) -> None:
         """Repeated $ref to the same definition reuses the same class."""
         schema = {
@@ -660,6 +679,159 @@ class TestMCPPrompts:
             await client.list_prompts()
 
 
+# ---------- MCPClientPool ----------
+
+
+class TestMCPClientPool:
+    @pytest.mark.asyncio
+    async def test_pool_connects_and_calls_tools(self) -> None:
+        async with MCPClientPool("test", server=_SERVER_CONFIG, size=2) as pool:
+            assert pool.healthy_sessions == 2
+            tools = {t.name: t for t in pool.tools()}
+            assert {"add", "test_list_resources"} <= set(tools)
+            result = await tools["add"](a=2, b=3)
+            assert result.content[0].text == "5"
+            readme = await tools["test_read_resource"](uri="docs://readme")
+            assert "# Test Project" in readme
+            prompts = await pool.list_prompts()
+            assert "greet" in {p.name for p in prompts.prompts}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_spread_across_sessions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        used: list[int] = []
+        original = ClientSession.call_tool
+
+        async def spy(self: ClientSession, *args: Any, **kwargs: Any) -> Any:
+            used.append(id(self))
+            return await original(self, *args, **kwargs)
+
+        monkeypatch.setattr(ClientSession, "call_tool", spy)
+        async with MCPClientPool("test", server=_SERVER_CONFIG, size=2) as pool:
+            results = await asyncio.gather(
+                *(pool.call_tool("echo", {"message": str(i)}) for i in range(4))
+            )
+        assert [r.content[0].text for r in results] == ["0", "1", "2", "3"]  # type: ignore[union-attr]
+        assert len(set(used)) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        active = 0
+        peak = 0
+        original = ClientSession.call_tool
+
+        async def spy(self: ClientSession, *args: Any, **kwargs: Any) -> Any:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                return await original(self, *args, **kwargs)
+            finally:
+                active -= 1
+
+        monkeypatch.setattr(ClientSession, "call_tool", spy)
+        async with MCPClientPool(
+            "test", server=_SERVER_CONFIG, size=2, max_concurrency=1
+        ) as pool:
+            await asyncio.gather(
+                *(pool.call_tool("echo", {"message": "x"}) for _ in range(4))
+            )
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_broken_session_is_reconnected(self) -> None:
+        async with MCPClientPool(
+            "test", server=_SERVER_CONFIG, size=2, reconnect_backoff=0.05
+        ) as pool:
+            member = pool._members[0]
+            old_client = member.client
+            member.broken.set()
+            assert not member.healthy
+            # The other session keeps serving meanwhile.
+            result = await pool.call_tool("add", {"a": 1, "b": 1})
+            assert result.content[0].text == "2"  # type: ignore[union-attr]
+
+            for _ in range(200):
+                if pool.healthy_sessions == 2:
+                    break
+                await asyncio.sleep(0.05)
+            assert pool.healthy_sessions == 2
+            assert member.client is not old_client
+
+    @pytest.mark.asyncio
+    async def test_member_notifications_make_a_pooled_index_stale(self) -> None:
+        async with MCPClientPool(
+            "test", server=_SERVER_CONFIG, size=2, reconnect_backoff=0.05
+        ) as pool:
+            index = MCPResourceIndex(pool, uri_scheme="docs://")
+            assert "docs://readme" in await index.load()
+
+            async def notify(member_index: int) -> None:
+                client = pool._members[member_index].client
+                assert client is not None
+                await client._handle_message(
+                    ServerNotification(
+                        ResourceListChangedNotification(
+                            method="notifications/resources/list_changed"
+                        )
+                    )
+                )
+
+            await notify(1)
+            assert index._stale
+            await index.load()
+            assert not index._stale
+
+            # A reconnected session relays too.
+            member = pool._members[0]
+            old_client = member.client
+            member.broken.set()
+            for _ in range(200):
+                if member.healthy and member.client is not old_client:
+                    break
+                await asyncio.sleep(0.05)
+            await notify(0)
+            assert index._stale
+            index.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_raises_and_closes(self) -> None:
+        pool = MCPClientPool(
+            "dead",
+            server=MCPServerStdio(
+                command=sys.executable, args=["-c", "import sys; sys.exit(1)"]
+            ),
+            size=2,
+        )
+        with pytest.raises(BaseException):
+            await asyncio.wait_for(pool.connect(), timeout=20.0)
+        assert pool.healthy_sessions == 0
+        with pytest.raises(RuntimeError, match="Not connected"):
+            pool.tools()
+        with pytest.raises(RuntimeError, match="no healthy session"):
+            await pool.call_tool("add", {"a": 1, "b": 1})
+
+    @pytest.mark.asyncio
+    async def test_shared_pool_per_server_spec(self) -> None:
+        server = MCPServerStdio(command=sys.executable, args=[_SERVER_PATH])
+        pool = MCPClientPool.shared("a", server=server)
+        same = MCPClientPool.shared(
+            "b", server=MCPServerStdio(command=sys.executable, args=[_SERVER_PATH])
+        )
+        assert same is pool
+        await pool.close()
+        fresh = MCPClientPool.shared("a", server=server)
+        assert fresh is not pool
+        await fresh.close()
+
+    def test_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="size"):
+            MCPClientPool("test", server=_SERVER_CONFIG, size=0)
+
+
 # ---------- nullable / type-array params ----------
 
 
@@ -824,9 +996,7 @@ class TestMcpPathNormalization:
             cast("Any", _FakeClient()), allowed_roots=[Path("/memdir")]
         )
         with pytest.raises(PathAccessError, match="outside allowed roots"):
-            await backend.validate_path(
-                Path("/memdir/../etc/passwd"), must_exist=False
-            )
+            await backend.validate_path(Path("/memdir/../etc/passwd"), must_exist=False)
 
     @pytest.mark.asyncio
     async def test_inner_dotdot_collapsed(self) -> None:
@@ -899,6 +1069,137 @@ class TestMcpStalenessSurface:
         assert mtime == 999.0
 
 
+# ---------- resource index: path trie + delta refresh ----------
+
+
+class _ListingSession:
+    """Serves ``resources/list`` in pages of ``page_size``."""
+
+    def __init__(self, paths: list[str], page_size: int = 2) -> None:
+        self.paths = paths
+        self.page_size = page_size
+        self.calls = 0
+
+    async def list_resources(self, params: Any = None) -> Any:
+        self.calls += 1
+        start = int(params.cursor) if params is not None else 0
+        end = start + self.page_size
+        resources = [
+            Resource.model_validate(
+                {"uri": f"file://{p}", "name": p.rsplit("/", 1)[-1]}
+            )
+            for p in self.paths[start:end]
+        ]
+        next_cursor = str(end) if end < len(self.paths) else None
+        return SimpleNamespace(resources=resources, nextCursor=next_cursor)
+
+
+class _NotifyingClient:
+    def __init__(self, session: _ListingSession) -> None:
+        self.session = session
+        self.name = "notifying"
+        self.listeners: list[Any] = []
+
+    def add_resource_listener(self, listener: Any) -> None:
+        self.listeners.append(listener)
+
+    def remove_resource_listener(self, listener: Any) -> None:
+        self.listeners.remove(listener)
+
+
+_TREE = [
+    "/m/a.md",
+    "/m/notes/b.md",
+    "/m/notes/deep/c.py",
+    "/m/.hidden/d.md",
+    "/other/e.md",
+]
+
+
+class TestMcpResourceIndex:
+    @pytest.mark.asyncio
+    async def test_paginated_listing_and_children(self) -> None:
+        session = _ListingSession(list(_TREE))
+        index = MCPResourceIndex(cast("Any", _FakeClient(session=session)))
+        children = await index.children_of("/m")
+        assert {str(e.path) for e in children} == {"/m/a.md"}
+        under = await index.list_under("/m/notes")
+        assert {str(e.path) for e in under} == {"/m/notes/b.md", "/m/notes/deep/c.py"}
+        assert await index.has_entries_under("/m/notes")
+        assert not await index.has_entries_under("/m/a.md")
+        # Five resources in pages of two, fetched once.
+        assert session.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_glob_walks_trie(self) -> None:
+        index = MCPResourceIndex(
+            cast("Any", _FakeClient(session=_ListingSession(list(_TREE))))
+        )
+
+        async def paths(pattern: str, **kwargs: Any) -> set[str]:
+            return {str(e.path) for e in await index.glob("/m", pattern, **kwargs)}
+
+        assert await paths("**/*.md") == {"/m/a.md", "/m/notes/b.md"}
+        assert await paths("**/*.md", include_hidden=True) == {
+            "/m/a.md",
+            "/m/notes/b.md",
+            "/m/.hidden/d.md",
+        }
+        assert await paths("notes/**/*.py") == {"/m/notes/deep/c.py"}
+        assert await paths("*.md") == {"/m/a.md", "/m/notes/b.md"}
+        assert await paths("missing/**") == set()
+
+    @pytest.mark.asyncio
+    async def test_list_changed_notification_applies_delta(self) -> None:
+        session = _ListingSession(list(_TREE))
+        client = _NotifyingClient(session)
+        index = MCPResourceIndex(cast("Any", client))
+        assert await index.has_entries_under("/other")
+
+        session.paths = [p for p in _TREE if not p.startswith("/other")]
+        session.paths.append("/m/new.md")
+        # Cached until the server announces the change.
+        assert await index.has_entries_under("/other")
+        for listener in client.listeners:
+            listener(None)
+
+        assert not await index.has_entries_under("/other")
+        children = await index.children_of("/m")
+        assert {str(e.path) for e in children} == {"/m/a.md", "/m/new.md"}
+
+    @pytest.mark.asyncio
+    async def test_updates_outside_scheme_ignored_and_close_unregisters(
+        self,
+    ) -> None:
+        session = _ListingSession(list(_TREE))
+        client = _NotifyingClient(session)
+        index = MCPResourceIndex(cast("Any", client))
+        await index.load()
+
+        client.listeners[0]("memo://elsewhere")
+        await index.load()
+        assert session.calls == 3  # no re-list
+        client.listeners[0]("file:///m/a.md")
+        await index.load()
+        assert session.calls == 6
+
+        index.close()
+        index.close()
+        assert client.listeners == []
+
+    @pytest.mark.asyncio
+    async def test_backend_find_files_uses_index(self) -> None:
+        backend = MCPFileBackend(
+            cast("Any", _FakeClient(session=_ListingSession(list(_TREE)))),
+            allowed_roots=[Path("/m")],
+        )
+        found, truncated = await backend.find_files(Path("/m"), "**/*.md")
+        assert {str(e.path) for e in found} == {"/m/a.md", "/m/notes/b.md"}
+        assert not truncated
+        assert await backend.parent_exists(Path("/m/notes/new.md"))
+        assert not await backend.parent_exists(Path("/m/nope/new.md"))
+
+
 # ---------- SSE server config ----------
 
 
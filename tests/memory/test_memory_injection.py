@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import inspect
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 
+from grasp_agents.context.prompt_builder import PromptBuilder
+from grasp_agents.file_backend.local import LocalFileBackend
 from grasp_agents.memory import (
+    MemoryProvider,
     memory_system_prompt_section,
     render_memory_index,
     render_memory_instructions,
 )
+from grasp_agents.session_context import SessionContext
+from grasp_agents.tools.file_edit.session_state import FileEditSessionState
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from grasp_agents.agent.agent_context import AgentContext
 
 
 class TestRenderMemoryIndex:
@@ -68,6 +80,33 @@ class TestMemorySection:
             result = await result
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_memoized_render_still_loads_for_each_agent(
+        self, tmp_path: Path
+    ) -> None:
+        index = tmp_path / "MEMORY.md"
+        index.write_text("# Memory\n- [a](a.md)\n")
+        ctx = SessionContext[Any](
+            file_backend=LocalFileBackend(allowed_roots=[tmp_path]),
+            memory=MemoryProvider(tmp_path),
+        )
+        builder = PromptBuilder[str, Any](
+            agent_name="a", sys_prompt="Base.", in_prompt=None
+        )
+        builder.add_system_prompt_section(memory_system_prompt_section)
+        states = [FileEditSessionState(), FileEditSessionState()]
+
+        for state in (states[0], *states):
+            agent_ctx = cast("AgentContext", SimpleNamespace(file_edit_state=state))
+            await builder.build_system_prompt_parts(
+                ctx=ctx, exec_id="e", agent_ctx=agent_ctx
+            )
+
+        # Both agents saw the index in their prompt, so both may edit it.
+        assert all(s.get_read_record(index) is not None for s in states)
+        stats = builder.section_stats[memory_system_prompt_section.name]
+        assert (stats.computes, stats.hits) == (2, 1)
+
 
 class TestRenderMemoryInstructions:
     def test_emits_taxonomy_unconditionally(self) -> None:
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import os
 import time
+import weakref
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from grasp_agents.file_backend.base import FileBackend
 from grasp_agents.file_backend.local import LocalFileBackend
 from grasp_agents.memory import (
     DEFAULT_STALE_AFTER,
@@ -20,8 +24,10 @@ from grasp_agents.memory import (
 )
 from grasp_agents.memory.default_path import GRASP_MEMORY_ENV
 from grasp_agents.session_context import SessionContext
+from grasp_agents.tools.file_edit.session_state import FileEditSessionState
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
 
@@ -171,6 +177,195 @@ class TestMemoryProviderLocal:
             await p.load()
 
 
+class _CountingBackend(LocalFileBackend):
+    """Local backend that records every ``read_text`` / ``read_many`` path."""
+
+    def __init__(self, root: Path) -> None:
+        super().__init__(allowed_roots=[root])
+        self.reads: list[str] = []
+        self.batches = 0
+
+    async def read_text(self, path: Path) -> tuple[str, float]:
+        self.reads.append(path.name)
+        return await super().read_text(path)
+
+    async def read_many(
+        self, paths: Sequence[Path], *, max_concurrency: int = 16
+    ) -> list[tuple[bytes, float]]:
+        self.batches += 1
+        self.reads.extend(p.name for p in paths)
+        return await super().read_many(paths, max_concurrency=max_concurrency)
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestIncrementalRefresh:
+    @pytest.mark.asyncio
+    async def test_refresh_rereads_only_changed_files(self, tmp_path: Path) -> None:
+        (tmp_path / "MEMORY.md").write_text("# idx\n", encoding="utf-8")
+        for name in ("alpha", "beta", "gamma"):
+            _topic_file(tmp_path / f"{name}.md", name)
+        backend = _CountingBackend(tmp_path)
+        provider = MemoryProvider(tmp_path, backend=backend)
+        first = await provider.load()
+        assert sorted(backend.reads) == ["MEMORY.md", "alpha.md", "beta.md", "gamma.md"]
+        assert backend.batches == 1  # topics read in one batch
+
+        backend.reads.clear()
+        _topic_file(tmp_path / "beta.md", "beta", body="changed body")
+        _bump_mtime(tmp_path / "beta.md")
+        (tmp_path / "gamma.md").unlink()
+        _topic_file(tmp_path / "delta.md", "delta")
+        await provider.refresh()
+        second = await provider.load()
+
+        assert sorted(backend.reads) == ["beta.md", "delta.md"]
+        assert {e.name for e in second.entries} == {"alpha", "beta", "delta"}
+        assert second.get("alpha") is first.get("alpha")  # parse reused
+        beta = second.get("beta")
+        assert beta is not None
+        assert beta.body is not None
+        assert "changed body" in beta.body
+
+    @pytest.mark.asyncio
+    async def test_unchanged_index_is_not_reread(self, tmp_path: Path) -> None:
+        (tmp_path / "MEMORY.md").write_text("# idx\n", encoding="utf-8")
+        backend = _CountingBackend(tmp_path)
+        provider = MemoryProvider(tmp_path, backend=backend)
+        await provider.load()
+        await provider.refresh()
+        snap = await provider.load()
+        assert backend.reads == ["MEMORY.md"]
+        assert snap.index == "# idx\n"
+
+    @pytest.mark.asyncio
+    async def test_reads_are_bounded(self, tmp_path: Path) -> None:
+        for i in range(12):
+            _topic_file(tmp_path / f"t{i}.md", f"t{i}")
+        in_flight = peak = 0
+
+        class _Probe(LocalFileBackend):
+            async def read_bytes(self, path: Path) -> tuple[bytes, float]:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await super().read_bytes(path)
+                finally:
+                    in_flight -= 1
+
+            async def read_many(
+                self, paths: Sequence[Path], *, max_concurrency: int = 16
+            ) -> list[tuple[bytes, float]]:
+                # The generic per-file path, so the bound is observable.
+                return await FileBackend.read_many(
+                    self, paths, max_concurrency=max_concurrency
+                )
+
+        provider = MemoryProvider(
+            tmp_path,
+            backend=_Probe(allowed_roots=[tmp_path]),
+            read_concurrency=3,
+            auto_create_index=False,
+        )
+        snap = await provider.load()
+        assert len(snap.entries) == 12
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_unreadable_topic_falls_back_to_per_file_reads(
+        self, tmp_path: Path
+    ) -> None:
+        for name in ("alpha", "beta"):
+            _topic_file(tmp_path / f"{name}.md", name)
+
+        class _Flaky(_CountingBackend):
+            async def read_many(
+                self, paths: Sequence[Path], *, max_concurrency: int = 16
+            ) -> list[tuple[bytes, float]]:
+                raise PermissionError("beta.md")
+
+            async def read_text(self, path: Path) -> tuple[str, float]:
+                if path.name == "beta.md":
+                    raise PermissionError(path)
+                return await super().read_text(path)
+
+        provider = MemoryProvider(
+            tmp_path, backend=_Flaky(tmp_path), auto_create_index=False
+        )
+        snap = await provider.load()
+        assert {e.name for e in snap.entries} == {"alpha"}
+
+    @pytest.mark.asyncio
+    async def test_agent_write_invalidates_when_watched(self, tmp_path: Path) -> None:
+        _topic_file(tmp_path / "alpha.md", "alpha")
+        provider = MemoryProvider(
+            tmp_path,
+            backend=LocalFileBackend(allowed_roots=[tmp_path]),
+            refresh_on_write=True,
+        )
+        state = FileEditSessionState()
+        first = await provider.load(session_state=state)
+        generation = provider.generation
+
+        state.record_write(tmp_path.parent / "elsewhere.md", 0.0)
+        assert await provider.load(session_state=state) is first
+
+        path = _topic_file(tmp_path / "beta.md", "beta")
+        state.record_write(path.resolve(), path.stat().st_mtime)
+        assert provider.generation == generation + 1
+        second = await provider.load(session_state=state)
+        assert {e.name for e in second.entries} == {"alpha", "beta"}
+
+    @pytest.mark.asyncio
+    async def test_closed_provider_stops_watching(self, tmp_path: Path) -> None:
+        _topic_file(tmp_path / "alpha.md", "alpha")
+        provider = MemoryProvider(
+            tmp_path,
+            backend=LocalFileBackend(allowed_roots=[tmp_path]),
+            refresh_on_write=True,
+        )
+        state = FileEditSessionState()
+        await provider.load(session_state=state)
+        generation = provider.generation
+
+        provider.close()
+        provider.close()
+        path = _topic_file(tmp_path / "beta.md", "beta")
+        state.record_write(path.resolve(), path.stat().st_mtime)
+        assert provider.generation == generation
+        assert state._write_listeners == []  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_watch_does_not_keep_the_state_alive(self, tmp_path: Path) -> None:
+        provider = MemoryProvider(
+            tmp_path,
+            backend=LocalFileBackend(allowed_roots=[tmp_path]),
+            refresh_on_write=True,
+        )
+        state = FileEditSessionState()
+        await provider.load(session_state=state)
+        ref = weakref.ref(state)
+        del state
+        gc.collect()
+        assert ref() is None
+
+    @pytest.mark.asyncio
+    async def test_writes_ignored_without_opt_in(self, tmp_path: Path) -> None:
+        _topic_file(tmp_path / "alpha.md", "alpha")
+        ctx = _make_ctx(tmp_path)
+        assert ctx.memory is not None
+        state = FileEditSessionState()
+        first = await ctx.memory.load(session_state=state)
+        path = _topic_file(tmp_path / "beta.md", "beta")
+        state.record_write(path, path.stat().st_mtime)
+        assert await ctx.memory.load(session_state=state) is first
+
+
 class TestMemdirAdmission:
     """The SessionContext validator admits the memdir into the backend roots."""
 
@@ -1,16 +1,30 @@
 """
 stream_concurrent: the ``max_concurrency=1`` serial mode (drains each
-generator fully before the next, with the same per-stream error isolation).
+generator fully before the next, with the same per-stream error isolation),
+dependency ordering and group budgets, bounded per-producer buffers and their
+overflow policies.
 """
 
 from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
+from typing import Any
 
 import pytest
 
-from grasp_agents.utils.streaming import stream_concurrent
+from grasp_agents.types.events import (
+    Event,
+    LLMStreamEvent,
+    ToolOutputEvent,
+    ToolStreamEvent,
+)
+from grasp_agents.types.llm_events import OutputMessageTextPartTextDelta
+from grasp_agents.utils.streaming import (
+    EventStream,
+    coalesce_deltas,
+    stream_concurrent,
+)
 
 
 async def _gen(items: list[str]) -> AsyncIterator[str]:
@@ -37,3 +51,161 @@ async def test_serial_mode_isolates_per_stream_errors() -> None:
     items = [item async for _, item in merged]
     assert "1a" in items  # the other stream still runs
     assert [e.index for e in merged.errors] == [0]
+
+
+# --- dependency ordering / group budgets ------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_after_orders_only_dependent_generators() -> None:
+    gens = [_gen(["0a", "0b"]), _gen(["1a", "1b"]), _gen(["2a", "2b"])]
+    # 2 waits for 0; 1 is independent and runs alongside 0.
+    merged = stream_concurrent(gens, after=[[], [], [0]])
+    items = [item async for _, item in merged]
+    assert items.index("2a") > items.index("0b")
+    assert items.index("1a") < items.index("0b")
+
+
+@pytest.mark.asyncio
+async def test_after_runs_dependents_of_a_failed_generator() -> None:
+    async def boom() -> AsyncIterator[str]:
+        yield "x"
+        raise RuntimeError("boom")
+
+    merged = stream_concurrent([boom(), _gen(["1a"])], after=[[], [0]])
+    assert [item async for _, item in merged] == ["x", "1a"]
+    assert [e.index for e in merged.errors] == [0]
+
+
+def test_after_rejects_forward_references() -> None:
+    with pytest.raises(ValueError, match="earlier generators"):
+        stream_concurrent([_gen([]), _gen([])], after=[[1], []])
+
+
+@pytest.mark.asyncio
+async def test_group_limit_caps_members_only() -> None:
+    running = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    async def member(group: str) -> AsyncIterator[str]:
+        running[group] += 1
+        peak[group] = max(peak[group], running[group])
+        for _ in range(3):
+            await asyncio.sleep(0)
+        running[group] -= 1
+        yield group
+
+    groups = ["a", "a", "a", "b", "b", "b"]
+    merged = stream_concurrent(
+        [member(g) for g in groups], groups=groups, group_limits={"a": 1}
+    )
+    assert sorted([item async for _, item in merged]) == sorted(groups)
+    assert peak == {"a": 1, "b": 3}
+
+
+# --- bounded buffers / overflow policies ------------------------------------
+
+
+def _text_delta(delta: str, seq: int, item_id: str = "msg") -> LLMStreamEvent:
+    return LLMStreamEvent(
+        source="agent",
+        data=OutputMessageTextPartTextDelta(
+            item_id=item_id,
+            output_index=0,
+            content_index=0,
+            sequence_number=seq,
+            delta=delta,
+        ),
+    )
+
+
+async def _events(events: list[Event[Any]]) -> AsyncIterator[Event[Any]]:
+    for ev in events:
+        yield ev
+
+
+@pytest.mark.asyncio
+async def test_bounded_buffer_applies_backpressure() -> None:
+    produced = 0
+
+    async def fast() -> AsyncIterator[int]:
+        nonlocal produced
+        for i in range(50):
+            produced += 1
+            yield i
+
+    seen: list[int] = []
+    async for _, item in stream_concurrent([fast()], max_buffered=3):
+        # The producer never runs more than one item past the bound.
+        assert produced - len(seen) <= 4
+        seen.append(item)
+        await asyncio.sleep(0)
+    assert seen == list(range(50))
+
+
+@pytest.mark.asyncio
+async def test_bounded_buffer_keeps_chatty_producer_from_starving_others() -> None:
+    async def chatty() -> AsyncIterator[str]:
+        for i in range(1000):
+            yield f"c{i}"
+
+    order = [
+        item
+        async for _, item in stream_concurrent(
+            [chatty(), _gen(["q0", "q1", "q2"])], max_buffered=4
+        )
+    ]
+    assert len(order) == 1003
+    assert all(order.index(q) < 30 for q in ("q0", "q1", "q2"))
+
+
+@pytest.mark.asyncio
+async def test_drop_deltas_keeps_terminal_events() -> None:
+    events: list[Event[Any]] = [
+        *(ToolStreamEvent(source="t", data=f"line {i}\n") for i in range(20)),
+        ToolOutputEvent(source="t", data="done"),
+    ]
+    merged = stream_concurrent(
+        [_events(events)], max_buffered=2, overflow="drop_deltas"
+    )
+    out = [ev async for _, ev in merged]
+    assert isinstance(out[-1], ToolOutputEvent)
+    assert merged.dropped == 21 - len(out)
+    assert merged.dropped > 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_deltas_without_losing_text() -> None:
+    text = [f"tok{i} " for i in range(40)]
+    events: list[Event[Any]] = [_text_delta(t, i) for i, t in enumerate(text)]
+    merged = stream_concurrent([_events(events)], max_buffered=2, overflow="coalesce")
+    out = [ev async for _, ev in merged]
+    assert merged.coalesced == 40 - len(out) > 0
+    deltas = [ev.data for ev in out if isinstance(ev, LLMStreamEvent)]
+    assert "".join(d.delta for d in deltas) == "".join(text)  # type: ignore[union-attr]
+    assert deltas[-1].sequence_number == 39
+
+
+def test_coalesce_deltas_only_merges_the_same_part() -> None:
+    assert coalesce_deltas(_text_delta("a", 0), _text_delta("b", 1, "other")) is None
+    assert (
+        coalesce_deltas(
+            ToolStreamEvent(source="t", data="a"), ToolStreamEvent(source="u", data="b")
+        )
+        is None
+    )
+    merged = coalesce_deltas(
+        ToolStreamEvent(source="t", data="a"), ToolStreamEvent(source="t", data="b")
+    )
+    assert isinstance(merged, ToolStreamEvent)
+    assert merged.data == "ab"
+
+
+@pytest.mark.asyncio
+async def test_event_stream_retention_window() -> None:
+    events = [ToolStreamEvent(source="t", data=str(i)) for i in range(10)]
+    stream: EventStream[object] = EventStream(_events(list(events)), retain=3)
+    assert [ev.data for ev in await stream.drain()] == ["7", "8", "9"]
+
+    unbounded: EventStream[object] = EventStream(_events(list(events)))
+    assert len(await unbounded.drain()) == 10
@@ -0,0 +1,342 @@
+"""
+Branches run in worker processes (``ProcessPool`` / ``RemoteProcessor``).
+
+Factories and processors live at module level: spawned workers import this
+module to unpickle them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import os
+import socket
+import time
+from collections.abc import AsyncIterator
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import pytest_asyncio
+
+from grasp_agents.durability import InMemoryCheckpointStore
+from grasp_agents.processors import ParallelProcessor, Processor, RemoteProcessor
+from grasp_agents.rate_limiting.rate_limiter import RateLimiter
+from grasp_agents.runtime import ProcessPool, RemoteBranchError, WorkerContext
+from grasp_agents.runtime.process_pool import ProcessEnvelope, SocketTransport
+from grasp_agents.session_context import SessionContext
+from grasp_agents.types import BlobStore
+from grasp_agents.types.content import InputImage
+from grasp_agents.types.errors import ProcRunError
+from grasp_agents.types.events import (
+    Event,
+    ProcPacketOutEvent,
+    ProcPayloadOutEvent,
+    ProcStreamingErrorEvent,
+)
+from grasp_agents.types.response import ResponseUsage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Square(Processor[int, int, None]):
+    async def _process_stream(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[int] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> AsyncIterator[Event[Any]]:
+        for x in in_args or []:
+            if x < 0:
+                raise ValueError(f"negative input {x}")
+            yield ProcPayloadOutEvent(data=x * x, source=self.name, exec_id=exec_id)
+
+
+class _Pid(Processor[int, int, None]):
+    async def _process(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[int] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> list[int]:
+        await asyncio.sleep(0.2)
+        return [os.getpid()]
+
+
+class _Checkpointing(Processor[int, int, None]):
+    async def _process(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[int] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> list[int]:
+        store = self.ctx.checkpoint_store
+        assert store is not None
+        key = "/".join([self.ctx.session_key, *self.path])
+        await store.save(key, str(in_args).encode())
+        return [len(await store.list_keys(self.ctx.session_key))]
+
+
+class _Paced(Processor[int, float, None]):
+    def __init__(self, name: str, limiter: RateLimiter[Any]) -> None:
+        super().__init__(name=name)
+        self._limiter = limiter
+
+    async def _process(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[int] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> list[float]:
+        async def call() -> float:
+            return time.monotonic()
+
+        return [await self._limiter.process(call)]
+
+
+class _Spending(Processor[int, int, None]):
+    async def _process(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[int] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> list[int]:
+        for tokens in in_args or []:
+            self.ctx.usage_tracker.record(
+                self.name,
+                ResponseUsage(total_tokens=tokens, cost=tokens / 1000),
+                model="m",
+            )
+        return [sum(in_args or [])]
+
+
+class _ImageBytes(Processor[InputImage, int, None]):
+    async def _process(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[InputImage] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> list[int]:
+        return [len(image.decoded_bytes() or b"") for image in in_args or []]
+
+
+class _Crash(Processor[int, int, None]):
+    async def _process(
+        self,
+        chat_inputs: Any | None = None,
+        *,
+        in_args: list[int] | None = None,
+        exec_id: str,
+        step: int | None = None,
+    ) -> list[int]:
+        os._exit(1)
+
+
+def make_square(_: WorkerContext) -> _Square:
+    return _Square(name="square")
+
+
+def make_pid(_: WorkerContext) -> _Pid:
+    return _Pid(name="pid")
+
+
+def make_checkpointing(_: WorkerContext) -> _Checkpointing:
+    return _Checkpointing(name="ckpt")
+
+
+def make_paced(ctx: WorkerContext) -> _Paced:
+    return _Paced(name="paced", limiter=ctx.rate_limiter("llm"))
+
+
+def make_spending(_: WorkerContext) -> _Spending:
+    return _Spending(name="spend")
+
+
+def make_image_bytes(_: WorkerContext) -> _ImageBytes:
+    return _ImageBytes(name="img")
+
+
+def make_crash(_: WorkerContext) -> _Crash:
+    return _Crash(name="crash")
+
+
+# One pool (and one worker start-up) for the module; the crash test, which
+# kills a worker, gets its own.
+_LIMITER = RateLimiter[Any](rpm=600)  # one request per ~0.1s
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def pool() -> AsyncIterator[ProcessPool]:
+    async with ProcessPool(2, rate_limiters={"llm": _LIMITER}) as pool:
+        yield pool
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_remote_run_streams_the_result(pool: ProcessPool) -> None:
+    proc = RemoteProcessor[int, int, None](make_square, pool=pool, name="sq")
+    events = [e async for e in proc.run_stream(in_args=[2, 3])]
+
+    packets = [e for e in events if isinstance(e, ProcPacketOutEvent)]
+    # The worker's packet is re-packed under this run: one result packet.
+    assert len(packets) == 1
+    assert packets[0].data.payloads == [4, 9]
+    assert packets[0].data.sender == "sq"
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_parallel_replicas_spread_over_workers(pool: ProcessPool) -> None:
+    par = ParallelProcessor(
+        RemoteProcessor[int, int, None](make_pid, pool=pool, name="pid")
+    )
+    pids = (await par.run(in_args=[1, 2, 3, 4])).payloads
+
+    assert len(set(pids)) == 2
+    assert os.getpid() not in pids
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_branch_error_carries_the_remote_traceback(pool: ProcessPool) -> None:
+    proc = RemoteProcessor[int, int, None](make_square, pool=pool, name="sq")
+    with pytest.raises(ProcRunError) as exc_info:
+        await proc.run(in_args=[-1])
+
+    cause = exc_info.value.__cause__
+    assert isinstance(cause, RemoteBranchError)
+    assert "ValueError: negative input -1" in str(cause)
+    assert "_process_stream" in cause.remote_traceback
+    # The worker survives a failed branch.
+    assert (await proc.run(in_args=[5])).payloads == [25]
+    assert pool.live_workers == 2
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_checkpoint_writes_reach_the_parent_store(pool: ProcessPool) -> None:
+    store = InMemoryCheckpointStore()
+    ctx = SessionContext[None](session_key="s", checkpoint_store=store)
+    par = ParallelProcessor(
+        RemoteProcessor[int, int, None](
+            make_checkpointing, pool=pool, name="ckpt", ctx=ctx
+        ),
+        ctx=ctx,
+    )
+    await par.run(in_args=[7, 8])
+
+    assert await store.load("s/ckpt_par/ckpt_0") == b"[7]"
+    assert await store.load("s/ckpt_par/ckpt_1") == b"[8]"
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_rate_limiter_is_shared_across_workers(pool: ProcessPool) -> None:
+    par = ParallelProcessor(
+        RemoteProcessor[int, float, None](make_paced, pool=pool, name="paced")
+    )
+    stamps = sorted((await par.run(in_args=[1, 2, 3, 4])).payloads)
+
+    gaps = [b - a for a, b in pairwise(stamps)]
+    assert min(gaps) >= 0.09
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_branch_usage_reaches_the_parent_tracker(pool: ProcessPool) -> None:
+    ctx = SessionContext[None](session_key="s")
+    exceeded: list[str | None] = []
+    ctx.usage_tracker.add_budget(
+        max_tokens=100, on_exceeded=lambda b: exceeded.append(b.scope)
+    )
+    proc = RemoteProcessor[int, int, None](
+        make_spending, pool=pool, name="spend", ctx=ctx
+    )
+    await proc.run(in_args=[40, 70])
+
+    assert ctx.usage_tracker.total.total_tokens == 110
+    assert ctx.usage_tracker.usages["spend"].total_tokens == 110
+    assert ctx.usage_tracker.model_usages["m"].cost == pytest.approx(0.11)
+    assert exceeded == [None]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_offloaded_parts_cross_to_a_worker_inline(
+    pool: ProcessPool, tmp_path: Path
+) -> None:
+    store = BlobStore(tmp_path / "blobs", min_chars=16)
+    image = InputImage.from_base64(
+        base64.b64encode(b"\x89PNG" + bytes(64)).decode(), mime_type="image/png"
+    )
+    (offloaded,) = await store.offload_parts([image])
+    assert offloaded.blob is not None
+
+    # The worker has no BlobStore: the part must arrive with its payload.
+    proc = RemoteProcessor[InputImage, int, None](
+        make_image_bytes, pool=pool, name="img"
+    )
+    assert (await proc.run(in_args=[offloaded])).payloads == [68]
+
+
+@pytest.mark.asyncio
+async def test_lost_worker_fails_its_branches() -> None:
+    async with ProcessPool(2) as pool:
+        proc = RemoteProcessor[int, int, None](make_crash, pool=pool, name="crash")
+        events: list[Event[Any]] = []
+
+        async def consume() -> None:
+            async for event in proc.run_stream(in_args=[1]):
+                events.append(event)
+
+        with pytest.raises(ProcRunError) as exc_info:
+            await consume()
+
+        assert isinstance(exc_info.value.__cause__, RemoteBranchError)
+        assert any(isinstance(e, ProcStreamingErrorEvent) for e in events)
+        assert pool.live_workers == 1
+        # The surviving worker still takes work.
+        square = RemoteProcessor[int, int, None](make_square, pool=pool, name="sq")
+        assert (await square.run(in_args=[3])).payloads == [9]
+
+
+@pytest.mark.asyncio
+async def test_full_recipient_queue_pauses_only_its_sender() -> None:
+    parent, worker = SocketTransport(max_queue_size=2), SocketTransport()
+    for transport, sock in zip((parent, worker), socket.socketpair(), strict=True):
+        reader, writer = await asyncio.open_unix_connection(sock=sock)
+        transport.connect(reader, writer, default=True)
+    parent.register("slow")
+    parent.register("fast")
+
+    async def send(destination: str, count: int) -> None:
+        for i in range(count):
+            await worker.post(
+                ProcessEnvelope("event", destination, sender="w", payload=i)
+            )
+            await asyncio.sleep(0.01)
+
+    slow = asyncio.create_task(send("slow", 10))
+    # Nobody consumes "slow": its sender is paused, "fast" still flows.
+    async with asyncio.timeout(5):
+        _, fast = await asyncio.gather(
+            send("fast", 5),
+            asyncio.gather(*(parent.consume("fast") for _ in range(5))),
+        )
+    assert [e.payload for e in fast if isinstance(e, ProcessEnvelope)] == list(range(5))
+    await asyncio.sleep(0.1)
+    assert not slow.done()
+
+    received = [await parent.consume("slow") for _ in range(10)]
+    await slow
+    assert [e.payload for e in received if isinstance(e, ProcessEnvelope)] == list(
+        range(10)
+    )
+    await parent.shutdown()
+    await worker.shutdown()
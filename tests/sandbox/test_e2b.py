@@ -22,14 +22,21 @@ import base64
 import contextlib
 import datetime as dt
 import importlib.util
+import io
 import os
 import re
+import tarfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
 import pytest
-from e2b import AsyncSandbox, CommandExitException, TimeoutException
+from e2b import (
+    AsyncSandbox,
+    CommandExitException,
+    NotFoundException,
+    TimeoutException,
+)
 
 from grasp_agents.file_backend.base import FileBackend
 from grasp_agents.file_backend.paths import PathAccessError
@@ -127,6 +134,8 @@ class _FakeFiles:
         self.made_dirs: list[str] = []
 
     async def read(self, path: str, fmt: str = "text") -> Any:
+        if path not in self.reads:
+            raise NotFoundException(path)
         data = self.reads[path]
         if fmt == "bytes":
             return bytearray(data if isinstance(data, bytes) else str(data).encode())
@@ -140,6 +149,8 @@ class _FakeFiles:
         return None
 
     async def get_info(self, path: str) -> Any:
+        if path not in self.infos:
+            raise NotFoundException(path)
         return self.infos[path]
 
     async def exists(self, path: str) -> bool:
@@ -403,6 +414,73 @@ async def test_write_bytes_returns_post_write_mtime() -> None:
     assert mtime == 2000.0  # _FakeFiles.write stamps a fresh get_info mtime
 
 
+def _tar_b64(files: dict[str, bytes]) -> str:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name.lstrip("/"))
+            info.size = len(data)
+            info.mtime = 1234
+            tar.addfile(info, io.BytesIO(data))
+    return base64.b64encode(buf.getvalue()).decode()
+
+
+def _stat_sizes(fake: _FakeSandbox, sizes: dict[str, int]) -> None:
+    for path, size in sizes.items():
+        fake.files.infos[path] = _FakeEntry(name=Path(path).name, path=path, size=size)
+
+
+async def test_read_many_is_one_bulk_download() -> None:
+    archive = _tar_b64({f"{_WS}/a.txt": b"alpha", f"{_WS}/b.bin": b"\x00beta"})
+    fake = _FakeSandbox(commands=_FakeCommands(fg_stdout=archive))
+    _stat_sizes(fake, {f"{_WS}/a.txt": 5, f"{_WS}/b.bin": 5})
+    backend = _env(fake).file_backend
+
+    out = await backend.read_many([Path(f"{_WS}/b.bin"), Path(f"{_WS}/a.txt")])
+
+    assert out == [(b"\x00beta", 1234.0), (b"alpha", 1234.0)]
+    (call,) = fake.commands.calls
+    assert "tar -cf - --null -T" in call["cmd"]
+    (list_file,) = fake.files.written
+    assert fake.files.written[list_file] == f"{_WS}/b.bin\0{_WS}/a.txt".encode()
+
+
+async def test_read_many_missing_path_raises() -> None:
+    archive = _tar_b64({f"{_WS}/a.txt": b"alpha"})
+    fake = _FakeSandbox(commands=_FakeCommands(fg_stdout=archive))
+    backend = _env(fake).file_backend
+    with pytest.raises(FileNotFoundError):
+        await backend.read_many([Path(f"{_WS}/a.txt"), Path(f"{_WS}/gone")])
+
+
+async def test_read_many_splits_batches_by_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(e2b_file_backend, "READ_MANY_MAX_BYTES", 10)
+    archive = _tar_b64({f"{_WS}/a": b"aaaa", f"{_WS}/b": b"bbbb"})
+    fake = _FakeSandbox(commands=_FakeCommands(fg_stdout=archive))
+    _stat_sizes(fake, {f"{_WS}/a": 4, f"{_WS}/b": 4, f"{_WS}/big": 64})
+    fake.files.reads[f"{_WS}/big"] = b"x" * 64
+    backend = _env(fake).file_backend
+
+    out = await backend.read_many(
+        [Path(f"{_WS}/a"), Path(f"{_WS}/b"), Path(f"{_WS}/big")]
+    )
+
+    assert [data for data, _ in out] == [b"aaaa", b"bbbb", b"x" * 64]
+    # The two small files share one archive; the large one is read on its own.
+    (call,) = fake.commands.calls
+    assert "tar -cf -" in call["cmd"]
+
+
+async def test_read_many_timeout_is_an_os_error() -> None:
+    fake = _FakeSandbox(commands=_FakeCommands(fg_raises=_FakeTimeout("slow")))
+    _stat_sizes(fake, {f"{_WS}/a": 1, f"{_WS}/b": 1})
+    backend = _env(fake).file_backend
+    with pytest.raises(OSError, match="bulk read failed"):
+        await backend.read_many([Path(f"{_WS}/a"), Path(f"{_WS}/b")])
+
+
 async def test_delete_and_mkdir() -> None:
     fake = _FakeSandbox()
     backend = _env(fake).file_backend
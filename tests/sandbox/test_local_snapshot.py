@@ -0,0 +1,226 @@
+"""
+Copy-on-write workspace snapshots for the local environment
+(``LocalSnapshotStore`` / ``local_environment(snapshot_dir=...)``).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from grasp_agents.sandbox import SnapshotCapable, local_environment
+from grasp_agents.sandbox.local.snapshot import (
+    LocalSnapshotEnvironment,
+    LocalSnapshotStore,
+)
+
+
+def _tree(root: Path) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for path in sorted(root.rglob("*")):
+        rel = path.relative_to(root).as_posix()
+        if path.is_symlink():
+            out[rel] = "-> " + str(path.readlink())
+        elif path.is_dir():
+            out[rel] = "<dir>"
+        else:
+            out[rel] = path.read_text()
+    return out
+
+
+def _objects(store: LocalSnapshotStore) -> set[str]:
+    return {
+        p.parent.name + p.name
+        for p in (store.store_dir / "objects").glob("??/*")
+        if p.is_file()
+    }
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    ws = tmp_path / "ws"
+    (ws / "src" / "pkg").mkdir(parents=True)
+    (ws / "src" / "pkg" / "a.py").write_text("a = 1\n")
+    (ws / "src" / "b.txt").write_text("bee\n")
+    (ws / "README").write_text("readme\n")
+    (ws / "link").symlink_to("README")
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_round_trip_restores_modified_deleted_and_added(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    before = _tree(workspace)
+    ref = await store.snapshot()
+    assert ref.startswith("local:")
+
+    (workspace / "src" / "pkg" / "a.py").write_text("a = 2  # changed\n")
+    (workspace / "src" / "b.txt").unlink()
+    (workspace / "README").chmod(0o600)
+    (workspace / "new_dir" / "deep").mkdir(parents=True)
+    (workspace / "new_dir" / "deep" / "x").write_text("x")
+    (workspace / "link").unlink()
+    (workspace / "link").write_text("now a file")
+
+    await store.restore(ref)
+
+    assert _tree(workspace) == before
+    assert (workspace / "README").stat().st_mode & 0o777 != 0o600
+
+
+@pytest.mark.asyncio
+async def test_unchanged_files_are_not_reingested(
+    tmp_path: Path, workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    await store.snapshot()
+
+    ingested: list[Path] = []
+    original = LocalSnapshotStore._ingest
+
+    def spy(self: LocalSnapshotStore, path: Path) -> str:
+        ingested.append(path)
+        return original(self, path)
+
+    monkeypatch.setattr(LocalSnapshotStore, "_ingest", spy)
+    (workspace / "src" / "b.txt").write_text("changed\n")
+    await store.snapshot()
+
+    assert ingested == [workspace.resolve() / "src" / "b.txt"]
+
+
+@pytest.mark.asyncio
+async def test_change_detector_survives_a_new_store_instance(
+    tmp_path: Path, workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ref = await LocalSnapshotStore(tmp_path / "store", roots=[workspace]).snapshot()
+
+    def fail(self: LocalSnapshotStore, path: Path) -> str:
+        raise AssertionError(f"re-ingested {path}")
+
+    monkeypatch.setattr(LocalSnapshotStore, "_ingest", fail)
+    reopened = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    assert await reopened.snapshot() == ref
+
+
+@pytest.mark.asyncio
+async def test_restore_only_rewrites_changed_files(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    ref = await store.snapshot()
+    untouched = (workspace / "README").stat().st_ino
+    (workspace / "src" / "b.txt").write_text("changed\n")
+
+    await store.restore(ref)
+
+    assert (workspace / "README").stat().st_ino == untouched
+    assert (workspace / "src" / "b.txt").read_text() == "bee\n"
+
+
+@pytest.mark.asyncio
+async def test_identical_contents_are_stored_once(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    (workspace / "copy.txt").write_text("bee\n")
+    await store.snapshot()
+    first = _objects(store)
+    assert len(first) == 3  # a.py, b.txt == copy.txt, README
+
+    (workspace / "other.txt").write_text("readme\n")
+    await store.snapshot()
+    assert _objects(store) == first
+
+
+@pytest.mark.asyncio
+async def test_store_objects_are_independent_of_workspace(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    ref = await store.snapshot()
+    # In-place writes (as a subprocess would do) must not reach the store.
+    with (workspace / "README").open("r+") as f:
+        f.write("XXXXXX")
+    os.utime(workspace / "README", ns=(0, 0))
+
+    await store.restore(ref)
+    assert (workspace / "README").read_text() == "readme\n"
+
+
+@pytest.mark.asyncio
+async def test_excluded_entries_are_skipped_and_kept(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = LocalSnapshotStore(
+        tmp_path / "store", roots=[workspace], exclude=["__pycache__"]
+    )
+    cache = workspace / "src" / "__pycache__"
+    cache.mkdir()
+    (cache / "a.pyc").write_text("old")
+    ref = await store.snapshot()
+    assert len(_objects(store)) == 3
+
+    (cache / "a.pyc").write_text("new")
+    await store.restore(ref)
+    assert (cache / "a.pyc").read_text() == "new"
+
+
+@pytest.mark.asyncio
+async def test_store_inside_root_is_not_captured(workspace: Path) -> None:
+    store = LocalSnapshotStore(workspace / ".snapshots", roots=[workspace])
+    ref = await store.snapshot()
+    await store.snapshot()
+    (workspace / "README").write_text("changed")
+
+    await store.restore(ref)
+    assert (workspace / "README").read_text() == "readme\n"
+    assert store.refs() == [ref]
+
+
+@pytest.mark.asyncio
+async def test_gc_drops_unkept_snapshots_and_their_objects(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    old = await store.snapshot()
+    (workspace / "src" / "b.txt").write_text("v2\n")
+    new = await store.snapshot()
+    assert len(_objects(store)) == 4
+
+    removed = await store.gc([new])
+
+    assert removed == 1
+    assert store.refs() == [new]
+    with pytest.raises(KeyError):
+        await store.restore(old)
+    (workspace / "src" / "b.txt").write_text("v3\n")
+    await store.restore(new)
+    assert (workspace / "src" / "b.txt").read_text() == "v2\n"
+
+
+@pytest.mark.asyncio
+async def test_rejects_foreign_refs(tmp_path: Path, workspace: Path) -> None:
+    store = LocalSnapshotStore(tmp_path / "store", roots=[workspace])
+    with pytest.raises(ValueError, match="not a local snapshot ref"):
+        await store.restore("e2b:abc")
+
+
+@pytest.mark.asyncio
+async def test_local_environment_snapshot_dir(tmp_path: Path, workspace: Path) -> None:
+    plain = local_environment(allowed_roots=[workspace])
+    assert not isinstance(plain, SnapshotCapable)
+
+    env = local_environment(allowed_roots=[workspace], snapshot_dir=tmp_path / "s")
+    assert isinstance(env, LocalSnapshotEnvironment)
+    assert isinstance(env, SnapshotCapable)
+    assert env.snapshot_store.roots == (workspace.resolve(),)
+
+    ref = await env.snapshot()
+    (workspace / "README").unlink()
+    await env.restore(ref)
+    assert (workspace / "README").read_text() == "readme\n"
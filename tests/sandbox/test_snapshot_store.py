@@ -0,0 +1,370 @@
+"""
+The chunked, content-addressed snapshot store over a ``FileBackend``
+(``ChunkedSnapshotStore`` / ``SnapshottingEnvironment``).
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grasp_agents.durability import (
+    AgentCheckpoint,
+    InMemoryCheckpointStore,
+    SessionCheckpoint,
+    StepWatermark,
+    read_fs_snapshot_refs,
+)
+from grasp_agents.file_backend.local import LocalFileBackend
+from grasp_agents.sandbox import SnapshotCapable, local_environment
+from grasp_agents.sandbox.snapshot_store import (
+    ChunkedSnapshotStore,
+    SnapshottingEnvironment,
+    chunk_boundaries,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_SIZES = {"min_size": 256, "avg_size": 1024, "max_size": 8192}
+
+
+def _blob(n: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(n)  # noqa: S311 - deterministic fixture data
+
+
+def _chunks(store: ChunkedSnapshotStore) -> set[str]:
+    return {p.parent.name + p.name for p in (store.store_dir / "chunks").glob("??/*")}
+
+
+def _files(root: Path) -> dict[str, bytes]:
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    ws = tmp_path / "ws"
+    (ws / "pkg").mkdir(parents=True)
+    (ws / "pkg" / "mod.py").write_text("x = 1\n")
+    (ws / "big.bin").write_bytes(_blob(64 * 1024))
+    (ws / "notes.md").write_text("notes\n")
+    return ws
+
+
+def _store(
+    tmp_path: Path, workspace: Path, *, exclude: Sequence[str] = ()
+) -> ChunkedSnapshotStore:
+    backend = LocalFileBackend(allowed_roots=[workspace])
+    return ChunkedSnapshotStore(
+        backend,
+        tmp_path / "store",
+        min_chunk_size=256,
+        avg_chunk_size=1024,
+        max_chunk_size=8192,
+        exclude=exclude,
+    )
+
+
+# --- chunking ----------------------------------------------------------------
+
+
+def test_chunk_boundaries_respect_bounds_and_cover_data() -> None:
+    data = _blob(200_000)
+    ends = chunk_boundaries(data, **_SIZES)
+    assert ends[-1] == len(data)
+    sizes = [b - a for a, b in zip([0, *ends], ends, strict=False)]
+    assert all(256 < s <= 8192 for s in sizes[:-1])
+    # Normalized chunking keeps the mean near the target.
+    assert 512 < sum(sizes) / len(sizes) < 4096
+
+
+def test_chunk_boundaries_are_content_defined() -> None:
+    data = _blob(100_000, seed=1)
+    shifted = b"inserted prefix" + data
+    original = set(chunk_boundaries(data, **_SIZES))
+    moved = {
+        end - len(b"inserted prefix") for end in chunk_boundaries(shifted, **_SIZES)
+    }
+    # After the first couple of chunks the boundaries resynchronize.
+    assert len(original & moved) > 0.9 * len(original)
+
+
+def test_small_data_is_one_chunk() -> None:
+    assert chunk_boundaries(b"tiny", **_SIZES) == [4]
+    assert chunk_boundaries(b"", **_SIZES) == []
+
+
+def test_rejects_bad_chunk_sizes(tmp_path: Path) -> None:
+    backend = LocalFileBackend(allowed_roots=[tmp_path])
+    with pytest.raises(ValueError, match="power of two"):
+        ChunkedSnapshotStore(backend, tmp_path / "s", avg_chunk_size=1000)
+    with pytest.raises(ValueError, match="chunk sizes"):
+        ChunkedSnapshotStore(
+            backend, tmp_path / "s", min_chunk_size=4096, avg_chunk_size=2048
+        )
+
+
+# --- snapshot / restore -----------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_round_trip(tmp_path: Path, workspace: Path) -> None:
+    store = _store(tmp_path, workspace)
+    before = _files(workspace)
+    ref = await store.snapshot()
+    assert ref.startswith("cas:")
+
+    (workspace / "pkg" / "mod.py").write_text("x = 2\n")
+    (workspace / "notes.md").unlink()
+    (workspace / "pkg" / "new.py").write_text("new\n")
+
+    await store.restore(ref)
+    assert _files(workspace) == before
+
+
+@pytest.mark.asyncio
+async def test_local_edit_in_large_file_stores_few_chunks(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = _store(tmp_path, workspace)
+    await store.snapshot()
+    before = _chunks(store)
+
+    data = bytearray((workspace / "big.bin").read_bytes())
+    data[30_000:30_010] = b"0123456789"
+    (workspace / "big.bin").write_bytes(bytes(data))
+    await store.snapshot()
+
+    added = _chunks(store) - before
+    assert 1 <= len(added) <= 3
+
+
+@pytest.mark.asyncio
+async def test_unchanged_files_are_not_read(
+    tmp_path: Path, workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _store(tmp_path, workspace)
+    await store.snapshot()
+
+    read: list[Path] = []
+    original = LocalFileBackend.read_many
+
+    async def spy(
+        self: LocalFileBackend, paths: list[Path], **kw: int
+    ) -> list[tuple[bytes, float]]:
+        read.extend(paths)
+        return await original(self, paths, **kw)
+
+    monkeypatch.setattr(LocalFileBackend, "read_many", spy)
+    (workspace / "notes.md").write_text("changed\n")
+    await store.snapshot()
+    assert read == [workspace / "notes.md"]
+
+
+@pytest.mark.asyncio
+async def test_rewrite_within_mtime_granularity_is_detected(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = _store(tmp_path, workspace)
+    notes = workspace / "notes.md"
+    st = notes.stat()
+    await store.snapshot()
+
+    # Same mtime (a backend with whole-second mtimes), different size.
+    notes.write_text("notes, longer\n")
+    os.utime(notes, ns=(st.st_atime_ns, st.st_mtime_ns))
+    second = await store.snapshot()
+
+    # Same size, mtime a nanosecond apart: equal as float seconds.
+    notes.write_text("NOTES, longer\n")
+    os.utime(notes, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    third = await store.snapshot()
+
+    await store.restore(second)
+    assert notes.read_text() == "notes, longer\n"
+    await store.restore(third)
+    assert notes.read_text() == "NOTES, longer\n"
+
+
+@pytest.mark.asyncio
+async def test_restore_rewrites_only_differing_files(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = _store(tmp_path, workspace)
+    ref = await store.snapshot()
+    inode = (workspace / "big.bin").stat().st_ino
+    (workspace / "notes.md").write_text("changed\n")
+
+    await store.restore(ref)
+    assert (workspace / "big.bin").stat().st_ino == inode
+    assert (workspace / "notes.md").read_text() == "notes\n"
+
+    # A second restore right after finds nothing to do.
+    inode = (workspace / "notes.md").stat().st_ino
+    await store.restore(ref)
+    assert (workspace / "notes.md").stat().st_ino == inode
+
+
+@pytest.mark.asyncio
+async def test_restore_assembles_within_concurrency_limit(
+    tmp_path: Path, workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for i in range(12):
+        (workspace / f"f{i}.txt").write_text(f"file {i}\n")
+    backend = LocalFileBackend(allowed_roots=[workspace])
+    store = ChunkedSnapshotStore(backend, tmp_path / "store", max_concurrency=2)
+    ref = await store.snapshot()
+    for i in range(12):
+        (workspace / f"f{i}.txt").write_text("changed\n")
+
+    lock = threading.Lock()
+    active = peak = 0
+    assemble = store._assemble  # pyright: ignore[reportPrivateUsage]
+
+    def counting(record: object) -> bytes:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        try:
+            return assemble(record)  # type: ignore[arg-type]
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(store, "_assemble", counting)
+    await store.restore(ref)
+    assert (workspace / "f3.txt").read_text() == "file 3\n"
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_index_survives_a_new_store_instance(
+    tmp_path: Path, workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ref = await _store(tmp_path, workspace).snapshot()
+
+    async def fail(self: LocalFileBackend, paths: list[Path], **kw: int) -> None:
+        raise AssertionError(f"re-read {paths}")
+
+    monkeypatch.setattr(LocalFileBackend, "read_many", fail)
+    assert await _store(tmp_path, workspace).snapshot() == ref
+
+
+@pytest.mark.asyncio
+async def test_restores_executable_bit(tmp_path: Path, workspace: Path) -> None:
+    script = workspace / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    store = _store(tmp_path, workspace)
+    ref = await store.snapshot()
+    script.unlink()
+
+    await store.restore(ref)
+    assert os.access(script, os.X_OK)
+
+
+@pytest.mark.asyncio
+async def test_excluded_paths_are_left_alone(tmp_path: Path, workspace: Path) -> None:
+    cache = workspace / "pkg" / "__pycache__"
+    cache.mkdir()
+    (cache / "mod.pyc").write_bytes(b"old")
+    store = _store(tmp_path, workspace, exclude=["__pycache__"])
+    ref = await store.snapshot()
+
+    (cache / "mod.pyc").write_bytes(b"new")
+    (cache / "other.pyc").write_bytes(b"other")
+    await store.restore(ref)
+    assert (cache / "mod.pyc").read_bytes() == b"new"
+    assert (cache / "other.pyc").exists()
+
+
+# --- gc ------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_gc_keeps_refs_from_the_checkpoint_key_space(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = _store(tmp_path, workspace)
+    old = await store.snapshot()
+    (workspace / "big.bin").write_bytes(_blob(64 * 1024, seed=7))
+    kept = await store.snapshot()
+    (workspace / "notes.md").write_text("latest\n")
+    latest = await store.snapshot()
+
+    checkpoints = InMemoryCheckpointStore()
+    head = AgentCheckpoint(
+        session_key="s",
+        processor_name="agent",
+        step_watermarks=[StepWatermark(fs_snapshot_ref=kept)],
+    )
+    await checkpoints.save("s/agent/agent", head.model_dump_json().encode())
+    await checkpoints.save(
+        "other/session",
+        SessionCheckpoint(session_key="other").model_dump_json().encode(),
+    )
+    assert await read_fs_snapshot_refs(checkpoints) == {kept}
+
+    removed = await store.gc_unreferenced(checkpoints)
+
+    # ``old``'s unique chunks (the first big.bin) are gone; the latest
+    # snapshot survives even though no checkpoint records it yet.
+    assert removed > 0
+    assert store.refs() == sorted([kept, latest])
+    with pytest.raises(KeyError):
+        await store.restore(old)
+    await store.restore(kept)
+    assert (workspace / "big.bin").read_bytes() == _blob(64 * 1024, seed=7)
+    assert (workspace / "notes.md").read_text() == "notes\n"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_after_gc_rereads_collected_files(
+    tmp_path: Path, workspace: Path
+) -> None:
+    store = _store(tmp_path, workspace)
+    await store.snapshot()
+    await store.gc([])
+    assert _chunks(store) == set()
+
+    ref = await store.snapshot()
+    (workspace / "big.bin").unlink()
+    await store.restore(ref)
+    assert (workspace / "big.bin").read_bytes() == _blob(64 * 1024)
+
+
+@pytest.mark.asyncio
+async def test_rejects_foreign_refs(tmp_path: Path, workspace: Path) -> None:
+    store = _store(tmp_path, workspace)
+    with pytest.raises(ValueError, match="not a chunked snapshot ref"):
+        await store.restore("local:abc")
+
+
+# --- environment wrapper --------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_snapshotting_environment(tmp_path: Path, workspace: Path) -> None:
+    inner = local_environment(allowed_roots=[workspace])
+    async with SnapshottingEnvironment(inner, store_dir=tmp_path / "s") as env:
+        assert isinstance(env, SnapshotCapable)
+        assert env.file_backend is inner.file_backend
+        assert env.exec_backend is inner.exec_backend
+        assert env.policy is inner.policy
+
+        ref = await env.snapshot()
+        (workspace / "notes.md").write_text("changed\n")
+        await env.restore(ref)
+        assert (workspace / "notes.md").read_text() == "notes\n"
@@ -0,0 +1,215 @@
+"""
+Prebuilt venv templates cloned per environment (``VenvTemplateCache`` /
+``local_environment(venv_cache=...)``).
+
+The template build is replaced by a stand-in that lays out a minimal but real
+venv (``pyvenv.cfg`` + an interpreter symlink), so clones can be executed.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grasp_agents.sandbox import EnvironmentConfig, local_environment
+from grasp_agents.sandbox.local.exec import LocalExecBackend
+from grasp_agents.sandbox.local.venv_cache import VenvTemplateCache, template_key
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="stand-in venv layout is POSIX"
+)
+
+_BASE = os.path.realpath(sys.executable)
+_SITE = f"lib/python{sys.version_info.major}.{sys.version_info.minor}/site-packages"
+
+
+@pytest.fixture
+def builds(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Record template builds, each laying out a stand-in venv."""
+    calls: list[list[str]] = []
+
+    def fake_create_venv(
+        self: VenvTemplateCache, base: str, packages: Sequence[str], venv: Path
+    ) -> None:
+        calls.append(list(packages))
+        (venv / "bin").mkdir(parents=True)
+        (venv / "bin" / "python").symlink_to(base)
+        (venv / "pyvenv.cfg").write_text(
+            f"home = {Path(base).parent}\n"
+            "include-system-site-packages = false\n"
+            f"command = {base} -m venv {venv}\n"
+        )
+        tool = venv / "bin" / "tool"
+        tool.write_text(f"#!{venv}/bin/python\nprint('tool')\n")
+        tool.chmod(0o755)
+        site = venv / _SITE
+        site.mkdir(parents=True)
+        for name in packages:
+            (site / f"{name}.py").write_text(f"NAME = {name!r}\n")
+            dist = site / f"{name}-1.0.dist-info"
+            dist.mkdir()
+            (dist / "METADATA").write_text(
+                f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n"
+            )
+
+    monkeypatch.setattr(VenvTemplateCache, "_create_venv", fake_create_venv)
+    return calls
+
+
+def _run(python: str, code: str) -> str:
+    return subprocess.run(
+        [python, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_key_ignores_package_order_and_whitespace() -> None:
+    assert template_key(_BASE, ["a", "b>=1"]) == template_key(_BASE, ["b >=1", "a"])
+    assert template_key(_BASE, ["a"]) != template_key(_BASE, ["a", "b"])
+
+
+def test_miss_builds_then_hits_clone(tmp_path: Path, builds: list[list[str]]) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+    first = cache.provision(_BASE, ["fakepkg"], tmp_path / "a" / ".venv")
+    second = cache.provision(_BASE, ["fakepkg"], tmp_path / "b" / ".venv")
+
+    assert builds == [["fakepkg"]]
+    assert cache.templates() == [template_key(_BASE, ["fakepkg"])]
+    for python, root in ((first, tmp_path / "a"), (second, tmp_path / "b")):
+        out = _run(python, "import sys, fakepkg; print(sys.prefix, fakepkg.NAME)")
+        assert out == f"{root / '.venv'} fakepkg"
+
+
+def test_clone_rewrites_recorded_locations(
+    tmp_path: Path, builds: list[list[str]]
+) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+    venv = tmp_path / "ws" / ".venv"
+    cache.provision(_BASE, [], venv)
+
+    tool = venv / "bin" / "tool"
+    assert tool.read_text().startswith(f"#!{venv}/bin/python\n")
+    assert os.access(tool, os.X_OK)
+    assert f"-m venv {venv}\n" in (venv / "pyvenv.cfg").read_text()
+    assert (venv / "bin" / "python").readlink() == Path(_BASE)
+    assert not list(venv.parent.glob(".*clone-*"))
+
+
+def test_auto_clones_never_share_template_inodes(
+    tmp_path: Path, builds: list[list[str]]
+) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+    venv = tmp_path / "ws" / ".venv"
+    cache.provision(_BASE, ["fakepkg"], venv)
+
+    key = template_key(_BASE, ["fakepkg"])
+    template_file = tmp_path / "cache" / key / "venv" / _SITE / "fakepkg.py"
+    clone_file = venv / _SITE / "fakepkg.py"
+    assert clone_file.stat().st_ino != template_file.stat().st_ino
+    assert not template_file.stat().st_mode & 0o222
+    # In-place writes to the clone never reach the template.
+    with clone_file.open("r+") as f:
+        f.write("NAME = 'editd!'")
+    (venv / _SITE / "extra.py").write_text("x = 1\n")
+    assert template_file.read_text() == "NAME = 'fakepkg'\n"
+    assert not (template_file.parent / "extra.py").exists()
+
+
+def test_copy_clones_are_private_and_keep_mtimes(
+    tmp_path: Path, builds: list[list[str]]
+) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache", link_mode="copy")
+    venv = tmp_path / "ws" / ".venv"
+    cache.provision(_BASE, ["fakepkg"], venv)
+
+    key = template_key(_BASE, ["fakepkg"])
+    template_file = tmp_path / "cache" / key / "venv" / _SITE / "fakepkg.py"
+    clone_file = venv / _SITE / "fakepkg.py"
+    assert clone_file.stat().st_ino != template_file.stat().st_ino
+    assert clone_file.stat().st_mtime_ns == template_file.stat().st_mtime_ns
+    clone_file.write_text("NAME = 'edited'\n")
+    assert template_file.read_text() == "NAME = 'fakepkg'\n"
+
+
+def test_damaged_template_is_rebuilt(tmp_path: Path, builds: list[list[str]]) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+    cache.provision(_BASE, ["fakepkg"], tmp_path / "a" / ".venv")
+    # Rewritten in place at the same size and mode: only the mtime differs.
+    key = template_key(_BASE, ["fakepkg"])
+    template_file = tmp_path / "cache" / key / "venv" / _SITE / "fakepkg.py"
+    mode = template_file.stat().st_mode
+    template_file.chmod(0o644)
+    template_file.write_text("NAME = 'damaged'\n")
+    template_file.chmod(mode)
+    os.utime(template_file, ns=(0, template_file.stat().st_mtime_ns + 10**9))
+
+    python = cache.provision(_BASE, ["fakepkg"], tmp_path / "b" / ".venv")
+
+    assert len(builds) == 2
+    assert _run(python, "import fakepkg; print(fakepkg.NAME)") == "fakepkg"
+    assert len(cache.templates()) == 1
+
+
+def test_least_recently_used_templates_are_evicted(
+    tmp_path: Path, builds: list[list[str]]
+) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache", max_templates=2)
+    cache.provision(_BASE, ["a"], tmp_path / "1" / ".venv")
+    cache.provision(_BASE, ["b"], tmp_path / "2" / ".venv")
+    cache.provision(_BASE, ["a"], tmp_path / "3" / ".venv")  # refreshes "a"
+    cache.provision(_BASE, ["c"], tmp_path / "4" / ".venv")
+
+    assert cache.templates() == [
+        template_key(_BASE, ["c"]),
+        template_key(_BASE, ["a"]),
+    ]
+    # Evicting a template leaves clones made from it intact.
+    assert _run(str(tmp_path / "2" / ".venv" / "bin" / "python"), "import b") == ""
+    assert not list((tmp_path / "cache").glob(".*"))
+
+
+def test_local_environment_clones_from_the_cache(
+    tmp_path: Path, builds: list[list[str]]
+) -> None:
+    roots = [tmp_path / "one", tmp_path / "two"]
+    for root in roots:
+        root.mkdir()
+        env = local_environment(
+            allowed_roots=[root],
+            packages=["fakepkg"],
+            provision=True,
+            venv_cache=tmp_path / "cache",
+        )
+        backend = env.exec_backend
+        assert isinstance(backend, LocalExecBackend)
+        assert backend._kernel_launch_argv("cf")[0] == str(root / ".venv/bin/python")
+    assert builds == [["fakepkg"]]
+
+
+def test_config_venv_cache_dir(tmp_path: Path, builds: list[list[str]]) -> None:
+    cfg = EnvironmentConfig.model_validate(
+        {
+            "filesystem": {"allowed_roots": [str(tmp_path / "ws")]},
+            "exec": {"provision": True, "venv_cache_dir": str(tmp_path / "cache")},
+        }
+    )
+    (tmp_path / "ws").mkdir()
+    cfg.build()
+    assert builds == [[]]
+    assert (tmp_path / "ws" / ".venv" / "pyvenv.cfg").is_file()
+
+
+@pytest.mark.integration
+def test_real_template_round_trip(tmp_path: Path) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+    python = cache.provision(sys.executable, [], tmp_path / "ws" / ".venv")
+    assert _run(python, "import sys; print(sys.prefix)") == str(tmp_path / "ws/.venv")
+    pip = _run(python, "import pip; print(pip.__file__)")
+    assert pip.startswith(str(tmp_path / "ws" / ".venv"))
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from pathlib import Path
 
 import pytest
 
 from grasp_agents.skills import (
     Skill,
+    SkillFilter,
     SkillFrontmatter,
     SkillNotFoundError,
     SkillRegistry,
+    render_available_skills_block,
 )
+from grasp_agents.skills import registry as registry_module
 
 
 def _make_skill(
@@ -141,3 +146,153 @@ class TestSkillsRefresh:
 
         assert "code-skill" in registry
         assert "disk-skill" not in registry
+
+    def test_version_bumps_only_on_catalog_change(self, tmp_path: Path) -> None:
+        source = tmp_path / "skills"
+        _write_skill_dir(source, "disk-skill")
+
+        registry = SkillRegistry()
+        registry.add_source(source)
+        version = registry.version
+
+        registry.refresh()  # nothing changed on disk
+        assert registry.version == version
+
+        _write_skill_dir(source, "new-skill")
+        registry.refresh()
+        assert registry.version > version
+
+
+# ---------- incremental refresh / watching / catalog ----------
+
+
+def _touch(path: Path, text: str) -> None:
+    st = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def _count_loads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    loaded: list[str] = []
+    load = registry_module.load_skill_md
+
+    def counting(path: Path) -> Skill:
+        loaded.append(path.parent.name)
+        return load(path)
+
+    monkeypatch.setattr(registry_module, "load_skill_md", counting)
+    return loaded
+
+
+class TestIncrementalRefresh:
+    def test_refresh_reparses_only_changed_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        source = tmp_path / "skills"
+        for name in ("alpha", "beta", "gamma"):
+            _write_skill_dir(source, name)
+        loaded = _count_loads(monkeypatch)
+        registry = SkillRegistry.from_path(source)
+        alpha = registry.get("alpha")
+        assert sorted(loaded) == ["alpha", "beta", "gamma"]
+
+        loaded.clear()
+        _touch(
+            source / "beta" / "SKILL.md",
+            "---\nname: beta\ndescription: edited\n---\nnew body\n",
+        )
+        _write_skill_dir(source, "delta")
+        registry.refresh()
+
+        assert sorted(loaded) == ["beta", "delta"]
+        assert registry.get("alpha") is alpha
+        assert registry.get("beta").description == "edited"
+        assert "delta" in registry
+
+    def test_malformed_file_is_not_reparsed_until_changed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        source = tmp_path / "skills"
+        _write_skill_dir(source, "good")
+        broken = source / "broken"
+        broken.mkdir()
+        (broken / "SKILL.md").write_text("no frontmatter", encoding="utf-8")
+        loaded = _count_loads(monkeypatch)
+        registry = SkillRegistry.from_path(source)
+        assert "broken" not in registry
+
+        loaded.clear()
+        registry.refresh()
+        assert loaded == []
+
+        _touch(
+            broken / "SKILL.md",
+            "---\nname: broken\ndescription: fixed\n---\nbody\n",
+        )
+        registry.refresh()
+        assert loaded == ["broken"]
+        assert "broken" in registry
+
+    @pytest.mark.asyncio
+    async def test_arefresh_walks_off_the_loop(self, tmp_path: Path) -> None:
+        source = tmp_path / "skills"
+        _write_skill_dir(source, "alpha")
+        registry = SkillRegistry.from_path(source)
+        version = registry.version
+
+        _write_skill_dir(source, "beta")
+        await registry.arefresh()
+        assert "beta" in registry
+        assert registry.version > version
+
+    @pytest.mark.asyncio
+    async def test_watcher_applies_changes(self, tmp_path: Path) -> None:
+        source = tmp_path / "skills"
+        _write_skill_dir(source, "alpha")
+        registry = SkillRegistry.from_path(source)
+        registry.start_watching(poll_interval=0.01)
+        assert registry.watching
+        try:
+            _write_skill_dir(source, "beta")
+            for _ in range(200):
+                if "beta" in registry:
+                    break
+                await asyncio.sleep(0.01)
+            assert "beta" in registry
+        finally:
+            await registry.stop_watching()
+        assert not registry.watching
+
+
+class TestPrecomputedCatalog:
+    def test_catalog_matches_renderer(self) -> None:
+        registry = SkillRegistry(
+            [_make_skill("alpha"), _make_skill("hidden", disabled=True)]
+        )
+        catalog = registry.catalog
+        assert catalog.text == render_available_skills_block(registry.all)
+        assert [s.name for s in catalog.skills] == ["alpha"]
+        assert registry.catalog is catalog  # unchanged version: no rebuild
+
+    def test_filtered_render_matches_renderer(self) -> None:
+        skills = [_make_skill(n) for n in ("alpha", "beta", "gamma")]
+        registry = SkillRegistry(skills)
+        skill_filter = SkillFilter.build(exclude=["beta"])
+        assert skill_filter is not None
+        assert registry.catalog.render(skill_filter) == (
+            render_available_skills_block(skill_filter.apply(skills))
+        )
+        assert registry.catalog.render(SkillFilter.build(include=[])) == ""
+
+    def test_rebuild_reuses_unchanged_entries(self, tmp_path: Path) -> None:
+        source = tmp_path / "skills"
+        _write_skill_dir(source, "alpha")
+        registry = SkillRegistry.from_path(source)
+        first = registry.catalog
+
+        _write_skill_dir(source, "beta")
+        registry.refresh()
+        second = registry.catalog
+        assert second is not first
+        assert second.entries["alpha"] is first.entries["alpha"]
+        assert second.text == render_available_skills_block(registry.all)
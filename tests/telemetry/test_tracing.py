@@ -510,6 +510,20 @@ class TestSpanAttributes:
         assert "5" in str(attrs[ATTR_ENTITY_INPUT])
         assert "10" in str(attrs[ATTR_ENTITY_OUTPUT])
 
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_input_output_payloads_are_redacted(self) -> None:
+        secret = "sk-proj-abcdefghijklmnop1234567890"
+
+        @traced(name="leak")
+        async def leak(api_key: str) -> str:
+            return f"called with {api_key}"
+
+        await leak(api_key=secret)
+
+        attrs = _exporter.get_finished_spans()[0].attributes or {}
+        assert secret not in str(attrs[ATTR_ENTITY_INPUT])
+        assert secret not in str(attrs[ATTR_ENTITY_OUTPUT])
+
 
 # ========================================================================= #
 #  Span naming                                                               #
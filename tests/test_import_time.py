@@ -0,0 +1,99 @@
+"""
+Cold-start regression guard: the package namespace resolves lazily, the
+headline entry points stay off heavy dependencies they don't use (litellm,
+provider SDKs, the OpenTelemetry SDK, MCP, Textual, Jupyter), and importing
+them fits a time budget.
+
+Each check runs in a fresh interpreter, since ``sys.modules`` here is already
+warm from the rest of the suite. The budget can be raised on slow machines via
+``GRASP_IMPORT_BUDGET_S``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+IMPORT_BUDGET_S = float(os.environ.get("GRASP_IMPORT_BUDGET_S", "3.0"))
+
+# Loaded on demand only: token counting / pricing, a provider class, tracing
+# setup, an MCP client, the TUI, a kernel.
+DEFERRED_MODULES = (
+    "litellm",
+    "anthropic",
+    "google.genai",
+    "opentelemetry.sdk",
+    "mcp",
+    "textual",
+    "jupyter_client",
+    "nbformat",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _probe(stmt: str) -> tuple[float, set[str]]:
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _PROBE.format(stmt=stmt)],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    return result["elapsed"], set(result["modules"])
+
+
+def _loaded(modules: set[str], name: str) -> bool:
+    return any(m == name or m.startswith(f"{name}.") for m in modules)
+
+
+def test_package_import_is_lazy() -> None:
+    _, modules = _probe("import grasp_agents")
+    loaded = {m for m in modules if m.startswith("grasp_agents.")}
+    assert not loaded
+    assert not _loaded(modules, "openai")
+
+
+@pytest.mark.parametrize(
+    "stmt",
+    [
+        "from grasp_agents import LLMAgent",
+        "from grasp_agents import Runner, SessionContext, function_tool",
+        # Imported first, the session context must not trip an import cycle.
+        "from grasp_agents.session_context import SessionContext",
+    ],
+)
+def test_entry_points_defer_heavy_dependencies(stmt: str) -> None:
+    _, modules = _probe(stmt)
+    assert [m for m in DEFERRED_MODULES if _loaded(modules, m)] == []
+
+
+def test_agent_import_within_budget() -> None:
+    # Best of two, to damp one-off disk / scheduler noise.
+    elapsed = min(_probe("from grasp_agents import LLMAgent")[0] for _ in range(2))
+    assert elapsed < IMPORT_BUDGET_S, (
+        f"`from grasp_agents import LLMAgent` took {elapsed:.2f}s "
+        f"(budget {IMPORT_BUDGET_S:.2f}s)"
+    )
+
+
+def test_lazy_names_resolve() -> None:
+    import grasp_agents
+
+    for name in grasp_agents.__all__:
+        if name.startswith("MCP"):
+            continue  # needs the ``mcp`` extra
+        assert getattr(grasp_agents, name) is not None
+    with pytest.raises(AttributeError):
+        _ = grasp_agents.NoSuchName  # type: ignore[attr-defined]
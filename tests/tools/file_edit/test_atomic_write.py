@@ -16,6 +16,7 @@ from unittest.mock import patch
 import pytest
 
 from grasp_agents.file_backend.atomic_write import (
+    DirSyncBatch,
     atomic_write_bytes,
     atomic_write_text,
 )
@@ -92,3 +93,44 @@ def test_atomic_write_no_fsync_still_works(tmp_path: Path) -> None:
     target = tmp_path / "nofsync.txt"
     atomic_write_bytes(target, b"x", fsync=False)
     assert target.read_bytes() == b"x"
+
+
+def _record_fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    """Patch ``os.fsync``; each call records whether its fd is a directory."""
+    calls: list[bool] = []
+    real_fsync = os.fsync
+
+    def fsync(fd: int) -> None:
+        calls.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    return calls
+
+
+@pytest.mark.skipif(os.name == "nt", reason="directory fsync is POSIX-only")
+def test_atomic_write_sync_dir_flushes_parent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _record_fsyncs(monkeypatch)
+    atomic_write_bytes(tmp_path / "f.txt", b"x", sync_dir=True)
+    # The temp file's contents, then the directory holding the rename.
+    assert calls == [False, True]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="directory fsync is POSIX-only")
+def test_dir_sync_batch_syncs_each_directory_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    calls = _record_fsyncs(monkeypatch)
+    batch = DirSyncBatch()
+    for name in ("a/1", "a/2", "a/3", "b/1"):
+        atomic_write_bytes(tmp_path / name, b"x", sync_dir=batch)
+    assert calls.count(True) == 0
+    assert len(batch) == 2
+
+    batch.sync()
+    assert calls.count(True) == 2
+    assert len(batch) == 0
@@ -102,3 +102,22 @@ def test_cap_evicts_oldest_read_file_state() -> None:
     assert Path("/tmp/f0") not in state.read_file_state
     assert Path("/tmp/f1") not in state.read_file_state
     assert Path("/tmp/f4") in state.read_file_state
+
+
+def test_write_listeners_see_writes_and_deletes(
+    state: FileEditSessionState,
+) -> None:
+    seen: list[Path] = []
+    state.add_write_listener(seen.append)
+    state.add_write_listener(seen.append)  # idempotent
+    p = Path("/tmp/file_a")
+    state.record_read(p, 1.0)
+    state.record_write(p, 2.0)
+    state.record_delete(p)
+
+    assert seen == [p, p]
+    assert state.get_read_record(p) is None
+
+    state.remove_write_listener(seen.append)
+    state.record_write(p, 3.0)
+    assert seen == [p, p]
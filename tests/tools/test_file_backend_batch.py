@@ -0,0 +1,107 @@
+"""
+Batched LocalFileBackend calls: ``validate_many`` applies exactly the policy
+of ``validate_path`` (per-path errors instead of raising), ``stat_many`` and
+``read_many`` keep their per-path counterparts' results, and the scandir-based
+listings keep the ``os.walk`` / ``rglob`` shape.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from grasp_agents.file_backend import LocalFileBackend
+from grasp_agents.file_backend.paths import PathAccessError
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path.resolve()
+    (root / "pkg" / "sub").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("a")
+    (root / "pkg" / "sub" / "b.py").write_text("b")
+    (root / "pkg" / ".env").write_text("SECRET=1")
+    (root / "notes.txt").write_text("n")
+    (root / "pkg_link").symlink_to(root / "pkg")
+    return root
+
+
+def _candidates(root: Path) -> list[Path]:
+    return [
+        root / "pkg" / "a.py",
+        root / "pkg_link" / "a.py",  # symlinked parent
+        root / "pkg" / ".." / "notes.txt",
+        root / "pkg" / ".env",  # sensitive
+        root / "missing.txt",
+        root / "no_dir" / "x.txt",
+        root,
+        Path("/etc/hosts"),  # outside the roots
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("must_exist", [True, False])
+async def test_validate_many_matches_validate_path(
+    tree: Path, must_exist: bool
+) -> None:
+    backend = LocalFileBackend(allowed_roots=[tree])
+    paths = _candidates(tree)
+    batched = await backend.validate_many(paths, must_exist=must_exist)
+    for path, got in zip(paths, batched, strict=True):
+        try:
+            want: Path | PathAccessError = await backend.validate_path(
+                path, must_exist=must_exist
+            )
+        except PathAccessError as exc:
+            want = exc
+        assert type(got) is type(want), path
+        assert str(got) == str(want), path
+
+
+@pytest.mark.asyncio
+async def test_validate_many_sees_added_root(tree: Path) -> None:
+    backend = LocalFileBackend(allowed_roots=[tree / "pkg"])
+    [first] = await backend.validate_many([tree / "notes.txt"], must_exist=True)
+    assert isinstance(first, PathAccessError)
+    backend.add_allowed_root(tree)
+    [second] = await backend.validate_many([tree / "notes.txt"], must_exist=True)
+    assert second == tree / "notes.txt"
+
+
+@pytest.mark.asyncio
+async def test_stat_many_and_read_many(tree: Path) -> None:
+    backend = LocalFileBackend(allowed_roots=[tree])
+    a = tree / "pkg" / "a.py"
+    stats = await backend.stat_many([a, tree / "missing.txt"])
+    assert stats[0] == await backend.stat(a)
+    assert stats[1] is None
+
+    [(data, mtime)] = await backend.read_many([tree / "pkg_link" / "a.py"])
+    assert (data, mtime) == await backend.read_bytes(a)
+    with pytest.raises(FileNotFoundError):
+        await backend.read_many([a, tree / "missing.txt"])
+
+
+@pytest.mark.asyncio
+async def test_listings_do_not_descend_symlinked_dirs(tree: Path) -> None:
+    backend = LocalFileBackend(allowed_roots=[tree])
+    listed = await backend.list_dir(tree, recursive=True)
+    by_rel = {os.path.relpath(e.path, tree): e.is_dir for e in listed}
+    assert by_rel == {
+        "pkg": True,
+        "pkg/sub": True,
+        "pkg/a.py": False,
+        "pkg/sub/b.py": False,
+        "pkg/.env": False,
+        "notes.txt": False,
+        "pkg_link": True,
+    }
+
+    found, truncated = await backend.find_files(tree, "**/*.py")
+    assert not truncated
+    assert [os.path.relpath(e.path, tree) for e in found] == [
+        "pkg/a.py",
+        "pkg/sub/b.py",
+    ]
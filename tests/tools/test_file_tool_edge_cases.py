@@ -16,7 +16,7 @@ from nbformat import v4
 
 from grasp_agents.file_backend import LocalFileBackend
 from grasp_agents.session_context import SessionContext
-from grasp_agents.tools.base import _keys_overlap, batch_has_concurrency_conflict
+from grasp_agents.tools.base import keys_overlap, tool_call_dependencies
 from grasp_agents.tools.bash import Bash
 from grasp_agents.tools.bash_session import BashSession
 from grasp_agents.tools.code_interpreter import RunPython
@@ -119,15 +119,15 @@ class TestNotebookReadRedaction:
 
 class TestConflictKeys:
     def test_dotdot_normalized(self) -> None:
-        assert _keys_overlap("/ws/a/../x.md", "/ws/x.md")
+        assert keys_overlap("/ws/a/../x.md", "/ws/x.md")
 
     def test_rel_vs_abs_tail_match(self) -> None:
-        assert _keys_overlap("notes/x.md", "/workspace/notes/x.md")
-        assert not _keys_overlap("other/y.md", "/workspace/notes/x.md")
+        assert keys_overlap("notes/x.md", "/workspace/notes/x.md")
+        assert not keys_overlap("other/y.md", "/workspace/notes/x.md")
 
     def test_root_key_conflicts_with_everything(self) -> None:
-        assert _keys_overlap("/", "/anything/at/all")
-        assert _keys_overlap("relative/path.md", "/")
+        assert keys_overlap("/", "/anything/at/all")
+        assert keys_overlap("relative/path.md", "/")
 
     def test_exec_tools_declare_global_exclusivity(self) -> None:
         from grasp_agents.tools.bash_common import BashInput
@@ -161,12 +161,12 @@ class TestConflictKeys:
 
         bash = Bash()
         write = WriteTool()
-        assert batch_has_concurrency_conflict(
+        assert tool_call_dependencies(
             [
                 (bash, BashInput(command="make build")),
                 (write, WriteInput(path="/ws/out.txt", content="x")),
             ]
-        )
+        ) == [[], [0]]
 
 
 # ---------- Item 36: prompt file errors + truncation tail ----------
@@ -0,0 +1,251 @@
+"""
+ToolResultCache: opt-in memoization of idempotent tool results, keyed on the
+validated input and the tool's dependency fingerprint, invalidated by writes
+to overlapping paths and flagged on the served ``ToolOutputEvent``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from grasp_agents.agent.agent_context import AgentContext
+from grasp_agents.agent.background_tasks import BackgroundTaskManager
+from grasp_agents.agent.llm_agent_transcript import LLMAgentTranscript
+from grasp_agents.file_backend import LocalFileBackend
+from grasp_agents.session_context import SessionContext
+from grasp_agents.tools.bash_common import ShellState
+from grasp_agents.tools.bash_session import BashSessionHolder
+from grasp_agents.tools.file_edit import (
+    FileEditSessionState,
+    NullRedactor,
+    ReadInput,
+    ReadTool,
+    WriteInput,
+    WriteTool,
+)
+from grasp_agents.tools.file_search import GlobInput, GlobTool, GrepTool
+from grasp_agents.tools.function_tool import function_tool
+from grasp_agents.tools.notebook_exec import KernelHolder
+from grasp_agents.tools.result_cache import ToolResultCache
+from grasp_agents.types.events import ToolOutputEvent
+
+
+def _agent_ctx() -> AgentContext:
+    transcript = LLMAgentTranscript()
+    return AgentContext(
+        transcript=transcript,
+        tools={},
+        file_edit_state=FileEditSessionState(),
+        bg_tasks=BackgroundTaskManager(
+            agent_name="test", transcript=transcript, tools={}
+        ),
+        session_holder=BashSessionHolder(),
+        nb_kernel_holder=KernelHolder(),
+        shell_state=ShellState(),
+    )
+
+
+def _ctx(tmp_path: Path) -> SessionContext[Any]:
+    return SessionContext(
+        file_backend=LocalFileBackend(allowed_roots=[tmp_path]),
+        tool_cache=ToolResultCache(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_function_tool_memoized_only_when_opted_in() -> None:
+    calls: list[int] = []
+
+    @function_tool(memoize=True)
+    async def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    @function_tool
+    async def cube(x: int) -> int:
+        calls.append(x)
+        return x**3
+
+    ctx: SessionContext[Any] = SessionContext(tool_cache=ToolResultCache())
+    for _ in range(2):
+        assert await square.run(square.in_type(x=3), ctx=ctx) == 9
+        assert await cube.run(cube.in_type(x=2), ctx=ctx) == 8
+    assert calls == [3, 2, 2]
+
+    # Without a session cache nothing is memoized.
+    await square.run(square.in_type(x=3), ctx=SessionContext())
+    assert calls == [3, 2, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_memoized_stream_result_is_flagged() -> None:
+    @function_tool(memoize=True)
+    async def echo(text: str) -> str:
+        return text
+
+    ctx: SessionContext[Any] = SessionContext(tool_cache=ToolResultCache())
+    inp = echo.in_type(text="hi")
+    first = [e async for e in echo.run_stream(inp, ctx=ctx)]
+    second = [e async for e in echo.run_stream(inp, ctx=ctx)]
+    assert isinstance(first[-1], ToolOutputEvent)
+    assert not first[-1].memoized
+    assert isinstance(second[-1], ToolOutputEvent)
+    assert second[-1].memoized
+    assert second[-1].data == "hi"
+
+
+@pytest.mark.asyncio
+async def test_read_served_from_cache_until_file_changes(tmp_path: Path) -> None:
+    ctx = _ctx(tmp_path)
+    cache = ctx.tool_cache
+    assert cache is not None
+    f = tmp_path / "a.txt"
+    f.write_text("one")
+    read = ReadTool(redactor=NullRedactor())
+
+    await read.run(ReadInput(path=str(f)), ctx=ctx, agent_ctx=_agent_ctx())
+    # Another agent of the same session reads the same file: a hit that
+    # still records the read in *its* ledger.
+    other = _agent_ctx()
+    await read.run(ReadInput(path=str(f)), ctx=ctx, agent_ctx=other)
+    assert cache.hits == 1
+    assert other.file_edit_state.get_read_record(f) is not None
+
+    # An out-of-band change moves the mtime: the fingerprint misses.
+    f.write_text("two!")
+    os.utime(f, (f.stat().st_atime, f.stat().st_mtime + 5))
+    result = await read.run(ReadInput(path=str(f)), ctx=ctx, agent_ctx=other)
+    assert "two!" in getattr(result, "content", "")
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_overlapping_reads(tmp_path: Path) -> None:
+    ctx = _ctx(tmp_path)
+    cache = ctx.tool_cache
+    assert cache is not None
+    agent_ctx = _agent_ctx()
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    a.write_text("a")
+    b.write_text("b")
+    read = ReadTool(redactor=NullRedactor())
+    await read.run(ReadInput(path=str(a)), ctx=ctx, agent_ctx=agent_ctx)
+    await read.run(ReadInput(path=str(b)), ctx=ctx, agent_ctx=agent_ctx)
+    assert len(cache) == 2
+
+    await WriteTool().run(
+        WriteInput(path=str(a), content="A"), ctx=ctx, agent_ctx=agent_ctx
+    )
+    assert len(cache) == 1
+
+
+def test_cache_is_bounded_by_size_lru() -> None:
+    # Each entry is its 2-char key plus a 10-char value.
+    cache = ToolResultCache(max_chars=24)
+    cache.put("k1", "a" * 10, ())
+    cache.put("k2", "b" * 10, ())
+    assert cache.size_chars == 24
+    assert cache.get("k1", ()) == (True, "a" * 10)
+    cache.put("k3", "c" * 10, ())
+    # k2 was least recently used.
+    assert cache.get("k2", ()) == (False, None)
+    assert cache.get("k1", ()) == (True, "a" * 10)
+    assert cache.get("k3", ()) == (True, "c" * 10)
+    assert cache.size_chars == 24
+
+
+def test_oversized_result_is_not_stored() -> None:
+    cache = ToolResultCache(max_chars=24)
+    cache.put("k1", "a" * 10, ())
+    cache.put("big", "x" * 100, ())
+    assert cache.get("big", ()) == (False, None)
+    assert cache.get("k1", ()) == (True, "a" * 10)
+    # Replacing an entry releases its old size.
+    cache.put("k1", "a" * 20, ())
+    assert cache.size_chars == 22
+
+
+def test_mutable_results_are_copied_in_and_out() -> None:
+    cache = ToolResultCache()
+    value = {"lines": ["a"]}
+    cache.put("k", value, ())
+    value["lines"].append("mutated by the caller")
+    _, served = cache.get("k", ())
+    assert served == {"lines": ["a"]}
+    served["lines"].append("mutated by the agent")
+    assert cache.get("k", ()) == (True, {"lines": ["a"]})
+
+
+def test_cache_respects_ttl_and_fingerprint() -> None:
+    cache = ToolResultCache()
+    cache.put("k", "v", ("f", 1), ttl=0.0)
+    assert cache.get("k", ("f", 1)) == (False, None)
+    cache.put("k", "v", ("f", 1))
+    assert cache.get("k", ("f", 2)) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_differently_configured_instances_do_not_share(tmp_path: Path) -> None:
+    ctx = _ctx(tmp_path)
+    f = tmp_path / "cfg.txt"
+    f.write_text("token=SECRET123")
+
+    def redact_tokens(text: str) -> str:
+        return text.replace("SECRET123", "<REDACTED>")
+
+    plain = await ReadTool().run(
+        ReadInput(path=str(f)), ctx=ctx, agent_ctx=_agent_ctx()
+    )
+    assert "SECRET123" in getattr(plain, "content", "")
+    redacted = await ReadTool(redactor=redact_tokens).run(
+        ReadInput(path=str(f)), ctx=ctx, agent_ctx=_agent_ctx()
+    )
+    assert "SECRET123" not in getattr(redacted, "content", "")
+    # Same configuration: one entry serves both instances.
+    await ReadTool().run(ReadInput(path=str(f)), ctx=ctx, agent_ctx=_agent_ctx())
+    assert ctx.tool_cache is not None
+    assert ctx.tool_cache.hits == 1
+
+
+def test_result_overlapping_a_write_during_its_call_is_not_stored() -> None:
+    cache = ToolResultCache()
+    before = cache.generation
+    cache.invalidate(["/ws/src/a.py"])  # a write lands while the call runs
+
+    cache.put("grep", "stale", (), read_keys=["/ws/src"], since=before)
+    cache.put("read", "fresh", (), read_keys=["/ws/docs/b.md"], since=before)
+    assert cache.get("grep", ()) == (False, None)
+    assert cache.get("read", ()) == (True, "fresh")
+
+
+def test_search_tools_memoize_only_when_opted_in() -> None:
+    assert not GlobTool().memoize
+    assert not GrepTool().memoize
+    assert GlobTool(memoize=True).memoize
+    assert GrepTool(memoize=True).memoize
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_relative_read_of_its_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    ctx = _ctx(tmp_path)
+    cache = ctx.tool_cache
+    assert cache is not None
+    agent_ctx = _agent_ctx()
+    (tmp_path / "src").mkdir()
+    glob = GlobTool(memoize=True)
+    await glob.run(GlobInput(pattern="*.py", path="src"), ctx=ctx, agent_ctx=agent_ctx)
+    assert len(cache) == 1
+
+    await WriteTool().run(
+        WriteInput(path=str(tmp_path / "src" / "a.py"), content=""),
+        ctx=ctx,
+        agent_ctx=agent_ctx,
+    )
+    assert len(cache) == 0
@@ -1,13 +1,14 @@
 """
-Write-overlap detection: the agent loop serializes a foreground tool batch
-when two calls declare overlapping write targets (else runs them concurrently).
+Write-overlap detection: the agent loop orders the calls of a foreground tool
+batch that declare overlapping write targets (or a write overlapping a read),
+and runs the rest concurrently.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from grasp_agents.tools.base import _keys_overlap, batch_has_concurrency_conflict
+from grasp_agents.tools.base import keys_overlap, tool_call_dependencies
 
 
 class _WriteFake:
@@ -17,39 +18,90 @@ class _WriteFake:
     def concurrency_conflict_keys(self, inp: Any) -> list[str] | None:
         return self._paths
 
+    def concurrency_read_keys(self, inp: Any) -> list[str] | None:
+        return None
+
 
 class _ReadFake:
+    def __init__(self, *paths: str) -> None:
+        self._paths = list(paths)
+
     def concurrency_conflict_keys(self, inp: Any) -> list[str] | None:
         return None
 
+    def concurrency_read_keys(self, inp: Any) -> list[str] | None:
+        return self._paths or None
+
 
 def test_paths_overlap_same_file() -> None:
-    assert _keys_overlap("/x/a.txt", "/x/a.txt")
+    assert keys_overlap("/x/a.txt", "/x/a.txt")
 
 
 def test_paths_overlap_ancestor_either_order() -> None:
-    assert _keys_overlap("/x", "/x/a.txt")
-    assert _keys_overlap("/x/a.txt", "/x")
+    assert keys_overlap("/x", "/x/a.txt")
+    assert keys_overlap("/x/a.txt", "/x")
 
 
 def test_paths_no_overlap_for_siblings() -> None:
-    assert not _keys_overlap("/x/a.txt", "/x/b.txt")
+    assert not keys_overlap("/x/a.txt", "/x/b.txt")
 
 
 def test_paths_overlap_normalizes_dot_segments() -> None:
-    assert _keys_overlap("/x/./a.txt", "/x/a.txt")
+    assert keys_overlap("/x/./a.txt", "/x/a.txt")
 
 
 def test_batch_overlap_on_same_path() -> None:
-    calls = [(_WriteFake("/x/a.txt"), None), (_WriteFake("/x/a.txt"), None)]
-    assert batch_has_concurrency_conflict(calls)
+    calls: list[Any] = [(_WriteFake("/x/a.txt"), None), (_WriteFake("/x/a.txt"), None)]
+    assert tool_call_dependencies(calls) == [[], [0]]
 
 
 def test_batch_no_overlap_distinct_paths() -> None:
-    calls = [(_WriteFake("/x/a.txt"), None), (_WriteFake("/x/b.txt"), None)]
-    assert not batch_has_concurrency_conflict(calls)
+    calls: list[Any] = [(_WriteFake("/x/a.txt"), None), (_WriteFake("/x/b.txt"), None)]
+    assert tool_call_dependencies(calls) == [[], []]
 
 
 def test_batch_readonly_calls_never_overlap() -> None:
-    calls = [(_ReadFake(), None), (_ReadFake(), None), (_WriteFake("/x/a.txt"), None)]
-    assert not batch_has_concurrency_conflict(calls)
+    calls: list[Any] = [
+        (_ReadFake(), None),
+        (_ReadFake(), None),
+        (_WriteFake("/x/a.txt"), None),
+    ]
+    assert tool_call_dependencies(calls) == [[], [], []]
+
+
+def test_dependencies_order_only_conflicting_calls() -> None:
+    calls: list[Any] = [
+        (_ReadFake("/x/a.txt"), None),
+        (_ReadFake("/x/b.txt"), None),
+        (_WriteFake("/x/a.txt"), None),
+        (_ReadFake("/x/a.txt"), None),
+        (_WriteFake("/y/c.txt"), None),
+    ]
+    # The write waits for the earlier read of its path; the later read waits
+    # for the write; unrelated reads and writes don't wait at all.
+    assert tool_call_dependencies(calls) == [[], [], [0], [2], []]
+
+
+def test_dependencies_reads_of_same_path_are_compatible() -> None:
+    calls: list[Any] = [(_ReadFake("/x"), None), (_ReadFake("/x/a.txt"), None)]
+    assert tool_call_dependencies(calls) == [[], []]
+
+
+def test_dependencies_global_key_orders_everything_after_it() -> None:
+    calls: list[Any] = [
+        (_ReadFake("/x/a.txt"), None),
+        (_WriteFake("/"), None),
+        (_ReadFake("/y/b.txt"), None),
+    ]
+    assert tool_call_dependencies(calls) == [[], [0], [1]]
+
+
+def test_dependencies_resolve_relative_keys_against_root() -> None:
+    calls: list[Any] = [
+        (_ReadFake("src"), None),
+        (_WriteFake("/ws/src/a.py"), None),
+        (_WriteFake("docs/b.md"), None),
+    ]
+    # Without the root the relative directory read can't be placed.
+    assert tool_call_dependencies(calls) == [[], [], []]
+    assert tool_call_dependencies(calls, root="/ws") == [[], [0], []]